@@ -0,0 +1 @@
+"""Micro and load benchmarks for the BFF service."""
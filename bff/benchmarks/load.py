@@ -0,0 +1,224 @@
+"""End-to-end load benchmark of the BFF against local IdP and backend stubs.
+
+Runs the BFF in a subprocess (``bff_app.serve`` by default) with every
+upstream pointed at :class:`benchmarks.stubs.StubServers`, then loads one
+scenario after the other at a fixed concurrency:
+
+``proxy``
+    ``GET /proxy/api/request/items`` with valid sessions.
+``session``
+    ``GET /proxy/api/auth/session`` with valid sessions.
+``refresh``
+    ``GET /proxy/api/request/items`` with an expired access token, so every
+    request takes the backend ``401``, token refresh and retry path.
+
+Throughput and p50/p95/p99 latency are printed per scenario. ``--output``
+writes the run as a JSON baseline; ``--baseline`` compares the run with an
+earlier one and exits with status 1 when a scenario regressed by more than
+``--tolerance``.
+
+Run from the ``bff/`` directory::
+
+    python -m benchmarks.load --output baseline.json
+    python -m benchmarks.load --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Mapping
+
+from benchmarks.stubs import (
+    EXPIRED_ACCESS_TOKEN,
+    SERVER_COMMANDS,
+    StubServers,
+    drive,
+    session_cookie_header,
+    start_bff,
+)
+
+BASELINE_FORMAT_VERSION = 1
+SCENARIO_PATHS = {
+    "proxy": "/proxy/api/request/items",
+    "session": "/proxy/api/auth/session",
+    "refresh": "/proxy/api/request/items",
+}
+# Metrics compared against a baseline, and whether higher values are better.
+COMPARED_METRICS = {
+    "rps": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+}
+
+
+def compare_to_baseline(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    tolerance: float,
+) -> list[str]:
+    """List the regressions of ``current`` against ``baseline``.
+
+    A metric regresses when it is worse than the baseline value by more than
+    ``tolerance`` (a fraction, ``0.1`` for 10 %), or when the scenario now
+    fails more requests. Scenarios that were not run in both are skipped.
+
+    :param current: Benchmark document of this run.
+    :param baseline: Benchmark document of the reference run.
+    :param tolerance: Accepted relative slowdown.
+    :returns: Human-readable description of every regression.
+    :rtype: list[str]
+    """
+    regressions = []
+    for scenario, expected in baseline["scenarios"].items():
+        measured = current["scenarios"].get(scenario)
+        if measured is None:
+            continue
+        if measured["errors"] > expected["errors"]:
+            regressions.append(
+                f"{scenario}: {measured['errors']} errors "
+                f"(baseline {expected['errors']})"
+            )
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            reference = expected[metric]
+            if not reference:
+                continue
+            change = (measured[metric] - reference) / reference
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{scenario}: {metric} {measured[metric]} vs {reference} "
+                    f"({change:+.1%})"
+                )
+    return regressions
+
+
+def run_benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Start the stubs and the BFF, load every scenario and return the results.
+
+    :rtype: dict[str, Any]
+    """
+    stubs = StubServers(
+        backend_latency_seconds=args.backend_latency_ms / 1000,
+        idp_latency_seconds=args.idp_latency_ms / 1000,
+    )
+    scenarios: dict[str, dict[str, float | int]] = {}
+    with stubs:
+        env = stubs.env()
+        valid_sessions = [
+            session_cookie_header(env, f"benchmark-access-{index}")
+            for index in range(args.sessions)
+        ]
+        expired_session = [session_cookie_header(env, EXPIRED_ACCESS_TOKEN)]
+        with start_bff(args.server, env) as base_url:
+            for scenario in args.scenarios.split(","):
+                scenario = scenario.strip()
+                stubs.calls.clear()
+                scenarios[scenario] = drive(
+                    f"{base_url}{SCENARIO_PATHS[scenario]}",
+                    expired_session if scenario == "refresh" else valid_sessions,
+                    args.concurrency,
+                    args.duration,
+                    args.client_processes,
+                )
+                scenarios[scenario]["upstream_calls"] = dict(stubs.calls)
+
+    return {
+        "format_version": BASELINE_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            "server": args.server,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "sessions": args.sessions,
+            "backend_latency_ms": args.backend_latency_ms,
+            "idp_latency_ms": args.idp_latency_ms,
+            "client_processes": args.client_processes,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_report(result: Mapping[str, Any]) -> None:
+    print(
+        f"{'scenario':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}"
+    )
+    for scenario, summary in result["scenarios"].items():
+        print(
+            f"{scenario:<10}{summary['rps']:>10.1f}{summary['p50_ms']:>10.2f}"
+            f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}"
+            f"{summary['errors']:>8}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark; return 1 if it regressed against ``--baseline``."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--server", choices=sorted(SERVER_COMMANDS), default="serve")
+    parser.add_argument("--scenarios", default=",".join(SCENARIO_PATHS))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--sessions", type=int, default=16)
+    parser.add_argument("--backend-latency-ms", type=float, default=10.0)
+    parser.add_argument("--idp-latency-ms", type=float, default=10.0)
+    parser.add_argument("--client-processes", type=int, default=4)
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    parser.add_argument("--baseline", help="compare with this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    unknown = {name.strip() for name in args.scenarios.split(",")} - set(
+        SCENARIO_PATHS
+    )
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    result = run_benchmark(args)
+    _print_report(result)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(result, output, indent=2, sort_keys=True)
+            output.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("config") != result["config"]:
+        print("warning: baseline was recorded with a different configuration")
+    regressions = compare_to_baseline(result, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"no regression beyond {args.tolerance:.0%} of the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
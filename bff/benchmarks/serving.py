@@ -0,0 +1,62 @@
+"""Throughput of the development server versus ``bff_app.serve``.
+
+Starts the local IdP and backend stubs with a fixed backend latency, then runs
+the BFF twice, first with ``flask run`` (the former Docker command) and then
+with the gunicorn entrypoint, and drives authenticated proxied requests at
+both. Requests per second and latency percentiles are reported per server.
+
+Requires the ``serve`` extra. Run from the ``bff/`` directory::
+
+    python -m benchmarks.serving --concurrency 64 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from benchmarks.stubs import (
+    SERVER_COMMANDS,
+    StubServers,
+    drive,
+    session_cookie_header,
+    start_bff,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print one line per server."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servers", default=",".join(SERVER_COMMANDS))
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--backend-latency-ms", type=float, default=20.0)
+    parser.add_argument("--client-processes", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args(argv)
+
+    with StubServers(backend_latency_seconds=args.backend_latency_ms / 1000) as stubs:
+        env = stubs.env()
+        cookie_header = session_cookie_header(env, "benchmark-access-token")
+        for server in args.servers.split(","):
+            with start_bff(server.strip(), env) as base_url:
+                result = drive(
+                    f"{base_url}/proxy/api/request/items",
+                    [cookie_header],
+                    args.concurrency,
+                    args.duration,
+                    args.client_processes,
+                )
+            if args.json:
+                print(json.dumps({"server": server, **result}))
+            else:
+                print(
+                    f"{server:>6}: {result['rps']:8.1f} req/s  "
+                    f"p50 {result['p50_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms  "
+                    f"errors {result['errors']}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,350 @@
+"""Local stand-ins for the IdP and backend, and a BFF process launcher.
+
+Shared by the end-to-end benchmarks: :class:`StubServers` answers the OIDC
+token, userinfo and logout endpoints and the backend API from one threaded
+HTTP server, :func:`start_bff` runs the BFF against it in a subprocess, and
+:func:`drive` loads a BFF endpoint from several client processes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Sequence
+from urllib.parse import parse_qs
+
+import requests
+
+# Access token the stubs treat as expired: the backend answers 401 and the
+# userinfo endpoint rejects it, so every request carrying it is refreshed.
+EXPIRED_ACCESS_TOKEN = "benchmark-expired-access-token"
+BENCHMARK_ENV = {
+    "FLASK_SECRET_KEY": "benchmark-secret",
+    "TOKEN_COOKIE_ENCRYPTION_KEY": "MDEyMzQ1Njc4OWFiY2RlZjAxMjM0NTY3ODlhYmNkZWY",
+    "SESSION_COOKIE_NAME": "bff-benchmark",
+    "SESSION_COOKIE_PATH": "/",
+    "SESSION_COOKIE_HTTPONLY": "True",
+    "SESSION_COOKIE_SECURE": "False",
+    "SESSION_COOKIE_SAMESITE": "Lax",
+    "CORS_ALLOWED_ORIGIN": "http://frontend.benchmark",
+    "OAUTH_CLIENT_ID": "client-id",
+    "OAUTH_CLIENT_SECRET": "client-secret",
+    "OAUTH_OIDC_SCOPE": "openid",
+    "OAUTH_ENDPOINT_AUTHORIZATION": "http://auth.benchmark/authorize",
+    "OAUTH_LOGIN_REDIRECT_URI": "http://localhost/proxy/api/auth/callback",
+    "FRONTEND_REDIRECT": "http://frontend.benchmark",
+    "PROXY_COALESCE_REQUESTS": "False",
+}
+SERVER_COMMANDS = {
+    "dev": [sys.executable, "-m", "flask", "--app", "bff.py", "run"],
+    "serve": [sys.executable, "-m", "bff_app.serve"],
+}
+
+
+class StubServers:
+    """Threaded HTTP server playing the IdP and the backend API.
+
+    :param backend_latency_seconds: Delay before each backend answer.
+    :param idp_latency_seconds: Delay before each token/userinfo/logout answer.
+    :ivar calls: Number of calls per stub endpoint (``token``, ``userinfo``,
+        ``logout``, ``backend``).
+    """
+
+    def __init__(
+        self,
+        backend_latency_seconds: float = 0.0,
+        idp_latency_seconds: float = 0.0,
+    ) -> None:
+        self.backend_latency_seconds = backend_latency_seconds
+        self.idp_latency_seconds = idp_latency_seconds
+        self.calls: Counter[str] = Counter()
+        self._calls_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._server.request_queue_size = 1024
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Return the root URL of the stub server."""
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def env(self) -> dict[str, str]:
+        """Return the BFF environment pointing every upstream at the stubs."""
+        return {
+            **BENCHMARK_ENV,
+            "BACKEND_ENDPOINT": f"{self.base_url}/api",
+            "OAUTH_ENDPOINT_TOKEN": f"{self.base_url}/token",
+            "OAUTH_ENDPOINT_USERINFO": f"{self.base_url}/userinfo",
+            "OAUTH_ENDPOINT_LOGOUT": f"{self.base_url}/logout",
+        }
+
+    def start(self) -> StubServers:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> StubServers:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _count(self, endpoint: str) -> None:
+        with self._calls_lock:
+            self.calls[endpoint] += 1
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stubs = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._dispatch()
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._dispatch()
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                pass
+
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                bearer = self.headers.get("Authorization", "")
+                expired = bearer == f"Bearer {EXPIRED_ACCESS_TOKEN}"
+                if path.startswith("/api/"):
+                    stubs._count("backend")
+                    time.sleep(stubs.backend_latency_seconds)
+                    if expired:
+                        self._reply(
+                            401,
+                            {"detail": "token expired"},
+                            {"WWW-Authenticate": 'Bearer error="invalid_token"'},
+                        )
+                    else:
+                        self._reply(200, {"items": [], "path": path})
+                    return
+
+                endpoint = path.strip("/")
+                stubs._count(endpoint)
+                time.sleep(stubs.idp_latency_seconds)
+                if endpoint == "token":
+                    form = parse_qs(body.decode("utf-8"))
+                    if form.get("grant_type") != ["refresh_token"]:
+                        self._reply(400, {"error": "unsupported_grant_type"})
+                    else:
+                        self._reply(200, token_payload())
+                elif endpoint == "userinfo":
+                    if expired or not bearer:
+                        self._reply(401, {"error": "invalid_token"})
+                    else:
+                        self._reply(200, {"sub": "benchmark-user"})
+                elif endpoint == "logout":
+                    self._reply(204, None)
+                else:
+                    self._reply(404, {"error": "not_found"})
+
+            def _reply(
+                self,
+                status: int,
+                payload: object,
+                headers: dict[str, str] | None = None,
+            ) -> None:
+                data = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def token_payload(access_token: str | None = None) -> dict[str, object]:
+    """Return an OIDC token response valid for one hour."""
+    return {
+        "access_token": access_token or f"benchmark-access-{os.urandom(6).hex()}",
+        "refresh_token": "benchmark-refresh-token",
+        "id_token": "benchmark-id-token",
+        "expires_in": 3600,
+        "refresh_expires_in": 3600,
+        "token_type": "Bearer",
+        "scope": "openid",
+        "expires_at": int(time.time()) + 3600,
+    }
+
+
+def session_cookie_header(env: dict[str, str], access_token: str) -> str:
+    """Build the ``Cookie`` header of a browser session holding ``access_token``.
+
+    :param env: BFF environment, used for the cookie names and encryption key.
+    """
+    os.environ.update(env)
+    from bff_app import create_app
+    from bff_app.services.token_cookies import set_token_cookies
+    from bff_app.settings import load_settings_from_env
+
+    settings = load_settings_from_env()
+    response = create_app(settings).response_class()
+    set_token_cookies(response, token_payload(access_token), settings)
+    return "; ".join(
+        header.split(";", 1)[0] for header in response.headers.getlist("Set-Cookie")
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def start_bff(server: str, env: dict[str, str]) -> Iterator[str]:
+    """Run the BFF in a subprocess and yield its base URL once it answers.
+
+    :param server: ``dev`` (``flask run``) or ``serve`` (``bff_app.serve``).
+    :param env: Environment variables added to the current environment.
+    """
+    port = free_port()
+    command = [*SERVER_COMMANDS[server]]
+    if server == "dev":
+        command += ["--port", str(port)]
+    process = subprocess.Popen(
+        command,
+        env={**os.environ, **env, "PORT": str(port), "HOST": "127.0.0.1"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"BFF exited with status {process.returncode}")
+            try:
+                requests.get(f"{base_url}/ping", timeout=1)
+                break
+            except requests.exceptions.RequestException:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"BFF at {base_url} did not start") from None
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _drive_from_one_process(
+    url: str,
+    cookie_headers: Sequence[str],
+    threads: int,
+    duration: float,
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker(index: int) -> None:
+        nonlocal errors
+        session = requests.Session()
+        session.headers["Cookie"] = cookie_headers[index % len(cookie_headers)]
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                ok = session.get(url, timeout=30).status_code == 200
+            except requests.exceptions.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors += 1
+
+    workers = [
+        threading.Thread(target=worker, args=(index,)) for index in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return latencies, errors
+
+
+def drive(
+    url: str,
+    cookie_headers: Sequence[str],
+    concurrency: int,
+    duration: float,
+    client_processes: int = 4,
+) -> dict[str, float | int]:
+    """Send GET requests to ``url`` for ``duration`` seconds.
+
+    Clients run in several processes so the load generator is not limited by
+    one interpreter lock. Each client keeps one browser session, picked from
+    ``cookie_headers`` in turn.
+
+    :returns: Summary as built by :func:`summarize`.
+    """
+    client_processes = max(1, min(client_processes, concurrency))
+    threads = [
+        concurrency // client_processes + (index < concurrency % client_processes)
+        for index in range(client_processes)
+    ]
+    with ProcessPoolExecutor(client_processes) as pool:
+        results = list(
+            pool.map(
+                _drive_from_one_process,
+                [url] * client_processes,
+                [cookie_headers] * client_processes,
+                threads,
+                [duration] * client_processes,
+            )
+        )
+    latencies = [value for result in results for value in result[0]]
+    return summarize(latencies, sum(result[1] for result in results), duration)
+
+
+def summarize(
+    latencies: Sequence[float],
+    errors: int,
+    duration: float,
+) -> dict[str, float | int]:
+    """Summarize request latencies (in seconds) of one load run.
+
+    :returns: ``requests``, ``errors``, ``rps`` and ``p50_ms``/``p95_ms``/
+        ``p99_ms``/``mean_ms`` latencies of successful requests.
+    """
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(p50 * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "p99_ms": round(p99 * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+    }
@@ -0,0 +1,178 @@
+"""Microbenchmark for per-request token cookie decoding.
+
+Compares the legacy request path, where one proxied request decoded the four v1
+token cookies up to twice and built a fresh ``AESGCM`` object for every
+component, with the current path that decodes the single v2 cookie once per
+request and reuses the shared cipher. Cookie header sizes of both formats are
+reported as well.
+
+Run from the ``bff/`` directory::
+
+    python -m benchmarks.token_cookies --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import timeit
+from typing import Callable, Mapping
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from bff_app import create_app
+from bff_app.openapi.generate import _spec_settings
+from bff_app.services.auth import get_session_token, has_session_token_cookie
+from bff_app.services.token_cookies import (
+    COOKIE_NONCE_BYTES,
+    REQUIRED_TOKEN_FIELDS,
+    set_token_cookies,
+)
+
+# Number of cookie decodes a refreshing proxied request used to perform:
+# has_session_token_cookie() is free, get_session_token() ran once for the
+# proxied call and once more inside refresh_access_token().
+LEGACY_DECODES_PER_REQUEST = 2
+
+
+def _sample_jwt(claims: Mapping[str, object], signature_bytes: int = 256) -> str:
+    """Build a JWT-shaped string with a realistic header, claims and signature."""
+    segments = [
+        json.dumps({"alg": "RS256", "typ": "JWT", "kid": "benchmark"}).encode(),
+        json.dumps(claims).encode(),
+        os.urandom(signature_bytes),
+    ]
+    return ".".join(
+        base64.urlsafe_b64encode(segment).rstrip(b"=").decode("ascii")
+        for segment in segments
+    )
+
+
+def _sample_token() -> dict[str, object]:
+    claims = {
+        "iss": "https://auth.example/realms/wefa",
+        "sub": "8b8135af-4555-455c-bf84-567f99ff9e96",
+        "aud": ["account", "wefa-backend"],
+        "exp": 1773046864,
+        "iat": 1773046564,
+        "scope": "openid profile email",
+        "realm_access": {"roles": [f"role-{index}" for index in range(20)]},
+        "email": "olivia.diaz@embergenpower.demo",
+        "preferred_username": "olivia.diaz@embergenpower.demo",
+    }
+    return {
+        "access_token": _sample_jwt(claims),
+        "refresh_token": _sample_jwt({**claims, "typ": "Refresh"}),
+        "id_token": _sample_jwt({**claims, "typ": "ID"}),
+        "expires_in": 300,
+        "refresh_expires_in": 1800,
+        "token_type": "Bearer",
+        "scope": "openid profile email",
+        "expires_at": 1773046864,
+    }
+
+
+def _legacy_encode(
+    token: Mapping[str, object],
+    names: Mapping[str, str],
+    key: bytes,
+) -> dict[str, str]:
+    """Reference copy of the v1 per-field cookie encoding."""
+    meta = {
+        field: value for field, value in token.items() if field not in REQUIRED_TOKEN_FIELDS
+    }
+    plaintexts = {field: token[field] for field in REQUIRED_TOKEN_FIELDS}
+    plaintexts["meta"] = json.dumps(meta, separators=(",", ":"), sort_keys=True)
+    cookies = {}
+    for field, cookie_name in names.items():
+        nonce = os.urandom(COOKIE_NONCE_BYTES)
+        ciphertext = AESGCM(key).encrypt(
+            nonce,
+            str(plaintexts[field]).encode("utf-8"),
+            cookie_name.encode("utf-8"),
+        )
+        cookies[cookie_name] = (
+            base64.urlsafe_b64encode(bytes([1]) + nonce + ciphertext)
+            .rstrip(b"=")
+            .decode("ascii")
+        )
+    return cookies
+
+
+def _legacy_decode(cookies: Mapping[str, str], names: Mapping[str, str], key: bytes) -> dict:
+    """Reference copy of the v1 pre-memoization decode hot path."""
+    token: dict[str, object] = {}
+    for field, cookie_name in names.items():
+        encoded = cookies[cookie_name]
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        nonce = raw[1 : 1 + COOKIE_NONCE_BYTES]
+        plaintext = AESGCM(key).decrypt(
+            nonce,
+            raw[1 + COOKIE_NONCE_BYTES :],
+            cookie_name.encode("utf-8"),
+        ).decode("utf-8")
+        if field in REQUIRED_TOKEN_FIELDS:
+            token[field] = plaintext
+        else:
+            token.update(json.loads(plaintext))
+    return token
+
+
+def _per_call_microseconds(func: Callable[[], object], iterations: int) -> float:
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print per-request costs."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    settings = _spec_settings()
+    app = create_app(settings=settings)
+    response = app.response_class()
+    set_token_cookies(response, _sample_token(), settings)
+    cookies = {
+        header.split("=", 1)[0]: header.split("=", 1)[1].split(";", 1)[0]
+        for header in response.headers.getlist("Set-Cookie")
+    }
+    cookie_header = "; ".join(f"{name}={value}" for name, value in cookies.items())
+    names = dict(settings.legacy_token_cookie_names)
+    key = settings.token_cookie_encryption_key
+    legacy_cookies = _legacy_encode(_sample_token(), names, key)
+    legacy_cookie_header = "; ".join(
+        f"{name}={value}" for name, value in legacy_cookies.items()
+    )
+
+    def legacy_request() -> None:
+        for _ in range(LEGACY_DECODES_PER_REQUEST):
+            _legacy_decode(legacy_cookies, names, key)
+
+    def current_request() -> None:
+        with app.test_request_context(headers={"Cookie": cookie_header}):
+            has_session_token_cookie()
+            for _ in range(LEGACY_DECODES_PER_REQUEST):
+                get_session_token()
+
+    def request_context_only() -> None:
+        with app.test_request_context(headers={"Cookie": cookie_header}):
+            pass
+
+    context_cost = _per_call_microseconds(request_context_only, args.iterations)
+    legacy_cost = _per_call_microseconds(legacy_request, args.iterations)
+    current_cost = (
+        _per_call_microseconds(current_request, args.iterations) - context_cost
+    )
+
+    print(f"legacy cookie header:  {len(legacy_cookie_header):6d} bytes")
+    print(f"current cookie header: {len(cookie_header):6d} bytes")
+    print(f"legacy token decode per request:  {legacy_cost:8.2f} us")
+    print(f"current token decode per request: {current_cost:8.2f} us")
+    print(f"speedup: {legacy_cost / current_cost:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
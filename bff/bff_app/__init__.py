@@ -2,21 +2,52 @@
 
 from __future__ import annotations
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Flask
 from flask_cors import CORS
 from flask_smorest import Api
 
 from .routes.auth import auth_bp
 from .routes.health import health_bp
+from .routes.metrics import metrics_bp
 from .routes.proxy import proxy_bp
+from .services.admission import ConcurrencyLimiter, SessionRateLimiter
+from .services.background import BackgroundExecutor
+from .services.compression import build_response_compressor
+from .services.http_cache import ResponseCache
+from .services.metrics import BffMetrics, CallbackGauge, install_request_metrics
+from .services.single_flight import SingleFlight
+from .services.resilience import CircuitBreakerRegistry
+from .services.routing import build_route_table
+from .services.token_cookies import get_token_cipher
+from .services.token_store import TokenStore, build_token_store
+from .services.tracing import (
+    SpanExporter,
+    Tracer,
+    build_span_exporter,
+    install_request_tracing,
+)
+from .services.upstream import build_upstream_session
+from .services.userinfo_cache import UserinfoCache
 from .settings import BffSettings
 
 
-def create_app(settings: BffSettings) -> Flask:
+def create_app(
+    settings: BffSettings,
+    token_store: TokenStore | None = None,
+    span_exporter: SpanExporter | None = None,
+) -> Flask:
     """Create and configure the Flask application.
 
     :param settings:
         Fully resolved runtime settings loaded from environment variables.
+    :param token_store:
+        Optional server-side token store overriding ``TOKEN_STORE_BACKEND``,
+        e.g. a ``redis.Redis`` client.
+    :param span_exporter:
+        Optional span exporter overriding ``TRACING_EXPORTER``.
     :returns:
         Configured Flask application with registered blueprints and CORS.
     :rtype: flask.Flask
@@ -34,6 +65,90 @@ def create_app(settings: BffSettings) -> Flask:
     app.config["OPENAPI_VERSION"] = "3.0.3"
 
     app.extensions["bff_settings"] = settings
+    # Build the token-cookie cipher once so request handlers only reuse it.
+    get_token_cipher(settings.token_cookie_encryption_key)
+    app.extensions["bff_userinfo_cache"] = UserinfoCache(
+        max_entries=settings.userinfo_cache_max_entries,
+        ttl_seconds=settings.userinfo_cache_ttl_seconds,
+    )
+    app.extensions["bff_circuit_breakers"] = CircuitBreakerRegistry(
+        failure_threshold=settings.upstream_breaker_failure_threshold,
+        reset_timeout_seconds=settings.upstream_breaker_reset_timeout_seconds,
+    )
+    app.extensions["bff_metrics"] = BffMetrics()
+    app.extensions["bff_upstream_session"] = build_upstream_session(
+        settings,
+        app.extensions["bff_circuit_breakers"],
+        app.extensions["bff_metrics"],
+    )
+    app.extensions["bff_token_store"] = (
+        token_store if token_store is not None else build_token_store(settings)
+    )
+    app.extensions["bff_proxy_limiter"] = ConcurrencyLimiter(
+        max_in_flight=settings.proxy_max_in_flight,
+        max_queue=settings.proxy_max_queue,
+        queue_timeout_seconds=settings.proxy_queue_timeout_seconds,
+    )
+    # Event streams and WebSocket relays hold their connection for minutes,
+    # so they are capped separately instead of taking upstream call slots.
+    app.extensions["bff_stream_limiter"] = ConcurrencyLimiter(
+        max_in_flight=settings.proxy_stream_max_connections,
+        max_queue=0,
+        queue_timeout_seconds=0,
+    )
+    app.extensions["bff_route_table"] = build_route_table(
+        settings,
+        app.extensions["bff_upstream_session"],
+        app.extensions["bff_proxy_limiter"],
+        app.extensions["bff_circuit_breakers"],
+        app.extensions["bff_metrics"],
+    )
+    app.extensions["bff_session_rate_limiter"] = SessionRateLimiter(
+        rate_per_second=settings.proxy_session_rate_per_second,
+        burst=settings.proxy_session_burst,
+    )
+    app.extensions["bff_response_cache"] = ResponseCache(
+        max_bytes=settings.proxy_cache_max_bytes,
+    )
+    app.extensions["bff_single_flight"] = SingleFlight()
+    # Batch fan-out threads; more workers than pooled connections would only
+    # queue inside the connection pool.
+    app.extensions["bff_batch_executor"] = ThreadPoolExecutor(
+        max_workers=max(settings.upstream_pool_maxsize, 1),
+        thread_name_prefix="bff-batch",
+    )
+    metrics = app.extensions["bff_metrics"]
+
+    def record_compression(encoding: str, original: int, compressed: int) -> None:
+        metrics.compressed_responses.inc(encoding=encoding)
+        metrics.compression_bytes.inc(original, encoding=encoding, stage="in")
+        metrics.compression_bytes.inc(compressed, encoding=encoding, stage="out")
+
+    app.extensions["bff_response_compressor"] = build_response_compressor(
+        settings,
+        on_compressed=record_compression,
+    )
+    app.extensions["bff_background_executor"] = BackgroundExecutor(
+        max_workers=settings.background_max_workers,
+        max_queue=settings.background_max_queue,
+        on_outcome=lambda task, outcome: metrics.background_tasks.inc(
+            task=task,
+            outcome=outcome,
+        ),
+    )
+    # Give queued IdP calls a chance to finish when the worker process exits.
+    atexit.register(
+        app.extensions["bff_background_executor"].shutdown,
+        settings.background_drain_timeout_seconds,
+    )
+
+    app.extensions["bff_tracer"] = Tracer(
+        span_exporter if span_exporter is not None else build_span_exporter(settings)
+    )
+
+    _register_component_gauges(app)
+    install_request_metrics(app, app.extensions["bff_metrics"])
+    install_request_tracing(app, app.extensions["bff_tracer"])
 
     cors_kwargs = {"supports_credentials": True}
     if settings.cors_allowed_origin:
@@ -46,15 +161,76 @@ def create_app(settings: BffSettings) -> Flask:
         {
             "type": "apiKey",
             "in": "cookie",
-            "name": f"{settings.session_cookie_name}_at",
+            "name": settings.token_cookie_names[0],
             "description": (
-                "Authentication uses encrypted token cookies with suffixes "
-                "(_at, _rt, _it, _meta) derived from SESSION_COOKIE_NAME."
+                "Authentication uses an encrypted token cookie with suffix _tk "
+                "derived from SESSION_COOKIE_NAME. Large tokens are split over "
+                "numbered chunk cookies (_tk1, _tk2, ...)."
             ),
         },
     )
     api.register_blueprint(auth_bp)
     api.register_blueprint(proxy_bp)
     api.register_blueprint(health_bp)
+    api.register_blueprint(metrics_bp)
 
     return app
+
+
+def _register_component_gauges(app: Flask) -> None:
+    """Export limiter, breaker, cache and background queue state at scrape time."""
+    metrics = app.extensions["bff_metrics"]
+    route_table = app.extensions["bff_route_table"]
+    stream_limiter = app.extensions["bff_stream_limiter"]
+    breakers = app.extensions["bff_circuit_breakers"]
+    response_cache = app.extensions["bff_response_cache"]
+    background_executor = app.extensions["bff_background_executor"]
+
+    metrics.register(
+        CallbackGauge(
+            "bff_proxy_upstream_slots",
+            "Proxied upstream calls in flight or waiting for a slot.",
+            lambda: [
+                ((upstream.name, state), upstream.limiter.stats()[state])
+                for upstream in route_table.upstreams()
+                for state in ("in_flight", "waiting")
+            ],
+            ("upstream", "state"),
+        )
+    )
+    metrics.register(
+        CallbackGauge(
+            "bff_proxy_open_streams",
+            "Event streams and WebSocket relays currently open.",
+            lambda: [((), stream_limiter.stats()["in_flight"])],
+        )
+    )
+    metrics.register(
+        CallbackGauge(
+            "bff_upstream_circuit_open",
+            "Whether an upstream's circuit breaker is open or half-open.",
+            lambda: [
+                ((upstream,), float(stats["state"] != "closed"))
+                for upstream, stats in breakers.stats().items()
+            ],
+            ("upstream",),
+        )
+    )
+    metrics.register(
+        CallbackGauge(
+            "bff_response_cache_bytes",
+            "Bytes held by the proxy response cache.",
+            lambda: [((), response_cache.stats()["size_bytes"])],
+        )
+    )
+    metrics.register(
+        CallbackGauge(
+            "bff_background_tasks",
+            "Background tasks waiting for a worker or running.",
+            lambda: [
+                (("queued",), background_executor.stats()["queued"]),
+                (("running",), background_executor.stats()["running"]),
+            ],
+            ("state",),
+        )
+    )
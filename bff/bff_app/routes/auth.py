@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import secrets
+from functools import partial
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
@@ -14,11 +15,14 @@ from bff_app.services.auth import (
     clear_session_token,
     get_session_token,
     get_settings,
+    get_userinfo_cache,
     has_session_token_cookie,
     refresh_access_token,
     store_session_token,
 )
+from bff_app.services.background import submit_background
 from bff_app.services.token_cookies import TokenCookieTooLargeError
+from bff_app.services.upstream import get_upstream_session
 
 auth_bp = Blueprint(
     "auth",
@@ -226,7 +230,7 @@ def login_cb():
 
     response = _redirect_to_frontend(settings.frontend_redirect)
     try:
-        store_session_token(response, token)
+        store_session_token(response, token, rotate_session=True)
     except TokenCookieTooLargeError as exc:
         current_app.logger.warning(
             "OAuth callback token cookie %s exceeds browser size budget (%s bytes)",
@@ -261,7 +265,10 @@ def login_cb():
 @auth_bp.route("/logout", methods=["GET"])
 @auth_bp.doc(
     summary="Logout and revoke tokens",
-    description="Log out from auth server and clear local session data.",
+    description=(
+        "Clear local session data; the auth server session is ended in the "
+        "background."
+    ),
     security=[{"sessionCookie": []}],
     responses={
         "200": {
@@ -279,35 +286,23 @@ def login_cb():
     },
 )
 def logout():
-    """Log out from the auth server and clear local session data.
+    """Clear local session data and end the auth server session in the background.
 
     :returns:
         JSON payload confirming logout success.
     :rtype: flask.Response
     """
     current_app.logger.debug("Handling /proxy/api/auth/logout")
-    settings = get_settings()
 
     token = get_session_token()
     id_token = token.get("id_token") if isinstance(token, dict) else None
+    access_token = token.get("access_token") if isinstance(token, dict) else None
+    if isinstance(access_token, str):
+        get_userinfo_cache().invalidate(access_token)
 
     if id_token:
-        try:
-            response = requests.post(
-                settings.oauth_endpoint_logout,
-                {"id_token_hint": id_token},
-                timeout=(
-                    settings.backend_connect_timeout_seconds,
-                    settings.backend_read_timeout_seconds,
-                ),
-            )
-            if response.status_code >= 400:
-                current_app.logger.warning(
-                    "Logout endpoint returned status %s",
-                    response.status_code,
-                )
-        except requests.exceptions.RequestException as exc:
-            current_app.logger.warning("Logout request failed: %s", exc)
+        # The IdP answer is only logged, so do not make the browser wait for it.
+        submit_background("idp_logout", partial(_end_idp_session, id_token))
     else:
         current_app.logger.debug(
             "No id_token in token cookies; skipping upstream logout call"
@@ -318,6 +313,30 @@ def logout():
     return response
 
 
+def _end_idp_session(id_token: str) -> None:
+    """End the IdP session of ``id_token``; failures are only logged.
+
+    :param id_token: ID token sent as ``id_token_hint``.
+    """
+    settings = get_settings()
+    try:
+        response = get_upstream_session().post(
+            settings.oauth_endpoint_logout,
+            {"id_token_hint": id_token},
+            timeout=(
+                settings.backend_connect_timeout_seconds,
+                settings.backend_read_timeout_seconds,
+            ),
+        )
+        if response.status_code >= 400:
+            current_app.logger.warning(
+                "Logout endpoint returned status %s",
+                response.status_code,
+            )
+    except requests.exceptions.RequestException as exc:
+        current_app.logger.warning("Logout request failed: %s", exc)
+
+
 @auth_bp.route("/userinfo", methods=["GET"])
 @auth_bp.doc(
     summary="Fetch user info",
@@ -373,6 +392,10 @@ def auth_userinfo():
     Requires:
         ``access_token`` to be present in encrypted auth cookies.
 
+    Successful responses are kept in the in-process userinfo cache keyed by a
+    hash of the access token, so repeated calls skip the upstream round trip
+    until the cache TTL elapses, the user logs out or the token is refreshed.
+
     :returns:
         JSON object returned by the upstream userinfo endpoint.
     :rtype: flask.Response
@@ -392,8 +415,13 @@ def auth_userinfo():
             clear_session_token(response)
         return response
 
+    userinfo_cache = get_userinfo_cache()
+    cached_userinfo = userinfo_cache.get(access_token)
+    if cached_userinfo is not None:
+        return jsonify(cached_userinfo)
+
     try:
-        userinfo = requests.get(
+        userinfo = get_upstream_session().get(
             settings.oauth_endpoint_userinfo,
             headers={"Authorization": f"Bearer {access_token}"},
             timeout=(
@@ -419,11 +447,15 @@ def auth_userinfo():
         return jsonify({"message": "Failed to fetch user info"}), 502
 
     try:
-        return jsonify(userinfo.json())
+        userinfo_payload = userinfo.json()
     except ValueError:
         current_app.logger.warning("Userinfo response was not valid JSON")
         return jsonify({"message": "Invalid upstream response"}), 502
 
+    if isinstance(userinfo_payload, dict):
+        userinfo_cache.set(access_token, userinfo_payload)
+    return jsonify(userinfo_payload)
+
 
 @auth_bp.route("/session", methods=["GET"])
 @auth_bp.doc(
@@ -449,7 +481,8 @@ def check_session():
     """Validate whether the current browser session is still authenticated.
 
     Flow:
-        1. Call the userinfo endpoint with the stored access token.
+        1. Call the userinfo endpoint with the stored access token, unless a
+           cached userinfo response already proves the token valid.
         2. If token is invalid, attempt refresh via refresh token.
         3. Re-check userinfo after successful refresh.
         4. Clear auth state when no valid auth state remains.
@@ -467,7 +500,10 @@ def check_session():
 
     token = get_session_token()
     if token and "access_token" in token:
-        userinfo = requests.get(
+        if get_userinfo_cache().get(token["access_token"]) is not None:
+            return jsonify({"session": True})
+
+        userinfo = get_upstream_session().get(
             settings.oauth_endpoint_userinfo,
             headers={"Authorization": f"Bearer {token['access_token']}"},
             timeout=(
@@ -479,7 +515,7 @@ def check_session():
         if not is_valid_session:
             refreshed_token = refresh_access_token()
             if refreshed_token and "access_token" in refreshed_token:
-                userinfo = requests.get(
+                userinfo = get_upstream_session().get(
                     settings.oauth_endpoint_userinfo,
                     headers={
                         "Authorization": f"Bearer {refreshed_token['access_token']}"
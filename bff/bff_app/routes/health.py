@@ -5,6 +5,9 @@ from __future__ import annotations
 from flask import current_app, jsonify
 from flask_smorest import Blueprint
 
+from bff_app.services.resilience import BREAKER_CLOSED
+from bff_app.services.upstream import get_circuit_breakers
+
 health_bp = Blueprint(
     "health",
     __name__,
@@ -39,3 +42,63 @@ def ping():
     """
     current_app.logger.debug("Handling /ping")
     return jsonify({"message": "pong"})
+
+
+@health_bp.route("/health/upstreams", methods=["GET"])
+@health_bp.doc(
+    summary="Upstream health",
+    description="Report the circuit breaker state of every upstream called so far.",
+    responses={
+        "200": {
+            "description": "Circuit breaker states keyed by upstream origin.",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "status": {"type": "string", "enum": ["ok", "degraded"]},
+                            "upstreams": {
+                                "type": "object",
+                                "additionalProperties": {
+                                    "type": "object",
+                                    "properties": {
+                                        "state": {
+                                            "type": "string",
+                                            "enum": ["closed", "open", "half_open"],
+                                        },
+                                        "consecutive_failures": {"type": "integer"},
+                                        "rejected": {"type": "integer"},
+                                    },
+                                    "required": [
+                                        "state",
+                                        "consecutive_failures",
+                                        "rejected",
+                                    ],
+                                },
+                            },
+                        },
+                        "required": ["status", "upstreams"],
+                    }
+                }
+            },
+        }
+    },
+)
+def upstream_health():
+    """Report circuit breaker state per upstream.
+
+    The endpoint always answers ``200`` so an outage of a shared upstream does
+    not take every BFF instance out of load-balancer rotation; ``status`` is
+    ``degraded`` while any breaker is not closed.
+
+    :returns: ``{"status": ..., "upstreams": {<origin>: {...}}}``.
+    :rtype: flask.Response
+    """
+    current_app.logger.debug("Handling /health/upstreams")
+    upstreams = get_circuit_breakers().stats()
+    is_healthy = all(
+        breaker["state"] == BREAKER_CLOSED for breaker in upstreams.values()
+    )
+    return jsonify(
+        {"status": "ok" if is_healthy else "degraded", "upstreams": upstreams}
+    )
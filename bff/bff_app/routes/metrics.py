@@ -0,0 +1,34 @@
+"""Prometheus metrics route."""
+
+from __future__ import annotations
+
+from flask import Response
+from flask_smorest import Blueprint
+
+from bff_app.services.metrics import PROMETHEUS_CONTENT_TYPE, get_metrics
+
+metrics_bp = Blueprint(
+    "metrics",
+    __name__,
+    description="Operational metrics endpoints.",
+)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+@metrics_bp.doc(
+    summary="Prometheus metrics",
+    description="Return BFF metrics in the Prometheus text exposition format.",
+    responses={
+        "200": {
+            "description": "Metrics in text exposition format 0.0.4.",
+            "content": {"text/plain": {"schema": {"type": "string"}}},
+        }
+    },
+)
+def metrics():
+    """Return BFF metrics in the Prometheus text exposition format.
+
+    :returns: Plain-text metrics page.
+    :rtype: flask.Response
+    """
+    return Response(get_metrics().render(), content_type=PROMETHEUS_CONTENT_TYPE)
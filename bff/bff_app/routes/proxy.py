@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
+from typing import Callable
+
 import requests
-from flask import Response, current_app, request
+from flask import Response, current_app, jsonify, request
 from flask_smorest import Blueprint
 
+from bff_app.services.admission import ProxyOverloadedError, retry_after_header
 from bff_app.services.auth import (
     clear_session_token,
     get_session_token,
@@ -14,7 +18,41 @@ from bff_app.services.auth import (
     refresh_access_token,
     store_session_token,
 )
+from bff_app.services.batch import (
+    BatchItem,
+    BatchResult,
+    BatchValidationError,
+    encode_body,
+    parse_batch_items,
+    run_batch,
+)
+from bff_app.services.compression import (
+    get_response_compressor,
+    read_body_keeping_encoding,
+)
+from bff_app.services.http_cache import (
+    SHARED_SCOPE,
+    CachedResponse,
+    build_cached_response,
+    cache_key,
+    cached_response_headers,
+    private_scope,
+    revalidated,
+)
+from bff_app.services.resilience import CircuitOpenError
+from bff_app.services.routing import Upstream, get_route_table
+from bff_app.services.streaming import (
+    STREAM_EXCLUDED_RESPONSE_HEADERS,
+    SocketHandedOverResponse,
+    WebSocketHandshakeError,
+    client_socket,
+    is_event_stream,
+    open_upstream_websocket,
+    relay_event_stream,
+    relay_sockets,
+)
 from bff_app.services.token_cookies import TokenCookieTooLargeError
+from bff_app.services.tracing import get_tracer, propagation_headers
 
 proxy_bp = Blueprint(
     "proxy",
@@ -36,10 +74,55 @@ HOP_BY_HOP_REQUEST_HEADERS = {
 SENSITIVE_REQUEST_HEADERS = {
     "cookie",
 }
+# Headers describing the batch envelope itself or set by the BFF per sub-request.
+BATCH_ITEM_EXCLUDED_REQUEST_HEADERS = {
+    "authorization",
+    "content-length",
+    "content-type",
+    "host",
+}
+# Browser request headers that ask for an end-to-end exchange, bypassing the cache.
+CACHE_BYPASS_REQUEST_HEADERS = {
+    "if-match",
+    "if-modified-since",
+    "if-none-match",
+    "if-range",
+    "if-unmodified-since",
+    "range",
+}
+CACHE_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+COALESCED_METHODS = {"GET", "HEAD"}
+# Forwarded request headers that select a different upstream representation,
+# and therefore a different single-flight call. Authorization scopes calls to
+# one session.
+COALESCING_KEY_HEADERS = (
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "authorization",
+    "if-modified-since",
+    "if-none-match",
+    "range",
+)
+# Headers that cannot be replayed from inside a JSON batch response.
+BATCH_ITEM_EXCLUDED_RESPONSE_HEADERS = {
+    "access-control-allow-origin",
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+
 
+def _build_upstream_headers(
+    dropped_headers: frozenset[str] = frozenset(),
+) -> dict[str, str]:
+    """Filter incoming request headers before forwarding upstream.
 
-def _build_upstream_headers() -> dict[str, str]:
-    """Filter incoming request headers before forwarding upstream."""
+    :param dropped_headers: Lower-case headers the upstream must not receive.
+    """
     connection_header = request.headers.get("Connection", "")
     connection_scoped_headers = {
         header_name.strip().lower()
@@ -51,12 +134,17 @@ def _build_upstream_headers() -> dict[str, str]:
         | SENSITIVE_REQUEST_HEADERS
         | {"host"}
         | connection_scoped_headers
+        | dropped_headers
     )
-    return {
+    propagated_headers = propagation_headers()
+    excluded_headers |= {header_name.lower() for header_name in propagated_headers}
+    headers = {
         key: value
         for key, value in request.headers
         if key.lower() not in excluded_headers
     }
+    headers.update(propagated_headers)
+    return headers
 
 
 @proxy_bp.route(
@@ -79,7 +167,10 @@ def proxy_preflight(rest_of_url: str):
 )
 @proxy_bp.doc(
     summary="Proxy REST request",
-    description="Forward the incoming request to BACKEND_ENDPOINT with auth token passthrough.",
+    description=(
+        "Forward the incoming request to the PROXY_ROUTES service matching its "
+        "path, or to BACKEND_ENDPOINT, with auth token passthrough."
+    ),
     security=[{"sessionCookie": []}],
     responses={
         "200": {
@@ -88,14 +179,22 @@ def proxy_preflight(rest_of_url: str):
                 "*/*": {"schema": {"type": "string", "format": "binary"}},
             },
         },
+        "429": {"description": "Per-session request rate exceeded."},
         "502": {"description": "Upstream connection error."},
+        "503": {
+            "description": (
+                "Proxy overloaded or backend circuit open; "
+                "retry after Retry-After seconds."
+            )
+        },
     },
 )
 def proxy_request(rest_of_url: str):
     """Forward an incoming request to the configured backend API.
 
     :param rest_of_url:
-        Path segment appended to ``BACKEND_ENDPOINT`` to build the target URL.
+        Path appended to the endpoint of the matching ``PROXY_ROUTES`` entry,
+        or to ``BACKEND_ENDPOINT``, to build the target URL.
     :type rest_of_url: str
     :returns:
         Upstream response body/status/headers adapted for the frontend client.
@@ -108,11 +207,234 @@ def proxy_request(rest_of_url: str):
         - Retries once after token refresh when upstream returns
           ``401`` with ``invalid_token``.
         - Drops hop-by-hop and duplicate CORS headers from upstream response.
+        - Shares one upstream call between identical concurrent ``GET``/``HEAD``
+          requests of the same session.
+        - Serves ``GET`` responses from the response cache when enabled, and
+          revalidates stale entries upstream with ``If-None-Match``.
+        - Answers ``429`` when the browser session exceeds its token bucket and
+          ``503`` when no slot of the matched upstream frees up within the
+          queue timeout or its circuit breaker is open.
+        - Relays ``GET`` requests accepting ``text/event-stream`` chunk by chunk
+          while the upstream keeps the stream open, within the stream cap.
+        - Compresses eligible responses with the browser's preferred coding;
+          bodies the upstream already compressed are passed through unchanged.
     """
     current_app.logger.debug("Handling /proxy/api/request/%s", rest_of_url)
     settings = get_settings()
 
-    headers = _build_upstream_headers()
+    rate_limited_response = _enforce_session_rate_limit(rest_of_url)
+    if rate_limited_response is not None:
+        return rate_limited_response
+
+    upstream = get_route_table().match(rest_of_url)
+    if request.method == "GET" and "text/event-stream" in request.headers.get(
+        "Accept", ""
+    ):
+        return _proxy_event_stream(rest_of_url, upstream)
+
+    try:
+        with upstream.limiter.slot():
+            return _forward_to_backend(rest_of_url, upstream)
+    except ProxyOverloadedError:
+        current_app.logger.warning(
+            "Proxy overloaded for upstream %s; shedding request: %s",
+            upstream.name,
+            rest_of_url,
+        )
+        return Response(
+            "Service overloaded",
+            status=503,
+            headers={
+                "Retry-After": retry_after_header(settings.proxy_retry_after_seconds)
+            },
+        )
+
+
+def _proxy_event_stream(rest_of_url: str, upstream: Upstream) -> Response:
+    """Forward an event-stream request, holding a stream slot until it closes."""
+    stream_limiter = current_app.extensions["bff_stream_limiter"]
+    if not stream_limiter.acquire():
+        current_app.logger.warning(
+            "Stream limit reached; rejecting event stream: %s",
+            rest_of_url,
+        )
+        return _streams_exhausted_response()
+
+    try:
+        response = _forward_to_backend(rest_of_url, upstream, stream=True)
+    except BaseException:
+        stream_limiter.release()
+        raise
+    response.call_on_close(stream_limiter.release)
+    return response
+
+
+def _streams_exhausted_response() -> Response:
+    return Response(
+        "Too many open streams",
+        status=503,
+        headers={
+            "Retry-After": retry_after_header(get_settings().proxy_retry_after_seconds)
+        },
+    )
+
+
+def _enforce_session_rate_limit(path: str, cost: int = 1) -> Response | None:
+    """Return a ``429`` response when the session exceeds its token bucket.
+
+    :param cost: Number of upstream requests the browser request fans out to.
+    """
+    rate_limiter = current_app.extensions["bff_session_rate_limiter"]
+    if not rate_limiter.enabled:
+        return None
+
+    retry_after = rate_limiter.consume(_session_fairness_key(), cost)
+    if retry_after <= 0:
+        return None
+    current_app.logger.warning(
+        "Session rate limit exceeded for proxied request: %s",
+        path,
+    )
+    return Response(
+        "Too many requests",
+        status=429,
+        headers={"Retry-After": retry_after_header(retry_after)},
+    )
+
+
+def _session_fairness_key() -> bytes:
+    """Return a digest identifying the browser session for rate limiting."""
+    settings = get_settings()
+    session_marker = (
+        request.cookies.get(settings.session_id_cookie_name)
+        # Chunked v2 cookies share the "chunks-<n>" head, so hash every part.
+        or "".join(
+            request.cookies.get(name, "") for name in settings.token_cookie_names
+        )
+        or request.cookies.get(settings.legacy_token_cookie_names["access_token"])
+        or request.remote_addr
+        or ""
+    )
+    return hashlib.sha256(session_marker.encode("utf-8")).digest()
+
+
+def _cache_url(path: str, query_string: str) -> str:
+    """Return the cache identity of a backend path and raw query string."""
+    return f"{path.lstrip('/')}?{query_string}"
+
+
+def _response_cache_scope(rest_of_url: str, access_token: object) -> bytes | None:
+    """Return the cache tier scope for the current request, or ``None`` to bypass.
+
+    Paths under ``PROXY_CACHE_SHARED_PATHS`` use the shared tier and are sent
+    upstream without the session's access token; other ``GET`` requests of an
+    authenticated session use that session's private tier.
+    """
+    if (
+        request.method != "GET"
+        or not current_app.extensions["bff_response_cache"].enabled
+        or any(header in request.headers for header in CACHE_BYPASS_REQUEST_HEADERS)
+        or "no-store" in request.headers.get("Cache-Control", "")
+    ):
+        return None
+
+    path = rest_of_url.lstrip("/")
+    shared_paths = get_settings().proxy_cache_shared_paths
+    if any(path.startswith(prefix) for prefix in shared_paths):
+        return SHARED_SCOPE
+    if isinstance(access_token, str) and access_token:
+        return private_scope(access_token)
+    return None
+
+
+def _store_cached_response(
+    key: bytes,
+    status_code: int,
+    response_headers: list[tuple[str, str]],
+    body: bytes,
+    request_headers: dict[str, str],
+    revalidating: CachedResponse | None,
+    shared: bool,
+) -> CachedResponse | None:
+    """Store, refresh or drop the cache entry for a backend response."""
+    response_cache = current_app.extensions["bff_response_cache"]
+    now = response_cache.clock()
+    if revalidating is not None and status_code == 304:
+        entry = revalidated(revalidating, response_headers, now, shared)
+    else:
+        entry = build_cached_response(
+            status_code,
+            response_headers,
+            body,
+            request_headers,
+            now,
+            shared,
+            get_settings().proxy_cache_shared_ttl_seconds,
+        )
+    if entry is None:
+        response_cache.invalidate(key)
+    else:
+        response_cache.set(key, entry)
+    return entry
+
+
+def _invalidate_cached_url(path: str, url: str, access_token: object) -> None:
+    """Drop cached copies of ``url`` after a successful unsafe request."""
+    response_cache = current_app.extensions["bff_response_cache"]
+    if not response_cache.enabled:
+        return
+
+    scopes = [SHARED_SCOPE]
+    if isinstance(access_token, str) and access_token:
+        scopes.append(private_scope(access_token))
+    bare_url = _cache_url(path, "")
+    response_cache.invalidate(
+        *(
+            cache_key(scope, cache_url)
+            for scope in scopes
+            for cache_url in {url, bare_url}
+        )
+    )
+
+
+def _coalescing_key(
+    target_url: str,
+    headers: dict[str, str],
+    payload: bytes,
+) -> bytes | None:
+    """Return the single-flight key of the current request, or ``None`` to skip."""
+    if (
+        request.method not in COALESCED_METHODS
+        or not get_settings().proxy_coalesce_requests
+    ):
+        return None
+
+    normalized_headers = {key.lower(): value for key, value in headers.items()}
+    digest = hashlib.sha256()
+    for part in (
+        request.method,
+        target_url,
+        request.query_string.decode("latin-1"),
+        *(normalized_headers.get(name, "") for name in COALESCING_KEY_HEADERS),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(payload)
+    return digest.digest()
+
+
+def _forward_to_backend(
+    rest_of_url: str,
+    upstream: Upstream,
+    stream: bool = False,
+) -> Response:
+    """Forward the current request upstream, refreshing the token once if needed.
+
+    With ``stream``, event-stream responses are relayed as they arrive, the read
+    timeout becomes the stream idle timeout and caching and coalescing are
+    skipped.
+    """
+    headers = _build_upstream_headers(upstream.drop_request_headers)
     payload = request.get_data()
 
     has_token_cookie = has_session_token_cookie()
@@ -120,8 +442,19 @@ def proxy_request(rest_of_url: str):
     refreshed_token: dict[str, object] | None = None
 
     session_token = get_session_token()
+    access_token = session_token.get("access_token") if session_token else None
+    cache_scope = (
+        None if stream else _response_cache_scope(rest_of_url, access_token)
+    )
+    # A shared-tier response is served to every session, so it must not be
+    # produced with this session's credentials.
+    sends_access_token = upstream.forward_access_token and cache_scope != SHARED_SCOPE
+    if cache_scope == SHARED_SCOPE:
+        for name in [name for name in headers if name.lower() == "authorization"]:
+            del headers[name]
     if session_token and "access_token" in session_token:
-        headers["Authorization"] = f"Bearer {session_token['access_token']}"
+        if sends_access_token:
+            headers["Authorization"] = f"Bearer {session_token['access_token']}"
     else:
         if has_token_cookie:
             should_clear_token_cookies = True
@@ -130,24 +463,93 @@ def proxy_request(rest_of_url: str):
             rest_of_url,
         )
 
-    target_url = f"{settings.backend_endpoint.rstrip('/')}/{rest_of_url.lstrip('/')}"
+    target_url = upstream.target_url(rest_of_url)
 
-    def forward_request():
-        return requests.request(
+    response_cache = current_app.extensions["bff_response_cache"]
+    cache_url = _cache_url(rest_of_url, request.query_string.decode("latin-1"))
+    revalidating: CachedResponse | None = None
+    if cache_scope is not None:
+        cached = response_cache.get(cache_key(cache_scope, cache_url))
+        now = response_cache.clock()
+        if cached is not None and cached.matches(headers):
+            if cached.is_fresh(now):
+                response_cache.record("hit")
+                cached_response = Response(
+                    cached.body,
+                    cached.status_code,
+                    cached_response_headers(cached, now),
+                )
+                if should_clear_token_cookies:
+                    clear_session_token(cached_response)
+                return _compress_response(cached_response)
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+                revalidating = cached
+        response_cache.record("revalidation" if revalidating else "miss")
+
+    timeout = upstream.timeout
+    if stream:
+        timeout = (timeout[0], get_settings().proxy_stream_idle_timeout_seconds)
+
+    def send_request():
+        response = upstream.session.request(
             method=request.method,
             url=target_url,
             headers=headers,
             params=request.args,
             data=payload,
-            timeout=(
-                settings.backend_connect_timeout_seconds,
-                settings.backend_read_timeout_seconds,
-            ),
+            timeout=timeout,
             allow_redirects=False,
+            stream=True,
         )
+        if not stream:
+            read_body_keeping_encoding(response)
+        return response
+
+    attempts = 0
+
+    def forward_request():
+        nonlocal attempts
+        attempts += 1
+        with get_tracer().span(
+            "backend.request",
+            **{
+                "http.method": request.method,
+                "attempt": attempts,
+                "upstream": upstream.name,
+            },
+        ) as span:
+            headers.update(propagation_headers(span))
+            coalescing_key = (
+                None if stream else _coalescing_key(target_url, headers, payload)
+            )
+            if coalescing_key is None:
+                response = send_request()
+            else:
+                response = current_app.extensions["bff_single_flight"].do(
+                    coalescing_key,
+                    send_request,
+                )
+            if span is not None:
+                span.attributes["http.status_code"] = response.status_code
+            return response
 
     try:
         response = forward_request()
+    except CircuitOpenError as exc:
+        current_app.logger.warning(
+            "REST proxy failing fast for %s: %s",
+            rest_of_url,
+            exc,
+        )
+        failed_response = Response(
+            "Upstream unavailable",
+            status=503,
+            headers={"Retry-After": retry_after_header(exc.retry_after_seconds)},
+        )
+        if should_clear_token_cookies:
+            clear_session_token(failed_response)
+        return failed_response
     except requests.exceptions.RequestException as exc:
         current_app.logger.warning("REST proxy error for %s: %s", rest_of_url, exc)
         failed_response = Response("Upstream connection error", status=502)
@@ -156,10 +558,16 @@ def proxy_request(rest_of_url: str):
         return failed_response
 
     www_authenticate = response.headers.get("www-authenticate", "")
-    if response.status_code == 401 and "invalid_token" in www_authenticate:
+    if (
+        sends_access_token
+        and response.status_code == 401
+        and "invalid_token" in www_authenticate
+    ):
         refreshed_token = refresh_access_token()
         if refreshed_token and "access_token" in refreshed_token:
             headers["Authorization"] = f"Bearer {refreshed_token['access_token']}"
+            if stream:
+                response.close()
             try:
                 response = forward_request()
             except requests.exceptions.RequestException as exc:
@@ -184,8 +592,61 @@ def proxy_request(rest_of_url: str):
         if k.lower() not in excluded_headers
     ]
 
-    proxied_response = Response(response.content, response.status_code, filtered_headers)
+    if stream and is_event_stream(response.headers):
+        proxied_response = Response(
+            relay_event_stream(response, current_app.logger, rest_of_url),
+            response.status_code,
+            [
+                (key, value)
+                for key, value in filtered_headers
+                if key.lower() not in STREAM_EXCLUDED_RESPONSE_HEADERS
+            ]
+            # Stop reverse proxies such as nginx from buffering the stream.
+            + [("X-Accel-Buffering", "no")],
+        )
+        finished_response = _finish_proxied_response(
+            proxied_response,
+            refreshed_token,
+            should_clear_token_cookies,
+        )
+        if finished_response is not proxied_response:
+            response.close()
+        return finished_response
+
+    status_code, body = response.status_code, response.content
+    if refreshed_token and "access_token" in refreshed_token:
+        access_token = refreshed_token["access_token"]
+        if cache_scope is not None:
+            cache_scope = _response_cache_scope(rest_of_url, access_token)
+    if cache_scope is not None:
+        entry = _store_cached_response(
+            cache_key(cache_scope, cache_url),
+            status_code,
+            filtered_headers,
+            body,
+            headers,
+            revalidating,
+            shared=cache_scope == SHARED_SCOPE,
+        )
+        if entry is not None and revalidating is not None and status_code == 304:
+            status_code, body = entry.status_code, entry.body
+            filtered_headers = cached_response_headers(entry, entry.stored_at)
+    elif request.method not in CACHE_SAFE_METHODS and status_code < 400:
+        _invalidate_cached_url(rest_of_url, cache_url, access_token)
+
+    return _finish_proxied_response(
+        Response(body, status_code, filtered_headers),
+        refreshed_token,
+        should_clear_token_cookies,
+    )
+
 
+def _finish_proxied_response(
+    proxied_response: Response,
+    refreshed_token: dict[str, object] | None,
+    should_clear_token_cookies: bool,
+) -> Response:
+    """Attach refreshed or cleared token cookies to a proxied response."""
     if refreshed_token:
         try:
             store_session_token(proxied_response, refreshed_token)
@@ -202,4 +663,404 @@ def proxy_request(rest_of_url: str):
     if should_clear_token_cookies:
         clear_session_token(proxied_response)
 
-    return proxied_response
+    return _compress_response(proxied_response)
+
+
+def _compress_response(response: Response) -> Response:
+    """Compress ``response`` as negotiated with the browser's ``Accept-Encoding``."""
+    return get_response_compressor().compress(
+        response,
+        request.headers.get("Accept-Encoding"),
+        request.method,
+    )
+
+
+@proxy_bp.route("/proxy/api/ws/<path:rest_of_url>", methods=["GET"], websocket=True)
+@proxy_bp.doc(
+    summary="Relay a WebSocket",
+    description=(
+        "Upgrade to a WebSocket relayed to the PROXY_ROUTES service matching the "
+        "path, or to BACKEND_ENDPOINT, authenticated with the session's access "
+        "token."
+    ),
+    security=[{"sessionCookie": []}],
+    responses={
+        "101": {"description": "Switching protocols; frames are relayed as is."},
+        "400": {"description": "Not a WebSocket upgrade request."},
+        "401": {"description": "No valid session token."},
+        "429": {"description": "Per-session request rate exceeded."},
+        "501": {"description": "The WSGI server cannot hand over the connection."},
+        "502": {"description": "Upstream connection error."},
+        "503": {
+            "description": "Too many open streams; retry after Retry-After seconds."
+        },
+    },
+)
+def proxy_websocket(rest_of_url: str):
+    """Relay a browser WebSocket to the backend service owning the path.
+
+    :param rest_of_url:
+        Path appended to the endpoint of the matching ``PROXY_ROUTES`` entry,
+        or to ``BACKEND_ENDPOINT``.
+    :returns:
+        Upstream error status, or a response telling the WSGI server that the
+        connection was handed over once the relay ends.
+    :rtype: flask.Response
+
+    Behavior:
+        - Sends the upgrade to the upstream with the bearer access token from
+          the encrypted auth cookies and relays its ``101`` answer unchanged.
+        - Copies frames both ways until either side closes or both stay idle
+          for ``PROXY_STREAM_IDLE_TIMEOUT_SECONDS``.
+        - Expired tokens are not refreshed here; the upstream's ``401`` is
+          returned so the frontend refreshes through a regular request.
+    """
+    current_app.logger.debug("Handling /proxy/api/ws/%s", rest_of_url)
+    settings = get_settings()
+
+    sock = client_socket(request.environ)
+    if sock is None:
+        return Response("WebSocket relay not supported by this server", status=501)
+
+    session_token = get_session_token()
+    access_token = session_token.get("access_token") if session_token else None
+    if not isinstance(access_token, str):
+        unauthorized_response = Response("Unauthorized", status=401)
+        if has_session_token_cookie():
+            clear_session_token(unauthorized_response)
+        return unauthorized_response
+
+    rate_limited_response = _enforce_session_rate_limit(rest_of_url)
+    if rate_limited_response is not None:
+        return rate_limited_response
+
+    stream_limiter = current_app.extensions["bff_stream_limiter"]
+    if not stream_limiter.acquire():
+        current_app.logger.warning(
+            "Stream limit reached; rejecting WebSocket: %s",
+            rest_of_url,
+        )
+        return _streams_exhausted_response()
+
+    try:
+        upstream = get_route_table().match(rest_of_url)
+        headers = _build_upstream_headers(upstream.drop_request_headers)
+        if upstream.forward_access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        target_url = upstream.target_url(rest_of_url)
+        if request.query_string:
+            target_url = f"{target_url}?{request.query_string.decode('latin-1')}"
+        try:
+            upstream_sock, handshake_response = open_upstream_websocket(
+                target_url,
+                headers,
+                upstream.timeout,
+            )
+        except WebSocketHandshakeError as exc:
+            current_app.logger.warning(
+                "WebSocket upgrade refused for %s: %s",
+                rest_of_url,
+                exc,
+            )
+            return Response("WebSocket upgrade refused", status=exc.status_code)
+        except OSError as exc:
+            current_app.logger.warning(
+                "WebSocket proxy error for %s: %s",
+                rest_of_url,
+                exc,
+            )
+            return Response("Upstream connection error", status=502)
+
+        try:
+            sock.sendall(handshake_response)
+            relay_sockets(
+                sock,
+                upstream_sock,
+                settings.proxy_stream_idle_timeout_seconds,
+            )
+        except OSError as exc:
+            current_app.logger.info(
+                "WebSocket relay for %s ended: %s",
+                rest_of_url,
+                exc,
+            )
+        finally:
+            upstream_sock.close()
+    finally:
+        stream_limiter.release()
+    return SocketHandedOverResponse()
+
+
+@proxy_bp.route("/proxy/api/batch", methods=["POST"])
+@proxy_bp.doc(
+    summary="Batch proxied REST requests",
+    description=(
+        "Forward several requests to their PROXY_ROUTES service or "
+        "BACKEND_ENDPOINT concurrently and return their responses in one JSON "
+        "document, in request order."
+    ),
+    security=[{"sessionCookie": []}],
+    requestBody={
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "requests": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {"type": "string"},
+                                    "method": {
+                                        "type": "string",
+                                        "enum": [
+                                            "DELETE",
+                                            "GET",
+                                            "HEAD",
+                                            "PATCH",
+                                            "POST",
+                                            "PUT",
+                                        ],
+                                        "default": "GET",
+                                    },
+                                    "path": {"type": "string"},
+                                    "headers": {
+                                        "type": "object",
+                                        "additionalProperties": {"type": "string"},
+                                    },
+                                    "body": {"type": "string"},
+                                },
+                                "required": ["path"],
+                            },
+                        }
+                    },
+                    "required": ["requests"],
+                }
+            }
+        },
+    },
+    responses={
+        "200": {
+            "description": "Per-request status, headers and body.",
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "responses": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "id": {"type": "string"},
+                                        "status": {"type": "integer"},
+                                        "headers": {
+                                            "type": "object",
+                                            "additionalProperties": {
+                                                "type": "string"
+                                            },
+                                        },
+                                        "body": {"type": "string"},
+                                        "encoding": {
+                                            "type": "string",
+                                            "enum": ["utf-8", "base64"],
+                                        },
+                                    },
+                                    "required": [
+                                        "id",
+                                        "status",
+                                        "headers",
+                                        "body",
+                                        "encoding",
+                                    ],
+                                },
+                            }
+                        },
+                        "required": ["responses"],
+                    }
+                }
+            },
+        },
+        "400": {"description": "Malformed batch request."},
+        "401": {"description": "Refreshed token cookie exceeds size budget."},
+        "429": {"description": "Per-session request rate exceeded."},
+    },
+)
+def proxy_batch():
+    """Forward a batch of sub-requests to the backend concurrently.
+
+    :returns:
+        ``{"responses": [...]}`` with one entry per sub-request, in order.
+    :rtype: flask.Response
+
+    Behavior:
+        - Loads the session token once and reuses it for every sub-request.
+        - Sends at most ``PROXY_BATCH_MAX_CONCURRENCY`` sub-requests at a time,
+          each routed like ``/proxy/api/request`` and holding a slot of its
+          upstream's concurrency limit.
+        - Refreshes the access token at most once for the whole batch and
+          resends only the sub-requests rejected with ``invalid_token``.
+        - Charges one token of the session rate limit per sub-request.
+        - Reports upstream failures per sub-request as ``502``/``503`` entries.
+    """
+    current_app.logger.debug("Handling /proxy/api/batch")
+    settings = get_settings()
+
+    try:
+        items = parse_batch_items(
+            request.get_json(silent=True),
+            settings.proxy_batch_max_requests,
+        )
+    except BatchValidationError as exc:
+        return jsonify({"message": str(exc)}), 400
+
+    # Each sub-request is an upstream request of its own.
+    rate_limited_response = _enforce_session_rate_limit("batch", cost=len(items))
+    if rate_limited_response is not None:
+        return rate_limited_response
+
+    has_token_cookie = has_session_token_cookie()
+    should_clear_token_cookies = False
+    refreshed_token: dict[str, object] | None = None
+
+    session_token = get_session_token()
+    access_token = session_token.get("access_token") if session_token else None
+    if not isinstance(access_token, str):
+        access_token = None
+        should_clear_token_cookies = has_token_cookie
+        current_app.logger.warning(
+            "Access token missing in auth cookies for batch request"
+        )
+
+    executor = current_app.extensions["bff_batch_executor"]
+    results = run_batch(
+        items,
+        _build_batch_sender(access_token),
+        executor,
+        settings.proxy_batch_max_concurrency,
+    )
+
+    rejected_indexes = [
+        index for index, result in enumerate(results) if result.token_rejected
+    ]
+    if rejected_indexes:
+        refreshed_token = refresh_access_token()
+        if refreshed_token and "access_token" in refreshed_token:
+            retried_results = run_batch(
+                [items[index] for index in rejected_indexes],
+                _build_batch_sender(str(refreshed_token["access_token"])),
+                executor,
+                settings.proxy_batch_max_concurrency,
+            )
+            for index, result in zip(rejected_indexes, retried_results):
+                results[index] = result
+        else:
+            should_clear_token_cookies = has_token_cookie
+
+    final_access_token = (
+        refreshed_token["access_token"]
+        if refreshed_token and "access_token" in refreshed_token
+        else access_token
+    )
+    for item, result in zip(items, results):
+        if item.method not in CACHE_SAFE_METHODS and result.status < 400:
+            path, _, query_string = item.path.partition("?")
+            _invalidate_cached_url(
+                path,
+                _cache_url(path, query_string),
+                final_access_token,
+            )
+
+    batch_response = jsonify({"responses": [result.to_dict() for result in results]})
+
+    if refreshed_token:
+        try:
+            store_session_token(batch_response, refreshed_token)
+        except TokenCookieTooLargeError as exc:
+            current_app.logger.warning(
+                "Refreshed token cookie %s exceeds browser size budget (%s bytes)",
+                exc.cookie_name,
+                exc.cookie_size_bytes,
+            )
+            unauthorized_response = Response("Unauthorized", status=401)
+            clear_session_token(unauthorized_response)
+            return unauthorized_response
+
+    if should_clear_token_cookies:
+        clear_session_token(batch_response)
+
+    return _compress_response(batch_response)
+
+
+def _build_batch_sender(
+    access_token: str | None,
+) -> Callable[[BatchItem], BatchResult]:
+    """Bind request-scoped state into a sub-request sender safe to run on threads."""
+    route_table = get_route_table()
+    logger = current_app.logger
+    base_headers = {
+        key: value
+        for key, value in _build_upstream_headers().items()
+        if key.lower() not in BATCH_ITEM_EXCLUDED_REQUEST_HEADERS
+    }
+    excluded_item_headers = (
+        HOP_BY_HOP_REQUEST_HEADERS
+        | SENSITIVE_REQUEST_HEADERS
+        | BATCH_ITEM_EXCLUDED_REQUEST_HEADERS
+    ) - {"content-type"}
+
+    def send(item: BatchItem) -> BatchResult:
+        upstream = route_table.match(item.path.partition("?")[0])
+        headers = {
+            key: value
+            for key, value in base_headers.items()
+            if key.lower() not in upstream.drop_request_headers
+        }
+        headers.update(
+            (key, value)
+            for key, value in item.headers.items()
+            if key.lower() not in excluded_item_headers | upstream.drop_request_headers
+        )
+        if access_token and upstream.forward_access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+
+        try:
+            with upstream.limiter.slot():
+                response = upstream.session.request(
+                    method=item.method,
+                    url=upstream.target_url(item.path),
+                    headers=headers,
+                    data=item.body.encode("utf-8") if item.body is not None else None,
+                    timeout=upstream.timeout,
+                    allow_redirects=False,
+                )
+        except ProxyOverloadedError:
+            return BatchResult(id=item.id, status=503, body="Service overloaded")
+        except CircuitOpenError:
+            return BatchResult(id=item.id, status=503, body="Upstream unavailable")
+        except requests.exceptions.RequestException as exc:
+            logger.warning("Batch proxy error for %s: %s", item.path, exc)
+            return BatchResult(id=item.id, status=502, body="Upstream connection error")
+
+        www_authenticate = response.headers.get("www-authenticate", "")
+        body, encoding = encode_body(response.content)
+        return BatchResult(
+            id=item.id,
+            status=response.status_code,
+            headers={
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in BATCH_ITEM_EXCLUDED_RESPONSE_HEADERS
+            },
+            body=body,
+            encoding=encoding,
+            token_rejected=(
+                upstream.forward_access_token
+                and response.status_code == 401
+                and "invalid_token" in www_authenticate
+            ),
+        )
+
+    return send
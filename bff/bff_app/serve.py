@@ -0,0 +1,121 @@
+"""Production entrypoint for the Backend-for-Frontend service.
+
+Runs the Flask application under gunicorn's pre-fork arbiter. The app is
+built once in the master process, so settings, the token cookie cipher and
+the compiled route table are shared copy-on-write by every worker, and
+workers are recycled after ``SERVE_MAX_REQUESTS`` requests. Workers are
+``gthread`` (a thread pool per process) by default, or ``gevent``.
+
+Requires the ``serve`` extra, plus ``async`` for gevent workers::
+
+    uv sync --extra serve
+    uv run python -m bff_app.serve
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+import dotenv
+from flask import Flask
+
+from bff_app import create_app
+from bff_app.settings import (
+    ServeSettings,
+    load_serve_settings_from_env,
+    load_settings_from_env,
+)
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError as exc:  # pragma: no cover - depends on installed extras
+    raise RuntimeError(
+        "bff_app.serve requires the 'gunicorn' package; install the BFF 'serve' "
+        "extra"
+    ) from exc
+
+
+class BffServer(BaseApplication):
+    """Gunicorn application serving an already built Flask app.
+
+    :param app: Application loaded in the master process before forking.
+    :param options: Gunicorn settings, see :func:`gunicorn_options`.
+    """
+
+    def __init__(self, app: Flask, options: dict[str, Any]) -> None:
+        self.application = app
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for name, value in self.options.items():
+            self.cfg.set(name, value)
+
+    def load(self) -> Flask:
+        return self.application
+
+
+def gunicorn_options(serve_settings: ServeSettings) -> dict[str, Any]:
+    """Map :class:`ServeSettings` to gunicorn settings.
+
+    :param serve_settings: Resolved server settings.
+    :returns: Gunicorn setting values keyed by setting name.
+    :rtype: dict[str, Any]
+    """
+    return {
+        "bind": f"{serve_settings.host}:{serve_settings.port}",
+        "worker_class": serve_settings.worker_class,
+        "workers": serve_settings.workers,
+        "threads": serve_settings.threads,
+        "worker_connections": serve_settings.worker_connections,
+        "max_requests": serve_settings.max_requests,
+        "max_requests_jitter": serve_settings.max_requests_jitter,
+        "keepalive": serve_settings.keepalive_seconds,
+        "backlog": serve_settings.backlog,
+        "timeout": serve_settings.timeout_seconds,
+        "graceful_timeout": serve_settings.graceful_timeout_seconds,
+        "preload_app": True,
+    }
+
+
+def _restart_with_gevent_patches() -> None:
+    """Re-execute this module with the standard library patched by gevent.
+
+    ``requests`` and ``ssl`` are already imported here, and the app is built
+    before forking, so patching inside each gevent worker would come too late.
+    """
+    try:
+        from gevent import monkey
+    except ImportError as exc:
+        raise RuntimeError(
+            "SERVE_WORKER_CLASS=gevent requires the 'gevent' package; install the "
+            "BFF 'async' extra"
+        ) from exc
+    if monkey.is_module_patched("socket"):
+        return
+    arguments = ["-m", "gevent.monkey", "--module", "bff_app.serve", *sys.argv[1:]]
+    os.execv(sys.executable, [sys.executable, *arguments])
+
+
+def main() -> None:
+    """Serve the app with the settings read from the environment."""
+    dotenv.load_dotenv()
+    serve_settings = load_serve_settings_from_env()
+    if serve_settings.worker_class == "gevent":
+        _restart_with_gevent_patches()
+
+    app = create_app(settings=load_settings_from_env())
+    app.logger.info(
+        "Serving BFF on %s:%s with %s %s workers",
+        serve_settings.host,
+        serve_settings.port,
+        serve_settings.workers,
+        serve_settings.worker_class,
+    )
+    BffServer(app, gunicorn_options(serve_settings)).run()
+
+
+if __name__ == "__main__":
+    main()
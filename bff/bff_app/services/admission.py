@@ -0,0 +1,179 @@
+"""Admission control for proxied requests: concurrency limits and fairness."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class ProxyOverloadedError(Exception):
+    """Raised when a request cannot get an upstream slot in time."""
+
+
+class ConcurrencyLimiter:
+    """Bound concurrent upstream calls with a bounded FIFO-ish wait queue.
+
+    Requests beyond ``max_in_flight`` wait for a free slot. At most
+    ``max_queue`` requests wait at once; further requests, and waiters that do
+    not get a slot within ``queue_timeout_seconds``, are shed immediately.
+
+    :param max_in_flight: Maximum concurrent upstream calls. ``0`` disables the limit.
+    :param max_queue: Maximum number of requests waiting for a slot.
+    :param queue_timeout_seconds: Longest time a request waits for a slot.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+    ) -> None:
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the limiter bounds concurrency at all."""
+        return self._max_in_flight > 0
+
+    def acquire(self) -> bool:
+        """Take an upstream slot, waiting in the queue if needed.
+
+        :returns: ``True`` when a slot was taken, ``False`` when the request is shed.
+        """
+        if not self.enabled:
+            return True
+
+        with self._condition:
+            if self.in_flight < self._max_in_flight and self.waiting == 0:
+                self.in_flight += 1
+                return True
+            if self.waiting >= self._max_queue:
+                self.rejected += 1
+                return False
+
+            self.waiting += 1
+            try:
+                has_slot = self._condition.wait_for(
+                    lambda: self.in_flight < self._max_in_flight,
+                    timeout=self._queue_timeout_seconds,
+                )
+            finally:
+                self.waiting -= 1
+            if not has_slot:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Return a slot taken with :meth:`acquire`."""
+        if not self.enabled:
+            return
+
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold an upstream slot for the duration of the ``with`` block.
+
+        :raises ProxyOverloadedError: If no slot is available in time.
+        """
+        if not self.acquire():
+            raise ProxyOverloadedError("Upstream concurrency limit reached")
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of in-flight, waiting and rejected counters."""
+        with self._condition:
+            return {
+                "max_in_flight": self._max_in_flight,
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "rejected": self.rejected,
+            }
+
+
+class SessionRateLimiter:
+    """Per-session token buckets bounding how fast one browser can proxy.
+
+    Each session key owns a bucket of ``burst`` tokens refilled at
+    ``rate_per_second``. Buckets live in an LRU bounded by ``max_sessions``.
+
+    :param rate_per_second: Token refill rate per session.
+    :param burst: Bucket capacity. ``0`` disables rate limiting.
+    :param max_sessions: Maximum number of tracked buckets.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        max_sessions: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate_per_second = rate_per_second
+        self._burst = burst
+        self._max_sessions = max_sessions
+        self._clock = clock
+        self._buckets: OrderedDict[bytes, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether per-session rate limiting is active."""
+        return self._burst > 0
+
+    def consume(self, session_key: bytes, cost: int = 1) -> float:
+        """Take ``cost`` tokens from the bucket of ``session_key``.
+
+        A cost above the bucket capacity is admitted once the bucket is full
+        and leaves it in debt, so the tokens it spent are still paid back
+        before the next request.
+
+        :param cost: Number of upstream requests being admitted.
+        :returns: ``0.0`` when the request may proceed, otherwise the number of
+            seconds until enough tokens become available.
+        :rtype: float
+        """
+        if not self.enabled:
+            return 0.0
+
+        required = min(cost, self._burst)
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(session_key, (self._burst, now))
+            tokens = min(
+                self._burst,
+                tokens + (now - updated_at) * self._rate_per_second,
+            )
+            if tokens >= required:
+                self._buckets[session_key] = (tokens - cost, now)
+                retry_after = 0.0
+            else:
+                self._buckets[session_key] = (tokens, now)
+                retry_after = (required - tokens) / self._rate_per_second
+            self._buckets.move_to_end(session_key)
+            while len(self._buckets) > self._max_sessions:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+def retry_after_header(seconds: float) -> str:
+    """Format a ``Retry-After`` value as whole seconds, at least ``1``."""
+    return str(max(1, math.ceil(seconds)))
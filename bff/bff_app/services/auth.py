@@ -5,16 +5,30 @@ from __future__ import annotations
 from typing import Any, Mapping
 
 import requests
-from flask import current_app, request
+from flask import current_app, g, request
 
+from bff_app.services.metrics import get_metrics
 from bff_app.services.token_cookies import (
+    TokenCookieTooLargeError,
     clear_token_cookies,
     has_any_token_cookie,
     load_token_from_cookies,
     set_token_cookies,
 )
+from bff_app.services.token_store import (
+    TokenStore,
+    delete_token,
+    load_token,
+    new_session_id,
+    save_token,
+)
+from bff_app.services.tracing import get_tracer
+from bff_app.services.upstream import get_upstream_session
+from bff_app.services.userinfo_cache import UserinfoCache
 from bff_app.settings import BffSettings
 
+_SESSION_TOKEN_NOT_LOADED = object()
+
 
 def get_settings() -> BffSettings:
     """Return resolved application settings from Flask extensions.
@@ -25,28 +39,156 @@ def get_settings() -> BffSettings:
     return current_app.extensions["bff_settings"]
 
 
-def store_session_token(response: Any, token: Mapping[str, Any]) -> None:
-    """Store OAuth token payload in encrypted HttpOnly cookies."""
+def get_userinfo_cache() -> UserinfoCache:
+    """Return the process-wide userinfo cache from Flask extensions.
+
+    :returns: Userinfo cache shared by all requests of this app.
+    :rtype: UserinfoCache
+    """
+    return current_app.extensions["bff_userinfo_cache"]
+
+
+def get_token_store() -> TokenStore | None:
+    """Return the server-side token store, or ``None`` in cookie mode.
+
+    :returns: Token store configured for this app.
+    :rtype: TokenStore | None
+    """
+    return current_app.extensions.get("bff_token_store")
+
+
+def store_session_token(
+    response: Any,
+    token: Mapping[str, Any],
+    rotate_session: bool = False,
+) -> None:
+    """Store OAuth token payload for the current browser session.
+
+    In cookie mode the payload is written to encrypted HttpOnly cookies. With a
+    server-side token store the payload is saved under an opaque session id
+    and only that id is sent to the browser.
+
+    :param rotate_session:
+        Issue a new session id even if the browser already has one. Used after
+        login to prevent session fixation.
+    """
     settings = get_settings()
-    set_token_cookies(response, token, settings)
+    store = get_token_store()
+    if store is None:
+        try:
+            set_token_cookies(
+                response,
+                token,
+                settings,
+                existing_cookies=request.cookies,
+            )
+        except TokenCookieTooLargeError:
+            get_metrics().token_cookie_too_large.inc()
+            raise
+        _remember_session_token(token)
+        return
+
+    session_id = request.cookies.get(settings.session_id_cookie_name)
+    is_new_session = rotate_session or not session_id
+    if is_new_session:
+        if session_id:
+            delete_token(store, session_id)
+        session_id = new_session_id()
+
+    save_token(store, session_id, token, settings)
+    _remember_session_token(token)
+
+    if is_new_session:
+        response.set_cookie(
+            settings.session_id_cookie_name,
+            session_id,
+            path=settings.session_cookie_path,
+            secure=settings.session_cookie_secure,
+            httponly=settings.session_cookie_httponly,
+            samesite=settings.session_cookie_samesite,
+        )
+    if has_any_token_cookie(request.cookies, settings):
+        clear_token_cookies(response, settings)
 
 
 def clear_session_token(response: Any) -> None:
-    """Clear all encrypted token cookies from the browser."""
+    """Clear the stored token payload and its browser cookies."""
     settings = get_settings()
-    clear_token_cookies(response, settings)
+    store = get_token_store()
+    # The request still carries the old cookies; later lookups in this
+    # request must not read them back.
+    _remember_session_token(None)
+    if store is None:
+        clear_token_cookies(response, settings)
+        return
+
+    session_id = request.cookies.get(settings.session_id_cookie_name)
+    if session_id:
+        delete_token(store, session_id)
+    response.delete_cookie(
+        settings.session_id_cookie_name,
+        path=settings.session_cookie_path,
+        secure=settings.session_cookie_secure,
+        httponly=settings.session_cookie_httponly,
+        samesite=settings.session_cookie_samesite,
+    )
+    if has_any_token_cookie(request.cookies, settings):
+        clear_token_cookies(response, settings)
 
 
 def has_session_token_cookie() -> bool:
-    """Return whether at least one auth token cookie is present."""
+    """Return whether at least one auth token or session id cookie is present."""
     settings = get_settings()
+    if (
+        get_token_store() is not None
+        and settings.session_id_cookie_name in request.cookies
+    ):
+        return True
     return has_any_token_cookie(request.cookies, settings)
 
 
 def get_session_token() -> dict[str, Any] | None:
-    """Return OAuth token payload from encrypted auth cookies."""
+    """Return OAuth token payload for the current browser session.
+
+    The payload comes from the server-side token store when the request carries
+    a session id cookie, and from the encrypted auth cookies otherwise. It is
+    memoized on :data:`flask.g`, so repeated calls within one request load it
+    only once, and kept in step by :func:`store_session_token` and
+    :func:`clear_session_token`. Callers receive a shallow copy and may mutate
+    it freely.
+    """
+    token = g.get("bff_session_token", _SESSION_TOKEN_NOT_LOADED)
+    if token is _SESSION_TOKEN_NOT_LOADED:
+        token = _load_session_token()
+        g.bff_session_token = token
+    return dict(token) if token is not None else None
+
+
+def _remember_session_token(token: Mapping[str, Any] | None) -> None:
+    g.bff_session_token = dict(token) if token is not None else None
+
+
+def _load_session_token() -> dict[str, Any] | None:
     settings = get_settings()
-    return load_token_from_cookies(request.cookies, settings)
+    store = get_token_store()
+    session_id = request.cookies.get(settings.session_id_cookie_name)
+    if store is not None and session_id:
+        source = "store"
+    elif has_any_token_cookie(request.cookies, settings):
+        source = "cookie"
+    else:
+        return None
+
+    with get_tracer().span("token.decode", source=source) as span:
+        if source == "store":
+            token = load_token(store, session_id, settings)
+        else:
+            token = load_token_from_cookies(request.cookies, settings)
+        if token is None:
+            get_metrics().token_decode_failures.inc(source=source)
+            if span is not None:
+                span.status = "error"
+    return token
 
 
 def refresh_access_token() -> dict[str, Any] | None:
@@ -56,16 +198,26 @@ def refresh_access_token() -> dict[str, Any] | None:
         Merged token payload when refresh succeeds, otherwise ``None``.
     :rtype: dict[str, Any] | None
     """
+    with get_tracer().span("token.refresh") as span:
+        refreshed_token = _refresh_access_token()
+        if span is not None and refreshed_token is None:
+            span.status = "error"
+    return refreshed_token
+
+
+def _refresh_access_token() -> dict[str, Any] | None:
     settings = get_settings()
 
     existing_token = get_session_token() or {}
     refresh_token = existing_token.get("refresh_token")
+    metrics = get_metrics()
     if not isinstance(refresh_token, str) or not refresh_token:
         current_app.logger.warning("Refresh token is missing from token cookies")
+        metrics.token_refresh.inc(outcome="missing_refresh_token")
         return None
 
     try:
-        response = requests.post(
+        response = get_upstream_session().post(
             settings.oauth_endpoint_token,
             data={
                 "grant_type": "refresh_token",
@@ -80,6 +232,7 @@ def refresh_access_token() -> dict[str, Any] | None:
         )
     except requests.exceptions.RequestException as exc:
         current_app.logger.warning("Refresh token request failed: %s", exc)
+        metrics.token_refresh.inc(outcome="upstream_error")
         return None
 
     if response.status_code != 200:
@@ -87,6 +240,7 @@ def refresh_access_token() -> dict[str, Any] | None:
             "Refresh token request rejected with status %s",
             response.status_code,
         )
+        metrics.token_refresh.inc(outcome="rejected")
         return None
 
     refreshed_payload = response.json()
@@ -95,8 +249,14 @@ def refresh_access_token() -> dict[str, Any] | None:
             "Refresh token response has unexpected type %s",
             type(refreshed_payload).__name__,
         )
+        metrics.token_refresh.inc(outcome="invalid_response")
         return None
 
+    previous_access_token = existing_token.get("access_token")
+    if isinstance(previous_access_token, str):
+        get_userinfo_cache().invalidate(previous_access_token)
+
     merged_token = dict(existing_token)
     merged_token.update(dict(refreshed_payload))
+    metrics.token_refresh.inc(outcome="success")
     return merged_token
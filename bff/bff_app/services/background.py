@@ -0,0 +1,200 @@
+"""Bounded background executor for fire-and-forget upstream calls."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable
+
+from flask import Flask, current_app
+
+logger = logging.getLogger(__name__)
+
+OutcomeCallback = Callable[[str, str], None]
+
+
+def _ignore_outcome(task_name: str, outcome: str) -> None:
+    return None
+
+
+class BackgroundExecutor:
+    """Run tasks on a small worker pool without making callers wait.
+
+    Tasks are queued up to ``max_queue``; beyond that they are rejected rather
+    than piling up in memory. Workers start on the first submission. Each task
+    outcome (``ok``, ``error``, ``rejected`` or ``dropped``) is reported to
+    ``on_outcome``.
+
+    :param max_workers: Worker threads. ``0`` runs tasks inline in the caller.
+    :param max_queue: Tasks allowed to wait for a free worker.
+    :param on_outcome: Called with the task name and its outcome.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        on_outcome: OutcomeCallback = _ignore_outcome,
+        thread_name_prefix: str = "bff-background",
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._on_outcome = on_outcome
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue[tuple[str, Callable[[], None]] | None] = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._threads: list[threading.Thread] = []
+        self._queued = 0
+        self._running = 0
+        self._closed = False
+
+    def submit(self, task_name: str, fn: Callable[[], None]) -> bool:
+        """Schedule ``fn`` and return immediately.
+
+        :param task_name: Low-cardinality name used in logs and metrics.
+        :returns: ``False`` if the task was rejected because the queue is full
+            or the executor is shutting down.
+        :rtype: bool
+        """
+        if self._max_workers == 0:
+            self._run(task_name, fn)
+            return True
+
+        with self._lock:
+            accepted = not self._closed and self._queued < self._max_queue
+            if accepted:
+                self._start_workers()
+                self._queued += 1
+                self._queue.put((task_name, fn))
+        if not accepted:
+            logger.warning("Background queue full; dropping %s task", task_name)
+            self._on_outcome(task_name, "rejected")
+        return accepted
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no task is queued or running.
+
+        :returns: ``True`` if the executor became idle within ``timeout``.
+        :rtype: bool
+        """
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: self._queued == 0 and self._running == 0,
+                timeout,
+            )
+
+    def shutdown(self, timeout: float) -> int:
+        """Stop accepting tasks and let queued ones finish for up to ``timeout``.
+
+        Tasks still queued after the timeout are discarded; running tasks are
+        left to finish on their daemon threads.
+
+        :returns: Number of discarded tasks.
+        :rtype: int
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            self._closed = True
+            workers = len(self._threads)
+
+        deadline = time.monotonic() + timeout
+        self.wait_idle(timeout)
+        dropped = self._discard_queued()
+        for _ in range(workers):
+            self._queue.put(None)
+        for thread in list(self._threads):
+            thread.join(max(deadline - time.monotonic(), 0))
+        if dropped:
+            logger.warning("Discarded %s background tasks on shutdown", dropped)
+        return dropped
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of queued and running task counts."""
+        with self._lock:
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "workers": len(self._threads),
+            }
+
+    def _start_workers(self) -> None:
+        while len(self._threads) < self._max_workers:
+            thread = threading.Thread(
+                target=self._work,
+                name=f"{self._thread_name_prefix}-{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            task_name, fn = item
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                self._run(task_name, fn)
+            finally:
+                with self._idle:
+                    self._running -= 1
+                    self._idle.notify_all()
+
+    def _discard_queued(self) -> int:
+        dropped = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                continue
+            dropped += 1
+            with self._idle:
+                self._queued -= 1
+                self._idle.notify_all()
+            self._on_outcome(item[0], "dropped")
+        return dropped
+
+    def _run(self, task_name: str, fn: Callable[[], None]) -> None:
+        try:
+            fn()
+        except Exception:
+            logger.exception("Background %s task failed", task_name)
+            self._on_outcome(task_name, "error")
+        else:
+            self._on_outcome(task_name, "ok")
+
+
+def get_background_executor() -> BackgroundExecutor:
+    """Return the app-wide background executor from Flask extensions.
+
+    :returns: Background executor of the current application.
+    :rtype: BackgroundExecutor
+    """
+    return current_app.extensions["bff_background_executor"]
+
+
+def submit_background(task_name: str, fn: Callable[[], None]) -> bool:
+    """Run ``fn`` in the background within the current app's context.
+
+    :param task_name: Low-cardinality name used in logs and metrics.
+    :returns: ``False`` if the task was rejected.
+    :rtype: bool
+    """
+    app: Flask = current_app._get_current_object()  # type: ignore[attr-defined]
+
+    def run_in_app_context() -> None:
+        with app.app_context():
+            fn()
+
+    return get_background_executor().submit(task_name, run_in_app_context)
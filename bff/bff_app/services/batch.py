@@ -0,0 +1,174 @@
+"""Parsing and concurrent fan-out of batched proxy sub-requests."""
+
+from __future__ import annotations
+
+import base64
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping
+
+BATCH_METHODS: tuple[str, ...] = ("DELETE", "GET", "HEAD", "PATCH", "POST", "PUT")
+
+
+class BatchValidationError(ValueError):
+    """Raised when a batch request body is malformed."""
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One sub-request of a batch.
+
+    :ivar id: Caller-chosen identifier echoed in the matching result.
+    :ivar method: HTTP method forwarded to the backend.
+    :ivar path: Backend path, relative to ``BACKEND_ENDPOINT``, with optional query.
+    :ivar headers: Extra request headers for this sub-request.
+    :ivar body: Optional text body forwarded as-is.
+    """
+
+    id: str
+    method: str
+    path: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    body: str | None = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one sub-request.
+
+    :ivar id: Identifier of the originating :class:`BatchItem`.
+    :ivar status: Upstream status code, or a BFF-generated ``502``/``503``.
+    :ivar headers: Response headers forwarded to the browser.
+    :ivar body: Response body, as text or base64 depending on ``encoding``.
+    :ivar encoding: ``utf-8`` for text bodies, ``base64`` for bodies that are
+        not valid UTF-8.
+    :ivar token_rejected:
+        Whether the backend rejected the access token with ``invalid_token``.
+    """
+
+    id: str
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    encoding: str = "utf-8"
+    token_rejected: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON representation sent to the browser."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "headers": self.headers,
+            "body": self.body,
+            "encoding": self.encoding,
+        }
+
+
+def encode_body(content: bytes) -> tuple[str, str]:
+    """Return ``content`` as JSON-safe text and the encoding used.
+
+    UTF-8 bodies are passed as text; anything else is base64-encoded so binary
+    and other-charset responses reach the browser unchanged.
+
+    :returns: ``(body, encoding)`` with ``encoding`` ``utf-8`` or ``base64``.
+    :rtype: tuple[str, str]
+    """
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def parse_batch_items(payload: Any, max_requests: int) -> list[BatchItem]:
+    """Validate a batch request body and build its sub-requests.
+
+    :param payload: Decoded JSON body, expected as ``{"requests": [...]}``.
+    :param max_requests: Maximum number of sub-requests in one batch.
+    :returns: Sub-requests in the order they were sent.
+    :rtype: list[BatchItem]
+    :raises BatchValidationError: If the body does not describe a valid batch.
+    """
+    raw_items = payload.get("requests") if isinstance(payload, Mapping) else None
+    if not isinstance(raw_items, list) or not raw_items:
+        raise BatchValidationError("Body must contain a non-empty 'requests' list")
+    if len(raw_items) > max_requests:
+        raise BatchValidationError(
+            f"A batch may contain at most {max_requests} requests"
+        )
+
+    items: list[BatchItem] = []
+    seen_ids: set[str] = set()
+    for index, raw_item in enumerate(raw_items):
+        if not isinstance(raw_item, Mapping):
+            raise BatchValidationError(f"Request {index} must be an object")
+
+        item_id = raw_item.get("id", str(index))
+        method = raw_item.get("method", "GET")
+        path = raw_item.get("path")
+        headers = raw_item.get("headers", {})
+        body = raw_item.get("body")
+        if not isinstance(item_id, str) or item_id in seen_ids:
+            raise BatchValidationError(f"Request {index} needs a unique string 'id'")
+        if not isinstance(method, str) or method.upper() not in BATCH_METHODS:
+            raise BatchValidationError(
+                f"Request {index} method must be one of {', '.join(BATCH_METHODS)}"
+            )
+        if not isinstance(path, str) or not path.strip("/"):
+            raise BatchValidationError(f"Request {index} needs a non-empty 'path'")
+        if not isinstance(headers, Mapping) or not all(
+            isinstance(key, str) and isinstance(value, str)
+            for key, value in headers.items()
+        ):
+            raise BatchValidationError(
+                f"Request {index} 'headers' must map strings to strings"
+            )
+        if body is not None and not isinstance(body, str):
+            raise BatchValidationError(f"Request {index} 'body' must be a string")
+
+        seen_ids.add(item_id)
+        items.append(
+            BatchItem(
+                id=item_id,
+                method=method.upper(),
+                path=path,
+                headers=dict(headers),
+                body=body,
+            )
+        )
+    return items
+
+
+def run_batch(
+    items: list[BatchItem],
+    send: Callable[[BatchItem], BatchResult],
+    executor: Executor,
+    max_concurrency: int,
+) -> list[BatchResult]:
+    """Send ``items`` concurrently, at most ``max_concurrency`` at a time.
+
+    ``send`` runs on executor threads and must not rely on the Flask request
+    context.
+
+    :returns: Results in the same order as ``items``.
+    :rtype: list[BatchResult]
+    """
+    results: list[BatchResult | None] = [None] * len(items)
+    pending = iter(enumerate(items))
+    pending_lock = threading.Lock()
+
+    def drain() -> None:
+        while True:
+            with pending_lock:
+                next_item = next(pending, None)
+            if next_item is None:
+                return
+            index, item = next_item
+            results[index] = send(item)
+
+    workers = [
+        executor.submit(drain) for _ in range(min(max_concurrency, len(items)))
+    ]
+    for worker in workers:
+        worker.result()
+    return results  # type: ignore[return-value]
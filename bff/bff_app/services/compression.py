@@ -0,0 +1,297 @@
+"""Negotiated gzip/brotli compression of proxied responses."""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+import requests
+import urllib3
+from flask import Response, current_app
+
+from bff_app.settings import BffSettings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on installed extras
+    brotli = None
+
+# Codings an upstream may apply that browsers decode themselves.
+IDENTITY_CODINGS = {"", "identity"}
+# Statuses whose responses carry no body, or a body describing a byte range.
+UNCOMPRESSED_STATUS_CODES = {204, 206, 304}
+
+
+def brotli_available() -> bool:
+    """Return whether the optional ``brotli`` package is installed."""
+    return brotli is not None
+
+
+def parse_accept_encoding(header: str | None) -> dict[str, float]:
+    """Parse an ``Accept-Encoding`` header into lower-case codings and q-values.
+
+    Malformed q-values count as ``0``, so the coding is not used.
+    """
+    accepted: dict[str, float] = {}
+    for item in (header or "").split(","):
+        coding, *parameters = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+def read_body_keeping_encoding(response: requests.Response) -> None:
+    """Load the body of a ``stream=True`` response without decoding it.
+
+    ``requests`` undoes any ``Content-Encoding`` when it reads ``content``; for
+    encoded responses the raw bytes are read instead, so an upstream-compressed
+    body reaches the browser exactly as the upstream sent it.
+
+    :raises requests.exceptions.ConnectionError: If reading the body fails.
+    """
+    encoding = response.headers.get("content-encoding", "").strip().lower()
+    raw = getattr(response, "raw", None)
+    if encoding in IDENTITY_CODINGS or raw is None:
+        response.content  # noqa: B018 - reads and releases the connection
+        return
+    try:
+        # requests has no switch to keep .content encoded; pre-filling it is
+        # what requests itself does once the body has been read.
+        response._content = raw.read(decode_content=False)
+    except urllib3.exceptions.HTTPError as exc:
+        raise requests.exceptions.ConnectionError(exc) from exc
+    finally:
+        response._content_consumed = True
+        response.close()
+
+
+class ResponseCompressor:
+    """Compresses eligible responses with the coding a browser prefers.
+
+    :param encodings: Codings the BFF may apply, most preferred first.
+    :param min_bytes: Smallest body worth compressing.
+    :param gzip_level: ``zlib`` level used for gzip, ``1`` to ``9``.
+    :param brotli_quality: Brotli quality, ``0`` to ``11``.
+    :param content_types: Compressible media types; entries ending in ``/``
+        match a whole top-level type and entries starting with ``+`` a suffix.
+    :param on_compressed: Optional callback receiving the coding, the original
+        size and the compressed size of each compressed response.
+    """
+
+    def __init__(
+        self,
+        encodings: Iterable[str],
+        min_bytes: int,
+        gzip_level: int,
+        brotli_quality: int,
+        content_types: Iterable[str],
+        on_compressed: Callable[[str, int, int], None] | None = None,
+    ) -> None:
+        self.encodings = tuple(
+            encoding
+            for encoding in encodings
+            if encoding != "br" or brotli_available()
+        )
+        self.min_bytes = min_bytes
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = tuple(content_types)
+        self._on_compressed = on_compressed
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Return the coding to apply for ``accept_encoding``, if any.
+
+        The highest q-value wins; ties go to the coding listed first in
+        ``encodings``. A ``*`` entry covers codings not listed explicitly.
+        """
+        accepted = parse_accept_encoding(accept_encoding)
+        best: str | None = None
+        best_quality = 0.0
+        for encoding in self.encodings:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def is_compressible(self, response: Response) -> bool:
+        """Return whether ``response`` may be compressed, ignoring its size."""
+        if response.status_code in UNCOMPRESSED_STATUS_CODES:
+            return False
+        headers = response.headers
+        encoding = headers.get("Content-Encoding", "").strip().lower()
+        if encoding not in IDENTITY_CODINGS:
+            return False
+        if "Content-Range" in headers:
+            return False
+        if "no-transform" in headers.get("Cache-Control", "").lower():
+            return False
+        media_type = response.mimetype or ""
+        return any(
+            media_type.startswith(content_type)
+            if content_type.endswith("/")
+            else media_type.endswith(content_type)
+            if content_type.startswith("+")
+            else media_type == content_type
+            for content_type in self.content_types
+        )
+
+    def compress(
+        self,
+        response: Response,
+        accept_encoding: str | None,
+        method: str = "GET",
+    ) -> Response:
+        """Compress ``response`` in place when the browser and content allow it.
+
+        Buffered bodies below ``min_bytes`` are left alone. Streamed bodies are
+        compressed chunk by chunk and flushed after every chunk, so nothing is
+        held back from the browser. Responses that could have been compressed
+        get ``Vary: Accept-Encoding`` either way.
+
+        :param response: Response about to be returned to the browser.
+        :param accept_encoding: The browser's ``Accept-Encoding`` header.
+        :param method: Request method; ``HEAD`` responses are left alone.
+        :returns: ``response``.
+        :rtype: flask.Response
+        """
+        if method == "HEAD" or not self.encodings:
+            return response
+        if not self.is_compressible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate(accept_encoding)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = self._compress_stream(
+                response.response,
+                self._compressor(encoding),
+                encoding,
+            )
+            response.headers.pop("Content-Length", None)
+        else:
+            body = response.get_data()
+            if len(body) < self.min_bytes:
+                return response
+            compressor = self._compressor(encoding)
+            compressed = compressor.process(body) + compressor.finish()
+            if len(compressed) >= len(body):
+                return response
+            response.set_data(compressed)
+            self._record(encoding, len(body), len(compressed))
+
+        response.headers["Content-Encoding"] = encoding
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            # The compressed body is a different byte sequence.
+            response.headers["ETag"] = f"W/{etag}"
+        return response
+
+    def _compressor(self, encoding: str) -> _Compressor:
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+    def _compress_stream(
+        self,
+        chunks: Iterable[bytes],
+        compressor: _Compressor,
+        encoding: str,
+    ) -> Iterator[bytes]:
+        original = compressed = 0
+        try:
+            for chunk in chunks:
+                if chunk:
+                    output = compressor.process(chunk) + compressor.flush()
+                    original += len(chunk)
+                    compressed += len(output)
+                    yield output
+            output = compressor.finish()
+            compressed += len(output)
+            yield output
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            self._record(encoding, original, compressed)
+
+    def _record(self, encoding: str, original: int, compressed: int) -> None:
+        if self._on_compressed is not None:
+            self._on_compressed(encoding, original, compressed)
+
+
+class _Compressor(Protocol):
+    def process(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits 16 + MAX_WBITS selects the gzip container.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor: Any = brotli.Compressor(quality=quality)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def build_response_compressor(
+    settings: BffSettings,
+    on_compressed: Callable[[str, int, int], None] | None = None,
+) -> ResponseCompressor:
+    """Build the proxy response compressor from settings.
+
+    ``br`` is dropped from ``PROXY_COMPRESSION_ENCODINGS`` when the ``brotli``
+    package is not installed.
+
+    :rtype: ResponseCompressor
+    """
+    return ResponseCompressor(
+        encodings=settings.proxy_compression_encodings,
+        min_bytes=settings.proxy_compression_min_bytes,
+        gzip_level=settings.proxy_compression_gzip_level,
+        brotli_quality=settings.proxy_compression_brotli_quality,
+        content_types=settings.proxy_compression_content_types,
+        on_compressed=on_compressed,
+    )
+
+
+def get_response_compressor() -> ResponseCompressor:
+    """Return the app-wide proxy response compressor from Flask extensions.
+
+    :returns: Response compressor of the current application.
+    :rtype: ResponseCompressor
+    """
+    return current_app.extensions["bff_response_compressor"]
@@ -0,0 +1,279 @@
+"""In-memory HTTP response cache for proxied backend GET requests."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable, Mapping
+
+SHARED_SCOPE = b"shared"
+PRIVATE_SCOPE_PREFIX = b"private:"
+# Headers refreshed from a 304 response, as listed by RFC 9111, section 4.3.4.
+REVALIDATION_UPDATED_HEADERS = frozenset(
+    {"cache-control", "date", "etag", "expires", "last-modified", "vary"}
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored backend response.
+
+    :ivar status_code: Upstream status code.
+    :ivar headers: Filtered response headers, in upstream order.
+    :ivar body: Response body.
+    :ivar etag: ``ETag`` used to revalidate a stale entry, if any.
+    :ivar vary: Request header values the response varies on.
+    :ivar stored_at: Clock value when the entry was stored or revalidated.
+    :ivar expires_at: Clock value after which the entry must be revalidated.
+    """
+
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+    etag: str | None
+    vary: tuple[tuple[str, str], ...]
+    stored_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        """Return the approximate number of bytes held by the entry."""
+        return len(self.body) + sum(
+            len(key) + len(value) for key, value in self.headers
+        )
+
+    def is_fresh(self, now: float) -> bool:
+        """Return whether the entry may be served without revalidation."""
+        return now < self.expires_at
+
+    def matches(self, request_headers: Mapping[str, str]) -> bool:
+        """Return whether ``request_headers`` select this entry under ``Vary``."""
+        normalized = {key.lower(): value for key, value in request_headers.items()}
+        return all(normalized.get(name, "") == value for name, value in self.vary)
+
+
+class ResponseCache:
+    """Thread-safe LRU response cache bounded by a byte budget.
+
+    :param max_bytes: Total size budget of cached entries. ``0`` disables caching.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self.clock = clock
+        self._entries: OrderedDict[bytes, CachedResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache stores any entries at all."""
+        return self._max_bytes > 0
+
+    def get(self, key: bytes) -> CachedResponse | None:
+        """Return the entry stored under ``key``, fresh or stale, or ``None``."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: bytes, entry: CachedResponse) -> None:
+        """Store ``entry`` under ``key``, evicting least recently used entries."""
+        if not self.enabled or entry.size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, *keys: bytes) -> None:
+        """Drop the entries stored under ``keys``."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._size -= entry.size
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup ``outcome``: ``hit``, ``miss`` or ``revalidation``."""
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "revalidation":
+                self.revalidations += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of cache size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "size_bytes": self._size,
+                "max_bytes": self._max_bytes,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+            }
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parse a ``Cache-Control`` header into lower-case directives."""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def cache_key(scope: bytes, url: str) -> bytes:
+    """Return the cache key of ``url`` within a tier ``scope``."""
+    return hashlib.sha256(scope + b"\0" + url.encode("utf-8")).digest()
+
+
+def private_scope(access_token: str) -> bytes:
+    """Return the private-tier scope of the session owning ``access_token``."""
+    digest = hashlib.sha256(access_token.encode("utf-8")).digest()
+    return PRIVATE_SCOPE_PREFIX + digest
+
+
+def build_cached_response(
+    status_code: int,
+    headers: Iterable[tuple[str, str]],
+    body: bytes,
+    request_headers: Mapping[str, str],
+    now: float,
+    shared: bool,
+    shared_default_ttl_seconds: float,
+) -> CachedResponse | None:
+    """Build a cache entry for a backend response, or ``None`` if not storable.
+
+    Only ``200`` responses without ``Set-Cookie``, ``no-store`` or ``Vary: *``
+    are stored. Shared-tier entries also refuse ``private`` responses and fall
+    back to ``shared_default_ttl_seconds`` without explicit freshness. Private
+    entries without ``max-age`` are kept only when an ``ETag`` allows
+    revalidating them.
+
+    :param request_headers: Headers sent upstream, used to record ``Vary`` values.
+    :param shared: Whether the response is stored in the shared tier.
+    """
+    header_list = list(headers)
+    lower_headers = {key.lower(): value for key, value in header_list}
+    cache_control = parse_cache_control(lower_headers.get("cache-control"))
+    vary_names = [
+        name.strip().lower()
+        for name in lower_headers.get("vary", "").split(",")
+        if name.strip()
+    ]
+    if (
+        status_code != 200
+        or "set-cookie" in lower_headers
+        or "no-store" in cache_control
+        or "*" in vary_names
+        or (shared and "private" in cache_control)
+    ):
+        return None
+
+    lifetime = _freshness_lifetime(cache_control, shared)
+    if lifetime is None:
+        lifetime = shared_default_ttl_seconds if shared else 0.0
+    etag = lower_headers.get("etag")
+    if lifetime <= 0 and etag is None:
+        return None
+
+    normalized_request_headers = {
+        key.lower(): value for key, value in request_headers.items()
+    }
+    return CachedResponse(
+        status_code=status_code,
+        headers=tuple(header_list),
+        body=body,
+        etag=etag,
+        vary=tuple(
+            (name, normalized_request_headers.get(name, "")) for name in vary_names
+        ),
+        stored_at=now,
+        expires_at=now + lifetime,
+    )
+
+
+def revalidated(
+    entry: CachedResponse,
+    not_modified_headers: Iterable[tuple[str, str]],
+    now: float,
+    shared: bool,
+) -> CachedResponse:
+    """Return ``entry`` refreshed with the headers of a ``304`` response."""
+    updates = {
+        key.lower(): (key, value)
+        for key, value in not_modified_headers
+        if key.lower() in REVALIDATION_UPDATED_HEADERS
+    }
+    headers = [
+        updates.pop(key.lower(), (key, value)) for key, value in entry.headers
+    ]
+    headers.extend(updates.values())
+    cache_control = parse_cache_control(
+        next((value for key, value in headers if key.lower() == "cache-control"), None)
+    )
+    lifetime = _freshness_lifetime(cache_control, shared) or 0.0
+    etag = next((value for key, value in headers if key.lower() == "etag"), entry.etag)
+    return replace(
+        entry,
+        headers=tuple(headers),
+        etag=etag,
+        stored_at=now,
+        expires_at=now + lifetime,
+    )
+
+
+def cached_response_headers(
+    entry: CachedResponse,
+    now: float,
+) -> list[tuple[str, str]]:
+    """Return the headers to send with ``entry``, including its ``Age``."""
+    headers = [(key, value) for key, value in entry.headers if key.lower() != "age"]
+    headers.append(("Age", str(int(max(now - entry.stored_at, 0)))))
+    return headers
+
+
+def _freshness_lifetime(
+    cache_control: Mapping[str, Any],
+    shared: bool,
+) -> float | None:
+    if "no-cache" in cache_control:
+        return 0.0
+    for directive in ("s-maxage", "max-age") if shared else ("max-age",):
+        try:
+            return max(float(cache_control[directive]), 0.0)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
@@ -0,0 +1,330 @@
+"""Dependency-free Prometheus metrics for the BFF.
+
+Metrics are plain in-process counters, gauges and histograms rendered in the
+Prometheus text exposition format (version 0.0.4). Each labelled series owns
+its own small lock, so concurrent requests only contend when they update the
+very same series.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Iterable, Iterator
+
+from flask import Flask, current_app, g, request
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _Series:
+    """One labelled time series of a metric."""
+
+    __slots__ = ("lock", "value", "bucket_counts", "sum")
+
+    def __init__(self, bucket_count: int = 0) -> None:
+        self.lock = threading.Lock()
+        self.value = 0.0
+        self.bucket_counts = [0] * bucket_count
+        self.sum = 0.0
+
+
+class _Metric(abc.ABC):
+    """Base class holding labelled series of one metric family."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._series: dict[tuple[str, ...], _Series] = {}
+        self._series_lock = threading.Lock()
+
+    def _get_series(self, labels: dict[str, str]) -> _Series:
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        series = self._series.get(key)
+        if series is None:
+            with self._series_lock:
+                series = self._series.setdefault(key, self._new_series())
+        return series
+
+    def _new_series(self) -> _Series:
+        return _Series()
+
+    def _label_text(self, key: tuple[str, ...], extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape_label(value)}"'
+            for name, value in zip(self.labelnames, key)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Yield exposition lines for every series of the metric."""
+
+    def render(self) -> Iterator[str]:
+        """Yield the ``HELP``/``TYPE`` header followed by all samples."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.metric_type}"
+        yield from self.samples()
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the series selected by ``labels`` by ``amount``."""
+        series = self._get_series(labels)
+        with series.lock:
+            series.value += amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value of the series selected by ``labels``."""
+        return self._get_series(labels).value
+
+    def samples(self) -> Iterator[str]:
+        for key, series in list(self._series.items()):
+            yield f"{self.name}{self._label_text(key)} {_format_value(series.value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    metric_type = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the series selected by ``labels`` by ``amount``."""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the series selected by ``labels`` to ``value``."""
+        series = self._get_series(labels)
+        with series.lock:
+            series.value = value
+
+
+class CallbackGauge(_Metric):
+    """Gauge whose series are sampled from a callback at render time.
+
+    :param callback: Returns ``(label values, value)`` pairs in ``labelnames`` order.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        labelnames: Iterable[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._callback = callback
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self._callback():
+            yield f"{self.name}{self._label_text(key)} {_format_value(value)}"
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed upper bucket bounds."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_series(self) -> _Series:
+        # One slot per bound plus the implicit +Inf bucket.
+        return _Series(bucket_count=len(self.buckets) + 1)
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record ``value`` in the series selected by ``labels``."""
+        series = self._get_series(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with series.lock:
+            series.bucket_counts[index] += 1
+            series.sum += value
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations of the series selected by ``labels``."""
+        return sum(self._get_series(labels).bucket_counts)
+
+    def samples(self) -> Iterator[str]:
+        for key, series in list(self._series.items()):
+            with series.lock:
+                bucket_counts = list(series.bucket_counts)
+                total = series.sum
+            cumulative = 0
+            for bound, bucket_count in zip(
+                (*self.buckets, math.inf),
+                bucket_counts,
+            ):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{self._label_text(key, le)} {cumulative}"
+            yield f"{self.name}_sum{self._label_text(key)} {_format_value(total)}"
+            yield f"{self.name}_count{self._label_text(key)} {cumulative}"
+
+
+class BffMetrics:
+    """All metrics exported by one BFF application.
+
+    :ivar requests_in_flight: Requests currently handled, by route.
+    :ivar request_duration: Request latency, by route, method and status.
+    :ivar upstream_duration: Upstream call latency, by target and outcome.
+    :ivar token_refresh: Token refresh attempts, by outcome.
+    :ivar token_decode_failures: Undecryptable session tokens, by source.
+    :ivar token_cookie_too_large: Tokens that did not fit the cookie budget.
+    :ivar background_tasks: Fire-and-forget tasks, by task and outcome.
+    :ivar compressed_responses: Proxied responses compressed, by encoding.
+    :ivar compression_bytes: Bytes before and after compression, by encoding.
+    """
+
+    def __init__(self) -> None:
+        self.requests_in_flight = Gauge(
+            "bff_http_requests_in_flight",
+            "HTTP requests currently being handled.",
+            ("route",),
+        )
+        self.request_duration = Histogram(
+            "bff_http_request_duration_seconds",
+            "HTTP request latency.",
+            ("route", "method", "status"),
+        )
+        self.upstream_duration = Histogram(
+            "bff_upstream_request_duration_seconds",
+            "Latency of each upstream call attempt.",
+            ("target", "outcome"),
+        )
+        self.token_refresh = Counter(
+            "bff_token_refresh_total",
+            "Access token refresh attempts.",
+            ("outcome",),
+        )
+        self.token_decode_failures = Counter(
+            "bff_token_decode_failures_total",
+            "Session tokens that could not be decrypted or decoded.",
+            ("source",),
+        )
+        self.token_cookie_too_large = Counter(
+            "bff_token_cookie_too_large_total",
+            "Token payloads rejected for exceeding the cookie size budget.",
+        )
+        self.background_tasks = Counter(
+            "bff_background_tasks_total",
+            "Fire-and-forget background tasks, by outcome.",
+            ("task", "outcome"),
+        )
+        self.compressed_responses = Counter(
+            "bff_proxy_compressed_responses_total",
+            "Proxied responses compressed by the BFF.",
+            ("encoding",),
+        )
+        self.compression_bytes = Counter(
+            "bff_proxy_compression_bytes_total",
+            "Body bytes of compressed responses, before (in) and after (out).",
+            ("encoding", "stage"),
+        )
+        self._metrics: list[_Metric] = [
+            self.requests_in_flight,
+            self.request_duration,
+            self.upstream_duration,
+            self.token_refresh,
+            self.token_decode_failures,
+            self.token_cookie_too_large,
+            self.background_tasks,
+            self.compressed_responses,
+            self.compression_bytes,
+        ]
+
+    def register(self, metric: _Metric) -> None:
+        """Add ``metric`` to the exported metrics, e.g. a :class:`CallbackGauge`."""
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = [line for metric in self._metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+def get_metrics() -> BffMetrics:
+    """Return the app-wide metrics from Flask extensions.
+
+    :returns: Metrics of the current application.
+    :rtype: BffMetrics
+    """
+    return current_app.extensions["bff_metrics"]
+
+
+def install_request_metrics(app: Flask, metrics: BffMetrics) -> None:
+    """Record in-flight gauges and latency histograms for every request.
+
+    Routes are labelled with their URL rule, not the concrete path, so label
+    cardinality stays bounded by the number of endpoints.
+    """
+
+    @app.before_request
+    def _start_request_timer() -> None:
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        g.bff_metrics_route = route
+        g.bff_metrics_started_at = time.perf_counter()
+        metrics.requests_in_flight.inc(route=route)
+
+    @app.after_request
+    def _observe_request(response):  # noqa: ANN001, ANN202
+        started_at = g.get("bff_metrics_started_at")
+        if started_at is not None:
+            metrics.request_duration.observe(
+                time.perf_counter() - started_at,
+                route=g.bff_metrics_route,
+                method=request.method,
+                status=str(response.status_code),
+            )
+        return response
+
+    @app.teardown_request
+    def _finish_request(exc: BaseException | None) -> None:
+        route = g.pop("bff_metrics_route", None)
+        if route is not None:
+            metrics.requests_in_flight.dec(route=route)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
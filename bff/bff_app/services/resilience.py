@@ -0,0 +1,325 @@
+"""Circuit breakers and retry budget guarding upstream HTTP calls."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+HALF_OPEN_RETRY_AFTER_SECONDS = 1.0
+
+AttemptCallback = Callable[[requests.PreparedRequest, str, float], None]
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream whose circuit breaker is open.
+
+    Subclasses :class:`requests.exceptions.ConnectionError` so existing
+    ``RequestException`` handlers treat it like any other upstream failure.
+
+    :param upstream: Origin (``scheme://host:port``) of the failing upstream.
+    :param retry_after_seconds: Time until the breaker lets a probe through.
+    """
+
+    def __init__(self, upstream: str, retry_after_seconds: float) -> None:
+        super().__init__(f"Circuit breaker open for {upstream}")
+        self.upstream = upstream
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one upstream.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects calls for ``reset_timeout_seconds``. It then lets a single probe
+    through (half-open); the probe's outcome closes or re-opens the breaker.
+
+    :param failure_threshold: Consecutive failures that open the breaker.
+        ``0`` disables the breaker.
+    :param reset_timeout_seconds: How long the breaker stays open.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = BREAKER_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the breaker ever opens."""
+        return self._failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving ``open`` to ``half_open`` when due."""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def allow(self) -> float:
+        """Ask whether a call may go upstream now.
+
+        :returns: ``0.0`` when the call may proceed, otherwise the number of
+            seconds until the breaker lets a probe through.
+        :rtype: float
+        """
+        if not self.enabled:
+            return 0.0
+
+        now = self._clock()
+        with self._lock:
+            state = self._current_state(now)
+            if state == BREAKER_CLOSED:
+                return 0.0
+            if state == BREAKER_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return 0.0
+            self.rejected += 1
+            # While a half-open probe runs, callers back off for a short beat.
+            return max(
+                self._opened_at + self._reset_timeout_seconds - now,
+                HALF_OPEN_RETRY_AFTER_SECONDS,
+            )
+
+    def record_success(self) -> None:
+        """Record a call that reached the upstream and close the breaker."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._state = BREAKER_CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker past the threshold."""
+        if not self.enabled:
+            return
+
+        now = self._clock()
+        with self._lock:
+            self._consecutive_failures += 1
+            if (
+                self._current_state(now) == BREAKER_HALF_OPEN
+                or self._consecutive_failures >= self._failure_threshold
+            ):
+                self._state = BREAKER_OPEN
+                self._opened_at = now
+            self._probe_in_flight = False
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the breaker state and counters."""
+        with self._lock:
+            return {
+                "state": self._current_state(self._clock()),
+                "consecutive_failures": self._consecutive_failures,
+                "rejected": self.rejected,
+            }
+
+    def _current_state(self, now: float) -> str:
+        if (
+            self._state == BREAKER_OPEN
+            and now - self._opened_at >= self._reset_timeout_seconds
+        ):
+            self._state = BREAKER_HALF_OPEN
+        return self._state
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by upstream origin.
+
+    :param failure_threshold: Passed to every :class:`CircuitBreaker`.
+    :param reset_timeout_seconds: Passed to every :class:`CircuitBreaker`.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, upstream: str) -> CircuitBreaker:
+        """Return the breaker for ``upstream``, creating it on first use."""
+        breaker = self._breakers.get(upstream)
+        if breaker is not None:
+            return breaker
+        with self._lock:
+            return self._breakers.setdefault(
+                upstream,
+                CircuitBreaker(
+                    failure_threshold=self._failure_threshold,
+                    reset_timeout_seconds=self._reset_timeout_seconds,
+                    clock=self._clock,
+                ),
+            )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return breaker snapshots keyed by upstream origin."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {upstream: breaker.stats() for upstream, breaker in breakers.items()}
+
+
+class RetryBudget:
+    """Token bucket capping retries to a fraction of upstream calls.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so retries stay bounded even when a whole upstream is failing.
+
+    :param ratio: Retries allowed per first attempt, e.g. ``0.1`` for 10%.
+    :param max_tokens: Bucket capacity, also the initial balance.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float = 10.0) -> None:
+        self._ratio = ratio
+        self._max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit the budget for one first attempt."""
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget.
+
+        :returns: ``True`` when the retry is allowed.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class ResilientHTTPAdapter(HTTPAdapter):
+    """HTTP adapter adding circuit breaking and budgeted connect retries.
+
+    Only connect-phase failures of idempotent requests are retried, with full
+    jitter exponential backoff, since the upstream never saw those requests.
+
+    :param breakers: Registry providing one breaker per upstream origin.
+    :param retry_budget: Budget shared by all upstreams of the session.
+    :param max_retries_per_call: Maximum retries of a single call.
+    :param backoff_seconds: Base delay of the exponential backoff.
+    :param on_attempt: Optional callback receiving each attempt's request,
+        outcome (``ok``, ``error`` or ``circuit_open``) and duration in seconds.
+    :param sleep: Sleep function, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        breakers: CircuitBreakerRegistry,
+        retry_budget: RetryBudget,
+        max_retries_per_call: int,
+        backoff_seconds: float,
+        on_attempt: AttemptCallback | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.breakers = breakers
+        self._retry_budget = retry_budget
+        self._max_retries_per_call = max_retries_per_call
+        self._backoff_seconds = backoff_seconds
+        self._on_attempt = on_attempt or _ignore_attempt
+        self._sleep = sleep
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send ``request`` through the upstream's breaker, retrying if allowed.
+
+        :raises CircuitOpenError: If the upstream's breaker is open.
+        """
+        parts = urlsplit(request.url)
+        upstream = f"{parts.scheme}://{parts.netloc}"
+        breaker = self.breakers.get(upstream)
+        self._retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            retry_after = breaker.allow()
+            if retry_after > 0:
+                self._on_attempt(request, "circuit_open", 0.0)
+                raise CircuitOpenError(upstream, retry_after)
+            started_at = time.perf_counter()
+            try:
+                response = super().send(request, **kwargs)
+            except requests.exceptions.RequestException as exc:
+                self._on_attempt(request, "error", time.perf_counter() - started_at)
+                breaker.record_failure()
+                if not self._should_retry(request, exc, attempt):
+                    raise
+                self._sleep(self._backoff_delay(attempt))
+                attempt += 1
+                continue
+            self._on_attempt(request, "ok", time.perf_counter() - started_at)
+            breaker.record_success()
+            return response
+
+    def _should_retry(
+        self,
+        request: requests.PreparedRequest,
+        exc: requests.exceptions.RequestException,
+        attempt: int,
+    ) -> bool:
+        return (
+            attempt < self._max_retries_per_call
+            and request.method in IDEMPOTENT_METHODS
+            and is_connect_failure(exc)
+            and self._retry_budget.withdraw()
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Full jitter keeps retries from many workers from arriving in waves.
+        return random.uniform(0, self._backoff_seconds * 2**attempt)
+
+
+def _ignore_attempt(
+    request: requests.PreparedRequest,
+    outcome: str,
+    duration_seconds: float,
+) -> None:
+    pass
+
+
+def is_connect_failure(exc: requests.exceptions.RequestException) -> bool:
+    """Return whether ``exc`` happened before the request reached the upstream."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(exc, requests.exceptions.ConnectionError):
+        return False
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
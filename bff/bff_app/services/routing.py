@@ -0,0 +1,180 @@
+"""Path-prefix routing of proxied requests to backend services."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterable
+
+import requests
+from flask import current_app
+
+from bff_app.services.admission import ConcurrencyLimiter
+from bff_app.services.metrics import BffMetrics
+from bff_app.services.resilience import CircuitBreakerRegistry
+from bff_app.services.upstream import build_upstream_session
+from bff_app.settings import BffSettings, ProxyRoute
+
+DEFAULT_UPSTREAM_NAME = "backend"
+
+
+@dataclass(frozen=True)
+class Upstream:
+    """A proxy destination with its own pool, timeouts and concurrency limit.
+
+    :ivar name: Route name, ``backend`` for ``BACKEND_ENDPOINT``.
+    :ivar endpoint: Base URL proxied paths are appended to.
+    :ivar stripped_prefix: Path prefix removed before appending, if any.
+    :ivar timeout: ``(connect, read)`` timeout of upstream calls.
+    :ivar session: Pooled HTTP session used for this upstream.
+    :ivar limiter: Concurrency limiter of this upstream.
+    :ivar forward_access_token: Whether the bearer token is forwarded.
+    :ivar drop_request_headers: Lower-case request headers never forwarded.
+    """
+
+    name: str
+    endpoint: str
+    stripped_prefix: str
+    timeout: tuple[float, float]
+    session: requests.Session
+    limiter: ConcurrencyLimiter
+    forward_access_token: bool = True
+    drop_request_headers: frozenset[str] = frozenset()
+
+    def target_url(self, path: str) -> str:
+        """Return the upstream URL of a proxied ``path``."""
+        path = path.lstrip("/")
+        if self.stripped_prefix:
+            path = path[len(self.stripped_prefix) :].lstrip("/")
+        return f"{self.endpoint.rstrip('/')}/{path}"
+
+
+class _TrieNode:
+    """One path segment of the route trie."""
+
+    __slots__ = ("children", "upstream")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.upstream: Upstream | None = None
+
+
+class RouteTable:
+    """Longest-prefix match of proxied paths to upstreams.
+
+    Prefixes are compiled once into a trie of path segments, so matching costs
+    one dictionary lookup per segment of the request path, regardless of the
+    number of routes.
+
+    :param default: Upstream serving paths that match no route.
+    :param routes: ``(prefix, upstream)`` pairs; prefixes have no outer slashes.
+    """
+
+    def __init__(
+        self,
+        default: Upstream,
+        routes: Iterable[tuple[str, Upstream]] = (),
+    ) -> None:
+        self.default = default
+        self._root = _TrieNode()
+        self._upstreams = [default]
+        for prefix, upstream in routes:
+            node = self._root
+            for segment in prefix.split("/"):
+                node = node.children.setdefault(segment, _TrieNode())
+            node.upstream = upstream
+            self._upstreams.append(upstream)
+
+    def match(self, path: str) -> Upstream:
+        """Return the upstream of the longest route prefix matching ``path``."""
+        node = self._root
+        matched = self.default
+        for segment in path.lstrip("/").split("/"):
+            next_node = node.children.get(segment)
+            if next_node is None:
+                break
+            node = next_node
+            if node.upstream is not None:
+                matched = node.upstream
+        return matched
+
+    def upstreams(self) -> list[Upstream]:
+        """Return every upstream, the default one first."""
+        return list(self._upstreams)
+
+
+def build_route_table(
+    settings: BffSettings,
+    default_session: requests.Session,
+    default_limiter: ConcurrencyLimiter,
+    breakers: CircuitBreakerRegistry,
+    metrics: BffMetrics | None = None,
+) -> RouteTable:
+    """Compile ``PROXY_ROUTES`` into a route table.
+
+    ``BACKEND_ENDPOINT`` keeps the app-wide upstream session and proxy limiter;
+    every configured route gets its own pool and limiter so a slow service
+    cannot starve the others.
+
+    :param settings: Resolved application settings.
+    :param default_session: Session used for ``BACKEND_ENDPOINT``.
+    :param default_limiter: Limiter used for ``BACKEND_ENDPOINT``.
+    :param breakers: Circuit breakers shared by all upstream sessions.
+    :param metrics: Optional metrics receiving upstream attempt latencies.
+    :rtype: RouteTable
+    """
+    default = Upstream(
+        name=DEFAULT_UPSTREAM_NAME,
+        endpoint=settings.backend_endpoint,
+        stripped_prefix="",
+        timeout=(
+            settings.backend_connect_timeout_seconds,
+            settings.backend_read_timeout_seconds,
+        ),
+        session=default_session,
+        limiter=default_limiter,
+    )
+    return RouteTable(
+        default,
+        (
+            (route.prefix, _build_route_upstream(route, settings, breakers, metrics))
+            for route in settings.proxy_routes
+        ),
+    )
+
+
+def get_route_table() -> RouteTable:
+    """Return the app-wide proxy route table from Flask extensions.
+
+    :returns: Route table of the current application.
+    :rtype: RouteTable
+    """
+    return current_app.extensions["bff_route_table"]
+
+
+def _build_route_upstream(
+    route: ProxyRoute,
+    settings: BffSettings,
+    breakers: CircuitBreakerRegistry,
+    metrics: BffMetrics | None,
+) -> Upstream:
+    return Upstream(
+        name=route.name,
+        endpoint=route.endpoint,
+        stripped_prefix=route.prefix if route.strip_prefix else "",
+        timeout=(
+            route.connect_timeout_seconds or settings.backend_connect_timeout_seconds,
+            route.read_timeout_seconds or settings.backend_read_timeout_seconds,
+        ),
+        session=build_upstream_session(
+            replace(settings, upstream_pool_maxsize=route.pool_maxsize),
+            breakers,
+            metrics,
+        ),
+        limiter=ConcurrencyLimiter(
+            max_in_flight=route.max_in_flight,
+            max_queue=route.max_queue,
+            queue_timeout_seconds=settings.proxy_queue_timeout_seconds,
+        ),
+        forward_access_token=route.forward_access_token,
+        drop_request_headers=frozenset(route.drop_request_headers),
+    )
@@ -0,0 +1,74 @@
+"""Single-flight coalescing of identical concurrent upstream calls."""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """State of one in-flight call shared by its leader and followers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller of a key (the leader) runs the function; callers arriving
+    while it runs (followers) wait for it and receive the same result or
+    exception. Nothing is kept once the call finishes, so results are never
+    stale.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[bytes, _Flight[T]] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    def do(self, key: bytes, fn: Callable[[], T]) -> T:
+        """Run ``fn`` for ``key`` or join the call already running for it.
+
+        :returns: Result of the leader's ``fn`` call.
+        :raises BaseException: Whatever the leader's ``fn`` call raised.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[return-value]
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of in-flight keys and leader/follower counters."""
+        with self._lock:
+            return {
+                "in_flight": len(self._flights),
+                "leaders": self.leaders,
+                "followers": self.followers,
+            }
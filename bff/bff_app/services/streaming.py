@@ -0,0 +1,193 @@
+"""Long-lived proxy streams: server-sent events and WebSocket relays."""
+
+from __future__ import annotations
+
+import errno
+import logging
+import selectors
+import socket
+import ssl
+from typing import Any, Iterator, Mapping
+from urllib.parse import urlsplit
+
+import requests
+from flask import Response
+
+# Environ key under which ``bff_async.py`` exposes the client socket; the
+# werkzeug development server and gunicorn use their own keys.
+CLIENT_SOCKET_ENVIRON_KEYS = ("bff.socket", "werkzeug.socket", "gunicorn.socket")
+EVENT_STREAM_CONTENT_TYPE = "text/event-stream"
+# Response headers that no longer describe the body once it is relayed chunk
+# by chunk, already decoded.
+STREAM_EXCLUDED_RESPONSE_HEADERS = {"content-encoding", "content-length"}
+MAX_HANDSHAKE_RESPONSE_BYTES = 16 * 1024
+RELAY_CHUNK_BYTES = 64 * 1024
+
+
+class WebSocketHandshakeError(Exception):
+    """Raised when an upstream does not accept a WebSocket upgrade.
+
+    :param status_code: Status answered by the upstream, ``502`` if unreadable.
+    """
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SocketHandedOverResponse(Response):
+    """Response returned once the client socket has been used by a relay.
+
+    The relay already wrote everything the client will receive, so the WSGI
+    server must not write a response of its own. Raising ``ECONNRESET`` makes
+    werkzeug, gevent and gunicorn drop the connection without logging an error.
+    """
+
+    def __call__(self, environ: Any, start_response: Any) -> Any:
+        raise ConnectionResetError(
+            errno.ECONNRESET,
+            "Client connection handed over to the WebSocket relay",
+        )
+
+
+def is_event_stream(headers: Mapping[str, str]) -> bool:
+    """Return whether upstream response ``headers`` announce an event stream."""
+    content_type = next(
+        (value for key, value in headers.items() if key.lower() == "content-type"),
+        "",
+    )
+    return content_type.split(";", 1)[0].strip().lower() == EVENT_STREAM_CONTENT_TYPE
+
+
+def relay_event_stream(
+    upstream_response: requests.Response,
+    logger: logging.Logger,
+    path: str,
+) -> Iterator[bytes]:
+    """Yield upstream body chunks as soon as they arrive.
+
+    The stream ends quietly when the upstream closes it or stays silent for
+    longer than the read timeout of the upstream call; the upstream response
+    is closed when the browser disconnects.
+    """
+    try:
+        for chunk in upstream_response.iter_content(chunk_size=None):
+            if chunk:
+                yield chunk
+    except requests.exceptions.RequestException as exc:
+        logger.info("Event stream for %s ended: %s", path, exc)
+    finally:
+        upstream_response.close()
+
+
+def client_socket(environ: Mapping[str, Any]) -> socket.socket | None:
+    """Return the raw client socket exposed by the WSGI server, if any."""
+    for key in CLIENT_SOCKET_ENVIRON_KEYS:
+        sock = environ.get(key)
+        if sock is not None:
+            return sock
+    return None
+
+
+def open_upstream_websocket(
+    url: str,
+    headers: Mapping[str, str],
+    timeout: tuple[float, float],
+) -> tuple[socket.socket, bytes]:
+    """Connect to ``url`` and send a WebSocket upgrade request.
+
+    The browser's ``Sec-WebSocket-*`` headers are forwarded as they are, so
+    the upstream's ``101`` answer can be relayed to the browser unchanged.
+
+    :param url: ``http(s)``/``ws(s)`` URL of the upstream WebSocket endpoint.
+    :param headers: Request headers, without ``Host``, ``Upgrade`` and ``Connection``.
+    :param timeout: ``(connect, read)`` timeout of the handshake.
+    :returns: The connected socket and the raw ``101`` response head, including
+        any bytes the upstream sent right after it.
+    :raises WebSocketHandshakeError: If the upstream refuses the upgrade.
+    :raises OSError: If the upstream cannot be reached.
+    """
+    parts = urlsplit(url)
+    secure = parts.scheme in ("https", "wss")
+    host = parts.hostname or ""
+    sock = socket.create_connection(
+        (host, parts.port or (443 if secure else 80)),
+        timeout=timeout[0],
+    )
+    try:
+        if secure:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        sock.settimeout(timeout[1])
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_lines = [
+            f"GET {target} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            *(f"{key}: {value}" for key, value in headers.items()),
+        ]
+        sock.sendall(("\r\n".join(request_lines) + "\r\n\r\n").encode("latin-1"))
+
+        response_head = b""
+        while b"\r\n\r\n" not in response_head:
+            chunk = sock.recv(4096)
+            if not chunk or len(response_head) > MAX_HANDSHAKE_RESPONSE_BYTES:
+                raise WebSocketHandshakeError(502, "Malformed upgrade response")
+            response_head += chunk
+
+        status_line = response_head.split(b"\r\n", 1)[0].split(b" ", 2)
+        try:
+            status_code = int(status_line[1])
+        except (IndexError, ValueError):
+            status_code = 502
+        if status_code != 101:
+            raise WebSocketHandshakeError(
+                status_code,
+                f"Upstream refused the upgrade with status {status_code}",
+            )
+        sock.settimeout(None)
+        return sock, response_head
+    except BaseException:
+        sock.close()
+        raise
+
+
+def relay_sockets(
+    client: socket.socket,
+    upstream: socket.socket,
+    idle_timeout_seconds: float,
+) -> None:
+    """Copy bytes both ways until either side closes or both stay idle.
+
+    Frames are relayed untouched, so pings, fragmentation and negotiated
+    extensions keep working end to end.
+    """
+    peers = {client: upstream, upstream: client}
+    with selectors.DefaultSelector() as selector:
+        selector.register(client, selectors.EVENT_READ)
+        selector.register(upstream, selectors.EVENT_READ)
+        while True:
+            events = selector.select(timeout=idle_timeout_seconds)
+            if not events:
+                return
+            for key, _ in events:
+                source: socket.socket = key.fileobj  # type: ignore[assignment]
+                try:
+                    data = _receive(source)
+                    if not data:
+                        return
+                    peers[source].sendall(data)
+                except OSError:
+                    return
+
+
+def _receive(sock: socket.socket) -> bytes:
+    data = sock.recv(RELAY_CHUNK_BYTES)
+    # TLS records may already be decrypted in the SSL buffer, where select()
+    # cannot see them.
+    if isinstance(sock, ssl.SSLSocket):
+        while data and sock.pending():
+            data += sock.recv(sock.pending())
+    return data
@@ -7,6 +7,8 @@ import binascii
 import json
 import os
 import warnings
+import zlib
+from functools import lru_cache
 from typing import Any, Mapping
 
 from cryptography.exceptions import InvalidTag
@@ -15,18 +17,15 @@ from flask import current_app
 from werkzeug.datastructures import MultiDict
 from werkzeug.http import dump_cookie
 
-from bff_app.settings import BffSettings
+from bff_app.settings import TOKEN_COOKIE_MAX_CHUNKS, BffSettings
 
-COOKIE_VERSION = 1
+COOKIE_VERSION = 2
+LEGACY_COOKIE_VERSION = 1
 COOKIE_NONCE_BYTES = 12
+COOKIE_COMPRESSION_LEVEL = 6
+COOKIE_CHUNK_MARKER = "chunks-"
 MAX_SET_COOKIE_BYTES = 4096
-
-TOKEN_COOKIE_SUFFIXES = {
-    "access_token": "at",
-    "refresh_token": "rt",
-    "id_token": "it",
-    "meta": "meta",
-}
+MAX_TOKEN_PAYLOAD_BYTES = 64 * 1024
 
 REQUIRED_TOKEN_FIELDS: tuple[str, ...] = (
     "access_token",
@@ -38,22 +37,35 @@ REQUIRED_TOKEN_FIELDS: tuple[str, ...] = (
 class TokenCookieTooLargeError(ValueError):
     """Raised when a token cookie exceeds the browser size budget."""
 
-    def __init__(self, cookie_name: str, cookie_size_bytes: int) -> None:
+    def __init__(
+        self,
+        cookie_name: str,
+        cookie_size_bytes: int,
+        max_size_bytes: int = MAX_SET_COOKIE_BYTES,
+    ) -> None:
         super().__init__(
             f"Cookie {cookie_name!r} is {cookie_size_bytes} bytes; max is "
-            f"{MAX_SET_COOKIE_BYTES} bytes"
+            f"{max_size_bytes} bytes"
         )
         self.cookie_name = cookie_name
         self.cookie_size_bytes = cookie_size_bytes
+        self.max_size_bytes = max_size_bytes
 
 
-def token_cookie_names(settings: BffSettings) -> dict[str, str]:
-    """Return concrete token-cookie names derived from session cookie prefix."""
-    prefix = settings.session_cookie_name
-    return {
-        field: f"{prefix}_{suffix}"
-        for field, suffix in TOKEN_COOKIE_SUFFIXES.items()
-    }
+def token_cookie_names(settings: BffSettings) -> tuple[str, ...]:
+    """Return the v2 token-cookie name followed by its chunk-cookie names."""
+    return settings.token_cookie_names
+
+
+@lru_cache(maxsize=8)
+def get_token_cipher(key: bytes) -> AESGCM:
+    """Return the shared AES-GCM cipher for ``key``.
+
+    ``AESGCM`` objects are stateless apart from the key, so one instance per key
+    is reused across requests and threads instead of being rebuilt for every
+    cookie component.
+    """
+    return AESGCM(key)
 
 
 def has_any_token_cookie(
@@ -61,16 +73,210 @@ def has_any_token_cookie(
     settings: BffSettings,
 ) -> bool:
     """Return whether any encrypted token cookie is present in the request."""
-    names = token_cookie_names(settings)
-    return any(name in cookies for name in names.values())
+    return any(name in cookies for name in settings.token_cookie_names) or any(
+        name in cookies for name in settings.legacy_token_cookie_names.values()
+    )
 
 
 def load_token_from_cookies(
     cookies: Mapping[str, str] | MultiDict[str, str],
     settings: BffSettings,
 ) -> dict[str, Any] | None:
-    """Load and decrypt full OAuth token payload from request cookies."""
+    """Load and decrypt full OAuth token payload from request cookies.
+
+    The v2 token cookie is preferred. Requests that only carry v1 per-field
+    cookies are still decoded so sessions survive the format rollout.
+    """
+    if token_cookie_names(settings)[0] in cookies:
+        return _load_token(cookies, settings)
+    return _load_legacy_token(cookies, settings)
+
+
+def set_token_cookies(
+    response: Any,
+    token: Mapping[str, Any],
+    settings: BffSettings,
+    existing_cookies: Mapping[str, str] | MultiDict[str, str] | None = None,
+) -> None:
+    """Encrypt and write OAuth token payload to the v2 token cookie.
+
+    The payload is serialized to JSON, deflate-compressed and encrypted into a
+    single AES-GCM blob. The blob is written to ``<SESSION_COOKIE_NAME>_tk``
+    when it fits in one ``Set-Cookie`` header; otherwise ``_tk`` holds a
+    ``chunks-<n>`` marker and the blob is split over ``_tk1`` .. ``_tk<n>``.
+
+    :param existing_cookies:
+        Cookies sent with the current request. Token cookies found there that
+        are not rewritten (v1 cookies, stale chunks) are deleted.
+    :raises ValueError: If a required token field is missing.
+    :raises TokenCookieTooLargeError:
+        If the blob needs more than ``TOKEN_COOKIE_MAX_CHUNKS`` chunks.
+    """
     names = token_cookie_names(settings)
+    token_payload = dict(token)
+
+    missing_fields = [
+        field
+        for field in REQUIRED_TOKEN_FIELDS
+        if field not in token_payload or not isinstance(token_payload[field], str)
+    ]
+    if missing_fields:
+        missing_csv = ", ".join(missing_fields)
+        raise ValueError(
+            "Token payload must contain string values for required fields: "
+            f"{missing_csv}"
+        )
+
+    serialized = json.dumps(token_payload, separators=(",", ":"), sort_keys=True)
+    cipher = get_token_cipher(settings.token_cookie_encryption_key)
+    nonce = os.urandom(COOKIE_NONCE_BYTES)
+    ciphertext = cipher.encrypt(
+        nonce,
+        zlib.compress(serialized.encode("utf-8"), COOKIE_COMPRESSION_LEVEL),
+        names[0].encode("utf-8"),
+    )
+    encoded_blob = _urlsafe_b64encode(bytes([COOKIE_VERSION]) + nonce + ciphertext)
+
+    cookie_values = _split_token_blob(encoded_blob, settings)
+    written_names = set()
+    for cookie_name, cookie_value in zip(names, cookie_values):
+        response.set_cookie(
+            cookie_name,
+            cookie_value,
+            path=settings.session_cookie_path,
+            secure=settings.session_cookie_secure,
+            httponly=settings.session_cookie_httponly,
+            samesite=settings.session_cookie_samesite,
+        )
+        written_names.add(cookie_name)
+
+    if existing_cookies is not None:
+        stale_names = [
+            cookie_name
+            for cookie_name in _all_token_cookie_names(settings)
+            if cookie_name in existing_cookies and cookie_name not in written_names
+        ]
+        for cookie_name in stale_names:
+            _delete_cookie(response, cookie_name, settings)
+
+
+def clear_token_cookies(response: Any, settings: BffSettings) -> None:
+    """Clear all v2 and legacy v1 token cookies from the client."""
+    for cookie_name in _all_token_cookie_names(settings):
+        _delete_cookie(response, cookie_name, settings)
+
+
+def _all_token_cookie_names(settings: BffSettings) -> tuple[str, ...]:
+    return settings.token_cookie_names + tuple(
+        settings.legacy_token_cookie_names.values()
+    )
+
+
+def _delete_cookie(response: Any, cookie_name: str, settings: BffSettings) -> None:
+    response.delete_cookie(
+        cookie_name,
+        path=settings.session_cookie_path,
+        secure=settings.session_cookie_secure,
+        httponly=settings.session_cookie_httponly,
+        samesite=settings.session_cookie_samesite,
+    )
+
+
+def _split_token_blob(encoded_blob: str, settings: BffSettings) -> list[str]:
+    """Return the v2 cookie values, chunking the blob only when required."""
+    names = token_cookie_names(settings)
+    if _set_cookie_size(names[0], encoded_blob, settings) <= MAX_SET_COOKIE_BYTES:
+        return [encoded_blob]
+
+    # Every chunk name is at most as long as the last one, so its header
+    # overhead bounds the room left for the value.
+    chunk_budget = MAX_SET_COOKIE_BYTES - _set_cookie_size(names[-1], "", settings)
+    chunk_count = -(-len(encoded_blob) // chunk_budget)
+    if chunk_count > TOKEN_COOKIE_MAX_CHUNKS:
+        raise TokenCookieTooLargeError(
+            names[0],
+            len(encoded_blob),
+            max_size_bytes=chunk_budget * TOKEN_COOKIE_MAX_CHUNKS,
+        )
+
+    chunk_size = -(-len(encoded_blob) // chunk_count)
+    chunks = [
+        encoded_blob[offset : offset + chunk_size]
+        for offset in range(0, len(encoded_blob), chunk_size)
+    ]
+    return [f"{COOKIE_CHUNK_MARKER}{len(chunks)}"] + chunks
+
+
+def _load_token(
+    cookies: Mapping[str, str] | MultiDict[str, str],
+    settings: BffSettings,
+) -> dict[str, Any] | None:
+    names = token_cookie_names(settings)
+    head_value = cookies.get(names[0])
+    if not isinstance(head_value, str):
+        _log_warning("Token cookie %s has unexpected type", names[0])
+        return None
+
+    encoded_blob = head_value
+    if head_value.startswith(COOKIE_CHUNK_MARKER):
+        chunk_count_raw = head_value[len(COOKIE_CHUNK_MARKER) :]
+        if not chunk_count_raw.isdigit() or not (
+            1 <= int(chunk_count_raw) <= TOKEN_COOKIE_MAX_CHUNKS
+        ):
+            _log_warning("Token cookie chunk marker %r is invalid", head_value)
+            return None
+        chunks = [cookies.get(name) for name in names[1 : int(chunk_count_raw) + 1]]
+        if not all(isinstance(chunk, str) for chunk in chunks):
+            _log_warning("Token cookie payload is incomplete; treating as invalid")
+            return None
+        encoded_blob = "".join(chunks)
+
+    try:
+        raw_payload = _urlsafe_b64decode(encoded_blob)
+        if len(raw_payload) < 1 + COOKIE_NONCE_BYTES + 16:
+            raise ValueError("Encrypted cookie payload is truncated")
+        if raw_payload[0] != COOKIE_VERSION:
+            raise ValueError(f"Unsupported cookie payload version: {raw_payload[0]}")
+        compressed = get_token_cipher(settings.token_cookie_encryption_key).decrypt(
+            raw_payload[1 : 1 + COOKIE_NONCE_BYTES],
+            raw_payload[1 + COOKIE_NONCE_BYTES :],
+            names[0].encode("utf-8"),
+        )
+        decompressor = zlib.decompressobj()
+        serialized = decompressor.decompress(compressed, MAX_TOKEN_PAYLOAD_BYTES)
+        if decompressor.unconsumed_tail or not decompressor.eof:
+            raise ValueError("Token cookie payload exceeds the decompression limit")
+        token = json.loads(serialized.decode("utf-8"))
+    except (
+        InvalidTag,
+        ValueError,
+        binascii.Error,
+        UnicodeDecodeError,
+        zlib.error,
+    ) as exc:
+        _log_warning("Failed to decrypt token cookies: %s", exc)
+        return None
+
+    if not isinstance(token, dict):
+        _log_warning(
+            "Token cookie JSON must decode to object, got %s",
+            type(token).__name__,
+        )
+        return None
+
+    for required_field in REQUIRED_TOKEN_FIELDS:
+        if not isinstance(token.get(required_field), str):
+            _log_warning("Token cookie is missing field %s", required_field)
+            return None
+
+    return token
+
+
+def _load_legacy_token(
+    cookies: Mapping[str, str] | MultiDict[str, str],
+    settings: BffSettings,
+) -> dict[str, Any] | None:
+    names = settings.legacy_token_cookie_names
     encrypted_parts = {
         field: cookies.get(name)
         for field, name in names.items()
@@ -84,7 +290,7 @@ def load_token_from_cookies(
         _log_warning("Token cookie payload is incomplete; treating as invalid")
         return None
 
-    key = settings.token_cookie_encryption_key
+    cipher = get_token_cipher(settings.token_cookie_encryption_key)
     decrypted_token_fields: dict[str, str] = {}
     try:
         for field in REQUIRED_TOKEN_FIELDS:
@@ -95,7 +301,7 @@ def load_token_from_cookies(
                 return None
             decrypted_token_fields[field] = _decrypt_component(
                 encrypted_value,
-                key,
+                cipher,
                 cookie_name,
             )
 
@@ -104,9 +310,9 @@ def load_token_from_cookies(
         if not isinstance(encrypted_meta, str):
             _log_warning("Token cookie %s has unexpected type", meta_cookie_name)
             return None
-        decrypted_meta = _decrypt_component(encrypted_meta, key, meta_cookie_name)
+        decrypted_meta = _decrypt_component(encrypted_meta, cipher, meta_cookie_name)
     except (InvalidTag, ValueError, binascii.Error, UnicodeDecodeError) as exc:
-        _log_warning("Failed to decrypt token cookies: %s", exc)
+        _log_warning("Failed to decrypt legacy token cookies: %s", exc)
         return None
 
     try:
@@ -135,111 +341,19 @@ def load_token_from_cookies(
     return token
 
 
-def set_token_cookies(
-    response: Any,
-    token: Mapping[str, Any],
-    settings: BffSettings,
-) -> None:
-    """Encrypt and write OAuth token payload to multiple HttpOnly cookies."""
-    names = token_cookie_names(settings)
-    token_payload = dict(token)
-
-    missing_fields = [
-        field
-        for field in REQUIRED_TOKEN_FIELDS
-        if field not in token_payload or not isinstance(token_payload[field], str)
-    ]
-    if missing_fields:
-        missing_csv = ", ".join(missing_fields)
-        raise ValueError(
-            "Token payload must contain string values for required fields: "
-            f"{missing_csv}"
-        )
-
-    key = settings.token_cookie_encryption_key
-    encrypted_values = {
-        "access_token": _encrypt_component(
-            token_payload["access_token"],
-            key,
-            names["access_token"],
-        ),
-        "refresh_token": _encrypt_component(
-            token_payload["refresh_token"],
-            key,
-            names["refresh_token"],
-        ),
-        "id_token": _encrypt_component(
-            token_payload["id_token"],
-            key,
-            names["id_token"],
-        ),
-    }
-
-    metadata_payload = {
-        metadata_key: value
-        for metadata_key, value in token_payload.items()
-        if metadata_key not in REQUIRED_TOKEN_FIELDS
-    }
-    encrypted_values["meta"] = _encrypt_component(
-        json.dumps(metadata_payload, separators=(",", ":"), sort_keys=True),
-        key,
-        names["meta"],
-    )
-
-    for field, encrypted_value in encrypted_values.items():
-        _validate_set_cookie_size(
-            cookie_name=names[field],
-            cookie_value=encrypted_value,
-            settings=settings,
-        )
-
-    for field, encrypted_value in encrypted_values.items():
-        response.set_cookie(
-            names[field],
-            encrypted_value,
-            path=settings.session_cookie_path,
-            secure=settings.session_cookie_secure,
-            httponly=settings.session_cookie_httponly,
-            samesite=settings.session_cookie_samesite,
-        )
-
-
-def clear_token_cookies(response: Any, settings: BffSettings) -> None:
-    """Clear all token cookies from the client."""
-    for cookie_name in token_cookie_names(settings).values():
-        response.delete_cookie(
-            cookie_name,
-            path=settings.session_cookie_path,
-            secure=settings.session_cookie_secure,
-            httponly=settings.session_cookie_httponly,
-            samesite=settings.session_cookie_samesite,
-        )
-
-
-def _encrypt_component(plaintext: str, key: bytes, cookie_name: str) -> str:
-    nonce = os.urandom(COOKIE_NONCE_BYTES)
-    ciphertext = AESGCM(key).encrypt(
-        nonce,
-        plaintext.encode("utf-8"),
-        cookie_name.encode("utf-8"),
-    )
-    payload = bytes([COOKIE_VERSION]) + nonce + ciphertext
-    return _urlsafe_b64encode(payload)
-
-
-def _decrypt_component(encoded_payload: str, key: bytes, cookie_name: str) -> str:
+def _decrypt_component(encoded_payload: str, cipher: AESGCM, cookie_name: str) -> str:
     raw_payload = _urlsafe_b64decode(encoded_payload)
     min_payload_size = 1 + COOKIE_NONCE_BYTES + 16
     if len(raw_payload) < min_payload_size:
         raise ValueError("Encrypted cookie payload is truncated")
 
     payload_version = raw_payload[0]
-    if payload_version != COOKIE_VERSION:
+    if payload_version != LEGACY_COOKIE_VERSION:
         raise ValueError(f"Unsupported cookie payload version: {payload_version}")
 
     nonce = raw_payload[1 : 1 + COOKIE_NONCE_BYTES]
     ciphertext = raw_payload[1 + COOKIE_NONCE_BYTES :]
-    plaintext = AESGCM(key).decrypt(
+    plaintext = cipher.decrypt(
         nonce,
         ciphertext,
         cookie_name.encode("utf-8"),
@@ -256,11 +370,11 @@ def _urlsafe_b64decode(value: str) -> bytes:
     return base64.urlsafe_b64decode(value + padding)
 
 
-def _validate_set_cookie_size(
+def _set_cookie_size(
     cookie_name: str,
     cookie_value: str,
     settings: BffSettings,
-) -> None:
+) -> int:
     with warnings.catch_warnings():
         warnings.simplefilter("ignore", UserWarning)
         cookie_header = dump_cookie(
@@ -271,9 +385,7 @@ def _validate_set_cookie_size(
             httponly=settings.session_cookie_httponly,
             samesite=settings.session_cookie_samesite,
         )
-    cookie_size_bytes = len(cookie_header.encode("utf-8"))
-    if cookie_size_bytes > MAX_SET_COOKIE_BYTES:
-        raise TokenCookieTooLargeError(cookie_name, cookie_size_bytes)
+    return len(cookie_header.encode("utf-8"))
 
 
 def _log_warning(message: str, *args: Any) -> None:
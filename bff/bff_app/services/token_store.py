@@ -0,0 +1,254 @@
+"""Server-side token store backends and session-id helpers.
+
+When ``TOKEN_STORE_BACKEND`` is not ``cookie``, OAuth tokens are kept in a
+server-side store and the browser only holds an opaque session id cookie.
+Backends follow the subset of the redis-py client API used here (``get``,
+``set`` with ``ex`` and ``delete``), so a ``redis.Redis`` client can be passed
+to :func:`bff_app.create_app` as a drop-in store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Protocol
+
+from cryptography.exceptions import InvalidTag
+
+from bff_app.services.token_cookies import (
+    COOKIE_NONCE_BYTES,
+    REQUIRED_TOKEN_FIELDS,
+    get_token_cipher,
+)
+from bff_app.settings import BffSettings
+
+TOKEN_STORE_KEY_PREFIX = "bff:token:"
+SESSION_ID_BYTES = 32
+
+
+class TokenStore(Protocol):
+    """Minimal key/value interface shared with redis-py clients."""
+
+    def get(self, name: str) -> bytes | None:
+        """Return the value stored under ``name`` or ``None``."""
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        """Store ``value`` under ``name``, expiring after ``ex`` seconds."""
+
+    def delete(self, *names: str) -> int:
+        """Delete ``names`` and return how many keys were removed."""
+
+
+class MemoryTokenStore:
+    """Thread-safe in-process LRU token store with per-entry expiry.
+
+    :param max_entries: Maximum number of stored sessions.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> bytes | None:
+        """Return the value stored under ``name`` or ``None``."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[name]
+                return None
+            self._entries.move_to_end(name)
+            return value
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        """Store ``value`` under ``name``, expiring after ``ex`` seconds."""
+        expires_at = self._clock() + ex if ex is not None else None
+        with self._lock:
+            self._entries[name] = (expires_at, value)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def delete(self, *names: str) -> int:
+        """Delete ``names`` and return how many keys were removed."""
+        with self._lock:
+            return sum(self._entries.pop(name, None) is not None for name in names)
+
+
+class SqliteTokenStore:
+    """SQLite-backed token store shared by all workers on one host.
+
+    Each thread keeps its own connection. The database runs in WAL mode so
+    concurrent readers in other worker processes do not block writers.
+
+    :param path: Filesystem path of the SQLite database.
+    :param clock: Wall clock used for expiry, overridable for tests.
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time) -> None:
+        self._path = path
+        self._clock = clock
+        self._local = threading.local()
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS bff_token_store ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS bff_token_store_expires_at "
+            "ON bff_token_store (expires_at)"
+        )
+        connection.commit()
+
+    def get(self, name: str) -> bytes | None:
+        """Return the value stored under ``name`` or ``None``."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM bff_token_store "
+                "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (name, self._clock()),
+            )
+            .fetchone()
+        )
+        return bytes(row[0]) if row is not None else None
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        """Store ``value`` under ``name``, expiring after ``ex`` seconds."""
+        now = self._clock()
+        expires_at = now + ex if ex is not None else None
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "DELETE FROM bff_token_store WHERE expires_at <= ?",
+                (now,),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO bff_token_store (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (name, value, expires_at),
+            )
+        return True
+
+    def delete(self, *names: str) -> int:
+        """Delete ``names`` and return how many keys were removed."""
+        if not names:
+            return 0
+        connection = self._connection()
+        with connection:
+            cursor = connection.executemany(
+                "DELETE FROM bff_token_store WHERE key = ?",
+                [(name,) for name in names],
+            )
+        return cursor.rowcount
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=5.0)
+            self._local.connection = connection
+        return connection
+
+
+def build_token_store(settings: BffSettings) -> TokenStore | None:
+    """Build the configured token store, or ``None`` in cookie mode.
+
+    :param settings: Resolved application settings.
+    :returns: Token store backend matching ``settings.token_store_backend``.
+    :rtype: TokenStore | None
+    """
+    if settings.token_store_backend == "memory":
+        return MemoryTokenStore(max_entries=settings.token_store_max_entries)
+    if settings.token_store_backend == "sqlite":
+        return SqliteTokenStore(settings.token_store_sqlite_path)
+    return None
+
+
+def new_session_id() -> str:
+    """Return a fresh opaque session id for the session-id cookie."""
+    return secrets.token_urlsafe(SESSION_ID_BYTES)
+
+
+def save_token(
+    store: TokenStore,
+    session_id: str,
+    token: Mapping[str, Any],
+    settings: BffSettings,
+) -> None:
+    """Encrypt and save ``token`` under ``session_id``.
+
+    :raises ValueError: If a required token field is missing.
+    """
+    missing_fields = [
+        field for field in REQUIRED_TOKEN_FIELDS if not isinstance(token.get(field), str)
+    ]
+    if missing_fields:
+        missing_csv = ", ".join(missing_fields)
+        raise ValueError(
+            "Token payload must contain string values for required fields: "
+            f"{missing_csv}"
+        )
+
+    key = _store_key(session_id)
+    nonce = os.urandom(COOKIE_NONCE_BYTES)
+    serialized = json.dumps(dict(token), separators=(",", ":"), sort_keys=True)
+    ciphertext = get_token_cipher(settings.token_cookie_encryption_key).encrypt(
+        nonce,
+        serialized.encode("utf-8"),
+        key.encode("utf-8"),
+    )
+    store.set(key, nonce + ciphertext, ex=int(settings.token_store_ttl_seconds))
+
+
+def load_token(
+    store: TokenStore,
+    session_id: str,
+    settings: BffSettings,
+) -> dict[str, Any] | None:
+    """Load and decrypt the token saved under ``session_id``."""
+    key = _store_key(session_id)
+    raw_value = store.get(key)
+    if raw_value is None:
+        return None
+
+    try:
+        plaintext = get_token_cipher(settings.token_cookie_encryption_key).decrypt(
+            raw_value[:COOKIE_NONCE_BYTES],
+            raw_value[COOKIE_NONCE_BYTES:],
+            key.encode("utf-8"),
+        )
+        token = json.loads(plaintext.decode("utf-8"))
+    except (InvalidTag, ValueError, UnicodeDecodeError):
+        return None
+
+    return token if isinstance(token, dict) else None
+
+
+def delete_token(store: TokenStore, session_id: str) -> None:
+    """Delete the token saved under ``session_id``."""
+    store.delete(_store_key(session_id))
+
+
+def _store_key(session_id: str) -> str:
+    # Only a digest of the session id reaches the store, so read access to the
+    # store does not reveal usable session cookies.
+    digest = hashlib.sha256(session_id.encode("utf-8")).hexdigest()
+    return f"{TOKEN_STORE_KEY_PREFIX}{digest}"
@@ -0,0 +1,311 @@
+"""W3C trace-context propagation, request spans and correlation ids."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Protocol
+
+from flask import Flask, current_app, g, has_request_context, request
+
+from bff_app.settings import BffSettings
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_FLAG_SAMPLED = 0x01
+_TRACEPARENT_PATTERN = re.compile(
+    r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(?:-.*)?$"
+)
+_CORRELATION_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:\-]{1,128}$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+@dataclass
+class Span:
+    """A timed operation within a trace.
+
+    :ivar name: Operation name, e.g. ``token.refresh``.
+    :ivar trace_id: 32 hex digit trace id shared by the whole request.
+    :ivar span_id: 16 hex digit id of this span.
+    :ivar parent_span_id: Id of the enclosing span, or of the remote caller.
+    :ivar start_time_unix_nano: Start time in nanoseconds since the epoch.
+    :ivar end_time_unix_nano: End time, set once the span finishes.
+    :ivar attributes: Free-form span attributes.
+    :ivar status: ``ok`` or ``error``.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON representation written by exporters."""
+        end_time = self.end_time_unix_nano or self.start_time_unix_nano
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_unix_nano,
+            "end_time_unix_nano": end_time,
+            "duration_ms": (end_time - self.start_time_unix_nano) / 1_000_000,
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class SpanExporter(Protocol):
+    """Destination of finished spans."""
+
+    def export(self, span: Span) -> None:
+        """Record a finished ``span``."""
+
+
+class JsonLinesFileExporter:
+    """Append finished spans to a local file, one JSON document per line.
+
+    :param path: Filesystem path of the span log.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "a", buffering=1, encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write ``span`` as one JSON line."""
+        line = json.dumps(span.to_dict(), separators=(",", ":"), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        with self._lock:
+            self._file.close()
+
+
+@dataclass
+class TraceContext:
+    """Trace state of the current request, stored on :data:`flask.g`.
+
+    :ivar trace_id: Trace id continued from ``traceparent`` or newly generated.
+    :ivar trace_flags: W3C trace flags forwarded upstream.
+    :ivar correlation_id: Id forwarded to the backend for audit log joins.
+    :ivar spans: Stack of open spans, innermost last.
+    """
+
+    trace_id: str
+    trace_flags: int
+    correlation_id: str
+    spans: list[Span] = field(default_factory=list)
+
+    @property
+    def sampled(self) -> bool:
+        """Return whether the trace is recorded."""
+        return bool(self.trace_flags & TRACE_FLAG_SAMPLED)
+
+
+class Tracer:
+    """Create spans for the current request and hand them to an exporter.
+
+    Trace context is always propagated; spans are only exported when an
+    exporter is configured and the trace is sampled.
+
+    :param exporter: Span destination, or ``None`` to only propagate context.
+    """
+
+    def __init__(self, exporter: SpanExporter | None = None) -> None:
+        self.exporter = exporter
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        """Time the ``with`` block as a child of the current span.
+
+        Yields ``None`` outside of a traced request.
+        """
+        context = current_trace_context()
+        if context is None:
+            yield None
+            return
+
+        span = self.start_span(context, name, **attributes)
+        try:
+            yield span
+        except BaseException:
+            span.status = "error"
+            raise
+        finally:
+            self.end_span(context, span)
+
+    def start_span(
+        self,
+        context: TraceContext,
+        name: str,
+        parent_span_id: str | None = None,
+        **attributes: Any,
+    ) -> Span:
+        """Open a span and push it on the request's span stack."""
+        if parent_span_id is None and context.spans:
+            parent_span_id = context.spans[-1].span_id
+        span = Span(
+            name=name,
+            trace_id=context.trace_id,
+            span_id=new_span_id(),
+            parent_span_id=parent_span_id,
+            attributes=dict(attributes),
+        )
+        context.spans.append(span)
+        return span
+
+    def end_span(self, context: TraceContext, span: Span) -> None:
+        """Close ``span``, pop it from the stack and export it if sampled."""
+        span.end_time_unix_nano = time.time_ns()
+        if span in context.spans:
+            context.spans.remove(span)
+        if self.exporter is not None and context.sampled:
+            self.exporter.export(span)
+
+
+def build_span_exporter(settings: BffSettings) -> SpanExporter | None:
+    """Build the configured span exporter, or ``None`` when export is off.
+
+    :param settings: Resolved application settings.
+    :rtype: SpanExporter | None
+    """
+    if settings.tracing_exporter == "file":
+        return JsonLinesFileExporter(settings.tracing_file_path)
+    return None
+
+
+def get_tracer() -> Tracer:
+    """Return the app-wide tracer from Flask extensions.
+
+    :returns: Tracer of the current application.
+    :rtype: Tracer
+    """
+    return current_app.extensions["bff_tracer"]
+
+
+def current_trace_context() -> TraceContext | None:
+    """Return the trace context of the current request, if any."""
+    if not has_request_context():
+        return None
+    return g.get("bff_trace")
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str, int] | None:
+    """Parse a W3C ``traceparent`` header.
+
+    :returns: ``(trace_id, parent_span_id, trace_flags)`` or ``None`` if the
+        header is absent or invalid.
+    """
+    match = _TRACEPARENT_PATTERN.match((value or "").strip())
+    if match is None:
+        return None
+    version, trace_id, parent_span_id, flags = match.groups()
+    if (
+        version == "ff"
+        or trace_id == _INVALID_TRACE_ID
+        or parent_span_id == _INVALID_SPAN_ID
+    ):
+        return None
+    return trace_id, parent_span_id, int(flags, 16)
+
+
+def format_traceparent(trace_id: str, span_id: str, trace_flags: int) -> str:
+    """Format a version ``00`` W3C ``traceparent`` header value."""
+    return f"00-{trace_id}-{span_id}-{trace_flags:02x}"
+
+
+def new_trace_id() -> str:
+    """Return a random, valid 32 hex digit trace id."""
+    return os.urandom(16).hex()
+
+
+def new_span_id() -> str:
+    """Return a random, valid 16 hex digit span id."""
+    return os.urandom(8).hex()
+
+
+def propagation_headers(span: Span | None = None) -> dict[str, str]:
+    """Return ``traceparent`` and correlation id headers for an upstream call.
+
+    :param span: Span the upstream call belongs to; defaults to the innermost
+        open span of the request.
+    """
+    context = current_trace_context()
+    if context is None:
+        return {}
+
+    if span is None and context.spans:
+        span = context.spans[-1]
+    correlation_id_header = current_app.extensions["bff_settings"].correlation_id_header
+    headers = {correlation_id_header: context.correlation_id}
+    if span is not None:
+        headers[TRACEPARENT_HEADER] = format_traceparent(
+            context.trace_id,
+            span.span_id,
+            context.trace_flags,
+        )
+    return headers
+
+
+def install_request_tracing(app: Flask, tracer: Tracer) -> None:
+    """Continue or start a trace and open a server span for every request."""
+    correlation_id_header = app.extensions["bff_settings"].correlation_id_header
+
+    @app.before_request
+    def _start_request_span() -> None:
+        incoming = parse_traceparent(request.headers.get(TRACEPARENT_HEADER))
+        trace_id, parent_span_id, trace_flags = incoming or (
+            new_trace_id(),
+            None,
+            TRACE_FLAG_SAMPLED,
+        )
+        correlation_id = request.headers.get(correlation_id_header, "")
+        if not _CORRELATION_ID_PATTERN.match(correlation_id):
+            correlation_id = trace_id
+        context = TraceContext(trace_id, trace_flags, correlation_id)
+        g.bff_trace = context
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        tracer.start_span(
+            context,
+            f"{request.method} {route}",
+            parent_span_id=parent_span_id,
+            **{
+                "http.method": request.method,
+                "http.route": route,
+                "correlation_id": correlation_id,
+            },
+        )
+
+    @app.after_request
+    def _finish_request_span(response):  # noqa: ANN001, ANN202
+        context = g.get("bff_trace")
+        if context is not None:
+            response.headers[correlation_id_header] = context.correlation_id
+            if context.spans:
+                root_span = context.spans[0]
+                root_span.attributes["http.status_code"] = response.status_code
+                if response.status_code >= 500:
+                    root_span.status = "error"
+        return response
+
+    @app.teardown_request
+    def _end_request_span(exc: BaseException | None) -> None:
+        context = g.pop("bff_trace", None)
+        if context is None:
+            return
+        for span in reversed(list(context.spans)):
+            if exc is not None:
+                span.status = "error"
+            tracer.end_span(context, span)
@@ -0,0 +1,147 @@
+"""Pooled HTTP client shared by all upstream calls (backend and IdP)."""
+
+from __future__ import annotations
+
+import http.cookiejar
+
+import requests
+from flask import current_app
+
+from bff_app.services.metrics import BffMetrics
+from bff_app.services.resilience import (
+    AttemptCallback,
+    CircuitBreakerRegistry,
+    ResilientHTTPAdapter,
+    RetryBudget,
+)
+from bff_app.settings import BffSettings
+
+
+class _RejectAllCookiesPolicy(http.cookiejar.DefaultCookiePolicy):
+    """Cookie policy that never stores or sends cookies.
+
+    The upstream session is shared by every browser session, so cookies set by
+    an upstream must never be replayed on another user's request.
+    """
+
+    def set_ok(self, cookie, request) -> bool:  # noqa: ANN001
+        return False
+
+    def return_ok(self, cookie, request) -> bool:  # noqa: ANN001
+        return False
+
+
+def build_upstream_session(
+    settings: BffSettings,
+    breakers: CircuitBreakerRegistry,
+    metrics: BffMetrics | None = None,
+) -> requests.Session:
+    """Build the keep-alive connection pool used for upstream requests.
+
+    :param settings: Resolved application settings.
+    :param breakers: Circuit breakers consulted before each upstream call.
+    :param metrics: Optional metrics receiving the latency of each attempt.
+    :returns: Session whose adapters keep up to ``upstream_pool_maxsize``
+        connections per upstream host alive between requests, fail fast while
+        an upstream's breaker is open and retry connect failures within the
+        retry budget.
+    :rtype: requests.Session
+    :raises RuntimeError:
+        If ``UPSTREAM_HTTP2`` is enabled but the ``h2`` package is missing.
+    """
+    if settings.upstream_http2:
+        _enable_http2()
+
+    session = requests.Session()
+    session.cookies.set_policy(_RejectAllCookiesPolicy())
+    adapter = ResilientHTTPAdapter(
+        breakers=breakers,
+        retry_budget=RetryBudget(ratio=settings.upstream_retry_budget_ratio),
+        max_retries_per_call=settings.upstream_max_retries,
+        backoff_seconds=settings.upstream_retry_backoff_seconds,
+        on_attempt=(
+            _upstream_latency_recorder(settings, metrics)
+            if metrics is not None
+            else None
+        ),
+        pool_connections=8,
+        pool_maxsize=settings.upstream_pool_maxsize,
+        max_retries=0,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_upstream_session() -> requests.Session:
+    """Return the app-wide upstream session from Flask extensions.
+
+    :returns: Pooled upstream session.
+    :rtype: requests.Session
+    """
+    return current_app.extensions["bff_upstream_session"]
+
+
+def get_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the app-wide upstream circuit breakers from Flask extensions.
+
+    :returns: Circuit breaker registry shared with the upstream session.
+    :rtype: CircuitBreakerRegistry
+    """
+    return current_app.extensions["bff_circuit_breakers"]
+
+
+def upstream_target(url: str, settings: BffSettings) -> str:
+    """Name the upstream a URL belongs to, for low-cardinality metric labels.
+
+    :returns: ``token``, ``userinfo``, ``logout``, a ``PROXY_ROUTES`` name,
+        ``backend`` or ``other``.
+    :rtype: str
+    """
+    endpoint = url.split("?", 1)[0]
+    if endpoint == settings.oauth_endpoint_token:
+        return "token"
+    if endpoint == settings.oauth_endpoint_userinfo:
+        return "userinfo"
+    if endpoint == settings.oauth_endpoint_logout:
+        return "logout"
+    for route in sorted(
+        settings.proxy_routes,
+        key=lambda route: len(route.endpoint),
+        reverse=True,
+    ):
+        if endpoint.startswith(route.endpoint.rstrip("/")):
+            return route.name
+    if endpoint.startswith(settings.backend_endpoint.rstrip("/")):
+        return "backend"
+    return "other"
+
+
+def _upstream_latency_recorder(
+    settings: BffSettings,
+    metrics: BffMetrics,
+) -> AttemptCallback:
+    def record(
+        request: requests.PreparedRequest,
+        outcome: str,
+        duration_seconds: float,
+    ) -> None:
+        metrics.upstream_duration.observe(
+            duration_seconds,
+            target=upstream_target(request.url or "", settings),
+            outcome=outcome,
+        )
+
+    return record
+
+
+def _enable_http2() -> None:
+    try:
+        import urllib3.http2
+    except ImportError as exc:
+        raise RuntimeError(
+            "UPSTREAM_HTTP2 requires the 'h2' package; install the BFF 'async' extra"
+        ) from exc
+    # urllib3 patches its HTTPS connection class process-wide and negotiates
+    # HTTP/2 through ALPN, falling back to HTTP/1.1 when the upstream declines.
+    urllib3.http2.inject_into_urllib3()
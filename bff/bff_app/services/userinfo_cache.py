@@ -0,0 +1,109 @@
+"""In-process LRU cache for OAuth userinfo responses."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Mapping
+
+
+class UserinfoCache:
+    """Thread-safe LRU cache with per-entry TTL for userinfo payloads.
+
+    Entries are keyed by a SHA-256 digest of the access token so the token
+    itself is never retained. The cache holds at most ``max_entries`` payloads;
+    the least recently used entry is evicted once the bound is reached.
+
+    :param max_entries: Maximum number of cached payloads. ``0`` disables caching.
+    :param ttl_seconds: Lifetime in seconds of a cached payload.
+    :param clock: Monotonic clock, overridable for tests.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache stores any entries at all."""
+        return self._max_entries > 0
+
+    def get(self, access_token: str) -> dict[str, Any] | None:
+        """Return the cached userinfo for ``access_token`` or ``None`` on miss."""
+        if not self.enabled:
+            return None
+
+        key = _token_key(access_token)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, userinfo = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return userinfo
+
+    def set(self, access_token: str, userinfo: Mapping[str, Any]) -> None:
+        """Cache ``userinfo`` for ``access_token`` until the TTL elapses."""
+        if not self.enabled:
+            return
+
+        key = _token_key(access_token)
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, dict(userinfo))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, access_token: str) -> None:
+        """Drop any cached userinfo for ``access_token``."""
+        if not self.enabled:
+            return
+
+        key = _token_key(access_token)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of cache size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _token_key(access_token: str) -> bytes:
+    return hashlib.sha256(access_token.encode("utf-8")).digest()
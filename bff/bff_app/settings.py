@@ -4,9 +4,37 @@ from __future__ import annotations
 
 import base64
 import binascii
+import json
 import os
-from dataclasses import dataclass
-from typing import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+TOKEN_COOKIE_SUFFIX = "tk"
+SESSION_ID_COOKIE_SUFFIX = "sid"
+TOKEN_STORE_BACKENDS: tuple[str, ...] = ("cookie", "memory", "sqlite")
+TRACING_EXPORTERS: tuple[str, ...] = ("none", "file")
+SERVE_WORKER_CLASSES: tuple[str, ...] = ("gthread", "gevent")
+COMPRESSION_ENCODINGS: tuple[str, ...] = ("br", "gzip")
+DEFAULT_COMPRESSIBLE_CONTENT_TYPES: tuple[str, ...] = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "+json",
+    "+xml",
+)
+TOKEN_COOKIE_MAX_CHUNKS = 4
+LEGACY_TOKEN_COOKIE_SUFFIXES: Mapping[str, str] = MappingProxyType(
+    {
+        "access_token": "at",
+        "refresh_token": "rt",
+        "id_token": "it",
+        "meta": "meta",
+    }
+)
 
 
 class SettingsValidationError(ValueError):
@@ -55,6 +83,293 @@ def _env_positive_float(name: str, default: float) -> float:
     return parsed
 
 
+def _env_non_negative_int(name: str, default: int) -> int:
+    """Parse a non-negative integer environment variable.
+
+    :param name: Environment variable name.
+    :param default: Value returned when the environment variable is absent.
+    :returns: Parsed non-negative integer.
+    :rtype: int
+    :raises SettingsValidationError:
+        If the variable is present but not an integer greater than or equal to 0.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise SettingsValidationError(
+            f"{name} must be a non-negative integer. Received: {value!r}"
+        ) from exc
+
+    if parsed < 0:
+        raise SettingsValidationError(
+            f"{name} must be greater than or equal to 0. Received: {value!r}"
+        )
+    return parsed
+
+
+def _env_positive_int(name: str, default: int) -> int:
+    """Parse a positive integer environment variable.
+
+    :param name: Environment variable name.
+    :param default: Value returned when the environment variable is absent.
+    :returns: Parsed positive integer.
+    :rtype: int
+    :raises SettingsValidationError:
+        If the variable is present but not an integer greater than 0.
+    """
+    parsed = _env_non_negative_int(name, default)
+    if parsed == 0:
+        raise SettingsValidationError(
+            f"{name} must be greater than 0. Received: {os.getenv(name)!r}"
+        )
+    return parsed
+
+
+def _env_int_range(name: str, default: int, minimum: int, maximum: int) -> int:
+    """Parse an integer environment variable within ``[minimum, maximum]``.
+
+    :param name: Environment variable name.
+    :param default: Value returned when the environment variable is absent.
+    :returns: Parsed integer.
+    :rtype: int
+    :raises SettingsValidationError:
+        If the variable is present but not an integer in the range.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = minimum - 1
+    if not minimum <= parsed <= maximum:
+        raise SettingsValidationError(
+            f"{name} must be an integer from {minimum} to {maximum}. "
+            f"Received: {value!r}"
+        )
+    return parsed
+
+
+def _env_csv(
+    name: str,
+    default: tuple[str, ...],
+    choices: tuple[str, ...] | None = None,
+) -> tuple[str, ...]:
+    """Parse a comma-separated list of lower-case values.
+
+    :param name: Environment variable name.
+    :param default: Value returned when the environment variable is absent.
+    :param choices: Accepted values, if restricted.
+    :returns: Values in the given order; empty when the variable is blank.
+    :rtype: tuple[str, ...]
+    :raises SettingsValidationError:
+        If ``choices`` is given and a value is not one of them.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    items = tuple(item.strip().lower() for item in value.split(",") if item.strip())
+    unknown = [item for item in items if choices is not None and item not in choices]
+    if unknown:
+        choices_csv = ", ".join(choices or ())
+        raise SettingsValidationError(
+            f"{name} must list values among {choices_csv}. Received: {value!r}"
+        )
+    return items
+
+
+def _env_choice(name: str, default: str, choices: tuple[str, ...]) -> str:
+    """Parse an environment variable restricted to a fixed set of values.
+
+    :param name: Environment variable name.
+    :param default: Value returned when the environment variable is absent.
+    :param choices: Accepted lower-case values.
+    :returns: Normalized lower-case value.
+    :rtype: str
+    :raises SettingsValidationError:
+        If the variable is present but not one of ``choices``.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    normalized = value.strip().lower()
+    if normalized not in choices:
+        choices_csv = ", ".join(choices)
+        raise SettingsValidationError(
+            f"{name} must be one of {choices_csv}. Received: {value!r}"
+        )
+    return normalized
+
+
+def _env_path_prefixes(name: str) -> tuple[str, ...]:
+    """Parse a comma-separated list of URL path prefixes.
+
+    :param name: Environment variable name.
+    :returns: Prefixes without leading slashes; empty when the variable is absent.
+    :rtype: tuple[str, ...]
+    """
+    value = os.getenv(name, "")
+    return tuple(
+        prefix.strip().lstrip("/") for prefix in value.split(",") if prefix.strip()
+    )
+
+
+@dataclass(frozen=True)
+class ProxyRoute:
+    """A backend service reached through the proxy under a path prefix.
+
+    :ivar name: Route name used in metrics and logs.
+    :ivar prefix: Proxied path prefix without leading or trailing slashes,
+        matched on whole path segments.
+    :ivar endpoint: Base URL the matched path is appended to.
+    :ivar strip_prefix: Whether ``prefix`` is removed before appending the path.
+    :ivar connect_timeout_seconds: Connect timeout; ``None`` uses the global one.
+    :ivar read_timeout_seconds: Read timeout; ``None`` uses the global one.
+    :ivar max_in_flight: Concurrent calls to this upstream. ``0`` disables the limit.
+    :ivar max_queue: Requests waiting for a slot of this upstream.
+    :ivar pool_maxsize: Keep-alive connections of this upstream's own pool.
+    :ivar forward_access_token: Whether the session's bearer token is forwarded.
+    :ivar drop_request_headers: Lower-case request headers never forwarded.
+    """
+
+    name: str
+    prefix: str
+    endpoint: str
+    strip_prefix: bool = False
+    connect_timeout_seconds: float | None = None
+    read_timeout_seconds: float | None = None
+    max_in_flight: int = 0
+    max_queue: int = 0
+    pool_maxsize: int = 16
+    forward_access_token: bool = True
+    drop_request_headers: tuple[str, ...] = ()
+
+
+def _route_number(
+    name: str,
+    route: Mapping[str, Any],
+    key: str,
+    minimum: float,
+    integer: bool,
+) -> Any:
+    """Validate one numeric option of a ``PROXY_ROUTES`` entry."""
+    value = route[key]
+    expected_type = int if integer else (int, float)
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, expected_type)
+        or value < minimum
+        or (not integer and value <= 0)
+    ):
+        kind = "an integer" if integer else "a positive number"
+        raise SettingsValidationError(
+            f"{name} route {route.get('name')!r}: {key} must be {kind} "
+            f"greater than or equal to {minimum}. Received: {value!r}"
+        )
+    return value
+
+
+def _env_proxy_routes(name: str) -> tuple[ProxyRoute, ...]:
+    """Parse a JSON list of proxy routes.
+
+    :param name: Environment variable name.
+    :returns: Routes in configuration order; empty when the variable is absent.
+    :rtype: tuple[ProxyRoute, ...]
+    :raises SettingsValidationError:
+        If the value is not a JSON list of valid, uniquely named routes.
+    """
+    value = os.getenv(name, "").strip()
+    if not value:
+        return ()
+
+    try:
+        raw_routes = json.loads(value)
+    except ValueError as exc:
+        raise SettingsValidationError(f"{name} must be a JSON list of routes") from exc
+    if not isinstance(raw_routes, list):
+        raise SettingsValidationError(f"{name} must be a JSON list of routes")
+
+    known_keys = set(ProxyRoute.__dataclass_fields__)
+    routes: list[ProxyRoute] = []
+    for raw_route in raw_routes:
+        if not isinstance(raw_route, dict):
+            raise SettingsValidationError(f"{name} entries must be JSON objects")
+        unknown_keys = sorted(set(raw_route) - known_keys)
+        if unknown_keys:
+            raise SettingsValidationError(
+                f"{name} route {raw_route.get('name')!r} has unknown keys: "
+                + ", ".join(unknown_keys)
+            )
+        for key in ("name", "prefix", "endpoint"):
+            if not isinstance(raw_route.get(key), str) or not raw_route[key].strip():
+                raise SettingsValidationError(
+                    f"{name} route {raw_route.get('name')!r} must set {key}"
+                )
+        if not raw_route["endpoint"].startswith(("http://", "https://")):
+            raise SettingsValidationError(
+                f"{name} route {raw_route['name']!r}: endpoint must be an http(s) URL"
+            )
+
+        options: dict[str, Any] = {}
+        for key in ("connect_timeout_seconds", "read_timeout_seconds"):
+            if raw_route.get(key) is not None:
+                options[key] = float(_route_number(name, raw_route, key, 0, False))
+        for key, minimum in (
+            ("max_in_flight", 0),
+            ("max_queue", 0),
+            ("pool_maxsize", 1),
+        ):
+            if key in raw_route:
+                options[key] = _route_number(name, raw_route, key, minimum, True)
+        for key in ("strip_prefix", "forward_access_token"):
+            if key in raw_route:
+                if not isinstance(raw_route[key], bool):
+                    raise SettingsValidationError(
+                        f"{name} route {raw_route['name']!r}: {key} must be a boolean"
+                    )
+                options[key] = raw_route[key]
+        drop_headers = raw_route.get("drop_request_headers", [])
+        if not isinstance(drop_headers, list) or not all(
+            isinstance(header, str) for header in drop_headers
+        ):
+            raise SettingsValidationError(
+                f"{name} route {raw_route['name']!r}: drop_request_headers must be "
+                "a list of header names"
+            )
+
+        routes.append(
+            ProxyRoute(
+                name=raw_route["name"].strip(),
+                prefix=raw_route["prefix"].strip().strip("/"),
+                endpoint=raw_route["endpoint"].strip(),
+                drop_request_headers=tuple(header.lower() for header in drop_headers),
+                **options,
+            )
+        )
+
+    for field_name in ("name", "prefix"):
+        values = [getattr(route, field_name) for route in routes]
+        duplicates = sorted({value for value in values if values.count(value) > 1})
+        if duplicates:
+            raise SettingsValidationError(
+                f"{name} route {field_name}s must be unique. Duplicated: "
+                + ", ".join(duplicates)
+            )
+    if any(not route.prefix for route in routes):
+        raise SettingsValidationError(
+            f"{name} route prefixes must not be empty; BACKEND_ENDPOINT serves "
+            "unmatched paths"
+        )
+    return tuple(routes)
+
+
 def _env_base64url_32_bytes(name: str) -> bytes:
     """Parse a URL-safe base64 encoded 32-byte key from env."""
     value = os.getenv(name)
@@ -105,6 +420,98 @@ class BffSettings:
         Connect timeout in seconds for backend proxy requests.
     :ivar backend_read_timeout_seconds:
         Read timeout in seconds for backend proxy requests.
+    :ivar userinfo_cache_max_entries:
+        Maximum number of userinfo responses kept in memory. ``0`` disables the cache.
+    :ivar userinfo_cache_ttl_seconds:
+        Lifetime in seconds of a cached userinfo response.
+    :ivar token_store_backend:
+        Where OAuth tokens are kept: ``cookie`` (encrypted browser cookies),
+        ``memory`` or ``sqlite`` (server-side store keyed by a session id cookie).
+    :ivar token_store_sqlite_path: Database path used by the ``sqlite`` backend.
+    :ivar token_store_max_entries: Maximum sessions kept by the ``memory`` backend.
+    :ivar token_store_ttl_seconds: Lifetime in seconds of a server-side token entry.
+    :ivar upstream_pool_maxsize:
+        Keep-alive connections kept per upstream host by the shared HTTP pool.
+    :ivar upstream_http2:
+        Whether upstream HTTPS calls may negotiate HTTP/2 (requires ``h2``).
+    :ivar proxy_max_in_flight:
+        Maximum concurrent proxied upstream calls. ``0`` disables the limit.
+    :ivar proxy_max_queue:
+        Maximum proxied requests waiting for an upstream slot before shedding.
+    :ivar proxy_queue_timeout_seconds:
+        Longest time a proxied request waits for an upstream slot.
+    :ivar proxy_retry_after_seconds:
+        ``Retry-After`` value returned with ``503`` load-shedding responses.
+    :ivar proxy_session_burst:
+        Per-session token-bucket capacity. ``0`` disables per-session limiting.
+    :ivar proxy_session_rate_per_second:
+        Per-session token-bucket refill rate.
+    :ivar proxy_batch_max_requests:
+        Maximum number of sub-requests accepted by ``/proxy/api/batch``.
+    :ivar proxy_batch_max_concurrency:
+        Sub-requests of one batch sent to the backend at the same time.
+    :ivar proxy_coalesce_requests:
+        Whether identical concurrent ``GET``/``HEAD`` requests of one session
+        share a single upstream call.
+    :ivar proxy_cache_max_bytes:
+        Byte budget of the proxy response cache. ``0`` disables caching.
+    :ivar proxy_cache_shared_paths:
+        Backend path prefixes whose responses are cached once for all sessions.
+    :ivar proxy_cache_shared_ttl_seconds:
+        Freshness of shared-tier responses that carry no ``max-age``.
+    :ivar proxy_stream_max_connections:
+        Concurrent event streams and WebSocket relays. ``0`` disables the cap.
+    :ivar proxy_stream_idle_timeout_seconds:
+        How long an event stream or WebSocket relay may stay silent before it
+        is closed.
+    :ivar proxy_compression_encodings:
+        Codings the proxy may apply to responses, most preferred first. Empty
+        disables compression.
+    :ivar proxy_compression_min_bytes:
+        Smallest buffered response body the proxy compresses.
+    :ivar proxy_compression_gzip_level:
+        ``zlib`` compression level of gzip responses.
+    :ivar proxy_compression_brotli_quality:
+        Quality of brotli responses.
+    :ivar proxy_compression_content_types:
+        Media types, top-level types (``text/``) and suffixes (``+json``)
+        worth compressing.
+    :ivar proxy_routes:
+        Backend services selected by path prefix. Paths matching no route go
+        to ``backend_endpoint``.
+    :ivar correlation_id_header:
+        Header carrying the correlation id forwarded to the backend. Match it to
+        ``NSIDE_WEFA.AUDIT.REQUEST_ID_HEADER`` so audit ``cid`` values join up
+        with BFF traces.
+    :ivar tracing_exporter:
+        Where finished spans go: ``none`` (propagate context only) or ``file``.
+    :ivar tracing_file_path: JSON-lines span log used by the ``file`` exporter.
+    :ivar upstream_breaker_failure_threshold:
+        Consecutive failures that open an upstream's circuit breaker.
+        ``0`` disables circuit breaking.
+    :ivar upstream_breaker_reset_timeout_seconds:
+        How long an open circuit breaker fails fast before probing again.
+    :ivar upstream_max_retries:
+        Retries of one idempotent upstream call after a connect failure.
+    :ivar upstream_retry_budget_ratio:
+        Retries allowed per upstream call across the app, e.g. ``0.1`` for 10%.
+    :ivar upstream_retry_backoff_seconds:
+        Base delay of the jittered exponential backoff between retries.
+    :ivar background_max_workers:
+        Threads running fire-and-forget upstream calls such as IdP logout.
+        ``0`` runs them inline before the response is sent.
+    :ivar background_max_queue:
+        Background tasks allowed to wait for a worker before new ones are
+        rejected.
+    :ivar background_drain_timeout_seconds:
+        How long queued background tasks may keep finishing at shutdown.
+    :ivar token_cookie_names:
+        Names of the v2 token cookie followed by its numbered chunk cookies,
+        derived once from ``session_cookie_name``.
+    :ivar legacy_token_cookie_names:
+        Names of the v1 per-field token cookies keyed by token field.
+    :ivar session_id_cookie_name:
+        Name of the opaque session id cookie used by server-side token stores.
     """
     flask_secret_key: str
     token_cookie_encryption_key: bytes
@@ -126,6 +533,81 @@ class BffSettings:
     frontend_redirect: str
     backend_connect_timeout_seconds: float = 3.0
     backend_read_timeout_seconds: float = 30.0
+    userinfo_cache_max_entries: int = 1024
+    userinfo_cache_ttl_seconds: float = 60.0
+    token_store_backend: str = "cookie"
+    token_store_sqlite_path: str = "bff_token_store.sqlite3"
+    token_store_max_entries: int = 10000
+    token_store_ttl_seconds: float = 43200.0
+    upstream_pool_maxsize: int = 64
+    upstream_http2: bool = False
+    proxy_max_in_flight: int = 0
+    proxy_max_queue: int = 0
+    proxy_queue_timeout_seconds: float = 1.0
+    proxy_retry_after_seconds: float = 1.0
+    proxy_session_burst: int = 0
+    proxy_session_rate_per_second: float = 10.0
+    proxy_batch_max_requests: int = 32
+    proxy_batch_max_concurrency: int = 8
+    proxy_coalesce_requests: bool = True
+    proxy_cache_max_bytes: int = 0
+    proxy_cache_shared_paths: tuple[str, ...] = ()
+    proxy_cache_shared_ttl_seconds: float = 60.0
+    proxy_stream_max_connections: int = 256
+    proxy_stream_idle_timeout_seconds: float = 60.0
+    proxy_compression_encodings: tuple[str, ...] = COMPRESSION_ENCODINGS
+    proxy_compression_min_bytes: int = 1024
+    proxy_compression_gzip_level: int = 5
+    proxy_compression_brotli_quality: int = 4
+    proxy_compression_content_types: tuple[str, ...] = (
+        DEFAULT_COMPRESSIBLE_CONTENT_TYPES
+    )
+    proxy_routes: tuple[ProxyRoute, ...] = ()
+    correlation_id_header: str = "X-Correlation-ID"
+    tracing_exporter: str = "none"
+    tracing_file_path: str = "bff_spans.jsonl"
+    upstream_breaker_failure_threshold: int = 5
+    upstream_breaker_reset_timeout_seconds: float = 10.0
+    upstream_max_retries: int = 1
+    upstream_retry_budget_ratio: float = 0.1
+    upstream_retry_backoff_seconds: float = 0.05
+    background_max_workers: int = 2
+    background_max_queue: int = 256
+    background_drain_timeout_seconds: float = 5.0
+    token_cookie_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    legacy_token_cookie_names: Mapping[str, str] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    session_id_cookie_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        token_cookie_name = f"{self.session_cookie_name}_{TOKEN_COOKIE_SUFFIX}"
+        object.__setattr__(
+            self,
+            "token_cookie_names",
+            (token_cookie_name,)
+            + tuple(
+                f"{token_cookie_name}{index}"
+                for index in range(1, TOKEN_COOKIE_MAX_CHUNKS + 1)
+            ),
+        )
+        object.__setattr__(
+            self,
+            "legacy_token_cookie_names",
+            MappingProxyType(
+                {
+                    token_field: f"{self.session_cookie_name}_{suffix}"
+                    for token_field, suffix in LEGACY_TOKEN_COOKIE_SUFFIXES.items()
+                }
+            ),
+        )
+        object.__setattr__(
+            self,
+            "session_id_cookie_name",
+            f"{self.session_cookie_name}_{SESSION_ID_COOKIE_SUFFIX}",
+        )
 
 
 REQUIRED_ENV_VARS: tuple[str, ...] = (
@@ -209,4 +691,183 @@ def load_settings_from_env() -> BffSettings:
             "BACKEND_READ_TIMEOUT_SECONDS",
             30.0,
         ),
+        userinfo_cache_max_entries=_env_non_negative_int(
+            "USERINFO_CACHE_MAX_ENTRIES",
+            1024,
+        ),
+        userinfo_cache_ttl_seconds=_env_positive_float(
+            "USERINFO_CACHE_TTL_SECONDS",
+            60.0,
+        ),
+        token_store_backend=_env_choice(
+            "TOKEN_STORE_BACKEND",
+            "cookie",
+            TOKEN_STORE_BACKENDS,
+        ),
+        token_store_sqlite_path=os.getenv(
+            "TOKEN_STORE_SQLITE_PATH",
+            "bff_token_store.sqlite3",
+        ),
+        token_store_max_entries=_env_positive_int(
+            "TOKEN_STORE_MAX_ENTRIES",
+            10000,
+        ),
+        token_store_ttl_seconds=_env_positive_float(
+            "TOKEN_STORE_TTL_SECONDS",
+            43200.0,
+        ),
+        upstream_pool_maxsize=_env_non_negative_int("UPSTREAM_POOL_MAXSIZE", 64),
+        upstream_http2=_env_bool("UPSTREAM_HTTP2", False),
+        proxy_max_in_flight=_env_non_negative_int("PROXY_MAX_IN_FLIGHT", 0),
+        proxy_max_queue=_env_non_negative_int("PROXY_MAX_QUEUE", 0),
+        proxy_queue_timeout_seconds=_env_positive_float(
+            "PROXY_QUEUE_TIMEOUT_SECONDS",
+            1.0,
+        ),
+        proxy_retry_after_seconds=_env_positive_float(
+            "PROXY_RETRY_AFTER_SECONDS",
+            1.0,
+        ),
+        proxy_session_burst=_env_non_negative_int("PROXY_SESSION_BURST", 0),
+        proxy_session_rate_per_second=_env_positive_float(
+            "PROXY_SESSION_RATE_PER_SECOND",
+            10.0,
+        ),
+        proxy_batch_max_requests=_env_positive_int("PROXY_BATCH_MAX_REQUESTS", 32),
+        proxy_batch_max_concurrency=_env_positive_int(
+            "PROXY_BATCH_MAX_CONCURRENCY",
+            8,
+        ),
+        proxy_coalesce_requests=_env_bool("PROXY_COALESCE_REQUESTS", True),
+        proxy_cache_max_bytes=_env_non_negative_int("PROXY_CACHE_MAX_BYTES", 0),
+        proxy_cache_shared_paths=_env_path_prefixes("PROXY_CACHE_SHARED_PATHS"),
+        proxy_cache_shared_ttl_seconds=_env_positive_float(
+            "PROXY_CACHE_SHARED_TTL_SECONDS",
+            60.0,
+        ),
+        proxy_stream_max_connections=_env_non_negative_int(
+            "PROXY_STREAM_MAX_CONNECTIONS",
+            256,
+        ),
+        proxy_stream_idle_timeout_seconds=_env_positive_float(
+            "PROXY_STREAM_IDLE_TIMEOUT_SECONDS",
+            60.0,
+        ),
+        proxy_compression_encodings=_env_csv(
+            "PROXY_COMPRESSION_ENCODINGS",
+            COMPRESSION_ENCODINGS,
+            COMPRESSION_ENCODINGS,
+        ),
+        proxy_compression_min_bytes=_env_non_negative_int(
+            "PROXY_COMPRESSION_MIN_BYTES",
+            1024,
+        ),
+        proxy_compression_gzip_level=_env_int_range(
+            "PROXY_COMPRESSION_GZIP_LEVEL",
+            5,
+            1,
+            9,
+        ),
+        proxy_compression_brotli_quality=_env_int_range(
+            "PROXY_COMPRESSION_BROTLI_QUALITY",
+            4,
+            0,
+            11,
+        ),
+        proxy_compression_content_types=_env_csv(
+            "PROXY_COMPRESSION_CONTENT_TYPES",
+            DEFAULT_COMPRESSIBLE_CONTENT_TYPES,
+        ),
+        proxy_routes=_env_proxy_routes("PROXY_ROUTES"),
+        correlation_id_header=(
+            os.getenv("CORRELATION_ID_HEADER", "").strip() or "X-Correlation-ID"
+        ),
+        tracing_exporter=_env_choice("TRACING_EXPORTER", "none", TRACING_EXPORTERS),
+        tracing_file_path=os.getenv("TRACING_FILE_PATH", "bff_spans.jsonl"),
+        upstream_breaker_failure_threshold=_env_non_negative_int(
+            "UPSTREAM_BREAKER_FAILURE_THRESHOLD",
+            5,
+        ),
+        upstream_breaker_reset_timeout_seconds=_env_positive_float(
+            "UPSTREAM_BREAKER_RESET_TIMEOUT_SECONDS",
+            10.0,
+        ),
+        upstream_max_retries=_env_non_negative_int("UPSTREAM_MAX_RETRIES", 1),
+        upstream_retry_budget_ratio=_env_positive_float(
+            "UPSTREAM_RETRY_BUDGET_RATIO",
+            0.1,
+        ),
+        upstream_retry_backoff_seconds=_env_positive_float(
+            "UPSTREAM_RETRY_BACKOFF_SECONDS",
+            0.05,
+        ),
+        background_max_workers=_env_non_negative_int("BACKGROUND_MAX_WORKERS", 2),
+        background_max_queue=_env_positive_int("BACKGROUND_MAX_QUEUE", 256),
+        background_drain_timeout_seconds=_env_positive_float(
+            "BACKGROUND_DRAIN_TIMEOUT_SECONDS",
+            5.0,
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class ServeSettings:
+    """Process model of the production server started by ``bff_app.serve``.
+
+    :ivar host: Interface the server binds to.
+    :ivar port: Port the server binds to.
+    :ivar worker_class: ``gthread`` (threads per process) or ``gevent``.
+    :ivar workers: Number of forked worker processes.
+    :ivar threads: Request threads per ``gthread`` worker.
+    :ivar worker_connections: Concurrent connections per ``gevent`` worker.
+    :ivar max_requests: Requests after which a worker is recycled, ``0`` never.
+    :ivar max_requests_jitter: Random extra requests per worker, so workers are
+        not all recycled at once.
+    :ivar keepalive_seconds: Idle time before a keep-alive connection is closed.
+    :ivar backlog: Pending connections the listening socket accepts.
+    :ivar timeout_seconds: Time a silent worker may take before it is restarted.
+    :ivar graceful_timeout_seconds: Time workers get to finish on shutdown.
+    """
+
+    host: str = "0.0.0.0"
+    port: int = 5000
+    worker_class: str = "gthread"
+    workers: int = 2
+    threads: int = 8
+    worker_connections: int = 1000
+    max_requests: int = 10000
+    max_requests_jitter: int = 1000
+    keepalive_seconds: int = 5
+    backlog: int = 2048
+    timeout_seconds: int = 60
+    graceful_timeout_seconds: int = 30
+
+
+def load_serve_settings_from_env() -> ServeSettings:
+    """Build :class:`ServeSettings` from process environment variables.
+
+    :returns: Environment-derived server settings; ``SERVE_WORKERS`` defaults
+        to twice the number of CPUs plus one.
+    :rtype: ServeSettings
+    """
+    return ServeSettings(
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=_env_positive_int("PORT", 5000),
+        worker_class=_env_choice(
+            "SERVE_WORKER_CLASS",
+            "gthread",
+            SERVE_WORKER_CLASSES,
+        ),
+        workers=_env_positive_int("SERVE_WORKERS", 2 * (os.cpu_count() or 1) + 1),
+        threads=_env_positive_int("SERVE_THREADS", 8),
+        worker_connections=_env_positive_int("SERVE_WORKER_CONNECTIONS", 1000),
+        max_requests=_env_non_negative_int("SERVE_MAX_REQUESTS", 10000),
+        max_requests_jitter=_env_non_negative_int("SERVE_MAX_REQUESTS_JITTER", 1000),
+        keepalive_seconds=_env_positive_int("SERVE_KEEPALIVE_SECONDS", 5),
+        backlog=_env_positive_int("SERVE_BACKLOG", 2048),
+        timeout_seconds=_env_positive_int("SERVE_TIMEOUT_SECONDS", 60),
+        graceful_timeout_seconds=_env_positive_int(
+            "SERVE_GRACEFUL_TIMEOUT_SECONDS",
+            30,
+        ),
     )
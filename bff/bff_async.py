@@ -0,0 +1,85 @@
+"""Cooperative (gevent) entrypoint for the Backend-for-Frontend service.
+
+Serves the same Flask application as ``bff.py`` on a gevent WSGI server.
+Standard-library sockets are monkey-patched before anything else is imported,
+so every blocking upstream call made through ``requests`` yields to other
+requests instead of pinning an OS thread. One process can therefore keep
+thousands of slow backend calls in flight while routes, cookie handling,
+token refresh and the OpenAPI document stay exactly as in threaded mode.
+
+Requires the ``async`` extra (``uv sync --extra async``).
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import os  # noqa: E402
+
+import dotenv  # noqa: E402
+from gevent.pool import Pool  # noqa: E402
+from gevent.pywsgi import WSGIHandler, WSGIServer  # noqa: E402
+
+from bff_app import create_app  # noqa: E402
+from bff_app.settings import SettingsValidationError, load_settings_from_env  # noqa: E402
+
+dotenv.load_dotenv()
+
+settings = load_settings_from_env()
+app = create_app(settings=settings)
+
+
+class _SocketExposingHandler(WSGIHandler):
+    """WSGI handler exposing the client socket for the WebSocket relay."""
+
+    def get_environ(self):  # noqa: ANN202
+        environ = super().get_environ()
+        environ["bff.socket"] = self.socket
+        return environ
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise SettingsValidationError(
+            f"{name} must be a positive integer. Received: {value!r}"
+        ) from exc
+    if parsed <= 0:
+        raise SettingsValidationError(
+            f"{name} must be greater than 0. Received: {value!r}"
+        )
+    return parsed
+
+
+def main() -> None:
+    """Serve the app until interrupted.
+
+    Reads ``HOST`` (default ``0.0.0.0``), ``PORT`` (default ``5000``) and
+    ``ASYNC_MAX_CONNECTIONS`` (default ``1000``), the cap on concurrently
+    handled client connections.
+    """
+    host = os.getenv("HOST", "0.0.0.0")
+    port = _env_int("PORT", 5000)
+    max_connections = _env_int("ASYNC_MAX_CONNECTIONS", 1000)
+
+    server = WSGIServer(
+        (host, port),
+        app,
+        spawn=Pool(max_connections),
+        handler_class=_SocketExposingHandler,
+    )
+    app.logger.info(
+        "Serving BFF with gevent on %s:%s (max %s connections)",
+        host,
+        port,
+        max_connections,
+    )
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
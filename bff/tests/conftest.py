@@ -55,6 +55,12 @@ def client(app):
     return app.test_client()
 
 
+@pytest.fixture()
+def upstream(app):
+    """Pooled upstream session; patch its ``get``/``post``/``request`` methods."""
+    return app.extensions["bff_upstream_session"]
+
+
 @pytest.fixture()
 def build_token_payload():
     def _build_token_payload(**overrides):
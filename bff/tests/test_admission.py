@@ -0,0 +1,147 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bff_app.services.admission import (
+    ConcurrencyLimiter,
+    ProxyOverloadedError,
+    SessionRateLimiter,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limited_app(app, monkeypatch, **env):
+    from bff_app import create_app
+    from bff_app.settings import load_settings_from_env
+
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    flask_app = create_app(load_settings_from_env())
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+def test_concurrency_limiter_sheds_when_queue_is_full():
+    limiter = ConcurrencyLimiter(max_in_flight=1, max_queue=0, queue_timeout_seconds=1)
+
+    assert limiter.acquire() is True
+    assert limiter.acquire() is False
+    limiter.release()
+    assert limiter.acquire() is True
+    assert limiter.stats() == {
+        "max_in_flight": 1,
+        "in_flight": 1,
+        "waiting": 0,
+        "rejected": 1,
+    }
+
+
+def test_concurrency_limiter_queued_request_gets_released_slot():
+    limiter = ConcurrencyLimiter(max_in_flight=1, max_queue=1, queue_timeout_seconds=5)
+    limiter.acquire()
+    acquired = []
+
+    waiter = threading.Thread(target=lambda: acquired.append(limiter.acquire()))
+    waiter.start()
+    while limiter.stats()["waiting"] == 0:
+        pass
+    limiter.release()
+    waiter.join(timeout=5)
+
+    assert acquired == [True]
+    assert limiter.stats()["in_flight"] == 1
+
+
+def test_concurrency_limiter_queue_timeout_raises_overloaded():
+    limiter = ConcurrencyLimiter(
+        max_in_flight=1,
+        max_queue=1,
+        queue_timeout_seconds=0.01,
+    )
+    limiter.acquire()
+
+    with pytest.raises(ProxyOverloadedError):
+        with limiter.slot():
+            pass
+
+
+def test_session_rate_limiter_refills_per_session():
+    clock = FakeClock()
+    limiter = SessionRateLimiter(rate_per_second=2, burst=2, clock=clock)
+
+    assert limiter.consume(b"tab-a") == 0.0
+    assert limiter.consume(b"tab-a") == 0.0
+    assert limiter.consume(b"tab-a") == pytest.approx(0.5)
+    assert limiter.consume(b"tab-b") == 0.0
+
+    clock.now += 0.5
+    assert limiter.consume(b"tab-a") == 0.0
+
+
+def test_session_rate_limiter_charges_the_cost_of_a_request():
+    clock = FakeClock()
+    limiter = SessionRateLimiter(rate_per_second=1, burst=4, clock=clock)
+
+    assert limiter.consume(b"tab-a", cost=3) == 0.0
+    assert limiter.consume(b"tab-a", cost=3) == pytest.approx(2.0)
+    # A cost above the burst waits for a full bucket and then runs into debt.
+    clock.now += 3
+    assert limiter.consume(b"tab-a", cost=6) == 0.0
+    assert limiter.consume(b"tab-a") == pytest.approx(3.0)
+
+
+def test_proxy_returns_503_with_retry_after_when_overloaded(app, monkeypatch):
+    limited_app = _limited_app(
+        app,
+        monkeypatch,
+        PROXY_MAX_IN_FLIGHT="1",
+        PROXY_MAX_QUEUE="0",
+        PROXY_RETRY_AFTER_SECONDS="2",
+    )
+    mock_request = MagicMock()
+    monkeypatch.setattr(
+        limited_app.extensions["bff_upstream_session"],
+        "request",
+        mock_request,
+    )
+    limited_app.extensions["bff_proxy_limiter"].acquire()
+
+    res = limited_app.test_client().get("/proxy/api/request/widgets")
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "2"
+    mock_request.assert_not_called()
+
+
+def test_proxy_returns_429_when_session_exceeds_its_bucket(app, monkeypatch):
+    limited_app = _limited_app(
+        app,
+        monkeypatch,
+        PROXY_SESSION_BURST="2",
+        PROXY_SESSION_RATE_PER_SECOND="0.5",
+    )
+    monkeypatch.setattr(
+        limited_app.extensions["bff_upstream_session"],
+        "request",
+        MagicMock(
+            return_value=SimpleNamespace(content=b"{}", status_code=200, headers={})
+        ),
+    )
+    client = limited_app.test_client()
+
+    statuses = [client.get("/proxy/api/request/widgets").status_code for _ in range(3)]
+    res = client.get("/proxy/api/request/widgets")
+
+    assert statuses == [200, 200, 429]
+    assert res.status_code == 429
+    assert res.headers["Retry-After"] == "2"
+    assert limited_app.extensions["bff_proxy_limiter"].stats()["in_flight"] == 0
@@ -1,4 +1,5 @@
 import logging
+import secrets
 from unittest.mock import MagicMock
 
 from bff_app.routes import auth as auth_routes
@@ -46,10 +47,11 @@ def test_login_callback_exchanges_code_and_redirects(client, monkeypatch, app, c
         "location=http://frontend.test"
     ) in caplog.text
     set_cookie_headers = res.headers.getlist("Set-Cookie")
-    assert any(header.startswith("test-session_at=") for header in set_cookie_headers)
-    assert any(header.startswith("test-session_rt=") for header in set_cookie_headers)
-    assert any(header.startswith("test-session_it=") for header in set_cookie_headers)
-    assert any(header.startswith("test-session_meta=") for header in set_cookie_headers)
+    assert any(header.startswith("test-session_tk=") for header in set_cookie_headers)
+    assert not any(
+        header.startswith(("test-session_at=", "test-session_meta="))
+        for header in set_cookie_headers
+    )
 
     with client.session_transaction() as sess:
         assert "token" not in sess
@@ -163,7 +165,8 @@ def test_login_callback_token_exchange_error_redirects_without_500(
 
 
 def test_login_callback_cookie_too_large_redirects_with_error(client, monkeypatch):
-    large_access_token = "a" * 7000
+    # Random data does not compress, so it overflows every chunk cookie.
+    large_access_token = secrets.token_urlsafe(24000)
     fake_oauth = _fake_oauth_session(
         token={
             "access_token": large_access_token,
@@ -183,6 +186,7 @@ def test_login_callback_cookie_too_large_redirects_with_error(client, monkeypatc
     assert res.headers["Location"] == "http://frontend.test?error=auth_cookie_too_large"
     set_cookie_headers = res.headers.getlist("Set-Cookie")
     assert any(header.startswith("test-session_at=;") for header in set_cookie_headers)
+    assert client.application.extensions["bff_metrics"].token_cookie_too_large.value() == 1
 
 
 def test_login_callback_invalid_token_payload_redirects_with_error(client, monkeypatch):
@@ -3,18 +3,18 @@ from unittest.mock import MagicMock
 
 import requests
 
-from bff_app.routes import auth as auth_routes
-
 
 def test_logout_revokes_tokens_and_clears_session(
+    app,
     client,
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     # Mock the auth server logout call.
     mock_post = MagicMock(return_value=SimpleNamespace(status_code=200))
-    monkeypatch.setattr(auth_routes.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     set_auth_cookies(client, build_token_payload(id_token="id-token"))
 
@@ -22,6 +22,7 @@ def test_logout_revokes_tokens_and_clears_session(
 
     assert res.status_code == 200
     assert res.get_json() == {"message": "logout successful"}
+    assert app.extensions["bff_background_executor"].wait_idle(timeout=5)
     mock_post.assert_called_once()
     assert mock_post.call_args.args[0] == "http://auth.test/logout"
     assert mock_post.call_args.args[1] == {"id_token_hint": "id-token"}
@@ -32,9 +33,9 @@ def test_logout_revokes_tokens_and_clears_session(
         assert "token" not in sess
 
 
-def test_logout_without_token_still_clears_session(client, monkeypatch):
+def test_logout_without_token_still_clears_session(client, monkeypatch, upstream):
     mock_post = MagicMock()
-    monkeypatch.setattr(auth_routes.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     with client.session_transaction() as sess:
         sess["state"] = "stale-state"
@@ -49,13 +50,15 @@ def test_logout_without_token_still_clears_session(client, monkeypatch):
 
 
 def test_logout_handles_upstream_timeout_and_still_clears_session(
+    app,
     client,
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     mock_post = MagicMock(side_effect=requests.exceptions.Timeout("timeout"))
-    monkeypatch.setattr(auth_routes.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     set_auth_cookies(client, build_token_payload(id_token="id-token"))
 
@@ -63,6 +66,7 @@ def test_logout_handles_upstream_timeout_and_still_clears_session(
 
     assert res.status_code == 200
     assert res.get_json() == {"message": "logout successful"}
+    assert app.extensions["bff_background_executor"].wait_idle(timeout=5)
     mock_post.assert_called_once()
     assert mock_post.call_args.kwargs["timeout"] == (3.0, 30.0)
     with client.session_transaction() as sess:
@@ -1,19 +1,17 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from bff_app.routes import auth as auth_routes
-from bff_app.services import auth as auth_service
-
 
 def test_session_true_when_userinfo_ok(
     client,
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     # If userinfo returns 200, the session is considered valid.
     mock_get = MagicMock(return_value=SimpleNamespace(status_code=200))
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
+    monkeypatch.setattr(upstream, "get", mock_get)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -28,6 +26,7 @@ def test_session_refreshes_and_recovers(
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     mock_get = MagicMock(side_effect=[
         SimpleNamespace(status_code=401),
@@ -41,8 +40,8 @@ def test_session_refreshes_and_recovers(
             "refresh_token": "new-refresh-token",
         },
     ))
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
-    monkeypatch.setattr(auth_service.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "get", mock_get)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -62,12 +61,13 @@ def test_session_false_clears_cookie_on_failure(
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     # Non-200 from userinfo causes the session to be cleared.
     mock_get = MagicMock(return_value=SimpleNamespace(status_code=401))
     mock_post = MagicMock(return_value=SimpleNamespace(status_code=400))
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
-    monkeypatch.setattr(auth_service.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "get", mock_get)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     set_auth_cookies(client, build_token_payload())
 
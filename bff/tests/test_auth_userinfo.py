@@ -3,14 +3,13 @@ from unittest.mock import MagicMock
 
 import requests
 
-from bff_app.routes import auth as auth_routes
-
 
 def test_userinfo_proxies_to_auth_server(
     client,
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     # Mock userinfo response from auth server.
     mock_get = MagicMock(
@@ -19,7 +18,7 @@ def test_userinfo_proxies_to_auth_server(
             json=lambda: {"sub": "user-1"},
         )
     )
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
+    monkeypatch.setattr(upstream, "get", mock_get)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -31,9 +30,9 @@ def test_userinfo_proxies_to_auth_server(
     assert mock_get.call_args.kwargs["timeout"] == (3.0, 30.0)
 
 
-def test_userinfo_missing_session_token_returns_401(client, monkeypatch):
+def test_userinfo_missing_session_token_returns_401(client, monkeypatch, upstream):
     mock_get = MagicMock()
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
+    monkeypatch.setattr(upstream, "get", mock_get)
 
     res = client.get("/proxy/api/auth/userinfo")
 
@@ -47,9 +46,10 @@ def test_userinfo_handles_upstream_request_errors(
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     mock_get = MagicMock(side_effect=requests.exceptions.Timeout("timeout"))
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
+    monkeypatch.setattr(upstream, "get", mock_get)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -64,6 +64,7 @@ def test_userinfo_clears_session_on_upstream_401(
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     mock_get = MagicMock(
         return_value=SimpleNamespace(
@@ -71,7 +72,7 @@ def test_userinfo_clears_session_on_upstream_401(
             json=lambda: {"error": "invalid_token"},
         )
     )
-    monkeypatch.setattr(auth_routes.requests, "get", mock_get)
+    monkeypatch.setattr(upstream, "get", mock_get)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -84,3 +85,61 @@ def test_userinfo_clears_session_on_upstream_401(
     assert any(header.startswith("test-session_rt=;") for header in set_cookie_headers)
     assert any(header.startswith("test-session_it=;") for header in set_cookie_headers)
     assert any(header.startswith("test-session_meta=;") for header in set_cookie_headers)
+
+
+def test_userinfo_serves_repeated_calls_from_cache(
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    mock_get = MagicMock(
+        return_value=SimpleNamespace(
+            status_code=200,
+            json=lambda: {"sub": "user-1"},
+        )
+    )
+    monkeypatch.setattr(upstream, "get", mock_get)
+
+    set_auth_cookies(client, build_token_payload())
+
+    first = client.get("/proxy/api/auth/userinfo")
+    second = client.get("/proxy/api/auth/userinfo")
+    session_res = client.get("/proxy/api/auth/session")
+
+    assert first.get_json() == {"sub": "user-1"}
+    assert second.get_json() == {"sub": "user-1"}
+    assert session_res.get_json() == {"session": True}
+    mock_get.assert_called_once()
+    stats = client.application.extensions["bff_userinfo_cache"].stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_userinfo_cache_is_invalidated_on_logout(
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    mock_get = MagicMock(
+        return_value=SimpleNamespace(
+            status_code=200,
+            json=lambda: {"sub": "user-1"},
+        )
+    )
+    monkeypatch.setattr(upstream, "get", mock_get)
+    monkeypatch.setattr(
+        upstream,
+        "post",
+        MagicMock(return_value=SimpleNamespace(status_code=200)),
+    )
+
+    set_auth_cookies(client, build_token_payload())
+    client.get("/proxy/api/auth/userinfo")
+    client.get("/proxy/api/auth/logout")
+
+    cache = client.application.extensions["bff_userinfo_cache"]
+    assert cache.get("access-token") is None
@@ -0,0 +1,93 @@
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from bff_app.services.background import BackgroundExecutor
+
+
+def test_tasks_run_off_the_calling_thread_and_report_outcomes():
+    outcomes = []
+    executor = BackgroundExecutor(
+        max_workers=1,
+        max_queue=4,
+        on_outcome=lambda task, outcome: outcomes.append((task, outcome)),
+    )
+    ran_on = []
+
+    def fail():
+        raise RuntimeError("boom")
+
+    assert executor.submit("ok_task", lambda: ran_on.append(threading.current_thread()))
+    assert executor.submit("failing_task", fail)
+    assert executor.wait_idle(timeout=5)
+
+    assert ran_on[0] is not threading.current_thread()
+    assert outcomes == [("ok_task", "ok"), ("failing_task", "error")]
+
+
+def test_full_queue_rejects_tasks_and_shutdown_discards_leftovers():
+    outcomes = []
+    executor = BackgroundExecutor(
+        max_workers=1,
+        max_queue=1,
+        on_outcome=lambda task, outcome: outcomes.append((task, outcome)),
+    )
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    assert executor.submit("blocking", block)
+    assert started.wait(5)
+    assert executor.submit("queued", lambda: None)
+    assert not executor.submit("overflow", lambda: None)
+    assert executor.stats() == {"queued": 1, "running": 1, "workers": 1}
+
+    assert executor.shutdown(timeout=0.01) == 1
+    release.set()
+    assert executor.wait_idle(timeout=5)
+    assert not executor.submit("late", lambda: None)
+    assert ("overflow", "rejected") in outcomes
+    assert ("queued", "dropped") in outcomes
+    assert ("late", "rejected") in outcomes
+
+
+def test_shutdown_drains_queued_tasks_within_timeout():
+    executor = BackgroundExecutor(max_workers=2, max_queue=8)
+    done = []
+
+    for index in range(5):
+        executor.submit("task", lambda index=index: done.append(index))
+
+    assert executor.shutdown(timeout=5) == 0
+    assert sorted(done) == [0, 1, 2, 3, 4]
+
+
+def test_logout_answers_before_slow_idp_call_finishes(
+    app,
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    release = threading.Event()
+
+    def slow_logout(*args, **kwargs):
+        release.wait(5)
+        return SimpleNamespace(status_code=200)
+
+    mock_post = MagicMock(side_effect=slow_logout)
+    monkeypatch.setattr(upstream, "post", mock_post)
+    set_auth_cookies(client, build_token_payload(id_token="id-token"))
+
+    res = client.get("/proxy/api/auth/logout")
+
+    assert res.status_code == 200
+    release.set()
+    assert app.extensions["bff_background_executor"].wait_idle(timeout=5)
+    mock_post.assert_called_once()
+    metrics = app.extensions["bff_metrics"]
+    assert metrics.background_tasks.value(task="idp_logout", outcome="ok") == 1
@@ -0,0 +1,72 @@
+import requests
+
+from benchmarks.load import compare_to_baseline
+from benchmarks.stubs import EXPIRED_ACCESS_TOKEN, StubServers, summarize
+
+
+def _document(**scenarios):
+    return {"scenarios": scenarios}
+
+
+def _summary(rps=100.0, p99_ms=50.0, errors=0):
+    return {
+        "rps": rps,
+        "p50_ms": 10.0,
+        "p95_ms": 40.0,
+        "p99_ms": p99_ms,
+        "errors": errors,
+    }
+
+
+def test_summarize_reports_throughput_and_percentiles():
+    latencies = [index / 1000 for index in range(1, 101)]
+
+    summary = summarize(latencies, errors=2, duration=2.0)
+
+    assert summary["requests"] == 100
+    assert summary["errors"] == 2
+    assert summary["rps"] == 50.0
+    assert summary["p50_ms"] == 50.5
+    assert summary["p95_ms"] == 95.05
+    assert summary["p99_ms"] == 99.01
+
+
+def test_compare_to_baseline_flags_only_changes_beyond_tolerance():
+    baseline = _document(proxy=_summary(), refresh=_summary(), session=_summary())
+    current = _document(
+        proxy=_summary(rps=95.0, p99_ms=54.0),
+        refresh=_summary(rps=80.0, p99_ms=70.0, errors=1),
+    )
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.1)
+
+    assert regressions == [
+        "refresh: 1 errors (baseline 0)",
+        "refresh: rps 80.0 vs 100.0 (-20.0%)",
+        "refresh: p99_ms 70.0 vs 50.0 (+40.0%)",
+    ]
+
+
+def test_stub_backend_rejects_the_expired_token_until_refreshed():
+    with StubServers() as stubs:
+        env = stubs.env()
+        expired = requests.get(
+            f"{env['BACKEND_ENDPOINT']}/items",
+            headers={"Authorization": f"Bearer {EXPIRED_ACCESS_TOKEN}"},
+            timeout=5,
+        )
+        refreshed = requests.post(
+            env["OAUTH_ENDPOINT_TOKEN"],
+            data={"grant_type": "refresh_token", "refresh_token": "rt"},
+            timeout=5,
+        ).json()
+        retried = requests.get(
+            f"{env['BACKEND_ENDPOINT']}/items",
+            headers={"Authorization": f"Bearer {refreshed['access_token']}"},
+            timeout=5,
+        )
+
+    assert expired.status_code == 401
+    assert "invalid_token" in expired.headers["WWW-Authenticate"]
+    assert retried.status_code == 200
+    assert stubs.calls == {"backend": 2, "token": 1}
@@ -0,0 +1,203 @@
+import gzip
+import io
+import json
+import zlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from bff_app.services.compression import ResponseCompressor
+from bff_app.settings import (
+    DEFAULT_COMPRESSIBLE_CONTENT_TYPES,
+    SettingsValidationError,
+    load_settings_from_env,
+)
+
+LARGE_JSON = json.dumps({"items": [{"id": index} for index in range(500)]}).encode()
+
+
+def _json_response(body=LARGE_JSON, **headers):
+    return SimpleNamespace(
+        content=body,
+        status_code=200,
+        headers={"Content-Type": "application/json", **headers},
+    )
+
+
+def _compressor(encodings=("br", "gzip")):
+    return ResponseCompressor(
+        encodings=encodings,
+        min_bytes=1024,
+        gzip_level=5,
+        brotli_quality=4,
+        content_types=DEFAULT_COMPRESSIBLE_CONTENT_TYPES,
+    )
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0.5, br;q=0.8", "br"),
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        (None, None),
+    ],
+)
+def test_negotiate_follows_q_values_then_server_preference(accept_encoding, expected):
+    pytest.importorskip("brotli")
+
+    assert _compressor().negotiate(accept_encoding) == expected
+
+
+def test_large_json_is_gzipped_for_browsers_accepting_it(
+    app,
+    client,
+    monkeypatch,
+    upstream,
+):
+    monkeypatch.setattr(
+        upstream,
+        "request",
+        MagicMock(return_value=_json_response(ETag='"v1"')),
+    )
+
+    res = client.get("/proxy/api/request/items", headers={"Accept-Encoding": "gzip"})
+
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert res.headers["Vary"] == "Accept-Encoding"
+    assert res.headers["ETag"] == 'W/"v1"'
+    assert int(res.headers["Content-Length"]) == len(res.data) < len(LARGE_JSON)
+    assert gzip.decompress(res.data) == LARGE_JSON
+    metrics = app.extensions["bff_metrics"]
+    assert metrics.compressed_responses.value(encoding="gzip") == 1
+    assert metrics.compression_bytes.value(encoding="gzip", stage="in") == len(
+        LARGE_JSON
+    )
+
+
+def test_brotli_is_preferred_when_installed(client, monkeypatch, upstream):
+    brotli = pytest.importorskip("brotli")
+    monkeypatch.setattr(upstream, "request", MagicMock(return_value=_json_response()))
+
+    res = client.get(
+        "/proxy/api/request/items",
+        headers={"Accept-Encoding": "gzip, deflate, br"},
+    )
+
+    assert res.headers["Content-Encoding"] == "br"
+    assert brotli.decompress(res.data) == LARGE_JSON
+
+
+@pytest.mark.parametrize(
+    "upstream_response",
+    [
+        _json_response(body=b'{"small": true}'),
+        _json_response(**{"Content-Type": "image/png"}),
+        _json_response(**{"Cache-Control": "no-transform"}),
+    ],
+)
+def test_ineligible_responses_are_sent_as_is(
+    client,
+    monkeypatch,
+    upstream,
+    upstream_response,
+):
+    monkeypatch.setattr(upstream, "request", MagicMock(return_value=upstream_response))
+
+    res = client.get("/proxy/api/request/items", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in res.headers
+    assert res.data == upstream_response.content
+
+
+def test_upstream_compressed_bodies_are_passed_through_untouched(
+    client,
+    monkeypatch,
+    upstream,
+):
+    compressed = gzip.compress(LARGE_JSON)
+    upstream_response = requests.Response()
+    upstream_response.status_code = 200
+    upstream_response.headers.update(
+        {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+    )
+    upstream_response.raw = HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+    )
+    mock_request = MagicMock(return_value=upstream_response)
+    monkeypatch.setattr(upstream, "request", mock_request)
+
+    res = client.get("/proxy/api/request/items", headers={"Accept-Encoding": "gzip"})
+
+    assert mock_request.call_args.kwargs["headers"]["Accept-Encoding"] == "gzip"
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert res.data == compressed
+
+
+def test_event_streams_are_compressed_chunk_by_chunk(client, monkeypatch, upstream):
+    chunks = [b"data: 1\n\n", b"data: 2\n\n"]
+    upstream_response = SimpleNamespace(
+        status_code=200,
+        headers={"content-type": "text/event-stream"},
+        iter_content=lambda chunk_size=None: iter(chunks),
+        close=MagicMock(),
+    )
+    monkeypatch.setattr(upstream, "request", MagicMock(return_value=upstream_response))
+
+    res = client.get(
+        "/proxy/api/request/events",
+        headers={"Accept": "text/event-stream", "Accept-Encoding": "gzip"},
+        buffered=False,
+    )
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    stream = iter(res.response)
+
+    assert res.headers["Content-Encoding"] == "gzip"
+    assert decompressor.decompress(next(stream)) == chunks[0]
+    assert decompressor.decompress(next(stream)) == chunks[1]
+    res.close()
+    upstream_response.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("PROXY_COMPRESSION_ENCODINGS", "gzip,zstd"),
+        ("PROXY_COMPRESSION_GZIP_LEVEL", "10"),
+        ("PROXY_COMPRESSION_BROTLI_QUALITY", "fast"),
+    ],
+)
+def test_invalid_compression_settings_are_rejected(app, monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(SettingsValidationError, match=name):
+        load_settings_from_env()
+
+
+def test_empty_compression_encodings_disable_compression(app, monkeypatch):
+    from bff_app import create_app
+
+    monkeypatch.setenv("PROXY_COMPRESSION_ENCODINGS", "")
+    uncompressed_app = create_app(load_settings_from_env())
+    monkeypatch.setattr(
+        uncompressed_app.extensions["bff_upstream_session"],
+        "request",
+        MagicMock(return_value=_json_response()),
+    )
+
+    res = uncompressed_app.test_client().get(
+        "/proxy/api/request/items",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert "Content-Encoding" not in res.headers
+    assert res.data == LARGE_JSON
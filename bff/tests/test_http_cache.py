@@ -0,0 +1,199 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bff_app.services.http_cache import (
+    ResponseCache,
+    build_cached_response,
+    parse_cache_control,
+    revalidated,
+)
+
+
+@pytest.fixture()
+def cached_app(app, monkeypatch):
+    from bff_app import create_app
+    from bff_app.settings import load_settings_from_env
+
+    monkeypatch.setenv("PROXY_CACHE_MAX_BYTES", "1048576")
+    monkeypatch.setenv("PROXY_CACHE_SHARED_PATHS", "/legal/, locale/available/")
+    flask_app = create_app(load_settings_from_env())
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+def _backend_response(body=b'{"ok":true}', status_code=200, headers=None):
+    return SimpleNamespace(content=body, status_code=status_code, headers=headers or {})
+
+
+def _build(headers, shared=False, status_code=200):
+    return build_cached_response(
+        status_code,
+        list(headers.items()),
+        b"body",
+        {"Accept-Language": "fr"},
+        now=100.0,
+        shared=shared,
+        shared_default_ttl_seconds=60,
+    )
+
+
+def test_parse_cache_control_normalizes_directives():
+    assert parse_cache_control('Private, Max-Age="30", no-transform') == {
+        "private": None,
+        "max-age": "30",
+        "no-transform": None,
+    }
+
+
+def test_build_cached_response_applies_storability_rules():
+    assert _build({"Cache-Control": "max-age=30"}).expires_at == 130.0
+    shared_entry = _build({"Cache-Control": "max-age=30, s-maxage=5"}, shared=True)
+    assert shared_entry.expires_at == 105.0
+    assert _build({}, shared=True).expires_at == 160.0
+    assert _build({"ETag": '"v1"'}).expires_at == 100.0
+    assert _build({"Vary": "Accept-Language", "Cache-Control": "max-age=1"}).vary == (
+        ("accept-language", "fr"),
+    )
+
+    assert _build({}) is None
+    assert _build({"Cache-Control": "no-store, max-age=30"}) is None
+    assert _build({"Cache-Control": "private, max-age=30"}, shared=True) is None
+    assert _build({"Cache-Control": "max-age=30", "Set-Cookie": "a=b"}) is None
+    assert _build({"Cache-Control": "max-age=30", "Vary": "*"}) is None
+    assert _build({"Cache-Control": "max-age=30"}, status_code=404) is None
+
+
+def test_revalidated_refreshes_freshness_and_headers():
+    entry = _build({"ETag": '"v1"', "Content-Type": "application/json"})
+
+    refreshed = revalidated(
+        entry,
+        [("Cache-Control", "max-age=10"), ("ETag", '"v1"'), ("X-Other", "x")],
+        now=200.0,
+        shared=False,
+    )
+
+    assert refreshed.body == b"body"
+    assert refreshed.expires_at == 210.0
+    assert ("Cache-Control", "max-age=10") in refreshed.headers
+    assert ("X-Other", "x") not in refreshed.headers
+
+
+def test_response_cache_evicts_least_recently_used_within_byte_budget():
+    cache = ResponseCache(max_bytes=10)
+    entry = _build({"ETag": "e"})  # 4 body bytes + 5 header bytes
+
+    cache.set(b"a", entry)
+    cache.set(b"b", entry)
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") is entry
+    assert cache.stats()["size_bytes"] == entry.size
+    assert cache.stats()["evictions"] == 1
+
+
+def test_private_tier_serves_fresh_hits_per_session(
+    cached_app,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+):
+    upstream = cached_app.extensions["bff_upstream_session"]
+    mock_request = MagicMock(
+        return_value=_backend_response(headers={"Cache-Control": "private, max-age=60"})
+    )
+    monkeypatch.setattr(upstream, "request", mock_request)
+    first_client = cached_app.test_client()
+    second_client = cached_app.test_client()
+    set_auth_cookies(first_client, build_token_payload(access_token="first"))
+    set_auth_cookies(second_client, build_token_payload(access_token="second"))
+
+    responses = [
+        first_client.get("/proxy/api/request/widgets?limit=5"),
+        first_client.get("/proxy/api/request/widgets?limit=5"),
+        second_client.get("/proxy/api/request/widgets?limit=5"),
+    ]
+
+    assert [res.data for res in responses] == [b'{"ok":true}'] * 3
+    assert responses[1].headers["Age"] == "0"
+    assert mock_request.call_count == 2
+
+
+def test_shared_tier_is_used_across_sessions(
+    cached_app,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+):
+    upstream = cached_app.extensions["bff_upstream_session"]
+    mock_request = MagicMock(return_value=_backend_response(body=b"terms"))
+    monkeypatch.setattr(upstream, "request", mock_request)
+    signed_in_client = cached_app.test_client()
+    set_auth_cookies(signed_in_client, build_token_payload(access_token="user-a"))
+
+    first = signed_in_client.get(
+        "/proxy/api/request/legal/terms/",
+        headers={"Authorization": "Bearer browser-supplied"},
+    )
+    second = cached_app.test_client().get("/proxy/api/request/legal/terms/")
+    bypassed = cached_app.test_client().get(
+        "/proxy/api/request/legal/terms/",
+        headers={"Cache-Control": "no-store"},
+    )
+
+    assert first.data == second.data == bypassed.data == b"terms"
+    assert mock_request.call_count == 2
+    # The shared copy is fetched without any session's credentials.
+    for call in mock_request.call_args_list:
+        assert not any(
+            name.lower() == "authorization" for name in call.kwargs["headers"]
+        )
+
+
+def test_stale_entry_is_revalidated_with_if_none_match(
+    cached_app,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+):
+    upstream = cached_app.extensions["bff_upstream_session"]
+    mock_request = MagicMock(
+        side_effect=[
+            _backend_response(headers={"ETag": '"v1"', "Cache-Control": "no-cache"}),
+            _backend_response(body=b"", status_code=304, headers={"ETag": '"v1"'}),
+        ]
+    )
+    monkeypatch.setattr(upstream, "request", mock_request)
+    client = cached_app.test_client()
+    set_auth_cookies(client, build_token_payload())
+
+    client.get("/proxy/api/request/widgets")
+    res = client.get("/proxy/api/request/widgets")
+
+    assert res.status_code == 200
+    assert res.data == b'{"ok":true}'
+    assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert cached_app.extensions["bff_response_cache"].stats()["revalidations"] == 1
+
+
+def test_unsafe_request_invalidates_cached_url(
+    cached_app,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+):
+    upstream = cached_app.extensions["bff_upstream_session"]
+    mock_request = MagicMock(
+        return_value=_backend_response(headers={"Cache-Control": "max-age=60"})
+    )
+    monkeypatch.setattr(upstream, "request", mock_request)
+    client = cached_app.test_client()
+    set_auth_cookies(client, build_token_payload())
+
+    client.get("/proxy/api/request/widgets")
+    client.put("/proxy/api/request/widgets", data=b"{}")
+    client.get("/proxy/api/request/widgets")
+
+    assert mock_request.call_count == 3
@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from bff_app.services.metrics import BffMetrics, Counter, Histogram, _Metric
+from bff_app.services.upstream import build_upstream_session
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1))
+
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.1, route="/a")
+    histogram.observe(3, route="/a")
+
+    assert list(histogram.render()) == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+        'latency_seconds_sum{route="/a"} 3.15',
+        'latency_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_counter_escapes_label_values():
+    counter = Counter("events_total", "Events.", ("reason",))
+
+    counter.inc(reason='bad "quote"\n')
+
+    assert list(counter.samples()) == ['events_total{reason="bad \\"quote\\"\\n"} 1']
+
+
+def test_metric_types_must_render_their_samples():
+    class Incomplete(_Metric):
+        metric_type = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("bff_incomplete", "Metric without samples().")
+
+
+def test_metrics_endpoint_reports_route_latency_and_gauges(client):
+    client.get("/ping")
+
+    res = client.get("/metrics")
+
+    assert res.status_code == 200
+    assert res.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = res.get_data(as_text=True)
+    assert (
+        'bff_http_request_duration_seconds_count{route="/ping",method="GET",status="200"} 1'
+        in body
+    )
+    assert 'bff_http_requests_in_flight{route="/ping"} 0' in body
+    assert 'bff_http_requests_in_flight{route="/metrics"} 1' in body
+    assert 'bff_proxy_upstream_slots{upstream="backend",state="in_flight"} 0' in body
+
+
+def test_refresh_outcomes_and_decode_failures_are_counted(
+    app,
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    monkeypatch.setattr(
+        upstream,
+        "request",
+        MagicMock(
+            return_value=SimpleNamespace(
+                content=b"",
+                status_code=401,
+                headers={"www-authenticate": 'Bearer error="invalid_token"'},
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        upstream,
+        "post",
+        MagicMock(return_value=SimpleNamespace(status_code=400)),
+    )
+    set_auth_cookies(client, build_token_payload())
+    client.get("/proxy/api/request/widgets")
+
+    client.set_cookie("test-session_tk", "garbage")
+    client.get("/proxy/api/request/widgets")
+
+    metrics = app.extensions["bff_metrics"]
+    assert metrics.token_refresh.value(outcome="rejected") == 1
+    assert metrics.token_decode_failures.value(source="cookie") == 1
+
+
+def test_upstream_attempts_are_timed_by_target(app, monkeypatch):
+    settings = app.extensions["bff_settings"]
+    metrics = BffMetrics()
+    session = build_upstream_session(
+        settings,
+        app.extensions["bff_circuit_breakers"],
+        metrics,
+    )
+    response = requests.Response()
+    response.status_code = 200
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kwargs: response)
+
+    session.post(settings.oauth_endpoint_token, data={"grant_type": "refresh_token"})
+    session.get("http://backend.test/api/widgets?limit=5")
+
+    assert metrics.upstream_duration.count(target="token", outcome="ok") == 1
+    assert metrics.upstream_duration.count(target="backend", outcome="ok") == 1
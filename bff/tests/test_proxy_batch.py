@@ -0,0 +1,195 @@
+import base64
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from bff_app.services.batch import BatchValidationError, parse_batch_items
+
+
+def _backend_response(body=b'{"ok":true}', status_code=200, headers=None):
+    return SimpleNamespace(
+        content=body,
+        status_code=status_code,
+        headers=headers or {"content-type": "application/json"},
+    )
+
+
+def test_parse_batch_items_defaults_and_validation():
+    items = parse_batch_items({"requests": [{"path": "widgets"}]}, max_requests=2)
+
+    assert items[0].id == "0"
+    assert items[0].method == "GET"
+
+    for payload in (
+        None,
+        {"requests": []},
+        {"requests": [{"path": "a"}] * 3},
+        {"requests": [{"path": "a", "method": "TRACE"}]},
+        {"requests": [{"id": "x", "path": "a"}, {"id": "x", "path": "b"}]},
+        {"requests": [{"path": "a", "headers": {"x": 1}}]},
+    ):
+        with pytest.raises(BatchValidationError):
+            parse_batch_items(payload, max_requests=2)
+
+
+def test_batch_fans_out_with_one_token_load(
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    def fake_request(method, url, **kwargs):
+        if url.endswith("/broken"):
+            raise requests.exceptions.ReadTimeout("slow")
+        return _backend_response(
+            body=f"{method} {url}".encode(),
+            headers={"content-type": "text/plain", "set-cookie": "backend=1"},
+        )
+
+    mock_request = MagicMock(side_effect=fake_request)
+    monkeypatch.setattr(upstream, "request", mock_request)
+    set_auth_cookies(client, build_token_payload(access_token="batch-token"))
+
+    res = client.post(
+        "/proxy/api/batch",
+        json={
+            "requests": [
+                {"id": "widgets", "path": "widgets?limit=5"},
+                {
+                    "id": "create",
+                    "method": "post",
+                    "path": "/widgets",
+                    "headers": {"Content-Type": "application/json", "Cookie": "x"},
+                    "body": '{"x":1}',
+                },
+                {"id": "broken", "path": "broken"},
+            ]
+        },
+        headers={"X-Keep": "ok"},
+    )
+
+    assert res.status_code == 200
+    assert res.get_json()["responses"] == [
+        {
+            "id": "widgets",
+            "status": 200,
+            "headers": {"content-type": "text/plain"},
+            "body": "GET http://backend.test/api/widgets?limit=5",
+            "encoding": "utf-8",
+        },
+        {
+            "id": "create",
+            "status": 200,
+            "headers": {"content-type": "text/plain"},
+            "body": "POST http://backend.test/api/widgets",
+            "encoding": "utf-8",
+        },
+        {
+            "id": "broken",
+            "status": 502,
+            "headers": {},
+            "body": "Upstream connection error",
+            "encoding": "utf-8",
+        },
+    ]
+    create_call = next(
+        call for call in mock_request.call_args_list if call.kwargs["method"] == "POST"
+    )
+    assert create_call.kwargs["data"] == b'{"x":1}'
+    assert create_call.kwargs["headers"]["Authorization"] == "Bearer batch-token"
+    assert create_call.kwargs["headers"]["Content-Type"] == "application/json"
+    assert create_call.kwargs["headers"]["X-Keep"] == "ok"
+    assert "Cookie" not in create_call.kwargs["headers"]
+
+
+def test_batch_refreshes_token_once_for_rejected_items(
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    def fake_request(method, url, headers, **kwargs):
+        if headers["Authorization"] == "Bearer old-token":
+            return _backend_response(
+                body=b'{"error":"invalid_token"}',
+                status_code=401,
+                headers={"www-authenticate": 'Bearer error="invalid_token"'},
+            )
+        return _backend_response()
+
+    mock_request = MagicMock(side_effect=fake_request)
+    monkeypatch.setattr(upstream, "request", mock_request)
+    mock_post = MagicMock(
+        return_value=SimpleNamespace(
+            status_code=200,
+            json=lambda: {
+                "access_token": "new-token",
+                "refresh_token": "new-refresh-token",
+            },
+        )
+    )
+    monkeypatch.setattr(upstream, "post", mock_post)
+    set_auth_cookies(client, build_token_payload(access_token="old-token"))
+
+    res = client.post(
+        "/proxy/api/batch",
+        json={"requests": [{"path": f"widgets/{index}"} for index in range(4)]},
+    )
+
+    assert res.status_code == 200
+    assert [item["status"] for item in res.get_json()["responses"]] == [200] * 4
+    assert mock_post.call_count == 1
+    assert mock_request.call_count == 8
+    assert any("_tk=" in header for header in res.headers.getlist("Set-Cookie"))
+
+
+def test_batch_rejects_malformed_body(client, upstream, monkeypatch):
+    mock_request = MagicMock()
+    monkeypatch.setattr(upstream, "request", mock_request)
+
+    res = client.post("/proxy/api/batch", json={"requests": "widgets"})
+
+    assert res.status_code == 400
+    assert "requests" in res.get_json()["message"]
+    mock_request.assert_not_called()
+
+
+def test_batch_base64_encodes_bodies_that_are_not_utf8(client, monkeypatch, upstream):
+    png = b"\x89PNG\r\n\x1a\n\x00\xff"
+    monkeypatch.setattr(
+        upstream,
+        "request",
+        MagicMock(return_value=_backend_response(body=png)),
+    )
+
+    res = client.post("/proxy/api/batch", json={"requests": [{"path": "logo"}]})
+
+    (item,) = res.get_json()["responses"]
+    assert item["encoding"] == "base64"
+    assert base64.b64decode(item["body"]) == png
+
+
+def test_batch_charges_one_rate_limit_token_per_item(app, monkeypatch):
+    from bff_app import create_app
+    from bff_app.settings import load_settings_from_env
+
+    monkeypatch.setenv("PROXY_SESSION_BURST", "3")
+    monkeypatch.setenv("PROXY_SESSION_RATE_PER_SECOND", "0.5")
+    limited_app = create_app(load_settings_from_env())
+    mock_request = MagicMock(return_value=_backend_response())
+    monkeypatch.setattr(
+        limited_app.extensions["bff_upstream_session"], "request", mock_request
+    )
+    client = limited_app.test_client()
+    batch = {"requests": [{"path": f"widgets/{index}"} for index in range(3)]}
+
+    first = client.post("/proxy/api/batch", json=batch)
+    second = client.post("/proxy/api/batch", json=batch)
+
+    assert first.status_code == 200
+    assert second.status_code == 429
+    assert mock_request.call_count == 3
@@ -1,15 +1,13 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from bff_app.routes import proxy as proxy_routes
-from bff_app.services import auth as auth_service
-
 
 def test_proxy_request_forwards_to_backend(
     client,
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     # Mock backend response so we avoid a real HTTP call.
     backend_response = SimpleNamespace(
@@ -22,7 +20,7 @@ def test_proxy_request_forwards_to_backend(
         },
     )
     mock_request = MagicMock(return_value=backend_response)
-    monkeypatch.setattr(proxy_routes.requests, "request", mock_request)
+    monkeypatch.setattr(upstream, "request", mock_request)
 
     set_auth_cookies(client, build_token_payload())
 
@@ -68,6 +66,7 @@ def test_proxy_request_retries_on_invalid_token(
     monkeypatch,
     set_auth_cookies,
     build_token_payload,
+    upstream,
 ):
     backend_response = SimpleNamespace(
         content=b'{"ok":true}',
@@ -82,7 +81,7 @@ def test_proxy_request_retries_on_invalid_token(
         headers={"www-authenticate": 'Bearer error="invalid_token"'},
     )
     mock_request = MagicMock(side_effect=[unauthorized_response, backend_response])
-    monkeypatch.setattr(proxy_routes.requests, "request", mock_request)
+    monkeypatch.setattr(upstream, "request", mock_request)
 
     mock_post = MagicMock(return_value=SimpleNamespace(
         status_code=200,
@@ -91,7 +90,7 @@ def test_proxy_request_retries_on_invalid_token(
             "refresh_token": "new-refresh-token",
         },
     ))
-    monkeypatch.setattr(auth_service.requests, "post", mock_post)
+    monkeypatch.setattr(upstream, "post", mock_post)
 
     set_auth_cookies(
         client,
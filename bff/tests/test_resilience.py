@@ -0,0 +1,199 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from bff_app.services.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    ResilientHTTPAdapter,
+    RetryBudget,
+    is_connect_failure,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _connect_error() -> requests.exceptions.ConnectionError:
+    reason = NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(None, "http://backend.test/api", reason)
+    )
+
+
+def _build_adapter(max_retries_per_call=1, ratio=0.1, failure_threshold=5):
+    return ResilientHTTPAdapter(
+        breakers=CircuitBreakerRegistry(
+            failure_threshold=failure_threshold,
+            reset_timeout_seconds=10,
+        ),
+        retry_budget=RetryBudget(ratio=ratio),
+        max_retries_per_call=max_retries_per_call,
+        backoff_seconds=0.01,
+        sleep=lambda seconds: None,
+    )
+
+
+def test_circuit_breaker_opens_then_half_opens_after_reset_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.allow() == pytest.approx(10)
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow() == 0.0
+    assert breaker.allow() > 0, "only one probe may run while half-open"
+
+    breaker.record_success()
+    assert breaker.stats() == {
+        "state": "closed",
+        "consecutive_failures": 0,
+        "rejected": 2,
+    }
+
+
+def test_circuit_breaker_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=5, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 5
+
+    assert breaker.allow() == 0.0
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.allow() == pytest.approx(5)
+
+
+def test_retry_budget_is_bounded_by_ratio():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
+    budget.deposit()
+    assert budget.withdraw() is False
+    budget.deposit()
+    assert budget.withdraw() is True
+
+
+def test_is_connect_failure_only_matches_connect_phase_errors():
+    assert is_connect_failure(_connect_error()) is True
+    assert is_connect_failure(requests.exceptions.ConnectTimeout()) is True
+    assert is_connect_failure(requests.exceptions.ReadTimeout()) is False
+    assert is_connect_failure(requests.exceptions.ConnectionError("reset")) is False
+
+
+def test_adapter_retries_idempotent_connect_failure(monkeypatch):
+    outcomes = [_connect_error(), requests.Response()]
+    calls = []
+
+    def fake_send(self, request, **kwargs):
+        calls.append(request.method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    adapter = _build_adapter()
+    request = requests.Request("GET", "http://backend.test/api/widgets").prepare()
+
+    adapter.send(request)
+
+    assert calls == ["GET", "GET"]
+    assert adapter.breakers.stats()["http://backend.test"]["state"] == "closed"
+
+
+def test_adapter_never_retries_post_or_read_failures(monkeypatch):
+    calls = []
+
+    def fake_send(self, request, **kwargs):
+        calls.append(request.method)
+        raise (
+            _connect_error()
+            if request.method == "POST"
+            else requests.exceptions.ReadTimeout()
+        )
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    adapter = _build_adapter(max_retries_per_call=3)
+
+    for method in ("POST", "GET"):
+        request = requests.Request(method, "http://backend.test/api").prepare()
+        with pytest.raises(requests.exceptions.RequestException):
+            adapter.send(request)
+
+    assert calls == ["POST", "GET"]
+
+
+def test_adapter_fails_fast_while_breaker_is_open(monkeypatch):
+    calls = []
+
+    def fake_send(self, request, **kwargs):
+        calls.append(request.method)
+        raise _connect_error()
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    adapter = _build_adapter(max_retries_per_call=0, failure_threshold=2)
+    request = requests.Request("GET", "http://backend.test/api").prepare()
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            adapter.send(request)
+    with pytest.raises(CircuitOpenError) as exc_info:
+        adapter.send(request)
+
+    assert len(calls) == 2
+    assert exc_info.value.upstream == "http://backend.test"
+
+
+def test_proxy_returns_503_while_backend_circuit_is_open(client, app):
+    breaker = app.extensions["bff_circuit_breakers"].get("http://backend.test")
+    for _ in range(5):
+        breaker.record_failure()
+
+    res = client.get("/proxy/api/request/widgets")
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "10"
+
+
+def test_upstream_health_reports_breaker_states(client, app):
+    breakers = app.extensions["bff_circuit_breakers"]
+    breakers.get("http://auth.test").record_success()
+
+    healthy = client.get("/health/upstreams")
+    for _ in range(5):
+        breakers.get("http://backend.test").record_failure()
+    degraded = client.get("/health/upstreams")
+
+    assert healthy.status_code == 200
+    assert healthy.get_json()["status"] == "ok"
+    assert degraded.get_json() == {
+        "status": "degraded",
+        "upstreams": {
+            "http://auth.test": {
+                "state": "closed",
+                "consecutive_failures": 0,
+                "rejected": 0,
+            },
+            "http://backend.test": {
+                "state": "open",
+                "consecutive_failures": 5,
+                "rejected": 0,
+            },
+        },
+    }
@@ -0,0 +1,189 @@
+import json
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bff_app.services.admission import ConcurrencyLimiter
+from bff_app.services.routing import RouteTable, Upstream
+from bff_app.settings import (
+    ProxyRoute,
+    SettingsValidationError,
+    load_settings_from_env,
+)
+
+REPORTING_ROUTE = {
+    "name": "reporting",
+    "prefix": "/reports/",
+    "endpoint": "http://reporting.test/api",
+    "strip_prefix": True,
+    "read_timeout_seconds": 120,
+    "max_in_flight": 1,
+    "pool_maxsize": 4,
+    "forward_access_token": False,
+    "drop_request_headers": ["X-Debug"],
+}
+
+
+def _upstream(name):
+    return Upstream(
+        name=name,
+        endpoint=f"http://{name}.test",
+        stripped_prefix="",
+        timeout=(1.0, 1.0),
+        session=MagicMock(),
+        limiter=ConcurrencyLimiter(0, 0, 1.0),
+    )
+
+
+def _routed_app(app, monkeypatch, routes):
+    from bff_app import create_app
+
+    monkeypatch.setenv("PROXY_ROUTES", json.dumps(routes))
+    routed_app = create_app(load_settings_from_env())
+    routed_app.config["TESTING"] = True
+    return routed_app
+
+
+def _ok_response():
+    return SimpleNamespace(content=b"{}", status_code=200, headers={})
+
+
+def test_route_table_matches_longest_prefix_on_whole_segments():
+    default = _upstream("backend")
+    reports = _upstream("reports")
+    exports = _upstream("exports")
+    table = RouteTable(default, [("reports", reports), ("reports/v2/exports", exports)])
+
+    assert table.match("reports") is reports
+    assert table.match("/reports/daily") is reports
+    assert table.match("reports/v2/exports/1") is exports
+    assert table.match("reports/v2") is reports
+    assert table.match("reportsx/daily") is default
+    assert table.match("widgets") is default
+    assert [upstream.name for upstream in table.upstreams()] == [
+        "backend",
+        "reports",
+        "exports",
+    ]
+
+
+def test_upstream_target_url_strips_prefix_when_configured():
+    upstream = replace(_upstream("reporting"), stripped_prefix="reports")
+
+    assert upstream.target_url("reports/daily") == "http://reporting.test/daily"
+    assert upstream.target_url("reports") == "http://reporting.test/"
+
+
+def test_routed_requests_use_the_route_pool_timeouts_and_header_policy(
+    app,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+):
+    routed_app = _routed_app(app, monkeypatch, [REPORTING_ROUTE])
+    route_table = routed_app.extensions["bff_route_table"]
+    reporting = route_table.match("reports/daily")
+    reporting_request = MagicMock(return_value=_ok_response())
+    backend_request = MagicMock(return_value=_ok_response())
+    monkeypatch.setattr(reporting.session, "request", reporting_request)
+    monkeypatch.setattr(
+        routed_app.extensions["bff_upstream_session"],
+        "request",
+        backend_request,
+    )
+    client = routed_app.test_client()
+    set_auth_cookies(client, build_token_payload())
+
+    client.get("/proxy/api/request/reports/daily", headers={"X-Debug": "1"})
+    client.get("/proxy/api/request/widgets", headers={"X-Debug": "1"})
+
+    assert reporting.session is not routed_app.extensions["bff_upstream_session"]
+    reporting_call = reporting_request.call_args.kwargs
+    assert reporting_call["url"] == "http://reporting.test/api/daily"
+    assert reporting_call["timeout"] == (3.0, 120.0)
+    assert "Authorization" not in reporting_call["headers"]
+    assert "X-Debug" not in reporting_call["headers"]
+    backend_call = backend_request.call_args.kwargs
+    assert backend_call["url"] == "http://backend.test/api/widgets"
+    assert backend_call["headers"]["Authorization"] == "Bearer access-token"
+    assert backend_call["headers"]["X-Debug"] == "1"
+
+
+def test_saturated_route_does_not_block_the_default_backend(app, monkeypatch):
+    routed_app = _routed_app(app, monkeypatch, [REPORTING_ROUTE])
+    reporting = routed_app.extensions["bff_route_table"].match("reports")
+    monkeypatch.setattr(
+        routed_app.extensions["bff_upstream_session"],
+        "request",
+        MagicMock(return_value=_ok_response()),
+    )
+    reporting.limiter.acquire()
+    client = routed_app.test_client()
+
+    assert client.get("/proxy/api/request/reports/daily").status_code == 503
+    assert client.get("/proxy/api/request/widgets").status_code == 200
+
+
+def test_batch_items_are_routed_per_path(app, monkeypatch):
+    routed_app = _routed_app(app, monkeypatch, [REPORTING_ROUTE])
+    reporting = routed_app.extensions["bff_route_table"].match("reports")
+    reporting_request = MagicMock(return_value=_ok_response())
+    backend_request = MagicMock(return_value=_ok_response())
+    monkeypatch.setattr(reporting.session, "request", reporting_request)
+    monkeypatch.setattr(
+        routed_app.extensions["bff_upstream_session"],
+        "request",
+        backend_request,
+    )
+
+    res = routed_app.test_client().post(
+        "/proxy/api/batch",
+        json={"requests": [{"path": "reports/daily?day=1"}, {"path": "widgets"}]},
+    )
+
+    assert res.status_code == 200
+    assert reporting_request.call_args.kwargs["url"] == (
+        "http://reporting.test/api/daily?day=1"
+    )
+    assert backend_request.call_args.kwargs["url"] == "http://backend.test/api/widgets"
+
+
+@pytest.mark.parametrize(
+    "routes",
+    [
+        {"name": "reporting"},
+        [{"name": "a", "prefix": "x", "endpoint": "ftp://x"}],
+        [{"name": "a", "prefix": "x", "endpoint": "http://x", "max_in_flight": -1}],
+        [{"name": "a", "prefix": "x", "endpoint": "http://x", "colour": "red"}],
+        [
+            {"name": "a", "prefix": "x", "endpoint": "http://x"},
+            {"name": "b", "prefix": "/x/", "endpoint": "http://y"},
+        ],
+    ],
+)
+def test_invalid_proxy_routes_are_rejected(app, monkeypatch, routes):
+    monkeypatch.setenv("PROXY_ROUTES", json.dumps(routes))
+
+    with pytest.raises(SettingsValidationError, match="PROXY_ROUTES"):
+        load_settings_from_env()
+
+
+def test_openapi_document_does_not_depend_on_proxy_routes():
+    from bff_app import create_app
+    from bff_app.openapi.generate import _spec_settings, build_openapi_document
+
+    routed_app = create_app(
+        replace(
+            _spec_settings(),
+            proxy_routes=(
+                ProxyRoute(name="reporting", prefix="reports", endpoint="http://r.test"),
+            ),
+        )
+    )
+    routed_api = routed_app.extensions["flask-smorest"]["apis"][""]["ext_obj"]
+    routed_document = routed_api.spec.to_dict()
+    routed_document.setdefault("servers", [{"url": "/"}])
+
+    assert routed_document == build_openapi_document()
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("gunicorn", reason="needs the BFF 'serve' extra")
+
+from bff_app.serve import BffServer, gunicorn_options
+from bff_app.settings import (
+    ServeSettings,
+    SettingsValidationError,
+    load_serve_settings_from_env,
+)
+
+
+def test_serve_settings_default_to_cpu_scaled_gthread_workers(monkeypatch):
+    for name in ("HOST", "PORT", "SERVE_WORKER_CLASS", "SERVE_WORKERS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+    serve_settings = load_serve_settings_from_env()
+
+    assert serve_settings.host == "0.0.0.0"
+    assert serve_settings.port == 5000
+    assert serve_settings.worker_class == "gthread"
+    assert serve_settings.workers == 9
+
+
+def test_serve_settings_read_tuning_from_env(monkeypatch):
+    monkeypatch.setenv("SERVE_WORKER_CLASS", "GEVENT")
+    monkeypatch.setenv("SERVE_WORKERS", "3")
+    monkeypatch.setenv("SERVE_MAX_REQUESTS", "0")
+    monkeypatch.setenv("SERVE_KEEPALIVE_SECONDS", "75")
+    monkeypatch.setenv("SERVE_BACKLOG", "512")
+
+    serve_settings = load_serve_settings_from_env()
+
+    assert serve_settings.worker_class == "gevent"
+    assert serve_settings.workers == 3
+    assert serve_settings.max_requests == 0
+    assert serve_settings.keepalive_seconds == 75
+    assert serve_settings.backlog == 512
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [("SERVE_WORKER_CLASS", "sync"), ("SERVE_WORKERS", "0")],
+)
+def test_serve_settings_reject_invalid_values(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(SettingsValidationError, match=name):
+        load_serve_settings_from_env()
+
+
+def test_gunicorn_serves_the_preloaded_app_with_recycling(app):
+    serve_settings = ServeSettings(host="127.0.0.1", port=5022, workers=3)
+
+    server = BffServer(app, gunicorn_options(serve_settings))
+
+    assert server.load() is app
+    assert server.cfg.bind == ["127.0.0.1:5022"]
+    assert server.cfg.preload_app is True
+    assert server.cfg.worker_class_str == "gthread"
+    assert server.cfg.workers == 3
+    assert server.cfg.threads == 8
+    assert server.cfg.max_requests == 10000
+    assert server.cfg.max_requests_jitter == 1000
+    assert server.cfg.keepalive == 5
+    assert server.cfg.backlog == 2048
@@ -114,3 +114,161 @@ def test_load_settings_from_env_rejects_invalid_cookie_encryption_key(
         match="TOKEN_COOKIE_ENCRYPTION_KEY must decode to exactly 32 bytes",
     ):
         load_settings_from_env()
+
+
+def test_load_settings_from_env_accepts_custom_userinfo_cache(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("USERINFO_CACHE_MAX_ENTRIES", "0")
+    monkeypatch.setenv("USERINFO_CACHE_TTL_SECONDS", "15")
+
+    settings = load_settings_from_env()
+
+    assert settings.userinfo_cache_max_entries == 0
+    assert settings.userinfo_cache_ttl_seconds == 15.0
+
+
+def test_load_settings_from_env_rejects_negative_userinfo_cache_size(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("USERINFO_CACHE_MAX_ENTRIES", "-1")
+
+    with pytest.raises(
+        SettingsValidationError,
+        match="USERINFO_CACHE_MAX_ENTRIES must be greater than or equal to 0",
+    ):
+        load_settings_from_env()
+
+
+def test_load_settings_from_env_accepts_token_store_backend(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TOKEN_STORE_BACKEND", "SQLite")
+    monkeypatch.setenv("TOKEN_STORE_SQLITE_PATH", "/tmp/tokens.sqlite3")
+
+    settings = load_settings_from_env()
+
+    assert settings.token_store_backend == "sqlite"
+    assert settings.token_store_sqlite_path == "/tmp/tokens.sqlite3"
+    assert settings.session_id_cookie_name == "test-session_sid"
+
+
+def test_load_settings_from_env_rejects_unknown_token_store_backend(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TOKEN_STORE_BACKEND", "postgres")
+
+    with pytest.raises(
+        SettingsValidationError,
+        match="TOKEN_STORE_BACKEND must be one of cookie, memory, sqlite",
+    ):
+        load_settings_from_env()
+
+
+def test_load_settings_from_env_rejects_zero_token_store_max_entries(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TOKEN_STORE_MAX_ENTRIES", "0")
+
+    with pytest.raises(
+        SettingsValidationError,
+        match="TOKEN_STORE_MAX_ENTRIES must be greater than 0",
+    ):
+        load_settings_from_env()
+
+
+def test_load_settings_from_env_accepts_proxy_admission_limits(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("PROXY_MAX_IN_FLIGHT", "32")
+    monkeypatch.setenv("PROXY_MAX_QUEUE", "64")
+    monkeypatch.setenv("PROXY_SESSION_BURST", "20")
+
+    settings = load_settings_from_env()
+
+    assert settings.proxy_max_in_flight == 32
+    assert settings.proxy_max_queue == 64
+    assert settings.proxy_session_burst == 20
+    assert settings.proxy_queue_timeout_seconds == 1.0
+
+
+def test_load_settings_from_env_accepts_upstream_resilience_settings(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("UPSTREAM_BREAKER_FAILURE_THRESHOLD", "0")
+    monkeypatch.setenv("UPSTREAM_MAX_RETRIES", "3")
+    monkeypatch.setenv("UPSTREAM_RETRY_BUDGET_RATIO", "0.25")
+
+    settings = load_settings_from_env()
+
+    assert settings.upstream_breaker_failure_threshold == 0
+    assert settings.upstream_breaker_reset_timeout_seconds == 10.0
+    assert settings.upstream_max_retries == 3
+    assert settings.upstream_retry_budget_ratio == 0.25
+
+
+def test_load_settings_from_env_rejects_zero_batch_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("PROXY_BATCH_MAX_CONCURRENCY", "0")
+
+    with pytest.raises(
+        SettingsValidationError,
+        match="PROXY_BATCH_MAX_CONCURRENCY must be greater than 0",
+    ):
+        load_settings_from_env()
+
+
+def test_load_settings_from_env_parses_shared_cache_paths(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("PROXY_CACHE_SHARED_PATHS", " /legal/ ,locale/available/,")
+
+    settings = load_settings_from_env()
+
+    assert settings.proxy_cache_shared_paths == ("legal/", "locale/available/")
+
+
+def test_load_settings_from_env_rejects_unknown_tracing_exporter(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("TRACING_EXPORTER", "zipkin")
+
+    with pytest.raises(SettingsValidationError, match="TRACING_EXPORTER must be one of"):
+        load_settings_from_env()
+
+
+def test_load_settings_from_env_accepts_inline_background_tasks(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("BACKGROUND_MAX_WORKERS", "0")
+
+    settings = load_settings_from_env()
+
+    assert settings.background_max_workers == 0
+    assert settings.background_max_queue == 256
+    assert settings.background_drain_timeout_seconds == 5.0
+
+
+def test_load_settings_from_env_rejects_zero_stream_idle_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _set_required_env(monkeypatch)
+    monkeypatch.setenv("PROXY_STREAM_IDLE_TIMEOUT_SECONDS", "0")
+
+    with pytest.raises(
+        SettingsValidationError,
+        match="PROXY_STREAM_IDLE_TIMEOUT_SECONDS must be greater than 0",
+    ):
+        load_settings_from_env()
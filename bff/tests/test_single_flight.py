@@ -0,0 +1,106 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bff_app.services.single_flight import SingleFlight
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.001)
+
+
+def _run_concurrently(single_flight, key, fn, callers):
+    results = []
+
+    def call():
+        try:
+            results.append(single_flight.do(key, fn))
+        except Exception as exc:  # noqa: BLE001
+            results.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    single_flight = SingleFlight()
+    release = threading.Event()
+    fn = MagicMock(side_effect=lambda: release.wait(5) and "value")
+
+    threads, results = _run_concurrently(single_flight, b"key", fn, callers=3)
+    _wait_for(lambda: single_flight.stats()["followers"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 3
+    assert fn.call_count == 1
+    assert single_flight.stats() == {"in_flight": 0, "leaders": 1, "followers": 2}
+    assert single_flight.do(b"key", lambda: "fresh") == "fresh"
+
+
+def test_single_flight_propagates_leader_error_to_followers():
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    threads, results = _run_concurrently(single_flight, b"key", fail, callers=2)
+    _wait_for(lambda: single_flight.stats()["followers"] == 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    with pytest.raises(ValueError):
+        single_flight.do(b"key", MagicMock(side_effect=ValueError))
+
+
+def test_proxy_coalesces_identical_concurrent_gets(
+    app,
+    monkeypatch,
+    upstream,
+    set_auth_cookies,
+    build_token_payload,
+):
+    release = threading.Event()
+
+    def slow_request(**kwargs):
+        release.wait(5)
+        return SimpleNamespace(content=b'{"ok":true}', status_code=200, headers={})
+
+    mock_request = MagicMock(side_effect=slow_request)
+    monkeypatch.setattr(upstream, "request", mock_request)
+    clients = [app.test_client() for _ in range(3)]
+    for client in clients:
+        set_auth_cookies(client, build_token_payload())
+    responses = []
+
+    threads = [
+        threading.Thread(
+            target=lambda client=client: responses.append(
+                client.get("/proxy/api/request/widgets?limit=5")
+            )
+        )
+        for client in clients
+    ]
+    for thread in threads:
+        thread.start()
+    single_flight = app.extensions["bff_single_flight"]
+    _wait_for(lambda: single_flight.stats()["followers"] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert [res.data for res in responses] == [b'{"ok":true}'] * 3
+    assert mock_request.call_count == 1
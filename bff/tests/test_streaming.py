@@ -0,0 +1,211 @@
+import socket
+import threading
+from http.cookies import SimpleCookie
+from unittest.mock import MagicMock
+
+import requests
+from werkzeug.serving import make_server
+
+from bff_app.services.token_cookies import set_token_cookies
+from bff_app.settings import load_settings_from_env
+
+UPGRADE_HEADERS = {
+    "Upgrade": "websocket",
+    "Connection": "Upgrade",
+    "Sec-WebSocket-Key": "dGhlIHNhbXBsZSBub25jZQ==",
+    "Sec-WebSocket-Version": "13",
+}
+
+
+class FakeEventStream:
+    def __init__(self, chunks, error=None):
+        self.status_code = 200
+        self.headers = {
+            "content-type": "text/event-stream; charset=utf-8",
+            "content-length": "999",
+            "content-encoding": "gzip",
+        }
+        self._chunks = chunks
+        self._error = error
+        self.close = MagicMock()
+
+    def iter_content(self, chunk_size=None):
+        yield from self._chunks
+        if self._error is not None:
+            raise self._error
+
+
+def _app_with_env(monkeypatch, **env):
+    from bff_app import create_app
+
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    configured_app = create_app(load_settings_from_env())
+    configured_app.config["TESTING"] = True
+    return configured_app
+
+
+def test_event_streams_are_relayed_unbuffered(
+    app,
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    upstream_response = FakeEventStream([b"data: 1\n\n", b"", b"data: 2\n\n"])
+    mock_request = MagicMock(return_value=upstream_response)
+    monkeypatch.setattr(upstream, "request", mock_request)
+    set_auth_cookies(client, build_token_payload())
+
+    res = client.get(
+        "/proxy/api/request/jobs/1/events",
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert res.status_code == 200
+    assert res.is_streamed
+    assert res.headers["X-Accel-Buffering"] == "no"
+    assert "Content-Length" not in res.headers
+    assert "Content-Encoding" not in res.headers
+    assert app.extensions["bff_stream_limiter"].stats()["in_flight"] == 1
+    assert res.get_data() == b"data: 1\n\ndata: 2\n\n"
+    res.close()
+
+    upstream_response.close.assert_called_once()
+    assert app.extensions["bff_stream_limiter"].stats()["in_flight"] == 0
+    call = mock_request.call_args.kwargs
+    assert call["stream"] is True
+    assert call["timeout"] == (3.0, 60.0)
+    assert call["headers"]["Authorization"] == "Bearer access-token"
+
+
+def test_event_stream_ends_quietly_when_upstream_goes_idle(
+    client,
+    monkeypatch,
+    upstream,
+):
+    upstream_response = FakeEventStream(
+        [b"data: 1\n\n"],
+        error=requests.exceptions.ConnectionError("Read timed out."),
+    )
+    monkeypatch.setattr(upstream, "request", MagicMock(return_value=upstream_response))
+
+    res = client.get(
+        "/proxy/api/request/jobs/1/events",
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert res.get_data() == b"data: 1\n\n"
+    upstream_response.close.assert_called_once()
+
+
+def test_event_streams_beyond_the_cap_get_503(app, monkeypatch):
+    capped_app = _app_with_env(monkeypatch, PROXY_STREAM_MAX_CONNECTIONS="1")
+    mock_request = MagicMock()
+    monkeypatch.setattr(
+        capped_app.extensions["bff_upstream_session"],
+        "request",
+        mock_request,
+    )
+    capped_app.extensions["bff_stream_limiter"].acquire()
+
+    res = capped_app.test_client().get(
+        "/proxy/api/request/jobs/1/events",
+        headers={"Accept": "text/event-stream"},
+    )
+
+    assert res.status_code == 503
+    assert res.headers["Retry-After"] == "1"
+    mock_request.assert_not_called()
+
+
+def test_websocket_requires_upgrade_and_session(client):
+    assert client.get("/proxy/api/ws/live").status_code == 400
+
+    res = client.get(
+        "/proxy/api/ws/live",
+        headers=UPGRADE_HEADERS,
+        environ_overrides={"werkzeug.socket": object()},
+    )
+
+    assert res.status_code == 401
+
+
+def _serve_fake_websocket_backend(listener, received_heads):
+    connection, _ = listener.accept()
+    with connection:
+        head = b""
+        while b"\r\n\r\n" not in head:
+            head += connection.recv(4096)
+        received_heads.append(head.decode("latin-1"))
+        connection.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\n"
+            b"Connection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=\r\n\r\n"
+        )
+        while True:
+            data = connection.recv(4096)
+            if not data:
+                return
+            connection.sendall(b"echo:" + data)
+
+
+def _cookie_header(app, token_payload):
+    response = app.response_class()
+    set_token_cookies(response, token_payload, app.extensions["bff_settings"])
+    parsed = SimpleCookie()
+    for set_cookie_header in response.headers.getlist("Set-Cookie"):
+        parsed.load(set_cookie_header)
+    return "; ".join(f"{morsel.key}={morsel.value}" for morsel in parsed.values())
+
+
+def test_websocket_frames_are_relayed_with_the_session_token(
+    app,
+    monkeypatch,
+    build_token_payload,
+):
+    listener = socket.create_server(("127.0.0.1", 0))
+    received_heads = []
+    backend_thread = threading.Thread(
+        target=_serve_fake_websocket_backend,
+        args=(listener, received_heads),
+        daemon=True,
+    )
+    backend_thread.start()
+    relay_app = _app_with_env(
+        monkeypatch,
+        BACKEND_ENDPOINT=f"http://127.0.0.1:{listener.getsockname()[1]}/api",
+    )
+    server = make_server("127.0.0.1", 0, relay_app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    try:
+        with socket.create_connection(("127.0.0.1", server.server_port), 5) as browser:
+            request_head = [
+                "GET /proxy/api/ws/live/feed?topic=jobs HTTP/1.1",
+                "Host: bff.test",
+                f"Cookie: {_cookie_header(relay_app, build_token_payload())}",
+                *(f"{key}: {value}" for key, value in UPGRADE_HEADERS.items()),
+            ]
+            browser.sendall(("\r\n".join(request_head) + "\r\n\r\n").encode())
+            response_head = b""
+            while b"\r\n\r\n" not in response_head:
+                response_head += browser.recv(4096)
+            assert response_head.startswith(b"HTTP/1.1 101 Switching Protocols")
+
+            browser.sendall(b"frame-1")
+            assert browser.recv(4096) == b"echo:frame-1"
+            assert relay_app.extensions["bff_stream_limiter"].stats()["in_flight"] == 1
+    finally:
+        backend_thread.join(5)
+        server.shutdown()
+        listener.close()
+
+    upstream_head = received_heads[0]
+    assert upstream_head.startswith("GET /api/live/feed?topic=jobs HTTP/1.1")
+    assert "Authorization: Bearer access-token" in upstream_head
+    assert "sec-websocket-key: dghlihnhbxbszsbub25jzq==" in upstream_head.lower()
+    assert "Cookie" not in upstream_head
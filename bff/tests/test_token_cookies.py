@@ -1,9 +1,16 @@
+import base64
+import json
+import os
+import secrets
 from http.cookies import SimpleCookie
 
 import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from bff_app.services.token_cookies import (
+    MAX_SET_COOKIE_BYTES,
     TokenCookieTooLargeError,
+    get_token_cipher,
     has_any_token_cookie,
     load_token_from_cookies,
     set_token_cookies,
@@ -18,6 +25,36 @@ def _extract_cookie_map(response) -> dict[str, str]:
     return {morsel.key: morsel.value for morsel in parsed.values()}
 
 
+def _encrypt_legacy_component(plaintext: str, key: bytes, cookie_name: str) -> str:
+    nonce = os.urandom(12)
+    ciphertext = AESGCM(key).encrypt(
+        nonce,
+        plaintext.encode("utf-8"),
+        cookie_name.encode("utf-8"),
+    )
+    return base64.urlsafe_b64encode(bytes([1]) + nonce + ciphertext).rstrip(b"=").decode()
+
+
+def _legacy_cookie_map(token_payload, settings) -> dict[str, str]:
+    names = settings.legacy_token_cookie_names
+    key = settings.token_cookie_encryption_key
+    cookie_map = {
+        names[field]: _encrypt_legacy_component(token_payload[field], key, names[field])
+        for field in ("access_token", "refresh_token", "id_token")
+    }
+    meta = {
+        meta_key: value
+        for meta_key, value in token_payload.items()
+        if meta_key not in {"access_token", "refresh_token", "id_token"}
+    }
+    cookie_map[names["meta"]] = _encrypt_legacy_component(
+        json.dumps(meta),
+        key,
+        names["meta"],
+    )
+    return cookie_map
+
+
 def test_token_cookie_roundtrip_preserves_payload(app, build_token_payload):
     settings = app.extensions["bff_settings"]
     response = app.response_class()
@@ -43,35 +80,96 @@ def test_token_cookie_tamper_returns_none(app, build_token_payload):
     set_token_cookies(response, token_payload, settings)
     cookie_map = _extract_cookie_map(response)
 
-    names = token_cookie_names(settings)
+    head_name = token_cookie_names(settings)[0]
     tampered = dict(cookie_map)
-    original = tampered[names["access_token"]]
-    tampered[names["access_token"]] = (
-        ("A" if original[0] != "A" else "B") + original[1:]
-    )
+    original = tampered[head_name]
+    tampered[head_name] = original[:-1] + ("A" if original[-1] != "A" else "B")
 
     assert load_token_from_cookies(tampered, settings) is None
 
 
-def test_token_cookie_missing_component_returns_none(app, build_token_payload):
+def test_token_cookie_is_single_compressed_cookie(app, build_token_payload):
     settings = app.extensions["bff_settings"]
     response = app.response_class()
-    token_payload = build_token_payload()
+    token_payload = build_token_payload(access_token="a" * 7000)
 
     set_token_cookies(response, token_payload, settings)
     cookie_map = _extract_cookie_map(response)
 
-    names = token_cookie_names(settings)
-    missing_id = dict(cookie_map)
-    missing_id.pop(names["id_token"])
+    assert list(cookie_map) == ["test-session_tk"]
+    assert len(cookie_map["test-session_tk"]) < 1000
+    assert load_token_from_cookies(cookie_map, settings) == token_payload
+
+
+def test_token_cookie_large_payload_is_chunked(app, build_token_payload):
+    settings = app.extensions["bff_settings"]
+    response = app.response_class()
+    token_payload = build_token_payload(access_token=secrets.token_urlsafe(6000))
+
+    set_token_cookies(response, token_payload, settings)
+    cookie_map = _extract_cookie_map(response)
+
+    assert cookie_map["test-session_tk"] == "chunks-3"
+    assert set(cookie_map) == {
+        "test-session_tk",
+        "test-session_tk1",
+        "test-session_tk2",
+        "test-session_tk3",
+    }
+    assert all(
+        len(header.encode()) <= MAX_SET_COOKIE_BYTES
+        for header in response.headers.getlist("Set-Cookie")
+    )
+    assert load_token_from_cookies(cookie_map, settings) == token_payload
+
+
+def test_token_cookie_missing_chunk_returns_none(app, build_token_payload):
+    settings = app.extensions["bff_settings"]
+    response = app.response_class()
+    token_payload = build_token_payload(access_token=secrets.token_urlsafe(6000))
+
+    set_token_cookies(response, token_payload, settings)
+    cookie_map = _extract_cookie_map(response)
+
+    missing_chunk = dict(cookie_map)
+    missing_chunk.pop("test-session_tk2")
 
+    assert load_token_from_cookies(missing_chunk, settings) is None
+
+
+def test_legacy_token_cookies_still_decode(app, build_token_payload):
+    settings = app.extensions["bff_settings"]
+    token_payload = build_token_payload()
+    cookie_map = _legacy_cookie_map(token_payload, settings)
+
+    assert has_any_token_cookie(cookie_map, settings) is True
+    assert load_token_from_cookies(cookie_map, settings) == token_payload
+
+    missing_id = dict(cookie_map)
+    missing_id.pop("test-session_it")
     assert load_token_from_cookies(missing_id, settings) is None
 
 
+def test_token_cookie_rewrite_deletes_stale_cookies(app, build_token_payload):
+    settings = app.extensions["bff_settings"]
+    existing = _legacy_cookie_map(build_token_payload(), settings)
+    existing["test-session_tk3"] = "stale-chunk"
+    response = app.response_class()
+
+    set_token_cookies(response, build_token_payload(), settings, existing)
+
+    set_cookie_headers = response.headers.getlist("Set-Cookie")
+    assert any(header.startswith("test-session_tk=") for header in set_cookie_headers)
+    for stale_name in [*existing]:
+        assert any(
+            header.startswith(f"{stale_name}=;") for header in set_cookie_headers
+        )
+
+
 def test_token_cookie_oversize_raises_error(app, build_token_payload):
     settings = app.extensions["bff_settings"]
     response = app.response_class()
-    token_payload = build_token_payload(access_token="a" * 7000)
+    token_payload = build_token_payload(access_token=secrets.token_urlsafe(24000))
 
     with pytest.raises(TokenCookieTooLargeError):
         set_token_cookies(response, token_payload, settings)
@@ -92,3 +190,84 @@ def test_token_cookie_values_do_not_expose_plaintext(app, build_token_payload):
     assert all("access-token-plaintext" not in value for value in cookie_map.values())
     assert all("refresh-token-plaintext" not in value for value in cookie_map.values())
     assert all("id-token-plaintext" not in value for value in cookie_map.values())
+
+
+def test_token_cookie_names_are_precomputed_on_settings(app):
+    settings = app.extensions["bff_settings"]
+
+    assert token_cookie_names(settings) is settings.token_cookie_names
+    assert settings.token_cookie_names == (
+        "test-session_tk",
+        "test-session_tk1",
+        "test-session_tk2",
+        "test-session_tk3",
+        "test-session_tk4",
+    )
+    assert dict(settings.legacy_token_cookie_names) == {
+        "access_token": "test-session_at",
+        "refresh_token": "test-session_rt",
+        "id_token": "test-session_it",
+        "meta": "test-session_meta",
+    }
+
+
+def test_token_cipher_is_shared_per_key(app):
+    settings = app.extensions["bff_settings"]
+
+    cipher = get_token_cipher(settings.token_cookie_encryption_key)
+
+    assert get_token_cipher(settings.token_cookie_encryption_key) is cipher
+    assert get_token_cipher(b"f" * 32) is not cipher
+
+
+def test_session_token_is_decrypted_once_per_request(
+    app,
+    monkeypatch,
+    build_token_payload,
+):
+    from bff_app.services import auth as auth_service
+
+    settings = app.extensions["bff_settings"]
+    response = app.response_class()
+    set_token_cookies(response, build_token_payload(), settings)
+    cookie_header = "; ".join(
+        f"{name}={value}" for name, value in _extract_cookie_map(response).items()
+    )
+
+    load_calls = []
+
+    def counting_load(cookies, load_settings):
+        load_calls.append(1)
+        return load_token_from_cookies(cookies, load_settings)
+
+    monkeypatch.setattr(auth_service, "load_token_from_cookies", counting_load)
+
+    with app.test_request_context(headers={"Cookie": cookie_header}):
+        first = auth_service.get_session_token()
+        first["access_token"] = "mutated"
+        second = auth_service.get_session_token()
+
+    assert len(load_calls) == 1
+    assert second == build_token_payload()
+
+
+def test_session_token_memo_follows_store_and_clear(app, build_token_payload):
+    from bff_app.services import auth as auth_service
+
+    settings = app.extensions["bff_settings"]
+    response = app.response_class()
+    set_token_cookies(response, build_token_payload(), settings)
+    cookie_header = "; ".join(
+        f"{name}={value}" for name, value in _extract_cookie_map(response).items()
+    )
+    refreshed = {**build_token_payload(), "access_token": "refreshed"}
+
+    with app.test_request_context(headers={"Cookie": cookie_header}):
+        auth_service.get_session_token()
+        auth_service.store_session_token(app.response_class(), refreshed)
+        after_refresh = auth_service.get_session_token()
+        auth_service.clear_session_token(app.response_class())
+        after_logout = auth_service.get_session_token()
+
+    assert after_refresh == refreshed
+    assert after_logout is None
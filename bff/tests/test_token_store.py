@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bff_app.routes import auth as auth_routes
+from bff_app.services.token_store import (
+    MemoryTokenStore,
+    SqliteTokenStore,
+    load_token,
+    save_token,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def store_app(app, monkeypatch):
+    from bff_app import create_app
+    from bff_app.settings import load_settings_from_env
+
+    monkeypatch.setenv("TOKEN_STORE_BACKEND", "memory")
+    flask_app = create_app(load_settings_from_env())
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+def _login(client, monkeypatch, token):
+    fake_oauth = MagicMock()
+    fake_oauth.fetch_token.return_value = token
+    monkeypatch.setattr(auth_routes, "OAuth2Session", lambda *args, **kwargs: fake_oauth)
+    with client.session_transaction() as sess:
+        sess["state"] = "state-123"
+        sess["cv"] = "cv-hex"
+    return client.get("/proxy/api/auth/callback?state=state-123&code=abc")
+
+
+def test_memory_token_store_expires_and_evicts():
+    clock = FakeClock()
+    store = MemoryTokenStore(max_entries=2, clock=clock)
+    store.set("a", b"1", ex=10)
+    store.set("b", b"2")
+    store.set("c", b"3")
+
+    assert store.get("a") is None
+    assert store.get("b") == b"2"
+
+    clock.now += 3600
+    assert store.get("b") == b"2"
+    store.set("d", b"4", ex=10)
+    clock.now += 10
+    assert store.get("d") is None
+    assert store.delete("b", "missing") == 1
+
+
+def test_sqlite_token_store_roundtrip_and_expiry(tmp_path):
+    clock = FakeClock()
+    store = SqliteTokenStore(str(tmp_path / "tokens.sqlite3"), clock=clock)
+    store.set("a", b"value", ex=10)
+
+    reopened = SqliteTokenStore(str(tmp_path / "tokens.sqlite3"), clock=clock)
+    assert reopened.get("a") == b"value"
+
+    clock.now += 10
+    assert reopened.get("a") is None
+    store.set("b", b"other")
+    assert store.delete("b") == 1
+    assert store.get("b") is None
+
+
+def test_saved_token_is_encrypted_and_keyed_by_session_digest(
+    app,
+    build_token_payload,
+):
+    settings = app.extensions["bff_settings"]
+    store = MemoryTokenStore(max_entries=10)
+    token_payload = build_token_payload(access_token="access-token-plaintext")
+
+    save_token(store, "session-id", token_payload, settings)
+
+    [(key, (_, value))] = store._entries.items()
+    assert "session-id" not in key
+    assert b"access-token-plaintext" not in value
+    assert load_token(store, "session-id", settings) == token_payload
+    assert load_token(store, "other-session", settings) is None
+
+
+def test_store_mode_login_sets_only_session_id_cookie(
+    store_app,
+    monkeypatch,
+    build_token_payload,
+):
+    client = store_app.test_client()
+
+    res = _login(client, monkeypatch, build_token_payload())
+
+    assert res.status_code == 302
+    set_cookie_headers = res.headers.getlist("Set-Cookie")
+    session_id_headers = [
+        header for header in set_cookie_headers if header.startswith("test-session_sid=")
+    ]
+    assert len(session_id_headers) == 1
+    assert len(session_id_headers[0].split(";", 1)[0]) < 64
+    assert not any(header.startswith("test-session_tk") for header in set_cookie_headers)
+
+
+def test_store_mode_proxies_with_stored_token_and_logout_deletes_it(
+    store_app,
+    monkeypatch,
+    build_token_payload,
+):
+    client = store_app.test_client()
+    _login(client, monkeypatch, build_token_payload(access_token="stored-access"))
+
+    mock_request = MagicMock(
+        return_value=SimpleNamespace(content=b"{}", status_code=200, headers={})
+    )
+    upstream = store_app.extensions["bff_upstream_session"]
+    monkeypatch.setattr(upstream, "request", mock_request)
+    monkeypatch.setattr(
+        upstream,
+        "post",
+        MagicMock(return_value=SimpleNamespace(status_code=200)),
+    )
+
+    res = client.get("/proxy/api/request/widgets")
+    assert res.status_code == 200
+    forwarded_headers = mock_request.call_args.kwargs["headers"]
+    assert forwarded_headers["Authorization"] == "Bearer stored-access"
+
+    logout_res = client.get("/proxy/api/auth/logout")
+    assert any(
+        header.startswith("test-session_sid=;")
+        for header in logout_res.headers.getlist("Set-Cookie")
+    )
+    assert store_app.extensions["bff_token_store"]._entries == {}
+
+
+def test_store_mode_login_rotates_existing_session_id(
+    store_app,
+    monkeypatch,
+    build_token_payload,
+):
+    client = store_app.test_client()
+    _login(client, monkeypatch, build_token_payload())
+    first_session_id = client.get_cookie("test-session_sid").value
+
+    _login(client, monkeypatch, build_token_payload())
+
+    assert client.get_cookie("test-session_sid").value != first_session_id
+    assert len(store_app.extensions["bff_token_store"]._entries) == 1
@@ -0,0 +1,138 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from bff_app.services.tracing import format_traceparent, parse_traceparent
+
+INCOMING_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+INCOMING_SPAN_ID = "00f067aa0ba902b7"
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+def _ok_response():
+    return SimpleNamespace(content=b"{}", status_code=200, headers={})
+
+
+def test_parse_traceparent_accepts_valid_headers_only():
+    header = format_traceparent(INCOMING_TRACE_ID, INCOMING_SPAN_ID, 1)
+
+    assert parse_traceparent(header) == (INCOMING_TRACE_ID, INCOMING_SPAN_ID, 1)
+    assert parse_traceparent(None) is None
+    assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("ff-" + INCOMING_TRACE_ID + "-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("00-XYZ-00f067aa0ba902b7-01") is None
+
+
+def test_proxy_propagates_trace_context_and_correlation_id(
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    request_mock = MagicMock(return_value=_ok_response())
+    monkeypatch.setattr(upstream, "request", request_mock)
+    set_auth_cookies(client, build_token_payload())
+
+    res = client.get(
+        "/proxy/api/request/widgets",
+        headers={
+            "traceparent": format_traceparent(INCOMING_TRACE_ID, INCOMING_SPAN_ID, 1),
+            "X-Correlation-ID": "req-42",
+        },
+    )
+
+    assert res.status_code == 200
+    assert res.headers["X-Correlation-ID"] == "req-42"
+    sent_headers = request_mock.call_args.kwargs["headers"]
+    assert sent_headers["X-Correlation-ID"] == "req-42"
+    trace_id, parent_span_id, trace_flags = parse_traceparent(
+        sent_headers["traceparent"]
+    )
+    assert trace_id == INCOMING_TRACE_ID
+    assert parent_span_id != INCOMING_SPAN_ID
+    assert trace_flags == 1
+
+
+def test_invalid_correlation_id_falls_back_to_trace_id(client):
+    res = client.get("/ping", headers={"X-Correlation-ID": "bad id\twith spaces"})
+
+    correlation_id = res.headers["X-Correlation-ID"]
+    assert correlation_id != "bad id\twith spaces"
+    assert len(correlation_id) == 32
+
+
+def test_spans_form_one_trace_per_request(
+    app,
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    exporter = RecordingExporter()
+    app.extensions["bff_tracer"].exporter = exporter
+    monkeypatch.setattr(upstream, "request", MagicMock(return_value=_ok_response()))
+    set_auth_cookies(client, build_token_payload())
+
+    client.get("/proxy/api/request/widgets")
+
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /proxy/api/request/<path:rest_of_url>"]
+    assert root.parent_span_id is None
+    assert root.attributes["http.status_code"] == 200
+    assert spans["token.decode"].parent_span_id == root.span_id
+    assert spans["token.decode"].attributes["source"] == "cookie"
+    assert spans["backend.request"].parent_span_id == root.span_id
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+
+
+def test_unsampled_traces_are_propagated_but_not_exported(
+    app,
+    client,
+    monkeypatch,
+    set_auth_cookies,
+    build_token_payload,
+    upstream,
+):
+    exporter = RecordingExporter()
+    app.extensions["bff_tracer"].exporter = exporter
+    request_mock = MagicMock(return_value=_ok_response())
+    monkeypatch.setattr(upstream, "request", request_mock)
+    set_auth_cookies(client, build_token_payload())
+
+    client.get(
+        "/proxy/api/request/widgets",
+        headers={
+            "traceparent": format_traceparent(INCOMING_TRACE_ID, INCOMING_SPAN_ID, 0)
+        },
+    )
+
+    assert exporter.spans == []
+    sent_traceparent = request_mock.call_args.kwargs["headers"]["traceparent"]
+    assert sent_traceparent.startswith(f"00-{INCOMING_TRACE_ID}-")
+    assert sent_traceparent.endswith("-00")
+
+
+def test_file_exporter_writes_json_lines(monkeypatch, app, tmp_path):
+    from bff_app import create_app
+    from bff_app.settings import load_settings_from_env
+
+    span_file = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("TRACING_EXPORTER", "file")
+    monkeypatch.setenv("TRACING_FILE_PATH", str(span_file))
+    traced_app = create_app(load_settings_from_env())
+
+    traced_app.test_client().get("/ping")
+
+    spans = [json.loads(line) for line in span_file.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["GET /ping"]
+    assert spans[0]["attributes"]["http.status_code"] == 200
+    assert spans[0]["duration_ms"] >= 0
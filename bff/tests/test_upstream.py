@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+from http.client import HTTPMessage
+from pathlib import Path
+
+import pytest
+import requests
+from requests.cookies import MockRequest, MockResponse
+
+
+def test_upstream_session_is_shared_and_pooled(app, upstream):
+    adapter = upstream.get_adapter("https://backend.test/api")
+
+    assert app.extensions["bff_upstream_session"] is upstream
+    assert adapter._pool_maxsize == 64
+    assert adapter.max_retries.total == 0
+
+
+def test_upstream_session_never_stores_upstream_cookies(upstream):
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "backend=secret; Path=/"
+    request = requests.Request("GET", "http://backend.test/api/widgets").prepare()
+
+    upstream.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    assert len(upstream.cookies) == 0
+
+
+def test_async_entrypoint_serves_same_app(app):
+    pytest.importorskip("gevent")
+    project_root = Path(__file__).resolve().parents[1]
+    script = (
+        "import socket, gevent.socket, bff_async\n"
+        "assert socket.socket is gevent.socket.socket\n"
+        "res = bff_async.app.test_client().get('/ping')\n"
+        "assert res.get_json() == {'message': 'pong'}, res.data\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=project_root,
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+
@@ -0,0 +1,74 @@
+from bff_app.services.userinfo_cache import UserinfoCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_userinfo_cache_hit_and_miss_counters():
+    cache = UserinfoCache(max_entries=4, ttl_seconds=60)
+
+    assert cache.get("token-a") is None
+    cache.set("token-a", {"sub": "user-1"})
+
+    assert cache.get("token-a") == {"sub": "user-1"}
+    assert cache.stats() == {
+        "size": 1,
+        "max_entries": 4,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+
+def test_userinfo_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = UserinfoCache(max_entries=4, ttl_seconds=60, clock=clock)
+    cache.set("token-a", {"sub": "user-1"})
+
+    clock.now += 59
+    assert cache.get("token-a") == {"sub": "user-1"}
+
+    clock.now += 1
+    assert cache.get("token-a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_userinfo_cache_evicts_least_recently_used_entry():
+    cache = UserinfoCache(max_entries=2, ttl_seconds=60)
+    cache.set("token-a", {"sub": "a"})
+    cache.set("token-b", {"sub": "b"})
+    assert cache.get("token-a") == {"sub": "a"}
+
+    cache.set("token-c", {"sub": "c"})
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") == {"sub": "a"}
+    assert cache.get("token-c") == {"sub": "c"}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_userinfo_cache_does_not_retain_raw_token():
+    cache = UserinfoCache(max_entries=2, ttl_seconds=60)
+    cache.set("super-secret-access-token", {"sub": "a"})
+
+    assert all(
+        b"super-secret-access-token" not in key for key in cache._entries
+    )
+
+
+def test_userinfo_cache_invalidate_and_disabled_mode():
+    cache = UserinfoCache(max_entries=2, ttl_seconds=60)
+    cache.set("token-a", {"sub": "a"})
+    cache.invalidate("token-a")
+    assert cache.get("token-a") is None
+
+    disabled = UserinfoCache(max_entries=0, ttl_seconds=60)
+    disabled.set("token-a", {"sub": "a"})
+    assert disabled.enabled is False
+    assert disabled.get("token-a") is None
+    assert disabled.stats()["misses"] == 0
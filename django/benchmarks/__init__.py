@@ -0,0 +1 @@
+"""Micro-benchmarks of the nside_wefa apps, run from the ``django/`` directory."""
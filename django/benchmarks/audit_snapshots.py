@@ -0,0 +1,103 @@
+"""Per-instance cost of the change tracking of the built-in audit sources.
+
+The ``legal_consent`` and ``locale`` audit sources need the persisted values
+of the rows they diff. They used to snapshot them from a ``post_init``
+receiver, which ran for every instance Django built; they now use
+:class:`nside_wefa.audit.tracking.FieldTracker`, which copies the values in
+``from_db``.
+
+The benchmark builds ``UserLocale`` instances the way a queryset does
+(``Model.from_db``) and reports the mean time per instance for:
+
+``untracked``
+    ``Model.from_db`` without any audit hook, the floor.
+``post_init``
+    The former ``post_init`` snapshot receiver.
+``tracker``
+    The shipped :class:`FieldTracker`.
+
+No database is touched. Run from the ``django/`` directory::
+
+    python -m benchmarks.audit_snapshots --instances 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from typing import Any, Callable
+
+
+def _legacy_snapshot(sender: Any, instance: Any, **kwargs: Any) -> None:
+    instance._wefa_audit_previous_code = instance.code
+
+
+def measure(
+    build: Callable[[], Any],
+    instances: int,
+    repeat: int,
+) -> float:
+    """Return the best mean time per ``build()`` call, in nanoseconds."""
+    timings = timeit.repeat(build, number=instances, repeat=repeat)
+    return min(timings) / instances * 1e9
+
+
+def run(instances: int, repeat: int) -> dict[str, float]:
+    """Measure every variant and return nanoseconds per instance by name."""
+    from django.db import models
+    from django.db.models.signals import post_init
+
+    from nside_wefa.locale.models import UserLocale
+
+    field_names = [field.attname for field in UserLocale._meta.concrete_fields]
+    values = tuple(
+        {"id": 1, "user_id": 1, "code": "fr"}.get(name) for name in field_names
+    )
+    untracked_from_db = models.Model.__dict__["from_db"].__func__
+
+    def untracked() -> Any:
+        return untracked_from_db(UserLocale, "default", field_names, values)
+
+    def tracked() -> Any:
+        return UserLocale.from_db("default", field_names, values)
+
+    results = {
+        "untracked": measure(untracked, instances, repeat),
+        "tracker": measure(tracked, instances, repeat),
+    }
+    post_init.connect(_legacy_snapshot, sender=UserLocale, weak=False)
+    try:
+        results["post_init"] = measure(untracked, instances, repeat)
+    finally:
+        post_init.disconnect(_legacy_snapshot, sender=UserLocale)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print one line per variant."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--instances", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "demo.settings")
+    import django
+
+    django.setup()
+
+    results = run(args.instances, args.repeat)
+    floor = results["untracked"]
+    for name in ("untracked", "post_init", "tracker"):
+        print(
+            f"{name:>10}: {results[name]:8.0f} ns/instance  "
+            f"({results[name] - floor:+6.0f} ns)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
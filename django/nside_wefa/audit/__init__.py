@@ -31,6 +31,10 @@ def __getattr__(name: str):
         from . import api
 
         return getattr(api, name)
+    if name == "register_repr":
+        from . import representation
+
+        return representation.register_repr
     if name == "AuditEventImmutableError":
         from . import immutability
 
@@ -47,4 +51,5 @@ __all__ = [
     "Outcome",
     "AuditWriteError",
     "AuditEventImmutableError",
+    "register_repr",
 ]
@@ -13,6 +13,8 @@ from django.contrib import admin
 from django.contrib.admin.exceptions import NotRegistered
 from django.http import HttpRequest
 
+from .models import AuditActionCount
+
 # Auditlog ships its own admin registration. Replace it with the WeFa
 # read-only variant so consumers see WeFa-style action labels and outcomes.
 try:
@@ -97,3 +99,27 @@ class LogEntryAdmin(admin.ModelAdmin):
     @admin.display(description="outcome")
     def outcome_label(self, obj: LogEntry) -> str:
         return (obj.additional_data or {}).get("outcome", "")
+
+
+@admin.register(AuditActionCount)
+class AuditActionCountAdmin(admin.ModelAdmin):
+    """Read-only admin for the exact counts of sampled audit actions."""
+
+    list_display = ("day", "action", "outcome", "count")
+    list_filter = ("outcome", "day")
+    search_fields = ("action",)
+    date_hierarchy = "day"
+    readonly_fields = ("action", "outcome", "day", "count")
+
+    def has_add_permission(self, request: HttpRequest) -> bool:  # noqa: D401
+        return False
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: Optional[Any] = None
+    ) -> bool:  # noqa: D401
+        return False
+
+    def has_delete_permission(
+        self, request: HttpRequest, obj: Optional[Any] = None
+    ) -> bool:  # noqa: D401
+        return False
@@ -12,6 +12,12 @@ The :class:`Outcome` enum is stored in ``LogEntry.additional_data["outcome"]``
 so login successes, failures, and permission denials can co-exist in the
 same table.
 
+``object_repr`` comes from the target's registered repr provider, if any; see
+:mod:`nside_wefa.audit.representation`.
+
+Actions matched by ``NSIDE_WEFA.AUDIT.SAMPLING`` are only partly written;
+see :mod:`nside_wefa.audit.sampling`.
+
 Failure handling is governed by ``NSIDE_WEFA.AUDIT.RAISE_ON_FAILURE`` (default
 ``False``): write errors are caught, logged as a warning, and :func:`log`
 returns ``None``. Set the flag to ``True`` in tests to surface regressions.
@@ -24,11 +30,11 @@ from typing import Any, Dict, Optional
 from auditlog import get_logentry_model
 from auditlog.context import set_actor as _auditlog_set_actor
 from auditlog.models import AbstractLogEntry
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 from nside_wefa.common.settings import get_section
 
+from . import representation, sampling
 from .settings_translation import DEFAULT_REDACT_FIELDS
 
 logger = logging.getLogger("nside_wefa.audit")
@@ -86,8 +92,9 @@ def log(
     :param metadata: Free-form JSON-serializable dict, stored under
         ``additional_data`` alongside the outcome label.
     :param outcome: One of :class:`Outcome`. Default :attr:`Outcome.SUCCESS`.
-    :returns: The created :class:`LogEntry` row, or ``None`` if the write was
-        soft-failed under ``RAISE_ON_FAILURE=False``.
+    :returns: The created :class:`LogEntry` row, or ``None`` if the event was
+        sampled out under ``SAMPLING`` or the write was soft-failed under
+        ``RAISE_ON_FAILURE=False``.
     :raises AuditWriteError: when ``RAISE_ON_FAILURE=True`` and the write
         cannot be persisted.
     """
@@ -95,6 +102,19 @@ def log(
     redact_fields = list(section.get("REDACT_FIELDS", DEFAULT_REDACT_FIELDS))
     raise_on_failure = bool(section.get("RAISE_ON_FAILURE", False))
 
+    sample_rate = sampling.get_sample_rate(action, section.get("SAMPLING"))
+    if sample_rate is not None:
+        try:
+            sampling.count_event(action, outcome.value)
+        except Exception as exc:  # noqa: BLE001 — by design; see RAISE_ON_FAILURE
+            if raise_on_failure:
+                raise AuditWriteError(
+                    f"Failed to count audit event {action!r}: {exc}"
+                ) from exc
+            logger.warning("audit.log: failed to count event %r: %s", action, exc)
+        if sampling.is_sampled_out(sample_rate, outcome.value):
+            return None
+
     redacted_changes = _redact(changes, redact_fields) if changes else None
     redacted_metadata = _redact(metadata, redact_fields) if metadata else {}
 
@@ -104,6 +124,9 @@ def log(
     }
     if redacted_metadata:
         additional_data["metadata"] = redacted_metadata
+    if sample_rate is not None and outcome.value not in sampling.UNSAMPLED_OUTCOMES:
+        # Lets consumers weight kept events back up to the full volume.
+        additional_data["sample_rate"] = sample_rate
 
     # Resolve the active LogEntry model so manual writes go to WefaLogEntry
     # when tamper-evidence is enabled. The Action enum lives on the abstract
@@ -133,16 +156,16 @@ def log(
     #    (or "audit.wefalogentry" under tamper-evidence).
     effective_target = target if target is not None else resolved_actor
     if effective_target is not None:
-        create_kwargs["content_type"] = ContentType.objects.get_for_model(
-            effective_target
+        create_kwargs["content_type"] = representation.get_content_type(
+            type(effective_target)
         )
         pk_value = effective_target.pk
         create_kwargs["object_pk"] = str(pk_value) if pk_value is not None else ""
         create_kwargs["object_id"] = pk_value if isinstance(pk_value, int) else None
-        create_kwargs["object_repr"] = str(effective_target)
+        create_kwargs["object_repr"] = representation.get_object_repr(effective_target)
     else:
         # Neither target nor actor: a true system / anonymous event.
-        create_kwargs["content_type"] = ContentType.objects.get_for_model(log_model)
+        create_kwargs["content_type"] = representation.get_content_type(log_model)
         create_kwargs["object_pk"] = "0"
         create_kwargs["object_id"] = 0
         create_kwargs["object_repr"] = "system"
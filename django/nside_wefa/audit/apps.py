@@ -50,6 +50,11 @@ class AuditConfig(AppConfig):
 
         install_builtin_sources()
 
+        # Write the exact counts of sampled actions between requests.
+        from . import sampling
+
+        sampling.install()
+
         # Install the immutability guard so accidental updates / deletes of
         # LogEntry rows raise loudly.
         from . import immutability
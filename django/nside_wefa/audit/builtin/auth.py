@@ -5,18 +5,46 @@ Logs login successes, login failures, and logouts as audit events. Hooks are
 installed on Django's built-in ``user_logged_in`` / ``user_logged_out`` /
 ``user_login_failed`` signals so any auth backend (DRF token, JWT, session)
 that emits them is covered automatically.
+
+Login failures can be coalesced with ``NSIDE_WEFA.AUDIT.LOGIN_FAILURE_COALESCING``
+so a credential-stuffing run does not turn into one audit row per attempt:
+per ``(username, remote_addr)`` and window, the first ``THRESHOLD`` failures
+are logged individually and the rest are counted in memory, then written as a
+single ``auth.login_failed`` event carrying ``count``, ``first_seen`` and
+``last_seen`` by the first login failure or finished request after the window
+is over. At most ``MAX_KEYS`` windows are kept
+open; past that, the oldest one is closed early.
 """
 
-from typing import Any
+import atexit
+import contextlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from auditlog.context import auditlog_value
+from django.conf import settings
 from django.contrib.auth.signals import (
     user_logged_in,
     user_logged_out,
     user_login_failed,
 )
+from django.core.signals import request_finished
+from django.utils import timezone
+
+from nside_wefa.common.settings import get_section
 
 from .. import api
 
+# Defaults of the NSIDE_WEFA.AUDIT.LOGIN_FAILURE_COALESCING keys.
+DEFAULT_COALESCING_WINDOW_SECONDS = 60
+DEFAULT_COALESCING_THRESHOLD = 5
+DEFAULT_COALESCING_MAX_KEYS = 10_000
+
+# ``(username, remote_addr)`` of a failed login.
+_FailureKey = Tuple[str, Optional[str]]
+
 
 def install() -> None:
     """Connect the auth signal handlers."""
@@ -35,6 +63,15 @@ def install() -> None:
         weak=False,
         dispatch_uid="nside_wefa.audit.builtin.auth.login_failed",
     )
+    # Coalesced failures are written between requests, outside of the
+    # auditlog middleware context, so the rows are not stamped with the actor
+    # and address of whichever request happens to be running.
+    request_finished.connect(
+        _flush_expired_login_failures,
+        weak=False,
+        dispatch_uid="nside_wefa.audit.builtin.auth.flush_login_failures",
+    )
+    atexit.register(flush_login_failures)
 
 
 def _on_login(sender: Any, request: Any, user: Any, **kwargs: Any) -> None:
@@ -52,9 +89,196 @@ def _on_login_failed(sender: Any, credentials: Any, **kwargs: Any) -> None:
     username = ""
     if isinstance(credentials, dict):
         username = str(credentials.get("username", ""))[:150]
+
+    coalescing = get_section("AUDIT", default={}).get("LOGIN_FAILURE_COALESCING")
+    if coalescing is not None:
+        key = (username, _remote_addr(kwargs.get("request")))
+        window_seconds = coalescing.get(
+            "WINDOW_SECONDS", DEFAULT_COALESCING_WINDOW_SECONDS
+        )
+        logged = _COALESCER.record(
+            key,
+            timezone.now(),
+            window_seconds=window_seconds,
+            threshold=coalescing.get("THRESHOLD", DEFAULT_COALESCING_THRESHOLD),
+            max_keys=coalescing.get("MAX_KEYS", DEFAULT_COALESCING_MAX_KEYS),
+        )
+        # Every failure also writes the windows that are over, whatever their
+        # key, so an attack keeps its summaries flowing even on a worker whose
+        # requests never finish in between.
+        with _outside_request_context():
+            _write_expired(window_seconds)
+        if not logged:
+            return
+
     api.log(
         "auth.login_failed",
         actor=None,
         outcome=api.Outcome.FAILURE,
         metadata={"username": username} if username else None,
     )
+
+
+def _remote_addr(request: Any) -> Optional[str]:
+    if request is None or getattr(settings, "AUDITLOG_DISABLE_REMOTE_ADDR", False):
+        return None
+    meta = getattr(request, "META", None) or {}
+    return meta.get("REMOTE_ADDR")
+
+
+@dataclass
+class _FailureWindow:
+    """Login failures of one ``(username, remote_addr)`` in one window."""
+
+    opened_at: datetime
+    logged: int = 0
+    count: int = 0
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+
+
+class LoginFailureCoalescer:
+    """Thread-safe, per-process aggregation of login failures.
+
+    Windows start at the first failure of a key. Each worker process keeps its
+    own windows, so a key failing on several workers yields one coalesced
+    event per worker; counts add up across events.
+
+    Open windows are kept in opening order, so expired ones are always at the
+    head and closing them never scans the windows that are still running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # A window is reinserted when its key reopens it, which keeps the
+        # dict ordered by ``opened_at``.
+        self._windows: Dict[_FailureKey, _FailureWindow] = {}
+        self._closed: List[Tuple[_FailureKey, _FailureWindow]] = []
+
+    def record(
+        self,
+        key: _FailureKey,
+        now: datetime,
+        window_seconds: int,
+        threshold: int,
+        max_keys: int = DEFAULT_COALESCING_MAX_KEYS,
+    ) -> bool:
+        """Record one failure of ``key``.
+
+        :param key: ``(username, remote_addr)`` of the failed attempt.
+        :param now: Time of the failure.
+        :param window_seconds: Length of a coalescing window.
+        :param threshold: Failures per window logged individually.
+        :param max_keys: Open windows kept at most. Opening one more closes
+            the oldest, whose coalesced event is then written as usual.
+        :returns: True if the failure must be logged individually, False if it
+            was counted towards the coalesced event of its window.
+        """
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None and now - window.opened_at >= timedelta(
+                seconds=window_seconds
+            ):
+                self._close(key, window)
+                window = None
+            if window is None:
+                while len(self._windows) >= max_keys:
+                    self._close(*next(iter(self._windows.items())))
+                window = self._windows[key] = _FailureWindow(opened_at=now)
+            if window.logged < threshold:
+                window.logged += 1
+                return True
+            window.count += 1
+            window.first_seen = window.first_seen or now
+            window.last_seen = now
+            return False
+
+    def pop_closed(
+        self, opened_before: Optional[datetime] = None
+    ) -> List[Tuple[_FailureKey, _FailureWindow]]:
+        """Close windows opened before ``opened_before`` and return all closed ones.
+
+        :param opened_before: Windows opened at or before this time are
+            closed; ``None`` closes every window.
+        :returns: ``(key, window)`` pairs holding at least one coalesced
+            failure, each returned once.
+        """
+        with self._lock:
+            while self._windows:
+                key, window = next(iter(self._windows.items()))
+                if opened_before is not None and window.opened_at > opened_before:
+                    break
+                self._close(key, window)
+            closed, self._closed = self._closed, []
+        return closed
+
+    def has_windows(self) -> bool:
+        """Return whether any window is open or waiting to be written."""
+        return bool(self._windows or self._closed)
+
+    def _close(self, key: _FailureKey, window: _FailureWindow) -> None:
+        del self._windows[key]
+        if window.count:
+            self._closed.append((key, window))
+
+
+_COALESCER = LoginFailureCoalescer()
+
+
+def flush_login_failures() -> None:
+    """Write the coalesced events of every window, finished or not.
+
+    Runs at interpreter exit; call it before shutting down workers in other
+    ways, or in tests.
+    """
+    _write_coalesced(_COALESCER.pop_closed())
+
+
+def _flush_expired_login_failures(sender: Any, **kwargs: Any) -> None:
+    coalescing = get_section("AUDIT", default={}).get("LOGIN_FAILURE_COALESCING")
+    _write_expired(
+        (coalescing or {}).get("WINDOW_SECONDS", DEFAULT_COALESCING_WINDOW_SECONDS)
+    )
+
+
+def _write_expired(window_seconds: int) -> None:
+    if not _COALESCER.has_windows():
+        return
+    opened_before = timezone.now() - timedelta(seconds=window_seconds)
+    _write_coalesced(_COALESCER.pop_closed(opened_before))
+
+
+@contextlib.contextmanager
+def _outside_request_context() -> Iterator[None]:
+    # Coalesced events describe other requests. Point auditlog at a context
+    # no receiver is connected for, so the running request's actor and
+    # address are not stamped on them.
+    token = auditlog_value.set({"signal_duid": None})
+    try:
+        yield
+    finally:
+        auditlog_value.reset(token)
+
+
+def _write_coalesced(
+    closed: List[Tuple[_FailureKey, _FailureWindow]],
+) -> None:
+    for (username, remote_addr), window in closed:
+        if window.first_seen is None or window.last_seen is None:
+            # Not reached: only windows with coalesced failures are closed.
+            continue
+        metadata: Dict[str, Any] = {
+            "count": window.count,
+            "first_seen": window.first_seen.isoformat(),
+            "last_seen": window.last_seen.isoformat(),
+        }
+        if username:
+            metadata["username"] = username
+        if remote_addr:
+            metadata["remote_addr"] = remote_addr
+        api.log(
+            "auth.login_failed",
+            actor=None,
+            outcome=api.Outcome.FAILURE,
+            metadata=metadata,
+        )
@@ -10,25 +10,23 @@ fields) does not produce a duplicate event. Pairs with catalog item E3
 
 from typing import Any
 
-from django.db.models.signals import post_init, post_save
+from django.db.models.signals import post_save
 
 from .. import api
+from ..representation import get_related_without_query, register_repr, user_label
+from ..tracking import FieldTracker
 
-# Per-instance attribute used to remember the last-loaded (version, accepted_at)
-# tuple so post_save can compute a diff without an extra DB call.
-_SNAPSHOT_ATTR = "_wefa_audit_previous_consent"
+# Remembers the last persisted (version, accepted_at) pair so post_save can
+# compute a diff without an extra DB call.
+_TRACKER = FieldTracker("version", "accepted_at", attr="_wefa_audit_previous_consent")
 
 
 def install() -> None:
     """Connect the legal_consent signal handlers."""
     from nside_wefa.legal_consent.models import LegalConsent
 
-    post_init.connect(
-        _snapshot_consent,
-        sender=LegalConsent,
-        weak=False,
-        dispatch_uid="nside_wefa.audit.builtin.legal_consent.snapshot",
-    )
+    register_repr(LegalConsent, _consent_repr)
+    _TRACKER.install(LegalConsent)
     post_save.connect(
         _on_consent_saved,
         sender=LegalConsent,
@@ -37,29 +35,30 @@ def install() -> None:
     )
 
 
-def _snapshot_consent(sender: Any, instance: Any, **kwargs: Any) -> None:
-    setattr(instance, _SNAPSHOT_ATTR, (instance.version, instance.accepted_at))
-
-
 def _on_consent_saved(sender: Any, instance: Any, created: bool, **kwargs: Any) -> None:
     # Auto-creation by the legal_consent post_save signal yields a row with
     # version=None and accepted_at=None — nothing to log there.
     if instance.accepted_at is None or instance.version is None:
-        setattr(instance, _SNAPSHOT_ATTR, (instance.version, instance.accepted_at))
+        _TRACKER.reset(instance)
         return
 
-    previous = getattr(instance, _SNAPSHOT_ATTR, (None, None))
-    current = (instance.version, instance.accepted_at)
-    if previous == current:
+    if _TRACKER.previous(instance) == _TRACKER.current(instance):
+        # Instances built in Python only get their snapshot here.
+        _TRACKER.reset(instance)
         return
 
     api.log(
         "legal_consent.renew",
-        actor=instance.user,
+        actor=get_related_without_query(instance, "user"),
         target=instance,
         metadata={
             "version": instance.version,
             "accepted_at": instance.accepted_at.isoformat(),
         },
     )
-    setattr(instance, _SNAPSHOT_ATTR, current)
+    _TRACKER.reset(instance)
+
+
+def _consent_repr(instance: Any) -> str:
+    # ``LegalConsent.__str__`` loads the user for its username.
+    return f"Legal Consent for {user_label(instance)}"
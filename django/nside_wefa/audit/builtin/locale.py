@@ -8,25 +8,23 @@ of empty rows on user signup is silently ignored.
 
 from typing import Any
 
-from django.db.models.signals import post_init, post_save
+from django.db.models.signals import post_save
 
 from .. import api
+from ..representation import get_related_without_query, register_repr, user_label
+from ..tracking import UNKNOWN, FieldTracker
 
-# Per-instance attribute we use to remember the last persisted code so
-# post_save can compute a diff without making an extra DB call.
-_SNAPSHOT_ATTR = "_wefa_audit_previous_code"
+# Remembers the last persisted code so post_save can compute a diff without
+# making an extra DB call.
+_TRACKER = FieldTracker("code", attr="_wefa_audit_previous_code")
 
 
 def install() -> None:
     """Connect the locale signal handlers."""
     from nside_wefa.locale.models import UserLocale
 
-    post_init.connect(
-        _snapshot_code,
-        sender=UserLocale,
-        weak=False,
-        dispatch_uid="nside_wefa.audit.builtin.locale.snapshot",
-    )
+    register_repr(UserLocale, _locale_repr)
+    _TRACKER.install(UserLocale)
     post_save.connect(
         _on_locale_saved,
         sender=UserLocale,
@@ -35,26 +33,33 @@ def install() -> None:
     )
 
 
-def _snapshot_code(sender: Any, instance: Any, **kwargs: Any) -> None:
-    setattr(instance, _SNAPSHOT_ATTR, instance.code)
-
-
 def _on_locale_saved(sender: Any, instance: Any, created: bool, **kwargs: Any) -> None:
     if created:
         # New row with an empty code: not interesting.
         if instance.code is None:
-            setattr(instance, _SNAPSHOT_ATTR, instance.code)
+            _TRACKER.reset(instance)
             return
 
-    previous = getattr(instance, _SNAPSHOT_ATTR, None)
+    (previous,) = _TRACKER.previous(instance)
     current = instance.code
     if previous == current:
+        # Instances built in Python only get their snapshot here.
+        _TRACKER.reset(instance)
         return
 
+    change = {"from": previous, "to": current}
+    if previous is UNKNOWN:
+        # ``code`` was deferred when the row was loaded.
+        del change["from"]
     api.log(
         "locale.change",
-        actor=instance.user,
+        actor=get_related_without_query(instance, "user"),
         target=instance,
-        changes={"code": {"from": previous, "to": current}},
+        changes={"code": change},
     )
-    setattr(instance, _SNAPSHOT_ATTR, current)
+    _TRACKER.reset(instance)
+
+
+def _locale_repr(instance: Any) -> str:
+    # ``UserLocale.__str__`` loads the user for its username.
+    return f"User Locale for {user_label(instance)}"
@@ -12,6 +12,9 @@ Validates:
 - Each entry in ``BUILTIN_SOURCES`` is a known WeFa source. Missing source
   apps are tolerated (the source is silently skipped at install time) but an
   unknown source name is an error.
+- ``LOGIN_FAILURE_COALESCING`` is ``None`` or a dict of a positive
+  ``WINDOW_SECONDS`` and a non-negative ``THRESHOLD``.
+- ``SAMPLING`` maps non-empty action prefixes to rates between 0 and 1.
 """
 
 from typing import Any, List
@@ -91,6 +94,8 @@ def audit_settings_check(app_configs, **kwargs) -> List[Error]:
         "ACTOR_RESOLVER": validate_dotted_path_callable(
             "NSIDE_WEFA.AUDIT.ACTOR_RESOLVER"
         ),
+        "LOGIN_FAILURE_COALESCING": _validate_login_failure_coalescing,
+        "SAMPLING": _validate_sampling,
     }
 
     errors: List[Error] = []
@@ -130,3 +135,70 @@ def _validate_non_empty_string(setting_path: str):
         return []
 
     return _validator
+
+
+def _validate_login_failure_coalescing(value: Any) -> List[Error]:
+    """``LOGIN_FAILURE_COALESCING`` is ``None`` or a dict of integer options."""
+    setting_path = "NSIDE_WEFA.AUDIT.LOGIN_FAILURE_COALESCING"
+    if value is None:
+        return []
+    if not isinstance(value, dict):
+        return [
+            Error(
+                f"{setting_path} must be a dict or None, got {type(value).__name__}.",
+            )
+        ]
+    errors: List[Error] = []
+    minimums = {"WINDOW_SECONDS": 1, "THRESHOLD": 0, "MAX_KEYS": 1}
+    for key, option in value.items():
+        if key not in minimums:
+            errors.append(
+                Error(
+                    f"{setting_path} key {key!r} is not allowed. "
+                    f"Expected one of {list(minimums)}.",
+                )
+            )
+        elif (
+            isinstance(option, bool)
+            or not isinstance(option, int)
+            or option < minimums[key]
+        ):
+            errors.append(
+                Error(
+                    f"{setting_path}.{key} must be an integer >= {minimums[key]}, "
+                    f"got {option!r}.",
+                )
+            )
+    return errors
+
+
+def _validate_sampling(value: Any) -> List[Error]:
+    """``SAMPLING`` maps action prefixes to sample rates in ``[0, 1]``."""
+    setting_path = "NSIDE_WEFA.AUDIT.SAMPLING"
+    if not isinstance(value, dict):
+        return [
+            Error(
+                f"{setting_path} must be a dict of action prefixes to rates, "
+                f"got {type(value).__name__}.",
+            )
+        ]
+    errors: List[Error] = []
+    for prefix, rate in value.items():
+        if not isinstance(prefix, str) or not prefix:
+            errors.append(
+                Error(
+                    f"{setting_path} keys must be non-empty strings, got {prefix!r}.",
+                )
+            )
+        elif (
+            isinstance(rate, bool)
+            or not isinstance(rate, (int, float))
+            or not 0 <= rate <= 1
+        ):
+            errors.append(
+                Error(
+                    f"{setting_path}[{prefix!r}] must be a number between 0 and 1, "
+                    f"got {rate!r}.",
+                )
+            )
+    return errors
@@ -0,0 +1,44 @@
+# Generated by Django 6.1.2 on 2026-10-19 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("audit", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditActionCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("action", models.CharField(max_length=255)),
+                ("outcome", models.CharField(max_length=16)),
+                (
+                    "day",
+                    models.DateField(help_text="UTC day the events were logged on."),
+                ),
+                ("count", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Audit Action Count",
+                "verbose_name_plural": "Audit Action Counts",
+                "ordering": ("-day", "action", "outcome"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("action", "outcome", "day"),
+                        name="audit_action_count_unique_day",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,7 +1,8 @@
 """
-Tamper-evident :class:`LogEntry` subclass.
+Models of the audit app.
 
-When ``NSIDE_WEFA.AUDIT.TAMPER_EVIDENT`` is True, the settings translation
+:class:`WefaLogEntry` is the tamper-evident :class:`LogEntry` subclass. When
+``NSIDE_WEFA.AUDIT.TAMPER_EVIDENT`` is True, the settings translation
 layer points ``AUDITLOG_LOGENTRY_MODEL`` at :class:`WefaLogEntry`, which
 adds two columns (``prev_hash``, ``hash``) and computes a SHA-256 hash chain
 in a ``pre_save`` handler. The :func:`wefa_audit_verify` management command
@@ -10,6 +11,9 @@ walks the chain forward and reports the first divergence.
 The model is **always** defined and migrated — leaving the table empty when
 the feature is off costs nothing and means flipping the setting later does
 not require an additional migration.
+
+:class:`AuditActionCount` keeps exact daily counts of the actions matched by
+``NSIDE_WEFA.AUDIT.SAMPLING``, whose events are only partly written.
 """
 
 import hashlib
@@ -102,3 +106,33 @@ def compute_event_hash(entry: AbstractLogEntry, prev_hash: str) -> str:
     }
     canonical = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
     return hashlib.sha256(canonical).hexdigest()
+
+
+class AuditActionCount(models.Model):
+    """Exact number of events of one sampled action and outcome on one day.
+
+    Written by :func:`nside_wefa.audit.api.log` for every committed event
+    whose action matches ``NSIDE_WEFA.AUDIT.SAMPLING``, whether the event
+    itself was kept or sampled out, so totals survive while most rows are
+    skipped. Counts are buffered for a few seconds per worker process; see
+    :mod:`nside_wefa.audit.sampling` for what a hard kill loses.
+    """
+
+    action = models.CharField(max_length=255)
+    outcome = models.CharField(max_length=16)
+    day = models.DateField(help_text="UTC day the events were logged on.")
+    count = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Audit Action Count"
+        verbose_name_plural = "Audit Action Counts"
+        ordering = ("-day", "action", "outcome")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["action", "outcome", "day"],
+                name="audit_action_count_unique_day",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.action} ({self.outcome}) on {self.day}: {self.count}"
@@ -0,0 +1,134 @@
+"""
+Query-free description of audit targets.
+
+:func:`nside_wefa.audit.log` stores an ``object_repr`` and a content type for
+every event. ``str(instance)`` often walks a foreign key (``LegalConsent``
+prints its user's username, for example), which costs one query per event.
+Models can register a repr provider that builds the text from local columns
+instead::
+
+    from nside_wefa import audit
+
+    audit.register_repr(Order, lambda order: f"Order #{order.pk}")
+
+Models without a provider keep using ``str(instance)``.
+
+Content types of the log model, the user model and every model with a
+provider are loaded in one query on the first event, instead of one query per
+model.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from auditlog import get_logentry_model
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models.base import DEFERRED
+
+ReprProvider = Callable[[Any], str]
+
+_REPR_PROVIDERS: Dict[Type[models.Model], ReprProvider] = {}
+# Models whose content types were loaded by the last preload.
+_preloaded_models: Tuple[Type[models.Model], ...] = ()
+
+
+def register_repr(model: Type[models.Model], provider: ReprProvider) -> None:
+    """Use ``provider(instance)`` as the ``object_repr`` of ``model`` events.
+
+    The provider should only read the instance's own columns; anything that
+    triggers a query defeats its purpose. Registering a model again replaces
+    its provider.
+
+    :param model: The target model class.
+    :param provider: Callable returning the representation of an instance.
+    """
+    _REPR_PROVIDERS[model] = provider
+
+
+def get_object_repr(instance: models.Model) -> str:
+    """Return the ``object_repr`` of an audit event targeting ``instance``."""
+    provider = _REPR_PROVIDERS.get(type(instance))
+    concrete_model = instance._meta.concrete_model
+    if provider is None and concrete_model is not None:
+        provider = _REPR_PROVIDERS.get(concrete_model)
+    if provider is None:
+        return str(instance)
+    return provider(instance)
+
+
+def get_content_type(model: Type[models.Model]) -> ContentType:
+    """Return the content type of ``model``, preloading the known ones first.
+
+    Content types are cached by Django's :class:`ContentTypeManager`; this
+    only makes sure the cache is filled with a single query.
+    """
+    preload_content_types()
+    return ContentType.objects.get_for_model(model)
+
+
+def preload_content_types() -> None:
+    """Load the content types audit events usually point at, in one query.
+
+    Covers the active log model (system events), the user model (events
+    without a target) and every model with a registered repr provider. The
+    query is repeated only when that list changes, e.g. after a new provider
+    is registered.
+    """
+    global _preloaded_models
+    wanted = (get_logentry_model(), get_user_model(), *_REPR_PROVIDERS)
+    if wanted == _preloaded_models:
+        return
+    ContentType.objects.get_for_models(*wanted)
+    _preloaded_models = wanted
+
+
+def get_related_without_query(
+    instance: models.Model, field_name: str
+) -> Optional[models.Model]:
+    """Return the object of the foreign key ``field_name`` without a query.
+
+    The cached related object is returned when the relation has already been
+    loaded; otherwise an instance built as if loaded from the database with
+    only the key the foreign key points at, which is enough to be stored as a
+    foreign key value (an audit ``actor``, for example). Its other fields are
+    deferred, so Django loads them the first time they are read.
+    """
+    field = _get_foreign_key(instance, field_name)
+    if field.is_cached(instance):
+        return getattr(instance, field_name)
+    key = getattr(instance, field.attname)
+    if key is None:
+        return None
+    related_model = field.related_model
+    target_attname = field.target_field.attname
+    concrete_fields = related_model._meta.concrete_fields
+    return related_model.from_db(
+        instance._state.db,
+        [related_field.attname for related_field in concrete_fields],
+        [
+            key if related_field.attname == target_attname else DEFERRED
+            for related_field in concrete_fields
+        ],
+    )
+
+
+def user_label(instance: models.Model, field_name: str = "user") -> str:
+    """Describe the user of ``instance`` without loading it.
+
+    :returns: The username when the user is already loaded, ``"user #<pk>"``
+        otherwise.
+    """
+    field = _get_foreign_key(instance, field_name)
+    if field.is_cached(instance):
+        user = getattr(instance, field_name)
+        if user is not None:
+            return user.get_username()
+    return f"user #{getattr(instance, field.attname)}"
+
+
+def _get_foreign_key(instance: models.Model, field_name: str) -> models.ForeignKey:
+    field = instance._meta.get_field(field_name)
+    if not isinstance(field, models.ForeignKey):
+        raise TypeError(f"{type(instance).__name__}.{field_name} is not a foreign key.")
+    return field
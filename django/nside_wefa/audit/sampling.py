@@ -0,0 +1,188 @@
+"""
+Per-action sampling of audit events.
+
+``NSIDE_WEFA.AUDIT.SAMPLING`` maps action prefixes to the fraction of events
+that are written, for high-volume actions that are only useful statistically
+(read-access logging, for example)::
+
+    NSIDE_WEFA = {"AUDIT": {"SAMPLING": {"document.view": 0.01, "read.": 0.1}}}
+
+The longest matching prefix wins. ``FAILURE`` and ``DENIED`` events are never
+sampled out. Every event of a matched action, kept or not, is counted in
+:class:`~nside_wefa.audit.models.AuditActionCount`, so totals survive
+sampling.
+
+An event is counted once the transaction it was logged in commits, in an
+in-memory counter of the worker process. The counters are added to their rows
+with one ``F()`` increment per action, outcome and day by a background timer,
+``COUNT_FLUSH_INTERVAL_SECONDS`` after the first pending count, and at
+interpreter exit, so a hot action does not turn into one UPDATE of the same
+row per event. Totals are therefore best-effort: a worker killed without a
+clean exit (OOM killer, ``SIGKILL`` after a timeout) loses the counts of its
+last few seconds.
+"""
+
+import atexit
+import logging
+import random
+import threading
+from datetime import date
+from functools import partial
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from auditlog import get_logentry_model
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger("nside_wefa.audit")
+
+# Seconds a count waits in memory before the timer writes it.
+COUNT_FLUSH_INTERVAL_SECONDS = 5
+
+# Outcomes that are always written, whatever the sampling policy says.
+UNSAMPLED_OUTCOMES = frozenset({"failure", "denied"})
+
+# ``(action, outcome, day)`` of a counter row.
+_CountKey = Tuple[str, str, date]
+
+
+def install() -> None:
+    """Flush the pending event counts at interpreter exit."""
+    atexit.register(flush_event_counts)
+
+
+def get_sample_rate(
+    action: str, policy: Optional[Mapping[str, Any]]
+) -> Optional[float]:
+    """Return the sample rate configured for ``action``.
+
+    :param action: The event's action identifier.
+    :param policy: The ``NSIDE_WEFA.AUDIT.SAMPLING`` mapping, if any.
+    :returns: The rate of the longest prefix of ``action`` in ``policy``, or
+        ``None`` when the action is not sampled.
+    """
+    if not policy:
+        return None
+    prefixes = [prefix for prefix in policy if action.startswith(prefix)]
+    if not prefixes:
+        return None
+    return float(policy[max(prefixes, key=len)])
+
+
+def is_sampled_out(sample_rate: float, outcome: str) -> bool:
+    """Return True if an event of ``outcome`` must be dropped at ``sample_rate``."""
+    if outcome in UNSAMPLED_OUTCOMES:
+        return False
+    return random.random() >= sample_rate  # nosec B311 - statistical sampling
+
+
+class EventCountBuffer:
+    """Thread-safe, per-process counts of events not yet added to their rows."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[_CountKey, int] = {}
+
+    def add(self, key: _CountKey, count: int = 1) -> None:
+        """Count ``count`` more events of ``key``."""
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + count
+
+    def pop(self) -> Dict[_CountKey, int]:
+        """Return the pending counts and start counting from zero."""
+        with self._lock:
+            counts, self._counts = self._counts, {}
+        return counts
+
+    def has_counts(self) -> bool:
+        """Return whether any count is waiting to be written."""
+        return bool(self._counts)
+
+
+_BUFFER = EventCountBuffer()
+_timer_lock = threading.Lock()
+_timer: Optional[threading.Timer] = None
+
+
+def count_event(action: str, outcome: str) -> None:
+    """Count one event of ``action`` and ``outcome`` towards today's row.
+
+    The event is counted when the current transaction commits, and not at all
+    if it rolls back. The count is written by the next flush; see
+    :func:`flush_event_counts`.
+    """
+    key = (action, outcome, timezone.now().date())
+    transaction.on_commit(
+        partial(_add_count, key), using=router.db_for_write(get_logentry_model())
+    )
+
+
+def flush_event_counts() -> None:
+    """Add every pending count to its ``AuditActionCount`` row.
+
+    Runs at interpreter exit; call it in processes that log sampled events
+    outside of requests (task workers, management commands) before they stop,
+    or in tests. Counts that could not be written are kept for the next flush.
+    """
+    _write_counts(_BUFFER.pop())
+
+
+def _add_count(key: _CountKey) -> None:
+    _BUFFER.add(key)
+    _schedule_flush()
+
+
+def _schedule_flush() -> None:
+    global _timer
+    with _timer_lock:
+        if _timer is not None:
+            return
+        _timer = threading.Timer(COUNT_FLUSH_INTERVAL_SECONDS, _flush_on_timer)
+        # Never keep the interpreter alive; atexit writes what is left.
+        _timer.daemon = True
+        _timer.start()
+
+
+def _flush_on_timer() -> None:
+    global _timer
+    with _timer_lock:
+        _timer = None
+    try:
+        flush_event_counts()
+    except Exception as exc:  # noqa: BLE001 — retried by the next timer
+        logger.warning("audit: failed to write event counts: %s", exc)
+        _schedule_flush()
+    finally:
+        # The timer thread's own connections; nothing else would close them.
+        connections.close_all()
+
+
+def _write_counts(counts: Dict[_CountKey, int]) -> None:
+    pending = dict(counts)
+    try:
+        for key, count in counts.items():
+            _increment(key, count)
+            del pending[key]
+    finally:
+        for key, count in pending.items():
+            _BUFFER.add(key, count)
+
+
+def _increment(key: _CountKey, count: int) -> None:
+    from .models import AuditActionCount
+
+    action, outcome, day = key
+    counter = AuditActionCount.objects.filter(action=action, outcome=outcome, day=day)
+    try:
+        # A savepoint, so a lost creation race does not break the transaction
+        # the flush may run in.
+        with transaction.atomic():
+            if counter.update(count=F("count") + count):
+                return
+            AuditActionCount.objects.create(
+                action=action, outcome=outcome, day=day, count=count
+            )
+    except IntegrityError:
+        # Another process created the row since the update above.
+        counter.update(count=F("count") + count)
@@ -1,5 +1,9 @@
 """Tests for the ``auth`` built-in audit source."""
 
+from datetime import timedelta
+from unittest.mock import patch
+
+from auditlog.context import set_actor
 from auditlog.models import LogEntry
 from django.contrib.auth.models import User
 from django.contrib.auth.signals import (
@@ -7,7 +11,11 @@ from django.contrib.auth.signals import (
     user_logged_out,
     user_login_failed,
 )
-from django.test import RequestFactory, TestCase
+from django.core.signals import request_finished
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from nside_wefa.audit.builtin import auth
 
 
 class AuthBuiltinSourceTest(TestCase):
@@ -44,3 +52,121 @@ class AuthBuiltinSourceTest(TestCase):
         self.assertEqual(
             last.additional_data.get("metadata", {}).get("username"), "alice"
         )
+
+
+@override_settings(
+    NSIDE_WEFA={
+        "AUDIT": {
+            "LOGIN_FAILURE_COALESCING": {"WINDOW_SECONDS": 60, "THRESHOLD": 2},
+        }
+    }
+)
+class LoginFailureCoalescingTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.addCleanup(auth._COALESCER.pop_closed)
+
+    def _fail(self, username="alice", remote_addr="10.0.0.1"):
+        user_login_failed.send(
+            sender=User,
+            credentials={"username": username},
+            request=self.factory.post("/", REMOTE_ADDR=remote_addr),
+        )
+
+    def _failures(self):
+        return LogEntry.objects.filter(
+            additional_data__action="auth.login_failed"
+        ).order_by("id")
+
+    def test_failures_over_threshold_are_written_as_one_event(self):
+        for _ in range(5):
+            self._fail()
+        self._fail(remote_addr="10.0.0.2")
+
+        self.assertEqual(self._failures().count(), 3)
+
+        auth.flush_login_failures()
+
+        coalesced = self._failures().last()
+        metadata = coalesced.additional_data["metadata"]
+        self.assertEqual(self._failures().count(), 4)
+        self.assertEqual(coalesced.additional_data["outcome"], "failure")
+        self.assertEqual(metadata["count"], 3)
+        self.assertEqual(metadata["username"], "alice")
+        self.assertEqual(metadata["remote_addr"], "10.0.0.1")
+        self.assertLessEqual(metadata["first_seen"], metadata["last_seen"])
+
+    def test_finished_windows_are_written_after_a_request(self):
+        for _ in range(3):
+            self._fail()
+        request_finished.send(sender=None)
+        self.assertEqual(self._failures().count(), 2)
+
+        later = timezone.now() + timedelta(seconds=61)
+        with patch("django.utils.timezone.now", return_value=later):
+            request_finished.send(sender=None)
+
+        self.assertEqual(self._failures().count(), 3)
+        self.assertEqual(
+            self._failures().last().additional_data["metadata"]["count"], 1
+        )
+
+    def test_windows_without_coalesced_failures_write_nothing(self):
+        self._fail()
+        self._fail()
+
+        auth.flush_login_failures()
+
+        self.assertEqual(self._failures().count(), 2)
+
+    def test_only_expired_windows_are_closed(self):
+        coalescer = auth.LoginFailureCoalescer()
+        start = timezone.now()
+        for offset, key in enumerate([("a", None), ("b", None), ("c", None)]):
+            for _ in range(2):
+                coalescer.record(
+                    key, start + timedelta(seconds=offset), 60, threshold=1
+                )
+
+        closed = coalescer.pop_closed(start + timedelta(seconds=1))
+
+        self.assertEqual([key for key, _ in closed], [("a", None), ("b", None)])
+        self.assertTrue(coalescer.has_windows())
+
+    @override_settings(
+        NSIDE_WEFA={
+            "AUDIT": {
+                "LOGIN_FAILURE_COALESCING": {
+                    "WINDOW_SECONDS": 60,
+                    "THRESHOLD": 1,
+                    "MAX_KEYS": 2,
+                },
+            }
+        }
+    )
+    def test_oldest_window_is_written_when_keys_overflow(self):
+        for remote_addr in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            self._fail(remote_addr=remote_addr)
+            self._fail(remote_addr=remote_addr)
+
+        self.assertEqual(self._failures().count(), 4)
+        coalesced = self._failures().get(additional_data__metadata__count=1)
+        self.assertEqual(
+            coalesced.additional_data["metadata"]["remote_addr"], "10.0.0.1"
+        )
+
+    def test_expired_windows_are_written_by_the_next_failure(self):
+        for _ in range(3):
+            self._fail()
+
+        later = timezone.now() + timedelta(seconds=61)
+        with (
+            patch("django.utils.timezone.now", return_value=later),
+            set_actor(None, remote_addr="10.0.0.9"),
+        ):
+            self._fail(username="bob", remote_addr="10.0.0.9")
+
+        coalesced = self._failures().get(additional_data__metadata__count=1)
+        self.assertEqual(coalesced.additional_data["metadata"]["username"], "alice")
+        self.assertIsNone(coalesced.remote_addr)
+        self.assertEqual(self._failures().last().remote_addr, "10.0.0.9")
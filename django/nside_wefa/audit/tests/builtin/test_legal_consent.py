@@ -3,6 +3,7 @@
 from auditlog.models import LogEntry
 from django.contrib.auth.models import User
 from django.test import TestCase
+from django.utils import timezone
 from freezegun import freeze_time
 
 from nside_wefa.legal_consent.models import LegalConsent
@@ -95,3 +96,15 @@ class LegalConsentBuiltinSourceTest(TestCase):
             ).count(),
             after_first + 1,
         )
+
+    def test_no_event_for_creation_with_a_consent(self):
+        LegalConsent.objects.filter(user=self.user).delete()
+        LegalConsent.objects.create(
+            user=self.user, version=1, accepted_at=timezone.now()
+        )
+
+        self.assertFalse(
+            LogEntry.objects.filter(
+                additional_data__action="legal_consent.renew"
+            ).exists()
+        )
@@ -47,3 +47,15 @@ class LocaleBuiltinSourceTest(TestCase):
 
         events = list(self._events().order_by("id"))
         self.assertEqual(events[-1].changes, {"code": {"from": "fr", "to": "en"}})
+
+    def test_no_event_for_creation_with_a_code(self):
+        UserLocale.objects.filter(user=self.user).delete()
+        locale = UserLocale.objects.create(user=self.user, code="fr")
+        self.assertEqual(self._events().count(), 0)
+
+        locale.code = "en"
+        locale.save()
+
+        self.assertEqual(
+            self._events().get().changes, {"code": {"from": "fr", "to": "en"}}
+        )
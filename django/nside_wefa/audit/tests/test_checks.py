@@ -222,3 +222,58 @@ class AuditSettingsCheckTest(TestCase):
 
     def test_actor_resolver_valid(self):
         self.assertEqual(self._run({"ACTOR_RESOLVER": "django.utils.timezone.now"}), [])
+
+    # ----- LOGIN_FAILURE_COALESCING -----
+
+    def test_login_failure_coalescing_valid(self):
+        self.assertEqual(self._run({"LOGIN_FAILURE_COALESCING": None}), [])
+        self.assertEqual(
+            self._run(
+                {
+                    "LOGIN_FAILURE_COALESCING": {
+                        "WINDOW_SECONDS": 30,
+                        "THRESHOLD": 0,
+                        "MAX_KEYS": 100,
+                    }
+                }
+            ),
+            [],
+        )
+
+    def test_login_failure_coalescing_must_be_dict(self):
+        errors = self._run({"LOGIN_FAILURE_COALESCING": True})
+        self.assertTrue(any("must be a dict or None" in e.msg for e in errors), errors)
+
+    def test_login_failure_coalescing_options_are_validated(self):
+        errors = self._run(
+            {
+                "LOGIN_FAILURE_COALESCING": {
+                    "WINDOW_SECONDS": 0,
+                    "THRESHOLD": -1,
+                    "MAX_KEYS": 0,
+                    "LIMIT": 3,
+                }
+            }
+        )
+        self.assertEqual(len(errors), 4, errors)
+        self.assertIn("WINDOW_SECONDS must be an integer >= 1", errors[0].msg)
+        self.assertIn("THRESHOLD must be an integer >= 0", errors[1].msg)
+        self.assertIn("MAX_KEYS must be an integer >= 1", errors[2].msg)
+        self.assertIn("'LIMIT' is not allowed", errors[3].msg)
+
+    # ----- SAMPLING -----
+
+    def test_sampling_valid(self):
+        self.assertEqual(
+            self._run({"SAMPLING": {"document.view": 0.01, "read.": 1}}), []
+        )
+
+    def test_sampling_must_be_dict(self):
+        errors = self._run({"SAMPLING": ["document.view"]})
+        self.assertTrue(any("must be a dict" in e.msg for e in errors), errors)
+
+    def test_sampling_entries_are_validated(self):
+        errors = self._run({"SAMPLING": {"": 0.5, "a.": 1.5, "b.": True, "c.": "1"}})
+        self.assertEqual(len(errors), 4, errors)
+        self.assertIn("keys must be non-empty strings", errors[0].msg)
+        self.assertIn("['a.'] must be a number between 0 and 1", errors[1].msg)
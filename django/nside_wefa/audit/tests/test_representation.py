@@ -0,0 +1,111 @@
+"""Tests for query-free ``object_repr`` and content type resolution."""
+
+from auditlog.models import LogEntry
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from nside_wefa import audit
+from nside_wefa.audit.builtin import auth, legal_consent, locale
+from nside_wefa.audit.models import WefaLogEntry
+from nside_wefa.audit.representation import (
+    _REPR_PROVIDERS,
+    get_object_repr,
+    get_related_without_query,
+    preload_content_types,
+)
+from nside_wefa.legal_consent.models import LegalConsent
+from nside_wefa.locale.models import UserLocale
+
+
+class ObjectReprTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice")
+
+    def tearDown(self):
+        _REPR_PROVIDERS.pop(User, None)
+
+    def test_models_without_provider_use_str(self):
+        self.assertEqual(get_object_repr(self.user), "alice")
+
+    def test_registered_provider_is_used(self):
+        audit.register_repr(User, lambda user: f"User #{user.pk}")
+
+        event = audit.log("demo.act", target=self.user)
+
+        self.assertEqual(event.object_repr, f"User #{self.user.pk}")
+
+    def test_builtin_providers_use_the_username_once_loaded(self):
+        consent = self.user.legalconsent
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_object_repr(consent), "Legal Consent for alice")
+
+    def test_builtin_providers_do_not_load_the_user(self):
+        user_locale = UserLocale.objects.get(user=self.user)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_object_repr(user_locale), f"User Locale for user #{self.user.pk}"
+            )
+
+    def test_related_without_query_carries_the_primary_key(self):
+        user_locale = UserLocale.objects.get(user=self.user)
+
+        with self.assertNumQueries(0):
+            user = get_related_without_query(user_locale, "user")
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertFalse(user._state.adding)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.username, "alice")
+
+
+class BuiltinSourceQueryCountTest(TestCase):
+    """Each built-in source writes its event with a single INSERT."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice")
+
+    def _queries(self, emit):
+        preload_content_types()
+        with CaptureQueriesContext(connection) as queries:
+            emit()
+        return [query["sql"] for query in queries.captured_queries]
+
+    def _emitters(self):
+        consent = LegalConsent.objects.get(user=self.user)
+        consent.version = 1
+        consent.accepted_at = timezone.now()
+        user_locale = UserLocale.objects.get(user=self.user)
+        user_locale.code = "fr"
+        return {
+            "auth": lambda: auth._on_login(None, None, self.user),
+            "auth.failed": lambda: auth._on_login_failed(None, {"username": "alice"}),
+            "legal_consent": lambda: legal_consent._on_consent_saved(
+                LegalConsent, consent, created=False
+            ),
+            "locale": lambda: locale._on_locale_saved(
+                UserLocale, user_locale, created=False
+            ),
+        }
+
+    def test_one_insert_per_event(self):
+        for source, emit in self._emitters().items():
+            with self.subTest(source=source):
+                queries = self._queries(emit)
+                self.assertEqual(len(queries), 1, queries)
+                self.assertTrue(queries[0].startswith("INSERT"), queries)
+        self.assertEqual(LogEntry.objects.count(), 4)
+
+    @override_settings(AUDITLOG_LOGENTRY_MODEL="audit.WefaLogEntry")
+    def test_one_insert_plus_chain_step_when_tamper_evident(self):
+        for source, emit in self._emitters().items():
+            with self.subTest(source=source):
+                queries = [sql for sql in self._queries(emit) if "SAVEPOINT" not in sql]
+                self.assertEqual(len(queries), 2, queries)
+                self.assertTrue(queries[0].startswith("SELECT"), queries)
+                self.assertTrue(queries[1].startswith("INSERT"), queries)
+        self.assertEqual(WefaLogEntry.objects.count(), 4)
@@ -0,0 +1,196 @@
+"""Tests for per-action sampling of audit events."""
+
+from datetime import date
+from unittest import mock
+
+from auditlog.models import LogEntry
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+
+from nside_wefa import audit
+from nside_wefa.audit import sampling
+from nside_wefa.audit.api import AuditWriteError, Outcome
+from nside_wefa.audit.models import AuditActionCount
+from nside_wefa.audit.sampling import count_event, flush_event_counts, get_sample_rate
+
+
+def _sampling(policy, **extra):
+    return override_settings(
+        NSIDE_WEFA={"APP_NAME": "T", "AUDIT": {"SAMPLING": policy, **extra}}
+    )
+
+
+def _count(action, outcome="success"):
+    flush_event_counts()
+    row = AuditActionCount.objects.filter(action=action, outcome=outcome).first()
+    return row.count if row else 0
+
+
+class GetSampleRateTest(TestCase):
+    def test_unmatched_action_is_not_sampled(self):
+        self.assertIsNone(get_sample_rate("demo.act", {"read.": 0.1}))
+        self.assertIsNone(get_sample_rate("demo.act", None))
+
+    def test_longest_prefix_wins(self):
+        policy = {"read.": 0.1, "read.document": 0.5, "read.document.view": 0}
+        self.assertEqual(get_sample_rate("read.document.view", policy), 0.0)
+        self.assertEqual(get_sample_rate("read.document.edit", policy), 0.5)
+        self.assertEqual(get_sample_rate("read.page", policy), 0.1)
+
+
+class CountingTestCase(TestCase):
+    """Runs the flush timer by hand and leaves no pending count behind."""
+
+    def setUp(self):
+        timer = mock.patch("nside_wefa.audit.sampling.threading.Timer")
+        self.timer = timer.start()
+        self.addCleanup(timer.stop)
+        self.addCleanup(sampling._BUFFER.pop)
+        self.addCleanup(setattr, sampling, "_timer", None)
+
+
+class SampledLogTest(CountingTestCase):
+    @_sampling({"read.": 0})
+    def test_sampled_out_success_is_counted_but_not_written(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                self.assertIsNone(audit.log("read.document"))
+
+        self.assertEqual(LogEntry.objects.count(), 0)
+        self.assertEqual(_count("read.document"), 3)
+
+    @_sampling({"read.": 0})
+    def test_rolled_back_events_are_not_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    audit.log("read.document")
+                    raise RuntimeError("rollback")
+            except RuntimeError:
+                pass
+            audit.log("read.document")
+
+        self.assertEqual(_count("read.document"), 1)
+
+    @_sampling({"read.": 0})
+    def test_failures_and_denials_are_never_sampled_out(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            audit.log("read.document", outcome=Outcome.FAILURE)
+            audit.log("read.document", outcome=Outcome.DENIED)
+
+        self.assertEqual(LogEntry.objects.count(), 2)
+        self.assertNotIn("sample_rate", LogEntry.objects.first().additional_data)
+        self.assertEqual(_count("read.document", "failure"), 1)
+        self.assertEqual(_count("read.document", "denied"), 1)
+
+    @_sampling({"read.": 0.25})
+    def test_kept_events_record_their_sample_rate(self):
+        with mock.patch("nside_wefa.audit.sampling.random.random", return_value=0.1):
+            event = audit.log("read.document")
+
+        self.assertEqual(event.additional_data["sample_rate"], 0.25)
+
+    @_sampling({"read.": 0.5})
+    def test_counts_stay_exact_whatever_is_kept(self):
+        draws = [0.1, 0.9, 0.4, 0.7]
+        with (
+            mock.patch("nside_wefa.audit.sampling.random.random", side_effect=draws),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            for _ in draws:
+                audit.log("read.document")
+
+        self.assertEqual(LogEntry.objects.count(), 2)
+        self.assertEqual(_count("read.document"), 4)
+
+    @_sampling({"read.": 0})
+    def test_unmatched_actions_are_written_and_not_counted(self):
+        audit.log("demo.act")
+
+        self.assertEqual(LogEntry.objects.count(), 1)
+        self.assertFalse(AuditActionCount.objects.exists())
+
+    @_sampling({"read.": 0}, RAISE_ON_FAILURE=True)
+    def test_counter_failure_raises_when_configured(self):
+        with (
+            mock.patch(
+                "nside_wefa.audit.sampling.count_event",
+                side_effect=RuntimeError("db"),
+            ),
+            self.assertRaises(AuditWriteError),
+        ):
+            audit.log("read.document")
+
+    @_sampling({"read.": 0})
+    def test_counter_failure_is_soft_by_default(self):
+        with mock.patch(
+            "nside_wefa.audit.sampling.count_event", side_effect=RuntimeError("db")
+        ):
+            self.assertIsNone(audit.log("read.document"))
+
+
+class CountEventTest(CountingTestCase):
+    @mock.patch("nside_wefa.audit.sampling.timezone.now")
+    def test_counts_are_kept_per_day(self, now):
+        with self.captureOnCommitCallbacks(execute=True):
+            now.return_value.date.return_value = date(2026, 1, 1)
+            count_event("read.document", "success")
+            count_event("read.document", "success")
+            now.return_value.date.return_value = date(2026, 1, 2)
+            count_event("read.document", "success")
+        flush_event_counts()
+
+        self.assertEqual(
+            list(AuditActionCount.objects.order_by("day").values_list("day", "count")),
+            [(date(2026, 1, 1), 2), (date(2026, 1, 2), 1)],
+        )
+
+    def test_concurrent_row_creation_falls_back_to_increment(self):
+        # Simulate a process that lost the creation race: the first increment
+        # finds nothing, the create collides with the other process's row.
+        with (
+            mock.patch(
+                "django.db.models.query.QuerySet.update",
+                autospec=True,
+                side_effect=[0, 1],
+            ) as update,
+            mock.patch.object(
+                AuditActionCount.objects, "create", side_effect=IntegrityError
+            ),
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                count_event("read.document", "success")
+            flush_event_counts()
+
+        self.assertEqual(update.call_count, 2)
+
+    def test_pending_counts_are_written_by_one_timer(self):
+        with (
+            self.assertNumQueries(0),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            count_event("read.document", "success")
+            count_event("read.document", "success")
+
+        self.timer.assert_called_once_with(
+            sampling.COUNT_FLUSH_INTERVAL_SECONDS, sampling._flush_on_timer
+        )
+        self.timer.return_value.start.assert_called_once_with()
+        # The timer thread closes its connections; the test's must stay open.
+        with mock.patch("nside_wefa.audit.sampling.connections"):
+            sampling._flush_on_timer()
+
+        self.assertEqual(AuditActionCount.objects.get().count, 2)
+
+    def test_counts_are_kept_when_the_write_fails(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            count_event("read.document", "success")
+        with (
+            mock.patch(
+                "nside_wefa.audit.sampling._increment", side_effect=RuntimeError("db")
+            ),
+            self.assertRaises(RuntimeError),
+        ):
+            flush_event_counts()
+
+        self.assertEqual(_count("read.document"), 1)
@@ -0,0 +1,69 @@
+"""Tests for the lazy change tracking of the built-in audit sources."""
+
+from auditlog.models import LogEntry
+from django.contrib.auth.models import User
+from django.db.models.signals import post_init
+from django.test import TestCase
+
+from nside_wefa.audit.builtin import legal_consent, locale
+from nside_wefa.audit.tracking import UNKNOWN
+from nside_wefa.legal_consent.models import LegalConsent
+from nside_wefa.locale.models import UserLocale
+
+TRACKER = locale._TRACKER
+
+
+class FieldTrackerTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice")
+        UserLocale.objects.filter(user=self.user).update(code="fr")
+
+    def test_builtin_sources_do_not_listen_to_post_init(self):
+        self.assertFalse(post_init.has_listeners(UserLocale))
+        self.assertFalse(post_init.has_listeners(LegalConsent))
+
+    def test_previous_values_come_from_the_loaded_row(self):
+        user_locale = UserLocale.objects.get(user=self.user)
+        user_locale.code = "de"
+
+        self.assertEqual(TRACKER.previous(user_locale), ("fr",))
+        self.assertEqual(TRACKER.current(user_locale), ("de",))
+
+    def test_related_loads_are_tracked(self):
+        consent = self.user.legalconsent
+        consent.version = 3
+
+        self.assertEqual(legal_consent._TRACKER.previous(consent), (None, None))
+        self.assertEqual(legal_consent._TRACKER.current(consent)[0], 3)
+
+    def test_reset_records_the_saved_values(self):
+        user_locale = UserLocale.objects.get(user=self.user)
+        user_locale.code = "de"
+        TRACKER.reset(user_locale)
+
+        self.assertEqual(TRACKER.previous(user_locale), ("de",))
+
+    def test_instances_built_in_python_compare_with_their_current_values(self):
+        self.assertEqual(TRACKER.previous(UserLocale(code="fr")), ("fr",))
+
+    def test_deferred_fields_are_not_loaded(self):
+        with self.assertNumQueries(1):
+            user_locales = list(UserLocale.objects.only("id"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(TRACKER.previous(user_locales[0]), (UNKNOWN,))
+
+    def test_saving_a_deferred_field_is_logged(self):
+        user_locale = UserLocale.objects.only("id").get(user=self.user)
+        user_locale.code = "de"
+        user_locale.save()
+
+        event = LogEntry.objects.get(additional_data__action="locale.change")
+        self.assertEqual(event.changes, {"code": {"to": "de"}})
+
+    def test_install_wraps_from_db_once(self):
+        from_db = UserLocale.from_db
+
+        TRACKER.install(UserLocale)
+
+        self.assertEqual(UserLocale.from_db, from_db)
@@ -44,3 +44,16 @@ class LogEntryAdminTest(TestCase):
             object_repr="x",
         )
         self.assertEqual(self.admin.actor_label(entry), "system")
+
+
+class AuditActionCountAdminTest(TestCase):
+    def test_admin_is_registered_and_read_only(self):
+        from nside_wefa.audit.admin import AuditActionCountAdmin
+        from nside_wefa.audit.models import AuditActionCount
+
+        model_admin = admin.site._registry[AuditActionCount]
+        request = RequestFactory().get("/admin/")
+        self.assertIsInstance(model_admin, AuditActionCountAdmin)
+        self.assertFalse(model_admin.has_add_permission(request))
+        self.assertFalse(model_admin.has_change_permission(request))
+        self.assertFalse(model_admin.has_delete_permission(request))
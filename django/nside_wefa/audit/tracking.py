@@ -0,0 +1,101 @@
+"""
+Change tracking for audit sources that diff a row against its stored state.
+
+A ``post_save`` handler can only tell what changed if it knows the values the
+row had in the database. Snapshotting them from a ``post_init`` receiver works,
+but it puts a signal dispatch on every instance Django builds, read-only
+querysets in the admin, exports and reports included.
+
+:class:`FieldTracker` instead wraps the model's ``from_db`` to keep a reference
+to the loaded row on the instance. The tracked values are only picked out of
+it when a save asks for them, and no deferred field is ever loaded; the
+previous value of a field deferred at load time is :data:`UNKNOWN`, which
+differs from any current value, so the change is never missed. Instances
+built in Python rather than loaded from the database have no loaded row;
+until :meth:`FieldTracker.reset` runs, their previous values are their
+current ones, so a first save of the values an instance was built with
+(``objects.create(...)``) counts as unchanged::
+
+    tracker = FieldTracker("code", attr="_wefa_audit_previous_code")
+    tracker.install(UserLocale)
+
+    # in post_save
+    if tracker.previous(instance) != tracker.current(instance):
+        ...
+    tracker.reset(instance)
+"""
+
+import inspect
+from typing import Any, Tuple, Type
+
+from django.db import models
+
+# Instance attribute holding the ``(field_names, values)`` row it was loaded
+# from, shared by every tracker of the model.
+_LOADED_ROW_ATTR = "_wefa_audit_loaded_row"
+# Model class attribute marking a ``from_db`` already wrapped.
+_WRAPPED_ATTR = "_wefa_audit_tracks_loaded_rows"
+
+# Previous value of a field that was deferred when the row was loaded. It is
+# only equal to itself, so comparing it with the current value reports a
+# change.
+UNKNOWN: Any = object()
+
+
+class FieldTracker:
+    """Remembers the persisted values of some fields of a model.
+
+    :param fields: Attribute names of the tracked fields.
+    :param attr: Instance attribute the values are stored under once
+        :meth:`reset` has run.
+    """
+
+    def __init__(self, *fields: str, attr: str) -> None:
+        self.fields = fields
+        self.attr = attr
+
+    def install(self, model: Type[models.Model]) -> None:
+        """Keep the loaded row of every ``model`` instance built by ``from_db``.
+
+        Installing more than one tracker on a model wraps ``from_db`` once.
+        """
+        if model.__dict__.get(_WRAPPED_ATTR):
+            return
+        load = inspect.getattr_static(model, "from_db").__func__
+
+        def from_db(
+            cls: Any, db: Any, field_names: Any, values: Any, **kwargs: Any
+        ) -> Any:
+            # ``kwargs`` forwards ``fetch_mode``, added in Django 6.1.
+            instance = load(cls, db, field_names, values, **kwargs)
+            instance.__dict__[_LOADED_ROW_ATTR] = (field_names, values)
+            return instance
+
+        # The stubs type ``from_db`` as a method, which rejects an assignment.
+        setattr(model, "from_db", classmethod(from_db))  # noqa: B010
+        setattr(model, _WRAPPED_ATTR, True)
+
+    def current(self, instance: models.Model) -> Tuple[Any, ...]:
+        """Return the tracked values ``instance`` holds now."""
+        return tuple(getattr(instance, field) for field in self.fields)
+
+    def previous(self, instance: models.Model) -> Tuple[Any, ...]:
+        """Return the tracked values last loaded or saved for ``instance``.
+
+        Fields that were deferred when the row was loaded are :data:`UNKNOWN`.
+        Instances built in Python and not reset yet return their current
+        values.
+        """
+        state = instance.__dict__
+        if self.attr in state:
+            return state[self.attr]
+        if _LOADED_ROW_ATTR not in state:
+            # Built in Python: compare with what it was built with, as far as
+            # can be told without a snapshot at construction.
+            return self.current(instance)
+        loaded = dict(zip(*state[_LOADED_ROW_ATTR]))
+        return tuple(loaded.get(field, UNKNOWN) for field in self.fields)
+
+    def reset(self, instance: models.Model) -> None:
+        """Record the current values as persisted, after a save."""
+        instance.__dict__[self.attr] = self.current(instance)
@@ -17,9 +17,12 @@ class AuthenticationConfig(AppConfig):
     name = "nside_wefa.authentication"
 
     def ready(self) -> None:
-        """Register system checks and initialize DRF settings at startup."""
+        """Register system checks and cache invalidation, initialize DRF settings."""
         # Import checks so Django registers them during app initialization.
         # The import is intentionally unused; registration happens via decorators in checks.py
         from . import checks  # noqa: F401
+        from .cache import install as install_cache_invalidation
+
+        install_cache_invalidation()
 
         initialize_settings()
@@ -0,0 +1,121 @@
+"""
+Cached DRF authentication classes for the nside_wefa.authentication app.
+
+Stock ``TokenAuthentication`` joins the token and user tables on every
+request and ``JWTAuthentication`` loads the user row on every request. The
+classes below keep that lookup in Django's default cache for
+``NSIDE_WEFA.AUTHENTICATION.CACHE_TIMEOUT`` seconds, so a repeated request
+with the same credentials costs no query. Entries are dropped by the signal
+handlers of :mod:`nside_wefa.authentication.cache`.
+
+They are selected with the ``TOKEN_CACHED`` and ``JWT_CACHED`` authentication
+types.
+
+:class:`StatelessJWTAuthentication`, selected with ``JWT_STATELESS``, does not
+look the user up at all: it builds it from the token claims.
+"""
+
+from typing import Any
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import router
+from django.db.models.base import DEFERRED
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from nside_wefa.authentication.cache import jwt_user_cache_key, token_cache_key
+from nside_wefa.authentication.utils.utils import get_cache_timeout, get_jwt_claims
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """``TokenAuthentication`` caching the token, with its user, by key.
+
+    Only tokens of active users are cached, so the inactive-user check of the
+    parent class still applies to every cache miss.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple[Any, Token]:
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key)
+        if token is None:
+            _user, token = super().authenticate_credentials(key)
+            cache.set(cache_key, token, get_cache_timeout())
+        return token.user, token
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` caching the user by its user id claim.
+
+    The token itself is validated on every request as usual. The
+    ``CHECK_REVOKE_TOKEN`` comparison is repeated on cache hits, as it depends
+    on the presented token.
+    """
+
+    def get_user(self, validated_token: Any) -> Any:
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        cache_key = jwt_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(cache_key, user, get_cache_timeout())
+            return user
+
+        if jwt_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            jwt_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+        return user
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` building the user from the token claims.
+
+    The user is an instance of the user model whose primary key and
+    ``NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS`` fields are set from the validated
+    token; every other field is deferred, so Django loads it from the database
+    the first time it is read. Views needing only the id and the claims run
+    without any user query, while the user still works as a foreign key value
+    and in ``has_perm`` checks (which query as usual).
+
+    As with SimpleJWT's ``JWTStatelessUserAuthentication``, deactivating a user
+    or changing their password does not affect tokens that are already issued;
+    they remain valid until they expire.
+    """
+
+    def get_user(self, validated_token: Any) -> Any:
+        claims = {jwt_settings.USER_ID_FIELD: jwt_settings.USER_ID_CLAIM}
+        claims.update((claim, claim) for claim in get_jwt_claims())
+        if jwt_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(
+                str(_("Token contained no recognizable user identification"))
+            )
+
+        values = []
+        for field in self.user_model._meta.concrete_fields:
+            claim = claims.get(field.name)
+            if claim is None or claim not in validated_token:
+                values.append(DEFERRED)
+                continue
+            try:
+                values.append(field.to_python(validated_token[claim]))
+            except ValidationError as error:
+                raise InvalidToken(
+                    _("Token contained an invalid %(claim)s claim") % {"claim": claim}
+                ) from error
+        return self.user_model.from_db(
+            router.db_for_read(self.user_model),
+            [field.attname for field in self.user_model._meta.concrete_fields],
+            values,
+        )
@@ -0,0 +1,100 @@
+"""
+Cache of authenticated users for the cached authentication classes.
+
+The ``TOKEN_CACHED`` and ``JWT_CACHED`` authentication types keep the result
+of the per-request user lookup in Django's default cache for
+``NSIDE_WEFA.AUTHENTICATION.CACHE_TIMEOUT`` seconds. :func:`install` connects
+the signal handlers that drop those entries as soon as the data they were
+built from changes:
+
+- deleting a DRF token drops its entry;
+- saving a user (deactivation, password change, any other edit) or deleting
+  it drops the entries of that user.
+
+Changes made with ``QuerySet.update()`` or raw SQL send no signals; they are
+picked up once the cached entry expires.
+"""
+
+import hashlib
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import signals
+from rest_framework.authtoken.models import Token
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from nside_wefa.authentication.constants import (
+    AUTH_TYPE_JWT_CACHED,
+    AUTH_TYPE_TOKEN_CACHED,
+)
+from nside_wefa.common.settings import get_value
+
+CACHE_KEY_PREFIX = "nside_wefa.authentication"
+
+
+def token_cache_key(key: str) -> str:
+    """Return the cache key of the DRF token ``key``.
+
+    The token is hashed so the credential itself never appears in the cache.
+    """
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:token:{digest}"
+
+
+def jwt_user_cache_key(user_id: Any) -> str:
+    """Return the cache key of the user identified by a JWT ``user_id`` claim."""
+    return f"{CACHE_KEY_PREFIX}:jwt-user:{user_id}"
+
+
+def install() -> None:
+    """Connect the cache invalidation signal handlers."""
+    signals.post_delete.connect(
+        _on_token_deleted,
+        sender=Token,
+        weak=False,
+        dispatch_uid="nside_wefa.authentication.cache.token_deleted",
+    )
+    signals.post_save.connect(
+        _on_user_changed,
+        sender=settings.AUTH_USER_MODEL,
+        weak=False,
+        dispatch_uid="nside_wefa.authentication.cache.user_saved",
+    )
+    signals.post_delete.connect(
+        _on_user_changed,
+        sender=settings.AUTH_USER_MODEL,
+        weak=False,
+        dispatch_uid="nside_wefa.authentication.cache.user_deleted",
+    )
+
+
+def _authentication_types() -> list[str]:
+    # Signals fire in every project using the app, including test settings
+    # that leave NSIDE_WEFA.AUTHENTICATION out, so read it defensively.
+    return get_value("AUTHENTICATION", "TYPES") or []
+
+
+def _on_token_deleted(sender: Any, instance: Token, **kwargs: Any) -> None:
+    if AUTH_TYPE_TOKEN_CACHED in _authentication_types():
+        cache.delete(token_cache_key(instance.key))
+
+
+def _on_user_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    authentication_types = _authentication_types()
+    keys = []
+    if AUTH_TYPE_JWT_CACHED in authentication_types:
+        user_id = getattr(instance, jwt_settings.USER_ID_FIELD, None)
+        if user_id is not None:
+            keys.append(jwt_user_cache_key(user_id))
+    if AUTH_TYPE_TOKEN_CACHED in authentication_types and not kwargs.get("created"):
+        # Only the key is needed; a deleted user's token is gone already and
+        # its own post_delete has dropped the entry.
+        keys.extend(
+            token_cache_key(key)
+            for key in Token.objects.filter(user_id=instance.pk).values_list(
+                "key", flat=True
+            )
+        )
+    if keys:
+        cache.delete_many(keys)
@@ -7,7 +7,8 @@ This module registers Django system checks related to the authentication app:
   correctly ordered in INSTALLED_APPS so that nside_wefa.common is loaded
   before nside_wefa.authentication.
 - authentication_settings_check: validates the NSIDE_WEFA.AUTHENTICATION
-  configuration, including the TYPES list via a custom validator.
+  configuration, including the TYPES list and the optional CACHE_TIMEOUT,
+  JWT_CLAIMS and THROTTLE via custom validators.
 
 See also
 
@@ -17,14 +18,22 @@ See also
 """
 
 from typing import Any
+from django.contrib.auth import get_user_model
 from django.core.checks import Error, register
+from django.core.exceptions import FieldDoesNotExist
 
-from nside_wefa.authentication.constants import AUTHENTICATION_TYPES
+from nside_wefa.authentication.constants import (
+    AUTHENTICATION_TYPES,
+    DEFAULT_THROTTLE_RATES,
+    JWT_AUTHENTICATION_TYPES,
+)
 from nside_wefa.authentication.apps import AuthenticationConfig
+from nside_wefa.authentication.throttling import parse_rate
 from nside_wefa.common.apps import CommonConfig
 from nside_wefa.utils.checks import (
     check_apps_dependencies_order,
     check_nside_wefa_settings,
+    validate_string_list,
 )
 
 
@@ -58,7 +67,9 @@ def validate_authentication_types(authentication_types: Any) -> list[Error]:
     """Validate the ``NSIDE_WEFA.AUTHENTICATION.TYPES`` setting.
 
     Ensures that each configured authentication type is one of the supported
-    values listed in :data:`nside_wefa.authentication.constants.AUTHENTICATION_TYPES`.
+    values listed in :data:`nside_wefa.authentication.constants.AUTHENTICATION_TYPES`
+    and that at most one JWT type is enabled, since they share the same
+    endpoints and only the first authentication class would ever be used.
 
     :param authentication_types: Iterable of authentication type identifiers to
         validate. If falsy/``None``, no errors are produced.
@@ -75,6 +86,111 @@ def validate_authentication_types(authentication_types: Any) -> list[Error]:
                         f"{authentication_type} is not in {AUTHENTICATION_TYPES}.",
                     )
                 )
+        jwt_types = [
+            authentication_type
+            for authentication_type in authentication_types
+            if authentication_type in JWT_AUTHENTICATION_TYPES
+        ]
+        if len(jwt_types) > 1:
+            errors.append(
+                Error(
+                    f"NSIDE_WEFA.AUTHENTICATION.TYPES is not properly configured. "
+                    f"Enable only one of {JWT_AUTHENTICATION_TYPES}, got {jwt_types}.",
+                )
+            )
+    return errors
+
+
+def validate_cache_timeout(cache_timeout: Any) -> list[Error]:
+    """Validate the optional ``NSIDE_WEFA.AUTHENTICATION.CACHE_TIMEOUT`` setting.
+
+    The value is the lifetime, in seconds, of users cached by the
+    ``TOKEN_CACHED`` and ``JWT_CACHED`` authentication types and must be a
+    positive integer.
+
+    :param cache_timeout: The configured value.
+    :return: A list with one error if the value is invalid, empty otherwise.
+    """
+    if (
+        isinstance(cache_timeout, bool)
+        or not isinstance(cache_timeout, int)
+        or cache_timeout <= 0
+    ):
+        return [
+            Error(
+                "NSIDE_WEFA.AUTHENTICATION.CACHE_TIMEOUT must be a positive "
+                f"integer, got {cache_timeout!r}.",
+            )
+        ]
+    return []
+
+
+def validate_jwt_claims(jwt_claims: Any) -> list[Error]:
+    """Validate the optional ``NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS`` setting.
+
+    Each entry must name a concrete field of the user model. The password is
+    refused, as JWT payloads are only signed, not encrypted.
+
+    :param jwt_claims: The configured value.
+    :return: A list of errors for invalid entries. Empty if all are valid.
+    """
+    setting_path = "NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS"
+    errors = validate_string_list(setting_path)(jwt_claims)
+    if errors:
+        return errors
+    user_model = get_user_model()
+    for claim in jwt_claims:
+        try:
+            field = user_model._meta.get_field(claim)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.many_to_many:
+            errors.append(
+                Error(
+                    f"{setting_path} entry {claim!r} is not a concrete field of "
+                    f"{user_model._meta.label}.",
+                )
+            )
+        elif claim == "password":
+            errors.append(
+                Error(f"{setting_path} must not include the password."),
+            )
+    return errors
+
+
+def validate_throttle(throttle: Any) -> list[Error]:
+    """Validate the optional ``NSIDE_WEFA.AUTHENTICATION.THROTTLE`` setting.
+
+    The value must be a dict whose keys are ``USERNAME`` and/or ``IP`` and
+    whose values are rates such as ``"10/minute"`` or ``None``.
+
+    :param throttle: The configured value.
+    :return: A list of errors for invalid entries. Empty if all are valid.
+    """
+    setting_path = "NSIDE_WEFA.AUTHENTICATION.THROTTLE"
+    if not isinstance(throttle, dict):
+        return [
+            Error(f"{setting_path} must be a dict, got {type(throttle).__name__}."),
+        ]
+    errors: list[Error] = []
+    for key, rate in throttle.items():
+        if key not in DEFAULT_THROTTLE_RATES:
+            errors.append(
+                Error(
+                    f"{setting_path} key {key!r} is not allowed. "
+                    f"Expected one of {list(DEFAULT_THROTTLE_RATES)}.",
+                )
+            )
+            continue
+        try:
+            parse_rate(rate)
+        except (AttributeError, ValueError):
+            errors.append(
+                Error(
+                    f"{setting_path}.{key} must be a rate such as '10/minute' "
+                    f"or None, got {rate!r}.",
+                )
+            )
     return errors
 
 
@@ -83,7 +199,8 @@ def authentication_settings_check(app_configs, **kwargs) -> list[Error]:
     """Run validation for the ``NSIDE_WEFA.AUTHENTICATION`` settings section.
 
     Delegates to :func:`nside_wefa.utils.checks.check_nside_wefa_settings` and applies the
-    custom validator for the ``TYPES`` key.
+    custom validators for the ``TYPES``, ``CACHE_TIMEOUT``, ``JWT_CLAIMS`` and
+    ``THROTTLE`` keys.
 
     :param app_configs: Iterable of Django app configs provided by the check
         framework. Unused in this implementation.
@@ -94,5 +211,10 @@ def authentication_settings_check(app_configs, **kwargs) -> list[Error]:
     return check_nside_wefa_settings(
         section_name="AUTHENTICATION",
         required_keys=["TYPES"],
-        custom_validators={"TYPES": validate_authentication_types},
+        custom_validators={
+            "TYPES": validate_authentication_types,
+            "CACHE_TIMEOUT": validate_cache_timeout,
+            "JWT_CLAIMS": validate_jwt_claims,
+            "THROTTLE": validate_throttle,
+        },
     )
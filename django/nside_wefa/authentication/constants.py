@@ -5,11 +5,42 @@ These names are used throughout the project to configure and validate the
 supported authentication mechanisms.
 
 :data AUTH_TYPE_TOKEN: Identifier for token-based authentication.
+:data AUTH_TYPE_TOKEN_CACHED: Identifier for token-based authentication with
+    the token-to-user lookup cached in Django's cache.
 :data AUTH_TYPE_JWT: Identifier for JWT-based authentication.
+:data AUTH_TYPE_JWT_CACHED: Identifier for JWT-based authentication with the
+    user lookup cached in Django's cache.
+:data AUTH_TYPE_JWT_STATELESS: Identifier for JWT-based authentication with a
+    user built from the token claims, loaded from the database only on demand.
 :data AUTHENTICATION_TYPES: Ordered list of all supported authentication types.
+:data TOKEN_AUTHENTICATION_TYPES: Types that expose the token endpoint.
+:data JWT_AUTHENTICATION_TYPES: Types that expose the JWT endpoints.
+:data DEFAULT_CACHE_TIMEOUT: Default lifetime, in seconds, of cached users.
+:data DEFAULT_JWT_CLAIMS: User fields copied into issued JWTs by default.
+:data DEFAULT_THROTTLE_RATES: Default login attempt rates, per username and
+    per client IP.
 """
 
 AUTH_TYPE_TOKEN = "TOKEN"  # nosec
+AUTH_TYPE_TOKEN_CACHED = "TOKEN_CACHED"  # nosec
 AUTH_TYPE_JWT = "JWT"
+AUTH_TYPE_JWT_CACHED = "JWT_CACHED"
+AUTH_TYPE_JWT_STATELESS = "JWT_STATELESS"
 
-AUTHENTICATION_TYPES = [AUTH_TYPE_TOKEN, AUTH_TYPE_JWT]
+AUTHENTICATION_TYPES = [
+    AUTH_TYPE_TOKEN,
+    AUTH_TYPE_TOKEN_CACHED,
+    AUTH_TYPE_JWT,
+    AUTH_TYPE_JWT_CACHED,
+    AUTH_TYPE_JWT_STATELESS,
+]
+TOKEN_AUTHENTICATION_TYPES = [AUTH_TYPE_TOKEN, AUTH_TYPE_TOKEN_CACHED]
+JWT_AUTHENTICATION_TYPES = [
+    AUTH_TYPE_JWT,
+    AUTH_TYPE_JWT_CACHED,
+    AUTH_TYPE_JWT_STATELESS,
+]
+
+DEFAULT_CACHE_TIMEOUT = 60
+DEFAULT_JWT_CLAIMS = ["username"]
+DEFAULT_THROTTLE_RATES = {"USERNAME": "10/minute", "IP": "60/minute"}
@@ -0,0 +1,41 @@
+"""
+Authentication Serializers Module
+
+This module contains the serializer issuing JWTs for the ``JWT_STATELESS``
+authentication type.
+"""
+
+from typing import Any, cast
+
+from django.contrib.auth import get_user_model
+from django.db.models import Field
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.tokens import Token
+
+from nside_wefa.authentication.utils.utils import get_jwt_claims
+
+# Claim values JSON can carry as-is; other field values are sent as strings.
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token pair serializer copying ``NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS``.
+
+    Each configured user field is added to the refresh token, from which
+    SimpleJWT copies it into every access token, so
+    :class:`nside_wefa.authentication.authentication.StatelessJWTAuthentication`
+    can rebuild the user without a query.
+    """
+
+    @classmethod
+    def get_token(cls, user: Any) -> Token:
+        token = super().get_token(user)
+        user_model = get_user_model()
+        for claim in get_jwt_claims():
+            # The checks only accept concrete fields as claims.
+            field = cast(Field, user_model._meta.get_field(claim))
+            value = field.value_from_object(user)
+            token[claim] = (
+                value if isinstance(value, _JSON_TYPES) else field.value_to_string(user)
+            )
+        return token
@@ -0,0 +1,183 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from nside_wefa.authentication.authentication import (
+    CachedJWTAuthentication,
+    CachedTokenAuthentication,
+    StatelessJWTAuthentication,
+)
+from nside_wefa.authentication.serializers import ClaimsTokenObtainPairSerializer
+
+
+@override_settings(NSIDE_WEFA={"AUTHENTICATION": {"TYPES": ["TOKEN_CACHED"]}})
+class CachedTokenAuthenticationTest(TestCase):
+    """Test cases for the cached DRF token authentication class."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="alice", password="secret")
+        self.token = Token.objects.create(user=self.user)
+        self.authentication = CachedTokenAuthentication()
+
+    def _authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Token {self.token.key}"
+        )
+        return self.authentication.authenticate(request)
+
+    def test_second_request_is_served_from_cache(self):
+        """Test that a repeated token costs no query once cached."""
+        with self.assertNumQueries(1):
+            self._authenticate()
+
+        with self.assertNumQueries(0):
+            user, token = self._authenticate()
+
+        self.assertEqual(user, self.user)
+        self.assertEqual(token.key, self.token.key)
+
+    def test_deleted_token_is_rejected(self):
+        """Test that deleting the token drops its cache entry."""
+        self._authenticate()
+
+        self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_deactivated_user_is_rejected(self):
+        """Test that deactivating the user drops the cached token."""
+        self._authenticate()
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_password_change_refreshes_cached_user(self):
+        """Test that a password change reloads the user on the next request."""
+        self._authenticate()
+
+        self.user.set_password("new-secret")
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate()
+        self.assertTrue(user.check_password("new-secret"))
+
+
+@override_settings(NSIDE_WEFA={"AUTHENTICATION": {"TYPES": ["JWT_CACHED"]}})
+class CachedJWTAuthenticationTest(TestCase):
+    """Test cases for the cached JWT authentication class."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="bob", password="secret")
+        self.access_token = AccessToken.for_user(self.user)
+        self.authentication = CachedJWTAuthentication()
+
+    def _authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.access_token}"
+        )
+        return self.authentication.authenticate(request)
+
+    def test_second_request_is_served_from_cache(self):
+        """Test that the user of a repeated JWT costs no query once cached."""
+        with self.assertNumQueries(1):
+            self._authenticate()
+
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate()
+
+        self.assertEqual(user, self.user)
+
+    def test_deactivated_user_is_rejected(self):
+        """Test that deactivating the user drops the cached user."""
+        self._authenticate()
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_deleted_user_is_rejected(self):
+        """Test that deleting the user drops the cached user."""
+        self._authenticate()
+
+        self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+
+@override_settings(
+    NSIDE_WEFA={
+        "AUTHENTICATION": {
+            "TYPES": ["JWT_STATELESS"],
+            "JWT_CLAIMS": ["username", "is_staff"],
+        }
+    }
+)
+class StatelessJWTAuthenticationTest(TestCase):
+    """Test cases for the stateless JWT authentication class."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="carol", password="secret", email="carol@example.com"
+        )
+        refresh = ClaimsTokenObtainPairSerializer.get_token(self.user)
+        self.access_token = refresh.access_token
+        self.authentication = StatelessJWTAuthentication()
+
+    def _authenticate(self, access_token=None):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {access_token or self.access_token}"
+        )
+        return self.authentication.authenticate(request)
+
+    def test_issued_tokens_carry_the_configured_claims(self):
+        """Test that the claims serializer copies JWT_CLAIMS into access tokens."""
+        self.assertEqual(self.access_token["username"], "carol")
+        self.assertIs(self.access_token["is_staff"], False)
+
+    def test_user_is_built_from_claims_without_query(self):
+        """Test that the id and claim fields are available without any query."""
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate()
+            self.assertIsInstance(user, User)
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertEqual(user.username, "carol")
+            self.assertFalse(user.is_staff)
+            self.assertTrue(user.is_authenticated)
+
+    def test_other_fields_are_loaded_on_first_access(self):
+        """Test that a field missing from the claims is read from the database."""
+        user, _ = self._authenticate()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, "carol@example.com")
+        with self.assertNumQueries(0):
+            self.assertEqual(user.email, "carol@example.com")
+
+    def test_user_can_be_used_as_foreign_key(self):
+        """Test that the stateless user works in queries on related models."""
+        Token.objects.create(user=self.user)
+        user, _ = self._authenticate()
+
+        self.assertTrue(Token.objects.filter(user=user).exists())
+
+    def test_token_without_user_id_is_rejected(self):
+        """Test that a token lacking the user id claim is rejected."""
+        access_token = AccessToken()
+
+        with self.assertRaises(InvalidToken):
+            self._authenticate(access_token)
@@ -140,7 +140,10 @@ class AuthenticationSettingsChecksTest(TestCase):
             self.assertEqual(len(errors), 1)
             self.assertIsInstance(errors[0], Error)
             self.assertIn("INVALID_TYPE is not in", errors[0].msg)
-            self.assertIn("['TOKEN', 'JWT']", errors[0].msg)
+            self.assertIn(
+                "['TOKEN', 'TOKEN_CACHED', 'JWT', 'JWT_CACHED', 'JWT_STATELESS']",
+                errors[0].msg,
+            )
 
     def test_authentication_settings_check_multiple_invalid_types(self):
         """Test that multiple invalid authentication types raise multiple errors."""
@@ -173,6 +176,108 @@ class AuthenticationSettingsChecksTest(TestCase):
             errors = authentication_settings_check(None)
             self.assertEqual(len(errors), 0)
 
+    def test_authentication_settings_check_valid_cached_types(self):
+        """Test that cached types and a positive CACHE_TIMEOUT pass validation."""
+        with override_settings(
+            NSIDE_WEFA={
+                "AUTHENTICATION": {
+                    "TYPES": ["TOKEN_CACHED", "JWT_CACHED"],
+                    "CACHE_TIMEOUT": 30,
+                }
+            }
+        ):
+            errors = authentication_settings_check(None)
+            self.assertEqual(len(errors), 0)
+
+    def test_authentication_settings_check_invalid_cache_timeout(self):
+        """Test that a non-positive or non-integer CACHE_TIMEOUT raises an error."""
+        for cache_timeout in (0, -5, "60", None, True):
+            with (
+                self.subTest(cache_timeout=cache_timeout),
+                override_settings(
+                    NSIDE_WEFA={
+                        "AUTHENTICATION": {
+                            "TYPES": ["TOKEN_CACHED"],
+                            "CACHE_TIMEOUT": cache_timeout,
+                        }
+                    }
+                ),
+            ):
+                errors = authentication_settings_check(None)
+
+                self.assertEqual(len(errors), 1)
+                self.assertIn("CACHE_TIMEOUT must be a positive", errors[0].msg)
+
+    def test_authentication_settings_check_several_jwt_types(self):
+        """Test that enabling more than one JWT type raises an error."""
+        with override_settings(
+            NSIDE_WEFA={"AUTHENTICATION": {"TYPES": ["JWT", "JWT_STATELESS"]}}
+        ):
+            errors = authentication_settings_check(None)
+
+            self.assertEqual(len(errors), 1)
+            self.assertIn("Enable only one of", errors[0].msg)
+
+    def test_authentication_settings_check_valid_jwt_claims(self):
+        """Test that JWT_CLAIMS naming user fields passes validation."""
+        with override_settings(
+            NSIDE_WEFA={
+                "AUTHENTICATION": {
+                    "TYPES": ["JWT_STATELESS"],
+                    "JWT_CLAIMS": ["username", "email", "is_staff"],
+                }
+            }
+        ):
+            errors = authentication_settings_check(None)
+            self.assertEqual(len(errors), 0)
+
+    def test_authentication_settings_check_invalid_jwt_claims(self):
+        """Test that unknown fields, relations and the password are rejected."""
+        with override_settings(
+            NSIDE_WEFA={
+                "AUTHENTICATION": {
+                    "TYPES": ["JWT_STATELESS"],
+                    "JWT_CLAIMS": ["nickname", "groups", "password"],
+                }
+            }
+        ):
+            errors = authentication_settings_check(None)
+
+            self.assertEqual(len(errors), 3)
+            self.assertIn("'nickname' is not a concrete field", errors[0].msg)
+            self.assertIn("'groups' is not a concrete field", errors[1].msg)
+            self.assertIn("must not include the password", errors[2].msg)
+
+    def test_authentication_settings_check_valid_throttle(self):
+        """Test that THROTTLE rates, or None to disable them, pass validation."""
+        with override_settings(
+            NSIDE_WEFA={
+                "AUTHENTICATION": {
+                    "TYPES": ["TOKEN"],
+                    "THROTTLE": {"USERNAME": "5/minute", "IP": None},
+                }
+            }
+        ):
+            errors = authentication_settings_check(None)
+            self.assertEqual(len(errors), 0)
+
+    def test_authentication_settings_check_invalid_throttle(self):
+        """Test that unknown THROTTLE keys and malformed rates raise errors."""
+        with override_settings(
+            NSIDE_WEFA={
+                "AUTHENTICATION": {
+                    "TYPES": ["TOKEN"],
+                    "THROTTLE": {"USERNAME": "5/week", "IP": 10, "EMAIL": "1/s"},
+                }
+            }
+        ):
+            errors = authentication_settings_check(None)
+
+            self.assertEqual(len(errors), 3)
+            self.assertIn("THROTTLE.USERNAME must be a rate", errors[0].msg)
+            self.assertIn("THROTTLE.IP must be a rate", errors[1].msg)
+            self.assertIn("key 'EMAIL' is not allowed", errors[2].msg)
+
     def test_authentication_settings_check_with_additional_keys(self):
         """Test that NSIDE_WEFA.AUTHENTICATION with additional keys still passes validation."""
         with override_settings(
@@ -0,0 +1,158 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from nside_wefa.authentication.throttling import (
+    LoginRateThrottle,
+    SlidingWindowCounter,
+    parse_rate,
+)
+
+
+class SlidingWindowCounterTest(TestCase):
+    """Test cases for the cache-backed sliding-window counter."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_rate(self):
+        """Test that DRF-style rates are parsed into a count and a window."""
+        self.assertEqual(parse_rate("10/minute"), (10, 60))
+        self.assertEqual(parse_rate("3/h"), (3, 3600))
+        self.assertIsNone(parse_rate(None))
+        with self.assertRaises(ValueError):
+            parse_rate("ten/minute")
+        with self.assertRaises(ValueError):
+            parse_rate("10/week")
+
+    def test_limit_is_enforced_within_window(self):
+        """Test that attempts beyond the limit are refused until the window moves."""
+        counter = SlidingWindowCounter("test", limit=2, window=60)
+        start = 6000.0
+
+        for _ in range(2):
+            self.assertIsNone(counter.wait(start))
+            counter.hit(start)
+
+        self.assertEqual(counter.wait(start + 10), 50)
+
+    def test_previous_window_counts_in_proportion(self):
+        """Test that the previous window weighs by how much it still overlaps."""
+        counter = SlidingWindowCounter("test", limit=2, window=60)
+        counter.hit(6000.0)
+        counter.hit(6000.0)
+
+        # A quarter into the next window, the two earlier hits count as 1.5.
+        self.assertIsNone(counter.wait(6075.0))
+        counter.hit(6075.0)
+        self.assertEqual(counter.wait(6075.0), 15)
+
+
+class LoginRateThrottleTest(TestCase):
+    """Test cases for throttling of the login endpoints."""
+
+    # Mid-minute, so every attempt of a test falls in the same window.
+    NOW = 1_700_000_010.0
+
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username="alice", password="secret")
+        self.factory = APIRequestFactory()
+        clock = patch(
+            "nside_wefa.authentication.throttling.time.time", return_value=self.NOW
+        )
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def _post(self, view, username, remote_addr="10.0.0.1", **extra):
+        request = self.factory.post(
+            "/",
+            {"username": username, "password": "wrong"},
+            format="json",
+            REMOTE_ADDR=remote_addr,
+            **extra,
+        )
+        return view(request)
+
+    @override_settings(
+        NSIDE_WEFA={
+            "AUTHENTICATION": {
+                "TYPES": ["TOKEN"],
+                "THROTTLE": {"USERNAME": "2/minute", "IP": None},
+            }
+        }
+    )
+    def test_username_is_throttled_before_password_hashing(self):
+        """Test that attempts over the username limit never hash the password."""
+        view = ObtainAuthToken.as_view(throttle_classes=[LoginRateThrottle])
+        for remote_addr in ("10.0.0.1", "10.0.0.2"):
+            self.assertEqual(self._post(view, "alice", remote_addr).status_code, 400)
+
+        with patch.object(User, "check_password") as check_password:
+            response = self._post(view, "ALICE", "10.0.0.3")
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        check_password.assert_not_called()
+        self.assertEqual(self._post(view, "bob").status_code, 400)
+
+    @override_settings(
+        NSIDE_WEFA={
+            "AUTHENTICATION": {
+                "TYPES": ["JWT"],
+                "THROTTLE": {"USERNAME": None, "IP": "2/minute"},
+            }
+        }
+    )
+    def test_client_ip_is_throttled_across_usernames(self):
+        """Test that one client cycling through usernames is throttled."""
+        view = TokenObtainPairView.as_view(throttle_classes=[LoginRateThrottle])
+        self.assertEqual(self._post(view, "alice").status_code, 401)
+        self.assertEqual(self._post(view, "bob").status_code, 401)
+
+        self.assertEqual(self._post(view, "carol").status_code, 429)
+        self.assertEqual(self._post(view, "carol", "10.0.0.2").status_code, 401)
+
+    @override_settings(
+        NSIDE_WEFA={
+            "AUTHENTICATION": {
+                "TYPES": ["JWT"],
+                "THROTTLE": {"USERNAME": None, "IP": "2/minute"},
+            }
+        }
+    )
+    def test_forwarded_for_is_ignored_without_proxies(self):
+        """Test that a forged X-Forwarded-For does not reset the IP limit."""
+        view = TokenObtainPairView.as_view(throttle_classes=[LoginRateThrottle])
+        for forwarded_for in ("192.0.2.1", "192.0.2.2"):
+            response = self._post(view, "alice", HTTP_X_FORWARDED_FOR=forwarded_for)
+            self.assertEqual(response.status_code, 401)
+
+        response = self._post(view, "alice", HTTP_X_FORWARDED_FOR="192.0.2.3")
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(
+        NSIDE_WEFA={
+            "AUTHENTICATION": {
+                "TYPES": ["JWT"],
+                "THROTTLE": {"USERNAME": None, "IP": "2/minute"},
+            }
+        },
+        REST_FRAMEWORK={"NUM_PROXIES": 1},
+    )
+    def test_forwarded_for_is_used_behind_proxies(self):
+        """Test that clients behind a configured proxy are told apart."""
+        view = TokenObtainPairView.as_view(throttle_classes=[LoginRateThrottle])
+        for _ in range(2):
+            response = self._post(view, "alice", HTTP_X_FORWARDED_FOR="192.0.2.1")
+            self.assertEqual(response.status_code, 401)
+
+        response = self._post(view, "alice", HTTP_X_FORWARDED_FOR="192.0.2.2")
+        self.assertEqual(response.status_code, 401)
+        response = self._post(view, "alice", HTTP_X_FORWARDED_FOR="192.0.2.1")
+        self.assertEqual(response.status_code, 429)
@@ -80,6 +80,35 @@ class SettingsInitializationTest(TestCase):
                 expected_permission_classes,
             )
 
+    def test_initialize_settings_with_cached_authentication_types(self):
+        """Test that cached types configure the WeFa cached authentication classes."""
+        with override_settings(
+            NSIDE_WEFA={"AUTHENTICATION": {"TYPES": ["JWT_CACHED", "TOKEN_CACHED"]}}
+        ):
+            initialize_settings()
+
+            expected_auth_classes = [
+                "nside_wefa.authentication.authentication.CachedTokenAuthentication",
+                "nside_wefa.authentication.authentication.CachedJWTAuthentication",
+            ]
+
+            self.assertEqual(
+                self.mock_rest_framework["DEFAULT_AUTHENTICATION_CLASSES"],
+                expected_auth_classes,
+            )
+
+    def test_initialize_settings_with_stateless_jwt_authentication(self):
+        """Test that JWT_STATELESS configures the stateless JWT authentication."""
+        with override_settings(
+            NSIDE_WEFA={"AUTHENTICATION": {"TYPES": ["JWT_STATELESS"]}}
+        ):
+            initialize_settings()
+
+            self.assertEqual(
+                self.mock_rest_framework["DEFAULT_AUTHENTICATION_CLASSES"],
+                ["nside_wefa.authentication.authentication.StatelessJWTAuthentication"],
+            )
+
     def test_initialize_settings_with_jwt_then_token_order(self):
         """Test that JWT first, TOKEN second maintains order."""
         with override_settings(
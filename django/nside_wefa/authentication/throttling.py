@@ -0,0 +1,167 @@
+"""
+Throttling of the WeFa login endpoints.
+
+``/token-auth/`` and ``/token/`` hash the submitted password on every attempt,
+which makes credential stuffing expensive in CPU. :class:`LoginRateThrottle`
+runs in DRF's ``initial()`` step, before the serializer authenticates the
+credentials, so rejected attempts never reach a password hasher.
+
+Attempts are counted per submitted username and per client IP with
+sliding-window counters kept in Django's default cache. The client IP is
+``REMOTE_ADDR`` unless ``REST_FRAMEWORK["NUM_PROXIES"]`` is set, in which case
+it is read from ``X-Forwarded-For`` as DRF does; a client could otherwise
+dodge the limit by sending a new forged header with each attempt. Limits come from
+``NSIDE_WEFA.AUTHENTICATION.THROTTLE``.
+"""
+
+import hashlib
+import math
+import time
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from nside_wefa.authentication.utils.utils import get_throttle_rates
+
+CACHE_KEY_PREFIX = "nside_wefa.authentication.throttle"
+# Seconds per rate period, keyed by the first letter of the period.
+RATE_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str | None) -> tuple[int, int] | None:
+    """Parse a DRF-style rate such as ``"10/minute"``.
+
+    :param rate: ``"<count>/<period>"`` where the period starts with ``s``,
+        ``m``, ``h`` or ``d``, or ``None`` to disable the limit.
+    :return: ``(count, window_seconds)``, or ``None`` when ``rate`` is ``None``.
+    :raises ValueError: If ``rate`` is malformed.
+    """
+    if rate is None:
+        return None
+    count, _, period = rate.partition("/")
+    if not period or period[0] not in RATE_PERIODS or int(count) <= 0:
+        raise ValueError(f"Invalid rate {rate!r}.")
+    return int(count), RATE_PERIODS[period[0]]
+
+
+class SlidingWindowCounter:
+    """Sliding-window request counter stored in Django's cache.
+
+    The window is approximated from two fixed windows: the count of the
+    previous window, weighted by how much of it still overlaps the sliding
+    window, plus the count of the current one. Counters are incremented
+    atomically with ``cache.incr`` so concurrent workers do not lose hits.
+
+    :param key: Cache key identifying what is counted.
+    :param limit: Attempts allowed per window.
+    :param window: Window length in seconds.
+    """
+
+    def __init__(self, key: str, limit: int, window: int) -> None:
+        self.key = key
+        self.limit = limit
+        self.window = window
+
+    def wait(self, now: float | None = None) -> float | None:
+        """Return how long to wait before the next attempt is allowed.
+
+        :param now: Current time, defaults to :func:`time.time`.
+        :return: ``None`` if an attempt is allowed now, otherwise the number of
+            seconds after which it may be retried.
+        """
+        now = time.time() if now is None else now
+        index, offset = divmod(now, self.window)
+        counts = cache.get_many([self._key(index), self._key(index - 1)])
+        previous = counts.get(self._key(index - 1), 0)
+        current = counts.get(self._key(index), 0)
+        if previous * (1 - offset / self.window) + current < self.limit:
+            return None
+        if current >= self.limit or not previous:
+            return self.window - offset
+        # Time until the decaying share of the previous window frees a slot.
+        overlap_allowed = (self.limit - current) / previous
+        return max(0.0, (1 - overlap_allowed) * self.window - offset)
+
+    def hit(self, now: float | None = None) -> None:
+        """Count one attempt in the current window.
+
+        :param now: Current time, defaults to :func:`time.time`.
+        """
+        now = time.time() if now is None else now
+        key = self._key(now // self.window)
+        # The counter must outlive its window to serve as the previous one.
+        cache.add(key, 0, timeout=2 * self.window)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr().
+            cache.set(key, 1, timeout=2 * self.window)
+
+    def _key(self, index: float) -> str:
+        return f"{self.key}:{int(index)}"
+
+
+class LoginRateThrottle(BaseThrottle):
+    """DRF throttle limiting login attempts per username and per client IP.
+
+    Every attempt counts, successful or not, since telling them apart would
+    require hashing the password first.
+    """
+
+    def __init__(self) -> None:
+        self.wait_seconds: float | None = None
+
+    def allow_request(self, request: Any, view: Any) -> bool:
+        rates = get_throttle_rates()
+        idents = [
+            ("username", self._get_username(request).lower(), rates["USERNAME"]),
+            ("ip", self._get_client_ip(request), rates["IP"]),
+        ]
+        counters = []
+        for scope, ident, rate in idents:
+            parsed_rate = parse_rate(rate)
+            if parsed_rate is None or not ident:
+                continue
+            digest = hashlib.sha256(ident.encode()).hexdigest()
+            counters.append(
+                SlidingWindowCounter(
+                    f"{CACHE_KEY_PREFIX}:{scope}:{digest}", *parsed_rate
+                )
+            )
+
+        # Check every counter before counting the attempt in any of them.
+        now = time.time()
+        waits = [counter.wait(now) for counter in counters]
+        if any(wait is not None for wait in waits):
+            self.wait_seconds = max(wait for wait in waits if wait is not None)
+            return False
+        for counter in counters:
+            counter.hit(now)
+        return True
+
+    def wait(self) -> float | None:
+        if self.wait_seconds is None:
+            return None
+        return max(1, math.ceil(self.wait_seconds))
+
+    def _get_client_ip(self, request: Any) -> str:
+        if api_settings.NUM_PROXIES is None:
+            # Without a configured proxy count, X-Forwarded-For is client input.
+            return request.META.get("REMOTE_ADDR", "")
+        return self.get_ident(request)
+
+    @staticmethod
+    def _get_username(request: Any) -> str:
+        try:
+            data = request.data
+        except APIException:
+            # Malformed bodies are reported by the view itself.
+            return ""
+        if not isinstance(data, dict):
+            return ""
+        username = data.get(get_user_model().USERNAME_FIELD, "")
+        return username if isinstance(username, str) else ""
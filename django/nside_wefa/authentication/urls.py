@@ -4,15 +4,27 @@ URL configuration for the nside_wefa.authentication app.
 This module exposes authentication endpoints depending on the configured
 authentication types in ``NSIDE_WEFA.AUTHENTICATION.TYPES``. When enabled:
 
-- ``TOKEN``: exposes ``/token-auth/`` using Django REST framework token auth.
-- ``JWT``: exposes ``/token/`` and ``/token/refresh/`` using SimpleJWT.
+- ``TOKEN`` or ``TOKEN_CACHED``: exposes ``/token-auth/`` using Django REST
+  framework token auth.
+- ``JWT``, ``JWT_CACHED`` or ``JWT_STATELESS``: exposes ``/token/`` and
+  ``/token/refresh/`` using SimpleJWT. With ``JWT_STATELESS``, ``/token/``
+  copies ``NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS`` into the issued tokens.
+
+``/token-auth/`` and ``/token/`` are throttled by
+:class:`nside_wefa.authentication.throttling.LoginRateThrottle`.
 """
 
 from django.urls import path
-from rest_framework.authtoken.views import obtain_auth_token
+from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from nside_wefa.authentication.constants import AUTH_TYPE_TOKEN, AUTH_TYPE_JWT
+from nside_wefa.authentication.constants import (
+    AUTH_TYPE_JWT_STATELESS,
+    JWT_AUTHENTICATION_TYPES,
+    TOKEN_AUTHENTICATION_TYPES,
+)
+from nside_wefa.authentication.serializers import ClaimsTokenObtainPairSerializer
+from nside_wefa.authentication.throttling import LoginRateThrottle
 from nside_wefa.authentication.utils.utils import get_authentication_types
 
 app_name = "authentication"
@@ -21,17 +33,30 @@ urlpatterns = []
 
 authentication_types = get_authentication_types()
 
-if AUTH_TYPE_TOKEN in authentication_types:
+if any(type_ in TOKEN_AUTHENTICATION_TYPES for type_ in authentication_types):
     urlpatterns.extend(
         [
-            path("token-auth/", obtain_auth_token, name="api-auth"),
+            path(
+                "token-auth/",
+                ObtainAuthToken.as_view(throttle_classes=[LoginRateThrottle]),
+                name="api-auth",
+            ),
         ]
     )
 
-if AUTH_TYPE_JWT in authentication_types:
+if any(type_ in JWT_AUTHENTICATION_TYPES for type_ in authentication_types):
     urlpatterns.extend(
         [
-            path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+            path(
+                "token/",
+                TokenObtainPairView.as_view(
+                    serializer_class=ClaimsTokenObtainPairSerializer
+                    if AUTH_TYPE_JWT_STATELESS in authentication_types
+                    else TokenObtainPairView.serializer_class,
+                    throttle_classes=[LoginRateThrottle],
+                ),
+                name="token_obtain_pair",
+            ),
             path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
         ]
     )
@@ -8,7 +8,13 @@ classes accordingly.
 
 from django.conf import settings
 
-from nside_wefa.authentication.constants import AUTH_TYPE_TOKEN, AUTH_TYPE_JWT
+from nside_wefa.authentication.constants import (
+    AUTH_TYPE_JWT,
+    AUTH_TYPE_JWT_CACHED,
+    AUTH_TYPE_JWT_STATELESS,
+    AUTH_TYPE_TOKEN,
+    AUTH_TYPE_TOKEN_CACHED,
+)
 import logging
 
 from nside_wefa.authentication.utils.utils import get_authentication_types
@@ -21,7 +27,10 @@ def initialize_settings():
 
     Depending on whether ``TOKEN`` and/or ``JWT`` authentication are enabled,
     this sets ``REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES']`` and ensures
-    ``IsAuthenticated`` is used as the default permission class.
+    ``IsAuthenticated`` is used as the default permission class. The
+    ``TOKEN_CACHED``, ``JWT_CACHED`` and ``JWT_STATELESS`` types select the
+    WeFa classes from :mod:`nside_wefa.authentication.authentication` instead
+    of the stock ones.
     """
     authentication_types = get_authentication_types()
     default_authentication_classes = []
@@ -33,11 +42,26 @@ def initialize_settings():
             "rest_framework.authentication.TokenAuthentication"
         )
 
+    if AUTH_TYPE_TOKEN_CACHED in authentication_types:
+        default_authentication_classes.append(
+            "nside_wefa.authentication.authentication.CachedTokenAuthentication"
+        )
+
     if AUTH_TYPE_JWT in authentication_types:
         default_authentication_classes.append(
             "rest_framework_simplejwt.authentication.JWTAuthentication"
         )
 
+    if AUTH_TYPE_JWT_CACHED in authentication_types:
+        default_authentication_classes.append(
+            "nside_wefa.authentication.authentication.CachedJWTAuthentication"
+        )
+
+    if AUTH_TYPE_JWT_STATELESS in authentication_types:
+        default_authentication_classes.append(
+            "nside_wefa.authentication.authentication.StatelessJWTAuthentication"
+        )
+
     settings.REST_FRAMEWORK.update(
         {
             "DEFAULT_AUTHENTICATION_CLASSES": default_authentication_classes,
@@ -7,6 +7,13 @@ accessors for project settings.
 
 from django.conf import settings
 
+from nside_wefa.authentication.constants import (
+    DEFAULT_CACHE_TIMEOUT,
+    DEFAULT_JWT_CLAIMS,
+    DEFAULT_THROTTLE_RATES,
+)
+from nside_wefa.common.settings import get_value
+
 
 def get_authentication_types():
     """Return the configured authentication types.
@@ -14,6 +21,45 @@ def get_authentication_types():
     Reads ``NSIDE_WEFA.AUTHENTICATION.TYPES`` from Django settings, which
     controls which authentication endpoints are exposed by the app.
 
+    Token types are ``TOKEN`` and ``TOKEN_CACHED``; JWT types are ``JWT``,
+    ``JWT_CACHED`` and ``JWT_STATELESS``.
+
     :return: A list of enabled authentication type identifiers (e.g., ``["TOKEN", "JWT"]``).
     """
     return settings.NSIDE_WEFA.get("AUTHENTICATION").get("TYPES")
+
+
+def get_cache_timeout() -> int:
+    """Return how long, in seconds, cached authentication classes keep a user.
+
+    Reads the optional ``NSIDE_WEFA.AUTHENTICATION.CACHE_TIMEOUT`` setting and
+    falls back to :data:`nside_wefa.authentication.constants.DEFAULT_CACHE_TIMEOUT`.
+
+    :return: The cache lifetime in seconds.
+    """
+    return get_value("AUTHENTICATION", "CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT)
+
+
+def get_jwt_claims() -> list[str]:
+    """Return the user fields copied into JWTs for the ``JWT_STATELESS`` type.
+
+    Reads the optional ``NSIDE_WEFA.AUTHENTICATION.JWT_CLAIMS`` setting and
+    falls back to :data:`nside_wefa.authentication.constants.DEFAULT_JWT_CLAIMS`.
+
+    :return: Names of concrete user model fields.
+    """
+    return get_value("AUTHENTICATION", "JWT_CLAIMS", DEFAULT_JWT_CLAIMS)
+
+
+def get_throttle_rates() -> dict:
+    """Return the login throttle rates, per username and per client IP.
+
+    Reads the optional ``NSIDE_WEFA.AUTHENTICATION.THROTTLE`` mapping; keys it
+    leaves out fall back to
+    :data:`nside_wefa.authentication.constants.DEFAULT_THROTTLE_RATES`.
+
+    :return: A mapping with ``USERNAME`` and ``IP`` rates such as
+        ``"10/minute"``, where ``None`` disables that limit.
+    """
+    throttle = get_value("AUTHENTICATION", "THROTTLE", {})
+    return {**DEFAULT_THROTTLE_RATES, **throttle}